@@ -3,7 +3,17 @@ import typer
 from api_bootstrapper_cli.commands.add_alembic import add_alembic
 from api_bootstrapper_cli.commands.add_pre_commit import add_pre_commit
 from api_bootstrapper_cli.commands.bootstrap_env import bootstrap_env
+from api_bootstrapper_cli.commands.bootstrap_many import env_bootstrap_many
+from api_bootstrapper_cli.commands.daemon import (
+    daemon_start,
+    daemon_status,
+    daemon_stop,
+)
+from api_bootstrapper_cli.commands.env_status import env_status
+from api_bootstrapper_cli.commands.env_watch import env_watch
 from api_bootstrapper_cli.commands.init import init
+from api_bootstrapper_cli.commands.wheelhouse import wheelhouse_build
+from api_bootstrapper_cli.core.shell import configure_transcripts_from_env
 
 
 app = typer.Typer(
@@ -33,13 +43,34 @@ db_app = typer.Typer(
     rich_markup_mode="rich",
 )
 
+daemon_app = typer.Typer(
+    no_args_is_help=True,
+    help="[cyan]Run a background daemon[/cyan] that answers commands in milliseconds.",
+    rich_markup_mode="rich",
+)
+
+wheelhouse_app = typer.Typer(
+    no_args_is_help=True,
+    help="[cyan]Manage a local wheelhouse[/cyan] for offline installs.",
+    rich_markup_mode="rich",
+)
+
 env_app.command("bootstrap")(bootstrap_env)
+env_app.command("bootstrap-many")(env_bootstrap_many)
+env_app.command("status")(env_status)
+env_app.command("watch")(env_watch)
+wheelhouse_app.command("build")(wheelhouse_build)
 hooks_app.command("add-pre-commit")(add_pre_commit)
 db_app.command("add-alembic")(add_alembic)
+daemon_app.command("start")(daemon_start)
+daemon_app.command("stop")(daemon_stop)
+daemon_app.command("status")(daemon_status)
 
+env_app.add_typer(wheelhouse_app, name="wheelhouse")
 app.add_typer(env_app, name="env")
 app.add_typer(hooks_app, name="hooks")
 app.add_typer(db_app, name="db")
+app.add_typer(daemon_app, name="daemon")
 
 # ── Top-level commands (kept for backward compatibility) ───────────────────────
 app.command("init")(init)
@@ -49,4 +80,5 @@ app.command("add-pre-commit")(add_pre_commit)
 
 
 def main() -> None:
+    configure_transcripts_from_env()
     app()
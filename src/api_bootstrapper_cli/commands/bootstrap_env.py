@@ -6,18 +6,20 @@ from pathlib import Path
 import typer
 from rich.console import Console
 
-from api_bootstrapper_cli.core.environment_service import (
-    EnvironmentBootstrapService,
-    EnvironmentSetupResult,
+from api_bootstrapper_cli.commands.common import (
+    bootstrap_projects,
+    create_bootstrap_service,
+    display_batch_report,
+    lock_mode_for,
+    wheelhouse_for,
 )
-from api_bootstrapper_cli.core.logger import RichLogger
-from api_bootstrapper_cli.core.poetry_manager import PoetryManager
+from api_bootstrapper_cli.core.batch import BatchProject
+from api_bootstrapper_cli.core.discovery import discover_projects
+from api_bootstrapper_cli.core.environment_service import EnvironmentSetupResult
+from api_bootstrapper_cli.core.profiling import print_profile, profiler
 from api_bootstrapper_cli.core.protocols import ManagerChoice
-from api_bootstrapper_cli.core.pyenv_manager import PyenvManager
-from api_bootstrapper_cli.core.shell import ShellError
-from api_bootstrapper_cli.core.uv_dependency_manager import UvDependencyManager
-from api_bootstrapper_cli.core.uv_python_manager import UvPythonManager
-from api_bootstrapper_cli.core.vscode_writer import VSCodeWriter
+from api_bootstrapper_cli.core.shell import ShellError, set_deadline
+from api_bootstrapper_cli.core.wheelhouse import OFFLINE_ENV, WHEELHOUSE_ENV
 
 
 console = Console()
@@ -44,6 +46,81 @@ def bootstrap_env(
         help="Python environment / dependency manager backend.",
         case_sensitive=False,
     ),
+    verbose: bool = typer.Option(
+        False,
+        "--verbose",
+        "-v",
+        help="Stream output of long-running tool commands to the console.",
+    ),
+    profile: bool = typer.Option(
+        False, "--profile", help="Print per-phase and per-command timings."
+    ),
+    profile_trace: Path | None = typer.Option(
+        None,
+        "--profile-trace",
+        help="Write a Chrome trace JSON file (implies --profile).",
+        dir_okay=False,
+        resolve_path=True,
+    ),
+    timeout: float | None = typer.Option(
+        None,
+        "--timeout",
+        envvar="API_BOOTSTRAPPER_TIMEOUT",
+        min=1,
+        help="Abort, killing running tools, if setup takes longer than this (seconds).",
+    ),
+    resume: bool = typer.Option(
+        True,
+        "--resume/--no-resume",
+        help="Skip steps a previous failed run already completed.",
+    ),
+    force_install: bool = typer.Option(
+        False,
+        "--force-install",
+        help="Install dependencies even if the venv is up to date with the lock file.",
+    ),
+    frozen: bool = typer.Option(
+        False,
+        "--frozen",
+        help="Install exactly the existing lock file; never resolve or update it.",
+    ),
+    locked: bool = typer.Option(
+        False,
+        "--locked",
+        help="Like --frozen, but fail first if the lock is out of date with pyproject.",
+    ),
+    compile_bytecode: bool = typer.Option(
+        False,
+        "--compile-bytecode",
+        help="Precompile site-packages and project sources to .pyc on all cores.",
+    ),
+    recursive: bool = typer.Option(
+        False,
+        "--recursive",
+        "-r",
+        help=(
+            "Bootstrap every project with a pyproject.toml under --path, "
+            "with the same Python and manager, each interpreter once."
+        ),
+    ),
+    wheelhouse_dir: Path | None = typer.Option(
+        None,
+        "--wheelhouse",
+        envvar=WHEELHOUSE_ENV,
+        help="Install wheels from this directory first (see 'env wheelhouse build').",
+        exists=True,
+        file_okay=False,
+        resolve_path=True,
+    ),
+    offline: bool = typer.Option(
+        False,
+        "--offline",
+        envvar=OFFLINE_ENV,
+        help=(
+            "Install only from --wheelhouse, never the index; "
+            "implies --frozen unless --locked is given."
+        ),
+    ),
 ) -> None:
     """Setup Python environment with a chosen manager and VSCode configuration.
 
@@ -57,13 +134,45 @@ def bootstrap_env(
     """
     project_root = path.resolve()
 
-    service = _create_bootstrap_service(manager)
+    profiling = profile or profile_trace is not None
+    if profiling:
+        profiler.enable()
+    if timeout is not None:
+        set_deadline(timeout)
 
     try:
+        wheelhouse = wheelhouse_for(wheelhouse_dir, offline)
+        lock_mode = lock_mode_for(frozen, locked, offline)
+        if recursive:
+            report = bootstrap_projects(
+                [
+                    BatchProject(project, python_version, manager)
+                    for project in _discover(project_root)
+                ],
+                verbose=verbose,
+                wheelhouse=wheelhouse,
+                install_dependencies=install,
+                lock_mode=lock_mode,
+                force_install=force_install,
+                compile_bytecode=compile_bytecode,
+                resume=resume,
+            )
+            display_batch_report(report)
+            if report.failed:
+                raise typer.Exit(code=1)
+            return
+
+        service = create_bootstrap_service(
+            manager, verbose=verbose, wheelhouse=wheelhouse
+        )
         result = service.bootstrap(
             project_root=project_root,
             python_version=python_version,
             install_dependencies=install,
+            resume=resume,
+            force_install=force_install,
+            lock_mode=lock_mode,
+            compile_bytecode=compile_bytecode,
         )
 
         _display_success(result, manager)
@@ -71,30 +180,19 @@ def bootstrap_env(
     except (ValueError, RuntimeError, OSError, ShellError) as e:
         console.print(f"[red]Error:[/red] {e}")
         raise typer.Exit(code=1)
-
-
-def _create_bootstrap_service(
-    manager: ManagerChoice = ManagerChoice.pyenv,
-) -> EnvironmentBootstrapService:
-    """Factory: build the service with the chosen manager backend.
-
-    Factory Pattern + Dependency Injection.
-    Single point of creation – facilitates testing and implementation substitution.
-    """
-    if manager == ManagerChoice.uv:
-        return EnvironmentBootstrapService(
-            python_env_manager=UvPythonManager(),
-            dependency_manager=UvDependencyManager(),
-            editor_writer=VSCodeWriter(),
-            logger=RichLogger(),
-        )
-    # Default: pyenv + Poetry
-    return EnvironmentBootstrapService(
-        python_env_manager=PyenvManager(),
-        dependency_manager=PoetryManager(),
-        editor_writer=VSCodeWriter(),
-        logger=RichLogger(),
-    )
+    finally:
+        if timeout is not None:
+            set_deadline(None)
+        if profiling:
+            print_profile(console, profile_trace)
+            profiler.disable()
+
+
+def _discover(project_root: Path) -> list[Path]:
+    projects = discover_projects(project_root)
+    if not projects:
+        raise ValueError(f"No pyproject.toml found under {project_root}")
+    return projects
 
 
 def _display_success(
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import typer
+from rich.console import Console
+
+from api_bootstrapper_cli.commands.common import (
+    bootstrap_projects,
+    display_batch_report,
+    lock_mode_for,
+    wheelhouse_for,
+)
+from api_bootstrapper_cli.core.batch import (
+    BatchReport,
+    SharedProvisioning,
+    load_manifest,
+)
+from api_bootstrapper_cli.core.wheelhouse import OFFLINE_ENV, WHEELHOUSE_ENV
+
+
+console = Console()
+
+
+def env_bootstrap_many(
+    manifest: Path = typer.Argument(
+        ...,
+        help="TOML or YAML file listing the projects (path, python, manager).",
+        exists=True,
+        dir_okay=False,
+        resolve_path=True,
+    ),
+    jobs: int | None = typer.Option(
+        None, "--jobs", "-j", min=1, help="Projects bootstrapped at once."
+    ),
+    build_jobs: int = typer.Option(
+        1,
+        "--build-jobs",
+        min=1,
+        help="Interpreters built at once; each build already uses every core.",
+    ),
+    install_jobs: int = typer.Option(
+        4,
+        "--install-jobs",
+        min=1,
+        help="Dependency resolves and installs at once (network-bound).",
+    ),
+    install: bool = typer.Option(
+        True, "--install/--no-install", help="Run dependency installation."
+    ),
+    frozen: bool = typer.Option(
+        False,
+        "--frozen",
+        help="Install exactly the existing lock files; never resolve or update them.",
+    ),
+    locked: bool = typer.Option(
+        False,
+        "--locked",
+        help="Like --frozen, but fail a project whose lock is out of date.",
+    ),
+    wheelhouse_dir: Path | None = typer.Option(
+        None,
+        "--wheelhouse",
+        envvar=WHEELHOUSE_ENV,
+        help="Install wheels from this directory first (see 'env wheelhouse build').",
+        exists=True,
+        file_okay=False,
+        resolve_path=True,
+    ),
+    offline: bool = typer.Option(
+        False,
+        "--offline",
+        envvar=OFFLINE_ENV,
+        help=(
+            "Install only from --wheelhouse, never the index; "
+            "implies --frozen unless --locked is given."
+        ),
+    ),
+    report_path: Path | None = typer.Option(
+        None,
+        "--report",
+        help="Also write the report as JSON to this file.",
+        dir_okay=False,
+        resolve_path=True,
+    ),
+    verbose: bool = typer.Option(
+        False,
+        "--verbose",
+        "-v",
+        help="Stream output of long-running tool commands to the console.",
+    ),
+) -> None:
+    """Bootstrap every project listed in a manifest, several at a time.
+
+    Each distinct Python version is provisioned once for all projects.
+    Exits with 1 when any project failed.
+    """
+    try:
+        wheelhouse = wheelhouse_for(wheelhouse_dir, offline)
+        lock_mode = lock_mode_for(frozen, locked, offline)
+        projects = load_manifest(manifest)
+    except (ValueError, OSError) as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(code=1)
+
+    report = bootstrap_projects(
+        projects,
+        verbose=verbose,
+        shared=SharedProvisioning(build_jobs=build_jobs, install_jobs=install_jobs),
+        jobs=jobs,
+        wheelhouse=wheelhouse,
+        install_dependencies=install,
+        lock_mode=lock_mode,
+    )
+
+    display_batch_report(report)
+    if report_path is not None:
+        report_path.write_text(json.dumps(_to_dict(report), indent=2) + "\n")
+    if report.failed:
+        raise typer.Exit(code=1)
+
+
+def _to_dict(report: BatchReport) -> dict[str, object]:
+    return {
+        "wall_seconds": round(report.wall, 3),
+        "busy_seconds": round(report.busy_seconds, 3),
+        "interpreters": {
+            name: round(seconds, 3) for name, seconds in report.interpreters.items()
+        },
+        "projects": [
+            {
+                "path": str(result.project.path),
+                "python": result.project.python_version,
+                "manager": result.project.manager.value,
+                "seconds": round(result.seconds, 3),
+                "ok": result.ok,
+                "error": result.error,
+                "venv_python": str(result.result.venv_python)
+                if result.result and result.result.venv_python
+                else None,
+            }
+            for result in report.results
+        ],
+    }
@@ -0,0 +1,179 @@
+"""Building blocks shared by the bootstrap commands.
+
+``bootstrap-env``, ``env bootstrap-many`` and ``env watch`` read the same
+lock and wheelhouse flags, build services the same way and report batches
+alike.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+from rich.console import Console
+from rich.markup import escape
+from rich.table import Table
+
+from api_bootstrapper_cli.core.batch import (
+    BatchProject,
+    BatchReport,
+    SharedProvisioning,
+    bootstrap_many,
+)
+from api_bootstrapper_cli.core.environment import CleanEnvironment
+from api_bootstrapper_cli.core.environment_service import EnvironmentBootstrapService
+from api_bootstrapper_cli.core.logger import PrefixedLogger, RichLogger
+from api_bootstrapper_cli.core.poetry_manager import PoetryManager
+from api_bootstrapper_cli.core.protocols import (
+    DependencyManager,
+    LockMode,
+    ManagerChoice,
+    PythonEnvironmentManager,
+)
+from api_bootstrapper_cli.core.pyenv_manager import PyenvManager
+from api_bootstrapper_cli.core.uv_dependency_manager import UvDependencyManager
+from api_bootstrapper_cli.core.uv_python_manager import UvPythonManager
+from api_bootstrapper_cli.core.venv_templates import (
+    VenvTemplates,
+    template_copies_enabled,
+    templates_enabled,
+)
+from api_bootstrapper_cli.core.vscode_writer import VSCodeWriter
+from api_bootstrapper_cli.core.wheelhouse import Wheelhouse
+
+
+console = Console()
+
+
+def lock_mode_for(frozen: bool, locked: bool, offline: bool = False) -> LockMode:
+    """--offline implies --frozen, unless --locked asks for the stricter check."""
+    if frozen and locked:
+        raise ValueError("--frozen and --locked cannot be used together")
+    if locked:
+        return LockMode.locked
+    if frozen or offline:
+        return LockMode.frozen
+    return LockMode.update
+
+
+def wheelhouse_for(path: Path | None, offline: bool) -> Wheelhouse | None:
+    if path is None:
+        if offline:
+            raise ValueError("--offline needs --wheelhouse to install from")
+        return None
+    return Wheelhouse(path, offline=offline)
+
+
+def create_bootstrap_service(
+    manager: ManagerChoice = ManagerChoice.pyenv,
+    verbose: bool = False,
+    logger: RichLogger | PrefixedLogger | None = None,
+    shared: SharedProvisioning | None = None,
+    wheelhouse: Wheelhouse | None = None,
+) -> EnvironmentBootstrapService:
+    """Factory: build the service with the chosen manager backend.
+
+    Factory Pattern + Dependency Injection.
+    Single point of creation – facilitates testing and implementation substitution.
+    With *shared*, the managers go through limits common to a batch of projects.
+    With *wheelhouse*, they install from local wheels.
+    """
+    logger = logger or RichLogger()
+    on_output = logger.output if verbose else None
+    environment = CleanEnvironment.capture()
+    templates = (
+        VenvTemplates(copy=template_copies_enabled()) if templates_enabled() else None
+    )
+
+    python_env: PythonEnvironmentManager
+    deps: DependencyManager
+    if manager == ManagerChoice.uv:
+        python_env = UvPythonManager(on_output=on_output, environment=environment)
+        deps = UvDependencyManager(
+            on_output=on_output,
+            environment=environment,
+            templates=templates,
+            wheelhouse=wheelhouse,
+        )
+    else:
+        # Default: pyenv + Poetry
+        python_env = PyenvManager(
+            on_output=on_output, environment=environment, wheelhouse=wheelhouse
+        )
+        deps = PoetryManager(
+            on_output=on_output,
+            environment=environment,
+            templates=templates,
+            wheelhouse=wheelhouse,
+        )
+    if shared is not None:
+        python_env = shared.python_manager(python_env)
+        deps = shared.dependency_manager(deps)
+    return EnvironmentBootstrapService(
+        python_env_manager=python_env,
+        dependency_manager=deps,
+        editor_writer=VSCodeWriter(),
+        logger=logger,
+    )
+
+
+def bootstrap_projects(
+    projects: list[BatchProject],
+    verbose: bool = False,
+    shared: SharedProvisioning | None = None,
+    jobs: int | None = None,
+    wheelhouse: Wheelhouse | None = None,
+    **options: Any,
+) -> BatchReport:
+    """Bootstrap *projects* concurrently; *options* go to each ``bootstrap``."""
+    logger = RichLogger()
+
+    def create_service(
+        project: BatchProject, shared: SharedProvisioning
+    ) -> EnvironmentBootstrapService:
+        return create_bootstrap_service(
+            project.manager,
+            verbose=verbose,
+            logger=PrefixedLogger(logger, f"[{project.name}]"),
+            shared=shared,
+            wheelhouse=wheelhouse,
+        )
+
+    return bootstrap_many(projects, create_service, shared, jobs=jobs, **options)
+
+
+def display_batch_report(report: BatchReport) -> None:
+    table = Table(padding=(0, 2))
+    table.add_column("Project")
+    table.add_column("Python")
+    table.add_column("Manager")
+    table.add_column("Virtualenv")
+    table.add_column("Time", justify="right")
+    table.add_column("Result")
+    for item in report.results:
+        venv_python = item.result.venv_python if item.result else None
+        table.add_row(
+            str(item.project.path),
+            item.project.python_version,
+            item.project.manager.value,
+            str(venv_python) if venv_python else "",
+            f"{item.seconds:.1f}s",
+            "[green]ready[/green]"
+            if item.ok
+            else f"[red]{escape(item.error or '')}[/red]",
+        )
+    console.print()
+    console.print(table)
+
+    for interpreter, seconds in report.interpreters.items():
+        console.print(f"[dim]Provisioned Python {interpreter} in {seconds:.1f}s[/dim]")
+    failed = len(report.failed)
+    summary = (
+        f"{len(report.results) - failed} ready, {failed} failed in "
+        f"{report.wall:.1f}s ({report.busy_seconds:.1f}s one at a time)"
+    )
+    if failed:
+        console.print(f"[bold red]✗[/bold red] [red]{summary}[/red]")
+    else:
+        console.print(f"[bold green]✓[/bold green] [green]{summary}[/green]")
+    console.print()
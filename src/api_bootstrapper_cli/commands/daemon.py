@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import os
+
+import typer
+from rich.console import Console
+
+from api_bootstrapper_cli.core import daemon
+from api_bootstrapper_cli.core.executables import clear_executable_cache
+from api_bootstrapper_cli.core.shell import kill_running_commands
+
+
+console = Console()
+
+
+def daemon_start() -> None:
+    """Serve bootstrap-env, add-pre-commit and env status from this process.
+
+    While it runs, those commands are answered over a Unix socket with the
+    toolchain lookups already warm. Runs in the foreground; stop it with
+    Ctrl-C or 'api-bootstrapper daemon stop'. Set API_BOOTSTRAPPER_NO_DAEMON=1
+    to run a command locally anyway.
+    """
+    path = daemon.socket_path()
+    console.print(f"[cyan]Daemon {os.getpid()} listening on {path}[/cyan]")
+    try:
+        daemon.serve(_run_cli, path, interrupt=kill_running_commands)
+    except RuntimeError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(code=1)
+    except KeyboardInterrupt:
+        pass
+    console.print("[dim]Daemon stopped[/dim]")
+
+
+def daemon_stop() -> None:
+    """Stop the running daemon."""
+    if not daemon.stop():
+        console.print("[yellow]No daemon is running[/yellow]")
+        raise typer.Exit(code=1)
+    console.print("[green]Daemon stopped[/green]")
+
+
+def daemon_status() -> None:
+    """Show whether a daemon is serving commands."""
+    pid = daemon.ping()
+    if pid is None:
+        console.print("[yellow]No daemon is running[/yellow]")
+        raise typer.Exit(code=1)
+    console.print(f"[green]Daemon {pid} listening on {daemon.socket_path()}[/green]")
+
+
+def _run_cli(argv: list[str]) -> int:
+    # Imported here: the CLI module registers this command.
+    from api_bootstrapper_cli.cli import app
+
+    # Each client brings its own PATH, and tools come and go between
+    # requests. Probes stay warm: they are cached against their own inputs.
+    clear_executable_cache()
+    try:
+        app(argv, prog_name="api-bootstrapper")
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            return e.code or 0
+        print(e.code)
+        return 1
+    return 0
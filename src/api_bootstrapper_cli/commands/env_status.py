@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from api_bootstrapper_cli.core.environment_state import (
+    EnvironmentState,
+    inspect_environment,
+)
+
+
+console = Console()
+
+
+def env_status(
+    path: Path = typer.Option(
+        Path("."),
+        "--path",
+        help="Target project folder (default: current).",
+        file_okay=False,
+        dir_okay=True,
+        resolve_path=True,
+    ),
+    as_json: bool = typer.Option(
+        False, "--json", help="Print the state as JSON instead of a table."
+    ),
+) -> None:
+    """Show the project's Python environment without running any tool.
+
+    Reads .python-version, pyproject.toml, lock files and .venv/pyvenv.cfg.
+    """
+    state = inspect_environment(path.resolve())
+
+    if as_json:
+        print(json.dumps(_to_dict(state), indent=2))
+        return
+
+    table = Table(show_header=False, box=None, padding=(0, 2))
+    table.add_column(style="dim")
+    table.add_column()
+
+    table.add_row("Project", str(state.project_root))
+    table.add_row("Python pin", state.python_pin or "[yellow]none[/yellow]")
+    table.add_row(
+        "pyproject.toml",
+        f"{state.manager.value}-style"
+        if state.has_pyproject
+        else "[yellow]missing[/yellow]",
+    )
+    for name, digest in state.lock_hashes.items():
+        table.add_row(name, f"sha256 {digest[:12]}")
+    if state.venv is None:
+        table.add_row("Virtualenv", "[yellow]missing[/yellow]")
+    else:
+        table.add_row("Virtualenv", str(state.venv.path))
+        table.add_row("Venv Python", state.venv.version or "[yellow]unknown[/yellow]")
+        table.add_row("Installed", f"{len(state.installed)} distributions")
+
+    console.print(table)
+    issues = _issues(state)
+    if not issues:
+        console.print("[bold green]✓[/bold green] [green]Environment ready[/green]")
+        return
+    for issue in issues:
+        console.print(f"[yellow]⚠[/yellow] {issue}")
+    console.print("[dim]Run[/dim] [cyan]api-bootstrapper env bootstrap[/cyan]")
+
+
+def _issues(state: EnvironmentState) -> list[str]:
+    if not state.python_pin:
+        return [".python-version is missing"]
+    return [issue.value for issue in state.diagnose(state.python_pin)]
+
+
+def _to_dict(state: EnvironmentState) -> dict[str, object]:
+    venv = state.venv
+    return {
+        "project_root": str(state.project_root),
+        "python_pin": state.python_pin,
+        "manager": state.manager.value,
+        "has_pyproject": state.has_pyproject,
+        "pyproject_hash": state.pyproject_hash,
+        "lock_hashes": dict(state.lock_hashes),
+        "venv": None
+        if venv is None
+        else {
+            "path": str(venv.path),
+            "python": str(venv.python),
+            "version": venv.version,
+            "home": str(venv.home) if venv.home else None,
+        },
+        "installed": dict(state.installed),
+        "dependencies_synced": state.dependencies_synced,
+        "issues": _issues(state),
+    }
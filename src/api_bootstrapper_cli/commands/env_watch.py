@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import typer
+from rich.console import Console
+
+from api_bootstrapper_cli.commands.common import create_bootstrap_service
+from api_bootstrapper_cli.core.environment_state import LOCK_FILES, inspect_environment
+from api_bootstrapper_cli.core.file_watcher import FileWatcher
+from api_bootstrapper_cli.core.protocols import ManagerChoice
+from api_bootstrapper_cli.core.shell import ShellError
+
+
+console = Console()
+
+WATCHED_FILES = (".python-version", "pyproject.toml", *LOCK_FILES)
+# A sync whose own writes keep changing the files is not retried forever.
+MAX_SYNC_ROUNDS = 3
+
+
+def env_watch(
+    path: Path = typer.Option(
+        Path("."),
+        "--path",
+        help="Target project folder (default: current).",
+        file_okay=False,
+        dir_okay=True,
+        resolve_path=True,
+    ),
+    python_version: str | None = typer.Option(
+        None, "--python", help="Python version to keep (default: .python-version)."
+    ),
+    manager: ManagerChoice | None = typer.Option(
+        None,
+        "--manager",
+        help="Backend (default: detected from pyproject.toml).",
+        case_sensitive=False,
+    ),
+    debounce: float = typer.Option(
+        0.5,
+        "--debounce",
+        min=0,
+        help="Seconds without further edits before a burst of edits is synced.",
+    ),
+    poll: bool = typer.Option(
+        False, "--poll", help="Poll the files instead of using inotify."
+    ),
+    verbose: bool = typer.Option(
+        False,
+        "--verbose",
+        "-v",
+        help="Stream output of long-running tool commands to the console.",
+    ),
+) -> None:
+    """Keep the environment in sync while its project files change.
+
+    Watches .python-version, pyproject.toml and the lock file. Each change
+    runs only the repair it needs: update the lock, sync dependencies or
+    rebuild the venv. Stop with Ctrl-C.
+    """
+    project_root = path.resolve()
+
+    with FileWatcher(
+        project_root, WATCHED_FILES, debounce=debounce, use_inotify=not poll
+    ) as watcher:
+        try:
+            _sync_until_settled(
+                watcher, project_root, set(), python_version, manager, verbose
+            )
+            console.print(
+                f"[cyan]Watching {project_root} ({watcher.backend}). "
+                "Press Ctrl-C to stop.[/cyan]"
+            )
+            while True:
+                changed = watcher.wait()
+                if not changed:
+                    continue
+                _sync_until_settled(
+                    watcher, project_root, changed, python_version, manager, verbose
+                )
+        except KeyboardInterrupt:
+            console.print("[dim]Stopped watching[/dim]")
+
+
+def _sync_until_settled(
+    watcher: FileWatcher,
+    project_root: Path,
+    changed: set[str],
+    python_version: str | None,
+    manager: ManagerChoice | None,
+    verbose: bool,
+) -> None:
+    """Sync, and sync again while the files changed during the last sync.
+
+    The sync rewrites pyproject and the lock itself, and an edit made while
+    it ran looks just the same. Another sync tells them apart: it leaves the
+    files alone when nothing is left to repair.
+    """
+    for _ in range(MAX_SYNC_ROUNDS):
+        _sync(project_root, changed, python_version, manager, verbose)
+        changed = watcher.rebaseline()
+        if not changed:
+            return
+
+
+def _sync(
+    project_root: Path,
+    changed: set[str],
+    python_version: str | None,
+    manager: ManagerChoice | None,
+    verbose: bool,
+) -> None:
+    state = inspect_environment(project_root)
+    version = python_version or state.python_pin
+    if changed:
+        console.print(f"\n[bold]Changed:[/bold] {', '.join(sorted(changed))}")
+    if version is None:
+        console.print(
+            "[yellow]No .python-version and no --python given; not syncing[/yellow]"
+        )
+        return
+
+    service = create_bootstrap_service(manager or state.manager, verbose=verbose)
+    try:
+        service.bootstrap(project_root=project_root, python_version=version)
+    except (ValueError, RuntimeError, OSError, ShellError) as e:
+        # Keep watching: the next edit may well fix it.
+        console.print(f"[red]Error:[/red] {e}")
@@ -9,7 +9,10 @@ from rich.console import Console
 
 from api_bootstrapper_cli.commands.add_pre_commit import add_pre_commit
 from api_bootstrapper_cli.commands.bootstrap_env import ManagerChoice, bootstrap_env
-from api_bootstrapper_cli.core.shell import ShellError
+from api_bootstrapper_cli.core.discovery import discover_projects
+from api_bootstrapper_cli.core.profiling import print_profile, profiler
+from api_bootstrapper_cli.core.shell import ShellError, set_deadline
+from api_bootstrapper_cli.core.wheelhouse import OFFLINE_ENV, WHEELHOUSE_ENV
 
 
 console = Console()
@@ -36,6 +39,70 @@ def init(
         help="Python environment / dependency manager backend.",
         case_sensitive=False,
     ),
+    verbose: bool = typer.Option(
+        False,
+        "--verbose",
+        "-v",
+        help="Stream output of long-running tool commands to the console.",
+    ),
+    profile: bool = typer.Option(
+        False, "--profile", help="Print per-phase and per-command timings."
+    ),
+    profile_trace: Path | None = typer.Option(
+        None,
+        "--profile-trace",
+        help="Write a Chrome trace JSON file (implies --profile).",
+        dir_okay=False,
+        resolve_path=True,
+    ),
+    timeout: float | None = typer.Option(
+        None,
+        "--timeout",
+        envvar="API_BOOTSTRAPPER_TIMEOUT",
+        min=1,
+        help="Abort, killing running tools, if setup takes longer than this (seconds).",
+    ),
+    force_install: bool = typer.Option(
+        False,
+        "--force-install",
+        help="Install dependencies even if the venv is up to date with the lock file.",
+    ),
+    frozen: bool = typer.Option(
+        False,
+        "--frozen",
+        help="Install exactly the existing lock file; never resolve or update it.",
+    ),
+    locked: bool = typer.Option(
+        False,
+        "--locked",
+        help="Like --frozen, but fail first if the lock is out of date with pyproject.",
+    ),
+    compile_bytecode: bool = typer.Option(
+        False,
+        "--compile-bytecode",
+        help="Precompile site-packages and project sources to .pyc on all cores.",
+    ),
+    recursive: bool = typer.Option(
+        False,
+        "--recursive",
+        "-r",
+        help="Initialize every project with a pyproject.toml under --path.",
+    ),
+    wheelhouse_dir: Path | None = typer.Option(
+        None,
+        "--wheelhouse",
+        envvar=WHEELHOUSE_ENV,
+        help="Install wheels from this directory first (see 'env wheelhouse build').",
+        exists=True,
+        file_okay=False,
+        resolve_path=True,
+    ),
+    offline: bool = typer.Option(
+        False,
+        "--offline",
+        envvar=OFFLINE_ENV,
+        help="Install only from --wheelhouse, never the index; implies --frozen.",
+    ),
 ) -> None:
     """
     Initialize a complete Python project with all features.
@@ -62,17 +129,44 @@ def init(
     \b
     # Skip dependency installation
     api-bootstrapper init --python 3.12.12 --no-install
+
+    \b
+    # Every project of a monorepo
+    api-bootstrapper init --python 3.12.12 --recursive
     """
     console.print("\n[bold cyan]🚀 Initializing Python project...[/bold cyan]\n")
 
+    profiling = profile or profile_trace is not None
+    if profiling:
+        profiler.enable()
+    if timeout is not None:
+        set_deadline(timeout)
+
     try:
         console.print("[bold]Step 1/2:[/bold] Setting up Python environment")
         bootstrap_env(
-            python_version=python, path=path, install=install, manager=manager
+            python_version=python,
+            path=path,
+            install=install,
+            manager=manager,
+            verbose=verbose,
+            profile=False,
+            profile_trace=None,
+            timeout=None,
+            resume=True,
+            force_install=force_install,
+            frozen=frozen,
+            locked=locked,
+            compile_bytecode=compile_bytecode,
+            recursive=recursive,
+            wheelhouse_dir=wheelhouse_dir,
+            offline=offline,
         )
 
         console.print("\n[bold]Step 2/2:[/bold] Configuring pre-commit hooks")
-        add_pre_commit(path=path, manager=manager)
+        with profiler.span("pre-commit"):
+            for project in discover_projects(path) if recursive else [path]:
+                add_pre_commit(path=project, manager=manager)
 
         console.print(
             "\n[bold green]✓ Project initialized successfully![/bold green]\n"
@@ -90,3 +184,9 @@ def init(
             f"\n[bold red]✗ Initialization failed (unexpected):[/bold red] {e}\n"
         )
         raise typer.Exit(1) from e
+    finally:
+        if timeout is not None:
+            set_deadline(None)
+        if profiling:
+            print_profile(console, profile_trace)
+            profiler.disable()
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import typer
+from rich.console import Console
+
+from api_bootstrapper_cli.core.discovery import discover_projects
+from api_bootstrapper_cli.core.environment import CleanEnvironment
+from api_bootstrapper_cli.core.environment_service import PYTHON_TOOLING
+from api_bootstrapper_cli.core.environment_state import inspect_environment
+from api_bootstrapper_cli.core.logger import RichLogger
+from api_bootstrapper_cli.core.protocols import ManagerChoice
+from api_bootstrapper_cli.core.shell import ShellError
+from api_bootstrapper_cli.core.wheelhouse import WHEELHOUSE_ENV, build_wheelhouse
+
+
+console = Console()
+
+
+def wheelhouse_build(
+    wheelhouse: Path = typer.Argument(
+        ...,
+        envvar=WHEELHOUSE_ENV,
+        help="Directory to add the wheels to; created if missing.",
+        file_okay=False,
+        resolve_path=True,
+    ),
+    path: Path = typer.Option(
+        Path("."),
+        "--path",
+        help="Target project folder (default: current).",
+        file_okay=False,
+        dir_okay=True,
+        resolve_path=True,
+    ),
+    recursive: bool = typer.Option(
+        False,
+        "--recursive",
+        "-r",
+        help="Every project with a pyproject.toml under --path.",
+    ),
+    python: Path | None = typer.Option(
+        None,
+        "--python",
+        help=(
+            "Interpreter to build wheels for "
+            "(default: the project's .venv, else the one running this CLI)."
+        ),
+        dir_okay=False,
+        resolve_path=True,
+    ),
+    verbose: bool = typer.Option(
+        False,
+        "--verbose",
+        "-v",
+        help="Stream output of long-running tool commands to the console.",
+    ),
+) -> None:
+    """Fill a wheelhouse with every wheel the projects' lock files install.
+
+    Wheels match one interpreter and platform: build once per Python version
+    the projects use, then bootstrap with --wheelhouse (and --offline).
+    """
+    on_output = RichLogger().output if verbose else None
+    env = CleanEnvironment.capture().base
+    try:
+        projects = discover_projects(path) if recursive else [path]
+        if not projects:
+            raise ValueError(f"No pyproject.toml found under {path}")
+        for project in projects:
+            state = inspect_environment(project)
+            interpreter = python or (
+                state.venv.python
+                if state.venv and state.venv.python.exists()
+                else Path(sys.executable)
+            )
+            console.print(f"[cyan][wheelhouse] {project} ({interpreter})[/cyan]")
+            build_wheelhouse(
+                wheelhouse,
+                project,
+                interpreter,
+                # pyenv projects pip-install Poetry itself into the interpreter.
+                extra=PYTHON_TOOLING if state.manager == ManagerChoice.pyenv else (),
+                env=env,
+                on_output=on_output,
+            )
+    except (ValueError, RuntimeError, OSError, ShellError) as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(code=1)
+
+    wheels = len(list(wheelhouse.glob("*.whl")))
+    console.print(
+        f"[bold green]✓[/bold green] [green]{wheels} wheels in {wheelhouse}[/green]"
+    )
@@ -0,0 +1,361 @@
+"""Bootstrap many projects from one manifest, sharing interpreters and limits.
+
+Projects run on a thread pool: every step waits on a child process, so
+threads are enough. Work crossing projects goes through
+:class:`SharedProvisioning`. Each distinct interpreter is built, and gets its
+tooling, exactly once. Builds are CPU-bound, so they get their own small limit.
+Resolves and installs are network-bound and get a wider one. Installs of
+identical lock files take turns, so every project after the first can clone
+the first one's venv template.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+import tomllib
+from collections.abc import Callable, Hashable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from api_bootstrapper_cli.core import files
+from api_bootstrapper_cli.core.environment_service import (
+    EnvironmentBootstrapService,
+    EnvironmentSetupResult,
+)
+from api_bootstrapper_cli.core.environment_state import inspect_environment
+from api_bootstrapper_cli.core.protocols import (
+    DependencyManager,
+    LockMode,
+    ManagerChoice,
+    PythonEnvironmentManager,
+)
+from api_bootstrapper_cli.core.shell import ShellError, kill_running_commands
+
+
+@dataclass(frozen=True)
+class BatchProject:
+    path: Path
+    python_version: str
+    manager: ManagerChoice
+
+    @property
+    def name(self) -> str:
+        return self.path.name
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    project: BatchProject
+    seconds: float
+    result: EnvironmentSetupResult | None = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class BatchReport:
+    results: list[BatchResult] = field(default_factory=list)
+    # "3.12.3 (pyenv)" → seconds spent provisioning it, once for all projects.
+    interpreters: dict[str, float] = field(default_factory=dict)
+    wall: float = 0.0
+
+    @property
+    def failed(self) -> list[BatchResult]:
+        return [result for result in self.results if not result.ok]
+
+    @property
+    def busy_seconds(self) -> float:
+        """Sum of per-project times: the wall time of running them one by one."""
+        return sum(result.seconds for result in self.results)
+
+
+def load_manifest(path: Path) -> list[BatchProject]:
+    """Read a TOML or YAML manifest of projects.
+
+    Top-level ``python`` and ``manager`` are defaults for every entry of
+    ``projects``. Paths are relative to the manifest. Without a Python
+    version an entry uses its ``.python-version``; without a manager, the one
+    its ``pyproject.toml`` implies.
+    """
+    data = _read_manifest(path)
+    entries = data.get("projects")
+    if not isinstance(entries, list) or not entries:
+        raise ValueError(f"{path.name}: expected a non-empty 'projects' list")
+
+    base = path.resolve().parent
+    projects: list[BatchProject] = []
+    seen: set[Path] = set()
+    for index, entry in enumerate(entries, start=1):
+        if isinstance(entry, str):
+            entry = {"path": entry}
+        if not isinstance(entry, dict) or not isinstance(entry.get("path"), str):
+            raise ValueError(f"{path.name}: project #{index} needs a 'path'")
+        project_root = (base / entry["path"]).resolve()
+        if project_root in seen:
+            raise ValueError(f"{path.name}: {entry['path']} is listed twice")
+        seen.add(project_root)
+
+        state = inspect_environment(project_root)
+        python_version = entry.get("python") or data.get("python") or state.python_pin
+        if not python_version:
+            raise ValueError(
+                f"{path.name}: no Python version for {entry['path']} "
+                "(set 'python' or add a .python-version)"
+            )
+        manager = entry.get("manager") or data.get("manager")
+        try:
+            choice = ManagerChoice(manager) if manager else state.manager
+        except ValueError:
+            raise ValueError(
+                f"{path.name}: unknown manager {manager!r} for {entry['path']}"
+            ) from None
+        projects.append(BatchProject(project_root, str(python_version), choice))
+    return projects
+
+
+def _read_manifest(path: Path) -> dict[str, Any]:
+    if path.suffix in (".yaml", ".yml"):
+        try:
+            import yaml  # type: ignore[import-untyped]
+        except ImportError:
+            raise ValueError(
+                "YAML manifests need PyYAML (pip install pyyaml); "
+                "or use a TOML manifest"
+            ) from None
+        with path.open("rb") as f:
+            data = yaml.safe_load(f)
+    else:
+        with path.open("rb") as f:
+            data = tomllib.load(f)
+    if not isinstance(data, dict):
+        raise ValueError(f"{path.name}: expected a mapping at the top level")
+    return data
+
+
+class SharedProvisioning:
+    """Deduplicate and limit the work concurrent bootstraps have in common.
+
+    :meth:`python_manager` and :meth:`dependency_manager` wrap one project's
+    managers; wrappers made by the same instance share the limits.
+    """
+
+    def __init__(self, build_jobs: int = 1, install_jobs: int = 4) -> None:
+        self._builds = threading.BoundedSemaphore(build_jobs)
+        self._installs = threading.BoundedSemaphore(install_jobs)
+        self._once = _Once()
+        self._lock = threading.Lock()
+        self._serial: dict[Hashable, threading.Lock] = {}
+        self.interpreters: dict[str, float] = {}
+
+    def python_manager(
+        self, inner: PythonEnvironmentManager
+    ) -> PythonEnvironmentManager:
+        return _SharedPythonManager(inner, self)
+
+    def dependency_manager(self, inner: DependencyManager) -> DependencyManager:
+        return _SharedDependencyManager(inner, self)
+
+    def provision(self, manager: str, version: str, action: Callable[[], None]) -> None:
+        def build() -> None:
+            with self._builds:
+                started = time.perf_counter()
+                action()
+            with self._lock:
+                self.interpreters[f"{version} ({manager})"] = (
+                    time.perf_counter() - started
+                )
+
+        self._once.run(("python", manager, version), build)
+
+    def once(self, key: Hashable, action: Callable[[], None]) -> None:
+        self._once.run(key, action)
+
+    def network(self) -> threading.BoundedSemaphore:
+        return self._installs
+
+    def serialized(self, key: Hashable) -> threading.Lock:
+        """One lock per *key*, shared by every project."""
+        with self._lock:
+            return self._serial.setdefault(key, threading.Lock())
+
+
+class _Once:
+    """Run each keyed action once; concurrent callers wait for the first.
+
+    A failure is remembered too: every project needing that interpreter fails
+    with the same error instead of building it again.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._futures: dict[Hashable, Future[None]] = {}
+
+    def run(self, key: Hashable, action: Callable[[], None]) -> None:
+        with self._lock:
+            future = self._futures.get(key)
+            owner = future is None
+            if future is None:
+                future = self._futures[key] = Future()
+        if not owner:
+            future.result()
+            return
+        try:
+            action()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        future.set_result(None)
+
+
+class _SharedPythonManager:
+    def __init__(
+        self, inner: PythonEnvironmentManager, shared: SharedProvisioning
+    ) -> None:
+        self._inner = inner
+        self._shared = shared
+        self.name: str = getattr(inner, "name", "python")
+
+    def is_installed(self) -> bool:
+        return self._inner.is_installed()
+
+    def ensure_python(self, version: str) -> None:
+        self._shared.provision(
+            self.name, version, lambda: self._inner.ensure_python(version)
+        )
+
+    def set_local(self, project_root: Path, version: str) -> None:
+        self._inner.set_local(project_root, version)
+
+    def get_python_path(self, version: str) -> Path:
+        return self._inner.get_python_path(version)
+
+    def install_pip_packages(self, version: str, packages: list[str]) -> None:
+        def install() -> None:
+            with self._shared.network():
+                self._inner.install_pip_packages(version, packages)
+
+        # Concurrent pip runs into one interpreter would race each other.
+        self._shared.once(("pip", self.name, version, tuple(packages)), install)
+
+
+class _SharedDependencyManager:
+    def __init__(self, inner: DependencyManager, shared: SharedProvisioning) -> None:
+        self._inner = inner
+        self._shared = shared
+        self.name: str = getattr(inner, "name", "deps")
+
+    def is_installed(self) -> bool:
+        return self._inner.is_installed()
+
+    def configure_venv(self, project_root: Path) -> None:
+        self._inner.configure_venv(project_root)
+
+    def use_python(self, project_root: Path, python_path: Path) -> None:
+        self._inner.use_python(project_root, python_path)
+
+    def get_venv_path(self, project_root: Path) -> Path:
+        return self._inner.get_venv_path(project_root)
+
+    def get_venv_python(self, project_root: Path) -> Path:
+        return self._inner.get_venv_python(project_root)
+
+    def ensure_venv(self, project_root: Path) -> None:
+        # Poetry installs everything while creating the venv.
+        with self._shared.network():
+            self._inner.ensure_venv(project_root)
+
+    def install_dependencies(
+        self,
+        project_root: Path,
+        force: bool = False,
+        lock_mode: LockMode = LockMode.update,
+    ) -> None:
+        locks = tuple(
+            (name, digest)
+            for name in ("poetry.lock", "uv.lock")
+            if (digest := files.sha256_file(project_root / name))
+        )
+        turn = (
+            self._shared.serialized(("install", self.name, locks))
+            if locks
+            else nullcontext()
+        )
+        with turn, self._shared.network():
+            self._inner.install_dependencies(
+                project_root, force=force, lock_mode=lock_mode
+            )
+
+    def check_lock(self, project_root: Path, lock_mode: LockMode) -> None:
+        self._inner.check_lock(project_root, lock_mode)
+
+    def lock(self, project_root: Path) -> None:
+        with self._shared.network():
+            self._inner.lock(project_root)
+
+    def relock(self, project_root: Path) -> None:
+        with self._shared.network():
+            self._inner.relock(project_root)
+
+
+def bootstrap_many(
+    projects: Sequence[BatchProject],
+    create_service: Callable[
+        [BatchProject, SharedProvisioning], EnvironmentBootstrapService
+    ],
+    shared: SharedProvisioning | None = None,
+    jobs: int | None = None,
+    install_dependencies: bool = True,
+    lock_mode: LockMode = LockMode.update,
+    force_install: bool = False,
+    compile_bytecode: bool = False,
+    resume: bool = True,
+) -> BatchReport:
+    """Bootstrap *projects*, up to *jobs* at a time; one failure stops none.
+
+    *create_service* builds each project's service around managers wrapped
+    by *shared*. Results keep the manifest's order.
+    """
+    shared = shared or SharedProvisioning()
+    jobs = jobs or min(len(projects), 4 * (os.cpu_count() or 1)) or 1
+    report = BatchReport()
+    started = time.perf_counter()
+
+    def run(project: BatchProject) -> BatchResult:
+        project_started = time.perf_counter()
+        try:
+            result = create_service(project, shared).bootstrap(
+                project_root=project.path,
+                python_version=project.python_version,
+                install_dependencies=install_dependencies,
+                force_install=force_install,
+                lock_mode=lock_mode,
+                compile_bytecode=compile_bytecode,
+                resume=resume,
+            )
+        except (ValueError, RuntimeError, OSError, ShellError) as e:
+            return BatchResult(
+                project, time.perf_counter() - project_started, error=str(e)
+            )
+        return BatchResult(project, time.perf_counter() - project_started, result)
+
+    with ThreadPoolExecutor(jobs, thread_name_prefix="batch") as pool:
+        futures = [pool.submit(run, project) for project in projects]
+        try:
+            report.results = [future.result() for future in futures]
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            kill_running_commands()
+            raise
+
+    report.wall = time.perf_counter() - started
+    report.interpreters = dict(shared.interpreters)
+    return report
@@ -0,0 +1,94 @@
+"""Precompile a virtualenv's bytecode across all cores.
+
+Without ``.pyc`` files the first import of every module compiles it, one at a
+time, on the first test run or server start. ``compileall`` runs inside the
+venv's own interpreter, so the files carry its magic number and cache tag, and
+reports the CPU time spent: the compilation those first imports no longer do.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+
+from api_bootstrapper_cli.core.environment import CleanEnvironment
+from api_bootstrapper_cli.core.shell import ShellError, exec_cmd
+
+
+# Runs in the venv's Python. Up-to-date .pyc files are skipped, so a repeat
+# run costs little. Pool workers are reaped before the last getrusage call.
+_COMPILE_SCRIPT = """\
+import compileall, json, os, sys, sysconfig, time
+try:
+    import resource
+except ImportError:
+    resource = None
+
+def cpu():
+    if resource is None:
+        return time.process_time()
+    own = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return own.ru_utime + own.ru_stime + children.ru_utime + children.ru_stime
+
+workers = int(sys.argv[1]) or os.cpu_count() or 1
+paths = dict.fromkeys([sysconfig.get_path("purelib"), sysconfig.get_path("platlib")])
+paths.update(dict.fromkeys(sys.argv[2:]))
+wall, start = time.perf_counter(), cpu()
+for path in paths:
+    if os.path.isdir(path):
+        compileall.compile_dir(path, quiet=2, workers=workers)
+print(json.dumps({
+    "wall": time.perf_counter() - wall, "cpu": cpu() - start, "workers": workers
+}))
+"""
+
+
+@dataclass(frozen=True)
+class BytecodeReport:
+    wall_seconds: float
+    cpu_seconds: float
+    workers: int
+
+
+def compile_bytecode(
+    venv_python: Path,
+    sources: list[Path],
+    workers: int = 0,
+    env: Mapping[str, str] | None = None,
+) -> BytecodeReport:
+    """Compile site-packages and *sources* with *workers* processes (0: all cores)."""
+    try:
+        res = exec_cmd(
+            [
+                str(venv_python),
+                "-c",
+                _COMPILE_SCRIPT,
+                str(workers),
+                *map(str, sources),
+            ],
+            check=True,
+            env=CleanEnvironment.capture().base if env is None else env,
+        )
+        report = json.loads(res.stdout.strip().splitlines()[-1])
+        return BytecodeReport(
+            wall_seconds=float(report["wall"]),
+            cpu_seconds=float(report["cpu"]),
+            workers=int(report["workers"]),
+        )
+    except (ShellError, ValueError, IndexError, KeyError) as e:
+        raise RuntimeError(f"[env] Falha ao pré-compilar bytecode: {e}") from e
+
+
+def project_sources(project_root: Path) -> list[Path]:
+    """``src/`` when present, else the project's top-level packages."""
+    src = project_root / "src"
+    if src.is_dir():
+        return [src]
+    return sorted(
+        path.parent
+        for path in project_root.glob("*/__init__.py")
+        if not path.parent.name.startswith(".")
+    )
@@ -0,0 +1,265 @@
+"""Serve CLI commands from a long-lived process over a Unix socket.
+
+A forwarded command skips importing typer and rich, and runs with the
+executable and probe caches the daemon keeps warm in memory. The daemon is
+opt-in: the client only forwards while ``api-bootstrapper daemon start`` runs.
+
+Frames are JSON lines. The client sends one request carrying its argv, cwd
+and environment; the daemon answers with ``{"out": ...}`` frames holding the
+command's output and a final ``{"exit": code}``. A client that hangs up
+interrupts its command. Only the standard library is imported here, so the
+client side stays cheap.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+import select
+import socket
+import socketserver
+import sys
+import threading
+import traceback
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager, redirect_stderr, redirect_stdout
+from pathlib import Path
+from typing import Any, TextIO
+
+from api_bootstrapper_cli import __version__
+from api_bootstrapper_cli.core import files
+
+
+SOCKET_ENV = "API_BOOTSTRAPPER_DAEMON_SOCKET"
+NO_DAEMON_ENV = "API_BOOTSTRAPPER_NO_DAEMON"
+
+FORWARDED_COMMANDS = (
+    ("bootstrap-env",),
+    ("env", "bootstrap"),
+    ("env", "status"),
+    ("add-pre-commit",),
+    ("hooks", "add-pre-commit"),
+)
+# Transcript record/replay is set up once per process (see core.shell).
+_LOCAL_ONLY_ENV = ("API_BOOTSTRAPPER_RECORD", "API_BOOTSTRAPPER_REPLAY")
+# How often a request checks whether its client hung up.
+_POLL_SECONDS = 0.1
+
+
+def socket_path() -> Path:
+    if override := os.environ.get(SOCKET_ENV):
+        return Path(override)
+    return files.user_cache_dir() / "daemon.sock"
+
+
+def forwardable(argv: Sequence[str]) -> bool:
+    if os.environ.get(NO_DAEMON_ENV) or any(map(os.environ.get, _LOCAL_ONLY_ENV)):
+        return False
+    return any(tuple(argv[: len(c)]) == c for c in FORWARDED_COMMANDS)
+
+
+def forward(
+    argv: Sequence[str], path: Path | None = None, out: TextIO | None = None
+) -> int | None:
+    """Run *argv* in the daemon and return its exit code.
+
+    ``None`` means the command should run locally: it is not served by the
+    daemon, no daemon is listening, or the daemon runs another version.
+    """
+    if not hasattr(socket, "AF_UNIX") or not forwardable(argv):
+        return None
+    out = sys.stdout if out is None else out
+    request = {
+        "version": __version__,
+        "argv": list(argv),
+        "cwd": os.getcwd(),
+        "env": dict(os.environ),
+    }
+    try:
+        sock = _connect(path or socket_path())
+    except OSError:
+        return None
+    with sock, sock.makefile("rb") as reader:
+        try:
+            sock.sendall(json.dumps(request).encode() + b"\n")
+            for line in reader:
+                frame = json.loads(line)
+                if "out" in frame:
+                    out.write(frame["out"])
+                    out.flush()
+                elif "exit" in frame:
+                    return int(frame["exit"])
+                elif "refused" in frame:
+                    return None
+        except (OSError, ValueError):
+            pass
+    out.write("Error: lost connection to the api-bootstrapper daemon\n")
+    return 1
+
+
+def ping(path: Path | None = None) -> int | None:
+    """The daemon's pid, or ``None`` when none is listening."""
+    frame = _control("ping", path)
+    return int(frame["pid"]) if frame and "pid" in frame else None
+
+
+def stop(path: Path | None = None) -> bool:
+    return _control("stop", path) is not None
+
+
+def serve(
+    run: Callable[[list[str]], int],
+    path: Path | None = None,
+    interrupt: Callable[[], None] | None = None,
+) -> None:
+    """Answer requests with *run*, one at a time, until stopped.
+
+    *run* gets the argv and returns the exit code. It borrows the process's
+    cwd, environment and stdout, which is why requests never overlap. When
+    the client hangs up, *interrupt* is called until *run* returns, so the
+    command stops instead of finishing for nobody.
+    """
+    path = path or socket_path()
+    files.ensure_dir(path.parent)
+    if ping(path) is not None:
+        raise RuntimeError(f"[daemon] Já existe um daemon escutando em {path}")
+    path.unlink(missing_ok=True)
+
+    # Only the owner may connect: requests run with the caller's environment.
+    umask = os.umask(0o177)
+    try:
+        server = DaemonServer(path, run, interrupt)
+    finally:
+        os.umask(umask)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        path.unlink(missing_ok=True)
+
+
+class DaemonServer(socketserver.UnixStreamServer):
+    def __init__(
+        self,
+        path: Path,
+        run: Callable[[list[str]], int],
+        interrupt: Callable[[], None] | None = None,
+    ) -> None:
+        self.run = run
+        self.interrupt = interrupt
+        super().__init__(str(path), _Handler)
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    server: DaemonServer
+
+    def handle(self) -> None:
+        try:
+            request = json.loads(self.rfile.readline())
+        except ValueError:
+            return
+        control = request.get("control")
+        if control == "ping":
+            self._send({"pid": os.getpid()})
+        elif control == "stop":
+            self._send({"exit": 0})
+            # shutdown() waits for serve_forever, which is running this handler.
+            threading.Thread(target=self.server.shutdown).start()
+        elif request.get("version") != __version__:
+            self._send({"refused": f"daemon runs version {__version__}"})
+        else:
+            self._send({"exit": self._run(request)})
+
+    def _run(self, request: dict[str, Any]) -> int:
+        writer = _FrameWriter(self._send)
+        done = threading.Event()
+        watcher = threading.Thread(target=self._watch_hangup, args=(done,), daemon=True)
+        watcher.start()
+        try:
+            with (
+                _client_context(request["cwd"], request["env"]),
+                redirect_stdout(writer),
+                redirect_stderr(writer),
+            ):
+                try:
+                    return self.server.run(list(request["argv"]))
+                except Exception:
+                    traceback.print_exc()
+                    return 1
+        finally:
+            done.set()
+            watcher.join()
+
+    def _watch_hangup(self, done: threading.Event) -> None:
+        """Interrupt the running command once the client disconnects."""
+        while not self._client_gone():
+            if done.is_set():
+                return
+        # Keep interrupting: the command may start another subprocess
+        # before it notices the first one died.
+        while self.server.interrupt is not None and not done.wait(_POLL_SECONDS):
+            self.server.interrupt()
+
+    def _client_gone(self) -> bool:
+        # The client sends nothing after its request, so any read is EOF
+        # or stray bytes to discard.
+        try:
+            readable, _, _ = select.select([self.connection], [], [], _POLL_SECONDS)
+            return bool(readable) and not self.connection.recv(4096)
+        except OSError:
+            return True
+
+    def _send(self, frame: dict[str, Any]) -> None:
+        try:
+            self.wfile.write(json.dumps(frame).encode() + b"\n")
+            self.wfile.flush()
+        except OSError:
+            # The client went away; _watch_hangup interrupts the command.
+            pass
+
+
+class _FrameWriter(io.TextIOBase):
+    def __init__(self, send: Callable[[dict[str, Any]], None]) -> None:
+        self._send = send
+
+    def write(self, text: str) -> int:
+        if text:
+            self._send({"out": text})
+        return len(text)
+
+
+@contextmanager
+def _client_context(cwd: str, env: dict[str, str]) -> Iterator[None]:
+    saved_cwd, saved_env = os.getcwd(), dict(os.environ)
+    os.chdir(cwd)
+    os.environ.clear()
+    os.environ.update(env)
+    try:
+        yield
+    finally:
+        os.environ.clear()
+        os.environ.update(saved_env)
+        os.chdir(saved_cwd)
+
+
+def _connect(path: Path) -> socket.socket:
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(path))
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+def _control(command: str, path: Path | None) -> dict[str, Any] | None:
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    try:
+        with _connect(path or socket_path()) as sock, sock.makefile("rb") as reader:
+            sock.sendall(json.dumps({"control": command}).encode() + b"\n")
+            frame = json.loads(reader.readline())
+    except (OSError, ValueError):
+        return None
+    return frame if isinstance(frame, dict) else None
@@ -0,0 +1,56 @@
+"""Find the Python projects in a source tree.
+
+A single ``os.scandir`` pass: entry types come from the directory listing, so
+no directory is ``stat``-ed twice, and ignored directories are never entered.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterable
+from pathlib import Path
+
+
+# Never hold projects of their own: environments, caches and build output.
+IGNORED_DIRS = frozenset(
+    {
+        "__pycache__",
+        "build",
+        "dist",
+        "env",
+        "node_modules",
+        "site-packages",
+        "venv",
+    }
+)
+
+
+def discover_projects(root: Path, ignored: Iterable[str] = IGNORED_DIRS) -> list[Path]:
+    """Every directory under *root*, itself included, holding a ``pyproject.toml``.
+
+    Hidden directories (``.venv``, ``.git``, ``.tox``...), *ignored* names and
+    virtualenvs under any name are skipped; symlinks are not followed.
+    """
+    ignored = frozenset(ignored)
+    projects: list[Path] = []
+    pending = [os.fspath(root)]
+    while pending:
+        directory = pending.pop()
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            continue
+        names = {entry.name for entry in entries}
+        if "pyvenv.cfg" in names:
+            continue
+        if "pyproject.toml" in names:
+            projects.append(Path(directory))
+        for entry in entries:
+            if (
+                entry.name.startswith(".")
+                or entry.name in ignored
+                or not entry.is_dir(follow_symlinks=False)
+            ):
+                continue
+            pending.append(entry.path)
+    return sorted(projects)
@@ -0,0 +1,85 @@
+"""The sanitized process environment handed to every toolchain command.
+
+A ``CleanEnvironment`` is captured once per run and shared by the managers.
+Each backend gets a read-only view built on first use, so commands do not copy
+``os.environ`` or re-split ``PATH`` on every call.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from functools import cached_property
+from types import MappingProxyType
+
+from api_bootstrapper_cli.core.executables import sanitized_path
+
+
+# Variables that would make tools act on the CLI's own venv instead of the
+# target project's.
+ACTIVATION_VARS = (
+    "VIRTUAL_ENV",
+    "POETRY_ACTIVE",
+    "PYTHONPATH",
+    "PYTHONHOME",
+    "PYTHONSTARTUP",
+    "PYTHONUSERBASE",
+)
+
+# Defaults that make the tools faster; an explicit value in the user's
+# environment always wins.
+DEFAULT_TUNING: Mapping[str, str] = MappingProxyType(
+    {
+        # pip otherwise checks PyPI for a newer pip on every invocation.
+        "PIP_DISABLE_PIP_VERSION_CHECK": "1",
+    }
+)
+
+# Backends that must not see pyenv shims, which redirect to other versions.
+_SHIMLESS_BACKENDS = frozenset({"poetry"})
+
+
+@dataclass(frozen=True)
+class CleanEnvironment:
+    """Immutable snapshot of the environment with venv activation removed."""
+
+    variables: Mapping[str, str]
+    tuning: Mapping[str, str] = field(default_factory=lambda: DEFAULT_TUNING)
+
+    @classmethod
+    def capture(
+        cls,
+        environ: Mapping[str, str] | None = None,
+        tuning: Mapping[str, str] | None = None,
+    ) -> CleanEnvironment:
+        source = os.environ if environ is None else environ
+        variables = {
+            key: value for key, value in source.items() if key not in ACTIVATION_VARS
+        }
+        return cls(
+            variables=MappingProxyType(variables),
+            tuning=MappingProxyType(dict(DEFAULT_TUNING if tuning is None else tuning)),
+        )
+
+    def with_tuning(self, **overrides: str) -> CleanEnvironment:
+        """Return a copy with extra knobs such as cache dirs or parallelism."""
+        return CleanEnvironment(
+            variables=self.variables,
+            tuning=MappingProxyType({**self.tuning, **overrides}),
+        )
+
+    @cached_property
+    def base(self) -> Mapping[str, str]:
+        """The shared environment: user variables plus unset tuning knobs."""
+        return MappingProxyType({**self.tuning, **self.variables})
+
+    @cached_property
+    def without_pyenv_shims(self) -> Mapping[str, str]:
+        return MappingProxyType({**self.base, "PATH": sanitized_path(self.base)})
+
+    def for_backend(self, backend: str) -> Mapping[str, str]:
+        """Return the environment for commands run by *backend*."""
+        if backend in _SHIMLESS_BACKENDS:
+            return self.without_pyenv_shims
+        return self.base
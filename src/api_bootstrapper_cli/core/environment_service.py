@@ -1,16 +1,46 @@
 from __future__ import annotations
 
-import subprocess
+import shutil
+import threading
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 
-from api_bootstrapper_cli.core import files
+from api_bootstrapper_cli.core import bytecode, files
+from api_bootstrapper_cli.core.environment_state import (
+    EnvironmentState,
+    Issue,
+    inspect_environment,
+)
+from api_bootstrapper_cli.core.journal import BootstrapJournal
+from api_bootstrapper_cli.core.profiling import profiler
 from api_bootstrapper_cli.core.protocols import (
     DependencyManager,
     EditorConfigWriter,
+    LockMode,
     Logger,
     PythonEnvironmentManager,
 )
+from api_bootstrapper_cli.core.scheduler import ScheduleReport, Step, run_steps
+from api_bootstrapper_cli.core.setup_cache import SetupResultCache
+
+
+PYTHON_TOOLING = ["pip", "setuptools", "wheel", "poetry"]
+
+# Bootstrap steps that fix each failed readiness check. Other issues (no
+# pyproject, no venv, a different Python) need the full bootstrap.
+REPAIRS: dict[Issue, tuple[str, ...]] = {
+    Issue.python_pin: ("set_local",),
+    Issue.broken_venv: (
+        "configure_venv",
+        "use_python",
+        "ensure_venv",
+        "install_dependencies",
+    ),
+    Issue.dependencies: ("install_dependencies",),
+    Issue.stale_lock: ("lock", "install_dependencies"),
+}
 
 
 @dataclass
@@ -30,40 +60,304 @@ class EnvironmentBootstrapService:
         dependency_manager: DependencyManager,
         editor_writer: EditorConfigWriter,
         logger: Logger,
+        max_workers: int | None = None,
     ):
         self._python_env = python_env_manager
         self._deps = dependency_manager
         self._editor = editor_writer
         self._logger = logger
+        self._max_workers = max_workers
+        self._journal: BootstrapJournal | None = None
+        self._resume = False
+        self._rerun: set[str] = set()
+        self._rerun_lock = threading.Lock()
+        self.last_schedule: ScheduleReport | None = None
 
     def bootstrap(
         self,
         project_root: Path,
         python_version: str,
         install_dependencies: bool = True,
+        resume: bool = True,
+        force_install: bool = False,
+        lock_mode: LockMode = LockMode.update,
+        compile_bytecode: bool = False,
     ) -> EnvironmentSetupResult:
         # Raises: ValueError if pyenv is not installed
         files.ensure_dir(project_root)
 
-        self._validate_requirements()
+        if install_dependencies:
+            # Reads files only; before any interpreter build, so a bad lock
+            # fails in moments.
+            self._deps.check_lock(project_root, lock_mode)
+
+        with profiler.span("check existing environment"):
+            state = inspect_environment(project_root)
+            issues = state.diagnose(
+                python_version, check_dependencies=install_dependencies
+            )
+            ready = not issues and not force_install and not compile_bytecode
+            # A ready environment with a saved result needs no tool at all.
+            if ready and (cached := self._cached_result(project_root, python_version)):
+                self._logger.info("environment already configured")
+                self._logger.success("environment ready")
+                return cached
+
+        with profiler.span("validate requirements"):
+            self._validate_requirements()
 
-        if self._is_environment_ready(project_root, python_version):
+        if ready:
             self._logger.info("environment already configured")
             return self._get_existing_environment_result(project_root, python_version)
+        repair = self._repair_plan(
+            state, issues, install_dependencies, force_install, compile_bytecode
+        )
 
-        python_path = self._setup_python_environment(project_root, python_version)
-        self._install_python_dependencies(python_version)
-        self._ensure_pyproject_exists(project_root, python_version)
+        self._journal = BootstrapJournal.for_project(project_root)
+        self._resume = resume
+        self._rerun = set()
+        if not resume:
+            self._journal.clear()
 
-        result = self._setup_dependency_environment(
+        steps = self._bootstrap_steps(
             project_root,
-            python_path,
             python_version,
             install_dependencies,
+            force_install,
+            lock_mode,
+            compile_bytecode,
+            relock=Issue.stale_lock in issues,
         )
+        if repair is not None:
+            if issues:
+                self._logger.info(
+                    f"[env] Repairing: {'; '.join(issue.value for issue in issues)}"
+                )
+            if Issue.broken_venv in issues:
+                self._discard_venv(project_root)
+            steps = _subgraph(steps, repair)
+
+        schedule = run_steps(steps, self._max_workers)
+        self.last_schedule = schedule
+        self._journal.clear()
+
+        dep_mgr = getattr(self._deps, "name", "deps")
+        venv_path = self._deps.get_venv_path(project_root)
+        self._logger.success(f"[{dep_mgr}] Virtual environment ready: {venv_path}")
 
+        result = EnvironmentSetupResult(
+            python_version=python_version,
+            python_path=Path(schedule.results["python_path"]),
+            venv_path=venv_path,
+            venv_python=self._deps.get_venv_python(project_root),
+            editor_config_path=schedule.results.get(
+                "vscode_config", project_root / ".vscode" / "settings.json"
+            ),
+            has_poetry_project=True,
+        )
+        self._save_result(project_root, result)
         return result
 
+    def _bootstrap_steps(
+        self,
+        project_root: Path,
+        python_version: str,
+        install_dependencies: bool,
+        force_install: bool = False,
+        lock_mode: LockMode = LockMode.update,
+        compile_bytecode: bool = False,
+        relock: bool = False,
+    ) -> list[Step]:
+        """The bootstrap as a graph; each step lists the steps it needs.
+
+        Dependency-manager commands run in the project, where ``pyenv which
+        poetry`` follows ``.python-version`` to the tooling installed into the
+        new interpreter, so they wait for ``set_local`` and ``python_tooling``;
+        that includes ``poetry lock``. ``uv lock`` is the exception: uv is
+        found without the project's pyenv version, so it only needs pyproject
+        and overlaps with the interpreter build. ``lock`` re-resolves an
+        existing lock when the Python constraint changed or *relock* is set.
+        A frozen or locked install leaves pyproject and the lock file
+        untouched.
+        """
+        dep_mgr = getattr(self._deps, "name", "deps")
+        update_lock = lock_mode == LockMode.update
+
+        def files_state(_: Mapping[str, Any]) -> dict[str, Any]:
+            return self._project_files_state(project_root, python_version)
+
+        def venv_python_exists() -> bool:
+            return self._deps.get_venv_python(project_root).exists()
+
+        steps = [
+            self._step(
+                "ensure_python",
+                lambda _: self._ensure_python(python_version),
+                inputs=lambda _: {"version": python_version},
+            ),
+            self._step(
+                "set_local",
+                lambda _: self._set_local(project_root, python_version),
+                after=("ensure_python",),
+                inputs=lambda _: {
+                    "version": python_version,
+                    "python_version_file": files.sha256_file(
+                        project_root / ".python-version"
+                    ),
+                },
+            ),
+            self._step(
+                "python_path",
+                lambda _: self._get_python_path(python_version),
+                after=("ensure_python",),
+                inputs=lambda _: {"version": python_version},
+                valid=lambda path: isinstance(path, str) and Path(path).exists(),
+            ),
+            self._step(
+                "python_tooling",
+                lambda _: self._install_python_tooling(python_version),
+                # Reuses the cached ``pyenv prefix`` instead of racing it.
+                after=("python_path",),
+                inputs=lambda _: {
+                    "version": python_version,
+                    "packages": PYTHON_TOOLING,
+                },
+            ),
+            self._step(
+                "pyproject",
+                lambda _: self._ensure_pyproject_exists(
+                    project_root, python_version, update_lock
+                ),
+                inputs=lambda _: {
+                    "version": python_version,
+                    "pyproject": files.sha256_file(project_root / "pyproject.toml"),
+                },
+            ),
+            self._step(
+                "lock",
+                lambda results: self._lock(
+                    project_root,
+                    update_lock and (relock or bool(results.get("pyproject"))),
+                    install_dependencies and update_lock,
+                ),
+                after=(
+                    ("pyproject",)
+                    if self._lock_file_name() == "uv.lock"
+                    else ("pyproject", "set_local", "python_tooling")
+                ),
+                inputs=lambda _: {
+                    "pyproject": files.sha256_file(project_root / "pyproject.toml"),
+                    "lock": files.sha256_file(project_root / self._lock_file_name()),
+                    "relock": relock,
+                },
+            ),
+            self._step(
+                "vscode_config",
+                lambda _: self._write_editor_config(project_root),
+            ),
+            self._step(
+                "configure_venv",
+                lambda _: self._configure_venv(project_root),
+                after=("set_local", "python_tooling", "pyproject"),
+                inputs=lambda _: {
+                    "manager": dep_mgr,
+                    "poetry_toml": files.sha256_file(project_root / "poetry.toml"),
+                },
+            ),
+            self._step(
+                "use_python",
+                lambda results: self._use_python(
+                    project_root, Path(results["python_path"])
+                ),
+                after=("python_path", "configure_venv"),
+                inputs=lambda results: {
+                    "python_path": results["python_path"],
+                    "venv_python": venv_python_exists(),
+                },
+            ),
+            self._step(
+                "ensure_venv",
+                lambda _: self._ensure_venv(project_root),
+                after=("use_python",),
+            ),
+        ]
+        if install_dependencies:
+            steps.append(
+                self._step(
+                    "install_dependencies",
+                    lambda _: self._install_dependencies(
+                        project_root, force_install, lock_mode
+                    ),
+                    after=("ensure_venv", "lock"),
+                    inputs=lambda results: {
+                        **files_state(results),
+                        "venv_python": venv_python_exists(),
+                        "force": force_install,
+                        "lock_mode": lock_mode.value,
+                    },
+                )
+            )
+        if compile_bytecode:
+            steps.append(
+                self._step(
+                    "compile_bytecode",
+                    lambda _: self._compile_bytecode(project_root),
+                    after=(
+                        ("install_dependencies",)
+                        if install_dependencies
+                        else ("ensure_venv",)
+                    ),
+                )
+            )
+        return steps
+
+    def _step(
+        self,
+        name: str,
+        action: Callable[[Mapping[str, Any]], Any],
+        after: tuple[str, ...] = (),
+        inputs: Callable[[Mapping[str, Any]], dict[str, Any]] | None = None,
+        valid: Callable[[Any], bool] | None = None,
+    ) -> Step:
+        """Wrap *action* so the journal can skip it on resume.
+
+        A step with *inputs* is skipped when the journal shows it done with the
+        same inputs and none of the steps it depends on re-ran. *inputs* is
+        evaluated again after the step so it can describe the state the step
+        produced. Steps without *inputs* always run.
+        """
+
+        def run(results: Mapping[str, Any]) -> Any:
+            journal = self._journal
+            upstream_rerun = bool(self._rerun.intersection(after))
+            if inputs is None:
+                if upstream_rerun:
+                    self._mark_rerun(name)
+                return action(results)
+
+            if (
+                journal is not None
+                and self._resume
+                and not upstream_rerun
+                and journal.completed(name, inputs(results))
+            ):
+                result = journal.result(name)
+                if valid is None or valid(result):
+                    self._logger.info(f"[resume] {name} already done, skipping")
+                    return result
+
+            self._mark_rerun(name)
+            result = action(results)
+            if journal is not None:
+                journal.record(name, inputs(results), result)
+            return result
+
+        return Step(name, run, after)
+
+    def _mark_rerun(self, name: str) -> None:
+        with self._rerun_lock:
+            self._rerun.add(name)
+
     def _validate_requirements(self) -> None:
         python_mgr = getattr(self._python_env, "name", "python environment manager")
         if not self._python_env.is_installed():
@@ -74,49 +368,43 @@ class EnvironmentBootstrapService:
         if not self._deps.is_installed():
             raise ValueError(f"{dep_mgr} not found in PATH. Install {dep_mgr} first.")
 
-    def _is_environment_ready(self, project_root: Path, python_version: str) -> bool:
-        venv_path = project_root / ".venv"
-        pyproject_path = project_root / "pyproject.toml"
-        python_version_file = project_root / ".python-version"
-
-        if not (
-            venv_path.exists()
-            and pyproject_path.exists()
-            and python_version_file.exists()
-        ):
-            return False
-
-        try:
-            existing_version = python_version_file.read_text().strip()
-            if existing_version != python_version:
-                return False
-        except Exception:
-            return False
-
-        venv_python = venv_path / "bin" / "python"
-        if not venv_python.exists():
-            return False
-
-        try:
-            version_parts = python_version.split(".")
-            expected_major_minor = f"{version_parts[0]}.{version_parts[1]}"
-            result = subprocess.run(
-                [str(venv_python), "--version"],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            # Output format: "Python X.Y.Z"
-            venv_version_str = result.stdout.strip() or result.stderr.strip()
-            if not venv_version_str.startswith("Python "):
-                return False
-            venv_major_minor = ".".join(venv_version_str.split()[1].split(".")[:2])
-            if venv_major_minor != expected_major_minor:
-                return False
-        except Exception:
-            return False
-
-        return True
+    def _repair_plan(
+        self,
+        state: EnvironmentState,
+        issues: list[Issue],
+        install_dependencies: bool,
+        force_install: bool,
+        compile_bytecode: bool = False,
+    ) -> set[str] | None:
+        """The steps that fix *issues*, or ``None`` when only a full run will do.
+
+        Repairs reuse the interpreter the venv was built from, so they need a
+        readable ``pyvenv.cfg`` whose ``home`` still exists. ``ensure_python``
+        and ``python_path`` stay in the plan; both are cached probes when the
+        interpreter is installed.
+        """
+        if any(issue not in REPAIRS for issue in issues):
+            return None
+        venv = state.venv
+        if venv is None or venv.home is None or not venv.home.is_dir():
+            return None
+
+        plan = {"ensure_python", "python_path"}
+        for issue in issues:
+            plan.update(REPAIRS[issue])
+        if force_install:
+            plan.add("install_dependencies")
+        if not install_dependencies:
+            plan.discard("install_dependencies")
+        if compile_bytecode:
+            plan.add("compile_bytecode")
+        return plan
+
+    def _discard_venv(self, project_root: Path) -> None:
+        venv_path = self._deps.get_venv_path(project_root)
+        dep_mgr = getattr(self._deps, "name", "deps")
+        self._logger.info(f"[{dep_mgr}] Removing broken virtual environment")
+        shutil.rmtree(venv_path, ignore_errors=True)
 
     def _get_existing_environment_result(
         self,
@@ -130,7 +418,7 @@ class EnvironmentBootstrapService:
 
         self._logger.success("environment ready")
 
-        return EnvironmentSetupResult(
+        result = EnvironmentSetupResult(
             python_version=python_version,
             python_path=python_path,
             venv_path=venv_path,
@@ -138,35 +426,102 @@ class EnvironmentBootstrapService:
             editor_config_path=vscode_settings,
             has_poetry_project=True,
         )
+        self._save_result(project_root, result)
+        return result
 
-    def _setup_python_environment(
-        self,
-        project_root: Path,
-        python_version: str,
-    ) -> Path:
+    def _result_cache(self, project_root: Path) -> SetupResultCache:
+        return SetupResultCache.in_venv(self._deps.get_venv_path(project_root))
+
+    def _result_fingerprint(
+        self, project_root: Path, python_version: str
+    ) -> dict[str, Any]:
+        """What the result depends on beyond the readiness checks."""
+        venv_path = self._deps.get_venv_path(project_root)
+        return {
+            "python_version": python_version,
+            "python_manager": getattr(self._python_env, "name", "python"),
+            "dependency_manager": getattr(self._deps, "name", "deps"),
+            "interpreter": files.sha256_file(venv_path / "pyvenv.cfg"),
+        }
+
+    def _cached_result(
+        self, project_root: Path, python_version: str
+    ) -> EnvironmentSetupResult | None:
+        data = self._result_cache(project_root).load(
+            self._result_fingerprint(project_root, python_version)
+        )
+        if data is None:
+            return None
+        try:
+            result = EnvironmentSetupResult(
+                python_version=data["python_version"],
+                python_path=Path(data["python_path"]),
+                venv_path=_optional_path(data["venv_path"]),
+                venv_python=_optional_path(data["venv_python"]),
+                editor_config_path=Path(data["editor_config_path"]),
+                has_poetry_project=bool(data["has_poetry_project"]),
+            )
+        except (KeyError, TypeError):
+            return None
+        # The base interpreter may have been uninstalled since.
+        return result if result.python_path.exists() else None
+
+    def _save_result(self, project_root: Path, result: EnvironmentSetupResult) -> None:
+        fingerprint = self._result_fingerprint(project_root, result.python_version)
+        if fingerprint["interpreter"] is None:
+            return
+        self._result_cache(project_root).store(
+            fingerprint,
+            {
+                "python_version": result.python_version,
+                "python_path": str(result.python_path),
+                "venv_path": _optional_str(result.venv_path),
+                "venv_python": _optional_str(result.venv_python),
+                "editor_config_path": str(result.editor_config_path),
+                "has_poetry_project": result.has_poetry_project,
+            },
+        )
+
+    def _ensure_python(self, python_version: str) -> None:
         self._logger.info(f"[bold][env] Setting up Python {python_version}[/bold]")
         self._python_env.ensure_python(python_version)
 
+    def _set_local(self, project_root: Path, python_version: str) -> None:
         self._logger.info("[env] Configuring pyenv local version")
         self._python_env.set_local(project_root, python_version)
 
+    def _get_python_path(self, python_version: str) -> str:
         python_path = self._python_env.get_python_path(python_version)
         self._logger.success(f"[env] Python configured: {python_path}")
+        return str(python_path)
 
-        return python_path
-
-    def _install_python_dependencies(self, python_version: str) -> None:
+    def _install_python_tooling(self, python_version: str) -> None:
         self._logger.info("[bold][env] Installing Python tooling[/bold]")
-        self._python_env.install_pip_packages(
-            python_version,
-            ["pip", "setuptools", "wheel", "poetry"],
-        )
+        self._python_env.install_pip_packages(python_version, PYTHON_TOOLING)
         self._logger.success("[env] Python tooling installed")
 
-    def _ensure_pyproject_exists(self, project_root: Path, python_version: str) -> None:
+    def _project_files_state(
+        self, project_root: Path, python_version: str
+    ) -> dict[str, Any]:
+        return {
+            "version": python_version,
+            "pyproject": files.sha256_file(project_root / "pyproject.toml"),
+            "poetry_lock": files.sha256_file(project_root / "poetry.lock"),
+            "uv_lock": files.sha256_file(project_root / "uv.lock"),
+        }
+
+    def _ensure_pyproject_exists(
+        self,
+        project_root: Path,
+        python_version: str,
+        update_constraint: bool = True,
+    ) -> bool:
+        """Create or update pyproject; return whether the Python constraint changed."""
         dep_mgr = getattr(self._deps, "name", "deps")
         use_pep621 = dep_mgr == "uv"
         pyproject_path = project_root / "pyproject.toml"
+        if not update_constraint and pyproject_path.exists():
+            return False
 
         if not pyproject_path.exists():
             self._logger.info(f"[{dep_mgr}] Creating minimal pyproject.toml")
@@ -176,67 +531,125 @@ class EnvironmentBootstrapService:
                 use_pep621=use_pep621,
             )
             self._logger.success(f"[{dep_mgr}] Created {pyproject_path}")
-        else:
-            updated = files.update_python_constraint(pyproject_path, python_version)
-            if updated:
-                version_parts = python_version.split(".")
-                major_minor = f"{version_parts[0]}.{version_parts[1]}"
-                constraint = f">={major_minor}" if use_pep621 else f"^{major_minor}"
-                self._logger.info(
-                    f"[{dep_mgr}] Updated Python constraint to {constraint}"
-                )
+            return False
 
-                lock_file_name = "uv.lock" if use_pep621 else "poetry.lock"
-                lock_file = project_root / lock_file_name
-                if lock_file.exists():
-                    self._logger.info(f"[{dep_mgr}] Removing old {lock_file_name}")
-                    try:
-                        lock_file.unlink()
-                    except OSError as e:
-                        self._logger.warning(
-                            f"[{dep_mgr}] Could not remove {lock_file_name}: {e}. "
-                            "Remove it manually before proceeding."
-                        )
-
-    def _setup_dependency_environment(
-        self,
-        project_root: Path,
-        python_path: Path,
-        python_version: str,
-        install_dependencies: bool,
-    ) -> EnvironmentSetupResult:
+        updated = files.update_python_constraint(pyproject_path, python_version)
+        if updated:
+            version_parts = python_version.split(".")
+            major_minor = f"{version_parts[0]}.{version_parts[1]}"
+            constraint = f">={major_minor}" if use_pep621 else f"^{major_minor}"
+            self._logger.info(f"[{dep_mgr}] Updated Python constraint to {constraint}")
+        return updated
+
+    def _lock_file_name(self) -> str:
+        return (
+            "uv.lock" if getattr(self._deps, "name", "deps") == "uv" else "poetry.lock"
+        )
+
+    def _lock(self, project_root: Path, outdated: bool, resolve: bool) -> None:
+        """Resolve while the interpreter is still being provisioned.
+
+        Resolution needs only pyproject's declared Python, so this step does
+        not wait for ``ensure_python``; the install that follows finds the
+        lock up to date. An existing lock is only updated when *outdated*, a
+        missing one only resolved when *resolve* is set.
+        """
+        lock_file = project_root / self._lock_file_name()
+        if lock_file.exists():
+            if not outdated:
+                return
+            self._relock(project_root, lock_file)
+            if lock_file.exists():
+                return
+        if not resolve:
+            return
+        dep_mgr = getattr(self._deps, "name", "deps")
+        self._logger.info(f"[{dep_mgr}] Resolving dependencies")
+        self._deps.lock(project_root)
+
+    def _relock(self, project_root: Path, lock_file: Path) -> None:
+        """Keep existing pins where pyproject allows; else drop the lock."""
+        dep_mgr = getattr(self._deps, "name", "deps")
+        self._logger.info(f"[{dep_mgr}] Updating {lock_file.name}")
+        try:
+            self._deps.relock(project_root)
+            return
+        except RuntimeError as e:
+            self._logger.warning(f"[{dep_mgr}] Could not update {lock_file.name}: {e}")
+
+        self._logger.info(f"[{dep_mgr}] Removing old {lock_file.name}")
+        try:
+            lock_file.unlink()
+        except OSError as e:
+            self._logger.warning(
+                f"[{dep_mgr}] Could not remove {lock_file.name}: {e}. "
+                "Remove it manually before proceeding."
+            )
+
+    def _configure_venv(self, project_root: Path) -> None:
         dep_mgr = getattr(self._deps, "name", "deps")
         self._logger.info(f"[bold][{dep_mgr}] Configuring {dep_mgr} environment[/bold]")
         self._deps.configure_venv(project_root)
 
+    def _use_python(self, project_root: Path, python_path: Path) -> None:
+        dep_mgr = getattr(self._deps, "name", "deps")
         self._logger.info(f"[{dep_mgr}] Linking to Python version")
         self._deps.use_python(project_root, python_path)
 
-        venv_path_dir = self._deps.get_venv_path(project_root)
-        if not venv_path_dir.exists():
+    def _ensure_venv(self, project_root: Path) -> None:
+        if not self._deps.get_venv_path(project_root).exists():
+            dep_mgr = getattr(self._deps, "name", "deps")
             self._logger.info(f"[{dep_mgr}] Creating virtual environment")
             self._deps.ensure_venv(project_root)
 
-        if install_dependencies:
-            self._logger.info(
-                f"[bold][{dep_mgr}] Installing project dependencies[/bold]"
+    def _install_dependencies(
+        self,
+        project_root: Path,
+        force: bool = False,
+        lock_mode: LockMode = LockMode.update,
+    ) -> None:
+        dep_mgr = getattr(self._deps, "name", "deps")
+        self._logger.info(f"[bold][{dep_mgr}] Installing project dependencies[/bold]")
+        self._deps.install_dependencies(project_root, force=force, lock_mode=lock_mode)
+
+    def _compile_bytecode(self, project_root: Path) -> None:
+        """Best effort: a failure only leaves compilation to the first imports."""
+        self._logger.info("[env] Precompiling bytecode")
+        try:
+            report = bytecode.compile_bytecode(
+                self._deps.get_venv_python(project_root),
+                bytecode.project_sources(project_root),
             )
-            self._deps.install_dependencies(project_root)
+        except RuntimeError as e:
+            self._logger.warning(str(e))
+            return
+        self._logger.success(
+            f"[env] Bytecode precompiled in {report.wall_seconds:.1f}s "
+            f"on {report.workers} workers; first imports skip "
+            f"{report.cpu_seconds:.1f}s of compilation"
+        )
 
-        venv_path = self._deps.get_venv_path(project_root)
+    def _write_editor_config(self, project_root: Path) -> Path:
+        # The venv interpreter path is known before the venv exists.
         venv_python = self._deps.get_venv_python(project_root)
-
-        self._logger.success(f"[{dep_mgr}] Virtual environment ready: {venv_path}")
-
         self._logger.info("[vscode] Writing VSCode configuration")
         editor_config = self._editor.write_config(project_root, venv_python)
         self._logger.success(f"[vscode] VSCode configured: {editor_config}")
+        return editor_config
 
-        return EnvironmentSetupResult(
-            python_version=python_version,
-            python_path=python_path,
-            venv_path=venv_path,
-            venv_python=venv_python,
-            editor_config_path=editor_config,
-            has_poetry_project=True,
-        )
+
+def _subgraph(steps: list[Step], names: set[str]) -> list[Step]:
+    """The steps in *names*, with edges to steps outside it dropped."""
+    return [
+        Step(step.name, step.run, tuple(dep for dep in step.after if dep in names))
+        for step in steps
+        if step.name in names
+    ]
+
+
+def _optional_path(value: str | None) -> Path | None:
+    return None if value is None else Path(value)
+
+
+def _optional_str(path: Path | None) -> str | None:
+    return None if path is None else str(path)
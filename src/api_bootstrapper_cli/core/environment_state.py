@@ -0,0 +1,243 @@
+"""Read a project's environment state from the filesystem alone.
+
+Everything here is answered from files the tools leave behind — ``pyvenv.cfg``,
+``.python-version``, ``pyproject.toml``, lock files and ``*.dist-info``
+directories — so inspecting a project never starts an interpreter.
+"""
+
+from __future__ import annotations
+
+import enum
+import re
+import tomllib
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any
+
+from api_bootstrapper_cli.core import files
+from api_bootstrapper_cli.core.install_stamp import InstallStamp
+from api_bootstrapper_cli.core.lock_files import (
+    poetry_lock_is_current,
+    uv_lock_is_current,
+)
+from api_bootstrapper_cli.core.protocols import ManagerChoice
+
+
+LOCK_FILES = ("poetry.lock", "uv.lock")
+
+_DIST_INFO = re.compile(r"^(?P<name>.+?)-(?P<version>[^-]+)\.dist-info$")
+
+
+class Issue(str, enum.Enum):
+    """A failed readiness check; the bootstrap service maps each to a repair."""
+
+    missing_pyproject = "pyproject.toml is missing"
+    python_pin = ".python-version does not match"
+    missing_venv = "virtualenv is missing"
+    broken_venv = "virtualenv is broken"
+    venv_version = "virtualenv uses another Python version"
+    dependencies = "dependencies are not in sync with the lock file"
+    stale_lock = "lock file is out of date with pyproject.toml"
+
+
+@dataclass(frozen=True)
+class VenvState:
+    path: Path
+    python: Path
+    # From pyvenv.cfg: "3.12.3"; ``None`` when the file does not record it.
+    version: str | None
+    home: Path | None
+    site_packages: Path | None
+    cfg_hash: str | None = None
+    install_stamp: Mapping[str, Any] | None = None
+
+    @property
+    def major_minor(self) -> str | None:
+        return major_minor(self.version) if self.version else None
+
+
+@dataclass(frozen=True)
+class EnvironmentState:
+    project_root: Path
+    python_pin: str | None
+    pyproject: Mapping[str, Any] | None
+    pyproject_hash: str | None
+    lock_hashes: Mapping[str, str] = field(default_factory=lambda: MappingProxyType({}))
+    venv: VenvState | None = None
+    installed: Mapping[str, str] = field(default_factory=lambda: MappingProxyType({}))
+
+    @property
+    def has_pyproject(self) -> bool:
+        return self.pyproject is not None
+
+    @property
+    def manager(self) -> ManagerChoice:
+        """Backend implied by ``pyproject.toml``: Poetry tables win over PEP 621."""
+        if not self.pyproject:
+            return ManagerChoice.pyenv
+        if "poetry" in self.pyproject.get("tool", {}):
+            return ManagerChoice.pyenv
+        if "project" in self.pyproject:
+            return ManagerChoice.uv
+        return ManagerChoice.pyenv
+
+    @property
+    def dependencies_synced(self) -> bool:
+        """Whether the venv's install stamp matches pyproject, lock and interpreter."""
+        stamp = self.venv.install_stamp if self.venv else None
+        if not stamp or self.venv is None:
+            return False
+        return (
+            stamp.get("pyproject") == self.pyproject_hash
+            and stamp.get("lock") is not None
+            and stamp.get("lock") == self.lock_hashes.get(stamp.get("lock_file", ""))
+            and stamp.get("interpreter") == self.venv.cfg_hash
+        )
+
+    @property
+    def lock_outdated(self) -> bool:
+        """Whether pyproject changed since the last install and the lock lags it.
+
+        Judged only once the stamp's pyproject differs, so a lock the local
+        check misreads is re-resolved at most once per pyproject edit.
+        """
+        stamp = self.venv.install_stamp if self.venv else None
+        if not stamp or stamp.get("pyproject") == self.pyproject_hash:
+            return False
+        lock_file = stamp.get("lock_file")
+        if lock_file not in self.lock_hashes:
+            return False
+        is_current = (
+            uv_lock_is_current if lock_file == "uv.lock" else poetry_lock_is_current
+        )
+        return not is_current(self.project_root)
+
+    def is_ready_for(self, python_version: str) -> bool:
+        """True when the pin, the pyproject and the venv all match *python_version*."""
+        return not self.diagnose(python_version, check_dependencies=False)
+
+    def diagnose(
+        self, python_version: str, check_dependencies: bool = True
+    ) -> list[Issue]:
+        """Every readiness check that fails for *python_version*."""
+        issues: list[Issue] = []
+        if not self.has_pyproject:
+            issues.append(Issue.missing_pyproject)
+        if self.python_pin != python_version:
+            issues.append(Issue.python_pin)
+        if self.venv is None:
+            if (self.project_root / ".venv").is_dir():
+                issues.append(Issue.broken_venv)
+            else:
+                issues.append(Issue.missing_venv)
+            return issues
+        if not self.venv.python.exists():
+            issues.append(Issue.broken_venv)
+        elif self.venv.major_minor != major_minor(python_version):
+            issues.append(Issue.venv_version)
+        elif check_dependencies and not self.dependencies_synced:
+            issues.append(
+                Issue.stale_lock if self.lock_outdated else Issue.dependencies
+            )
+        return issues
+
+
+def inspect_environment(project_root: Path) -> EnvironmentState:
+    pyproject_path = project_root / "pyproject.toml"
+    lock_hashes = {
+        name: digest
+        for name in LOCK_FILES
+        if (digest := files.sha256_file(project_root / name)) is not None
+    }
+    venv = _inspect_venv(project_root / ".venv")
+    return EnvironmentState(
+        project_root=project_root,
+        python_pin=_read_pin(project_root / ".python-version"),
+        pyproject=_read_toml(pyproject_path),
+        pyproject_hash=files.sha256_file(pyproject_path),
+        lock_hashes=MappingProxyType(lock_hashes),
+        venv=venv,
+        installed=MappingProxyType(
+            _installed_distributions(venv.site_packages) if venv else {}
+        ),
+    )
+
+
+def major_minor(version: str) -> str:
+    return ".".join(version.split(".")[:2])
+
+
+def _read_pin(path: Path) -> str | None:
+    try:
+        lines = files.read_text(path).split()
+    except (OSError, UnicodeDecodeError):
+        return None
+    return lines[0] if lines else None
+
+
+def _read_toml(path: Path) -> dict[str, Any] | None:
+    try:
+        with path.open("rb") as f:
+            return tomllib.load(f)
+    except OSError:
+        return None
+    except tomllib.TOMLDecodeError:
+        # Present but unparsable: still a project, with nothing we can read.
+        return {}
+
+
+def _inspect_venv(venv: Path) -> VenvState | None:
+    try:
+        cfg = _read_pyvenv_cfg(venv / "pyvenv.cfg")
+    except (OSError, UnicodeDecodeError):
+        return None
+    # venv writes "version", virtualenv and uv "version_info" (3.12.3.final.0).
+    version = cfg.get("version") or cfg.get("version_info")
+    if version:
+        version = ".".join(version.split(".")[:3])
+    home = cfg.get("home")
+    python = venv / "Scripts" / "python.exe"
+    if not python.exists():
+        python = venv / "bin" / "python"
+    return VenvState(
+        path=venv,
+        python=python,
+        version=version,
+        home=Path(home) if home else None,
+        site_packages=_site_packages(venv),
+        cfg_hash=files.sha256_file(venv / "pyvenv.cfg"),
+        install_stamp=InstallStamp.in_venv(venv).read(),
+    )
+
+
+def _read_pyvenv_cfg(path: Path) -> dict[str, str]:
+    cfg: dict[str, str] = {}
+    for line in files.read_text(path).splitlines():
+        key, sep, value = line.partition("=")
+        if sep:
+            cfg[key.strip().lower()] = value.strip()
+    return cfg
+
+
+def _site_packages(venv: Path) -> Path | None:
+    if (windows := venv / "Lib" / "site-packages").is_dir():
+        return windows
+    return next((venv / "lib").glob("python*/site-packages"), None)
+
+
+def _installed_distributions(site_packages: Path | None) -> dict[str, str]:
+    """Name → version for each ``*.dist-info`` directory, from the names alone."""
+    if site_packages is None:
+        return {}
+    installed: dict[str, str] = {}
+    try:
+        entries = list(site_packages.iterdir())
+    except OSError:
+        return {}
+    for entry in entries:
+        if match := _DIST_INFO.match(entry.name):
+            name = re.sub(r"[-_.]+", "-", match["name"]).lower()
+            installed[name] = match["version"]
+    return dict(sorted(installed.items()))
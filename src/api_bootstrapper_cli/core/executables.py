@@ -0,0 +1,128 @@
+"""Shared resolution of the toolchain executables (pyenv, Poetry, uv).
+
+Every manager asks this module for the binary to run, so a bootstrap uses the
+same ``poetry`` everywhere and each tool is looked up once per process.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import threading
+from collections.abc import Mapping
+from pathlib import Path
+
+from api_bootstrapper_cli.core.shell import ShellError, exec_cmd
+
+
+# Tools that pyenv can provide per Python version (pip-installed into it).
+_PYENV_PROVIDED = frozenset({"poetry"})
+
+_cache: dict[tuple[str, str, str | None], str] = {}
+# One lookup per key at a time; concurrent steps wait for its answer.
+_searching: dict[tuple[str, str, str | None], threading.Lock] = {}
+_lock = threading.Lock()
+
+
+def sanitized_path(env: Mapping[str, str] | None = None) -> str:
+    """Return ``PATH`` without pyenv shims, which redirect to other versions."""
+    environ = os.environ if env is None else env
+    return os.pathsep.join(
+        entry
+        for entry in environ.get("PATH", "").split(os.pathsep)
+        if entry and ".pyenv/shims" not in entry
+    )
+
+
+def resolve_executable(
+    name: str,
+    env: Mapping[str, str] | None = None,
+    project_root: Path | None = None,
+) -> str:
+    """Return the absolute path of *name*, or *name* itself if it is not found.
+
+    The search ignores pyenv shims. Results are cached per ``PATH`` (and, for
+    tools installed inside pyenv versions, per selected pyenv version).
+    """
+    environ = os.environ if env is None else env
+    version = _pyenv_version(environ, project_root) if name in _PYENV_PROVIDED else None
+    key = (name, environ.get("PATH", ""), version)
+
+    with _lock:
+        cached = _cache.get(key)
+        searching = _searching.setdefault(key, threading.Lock())
+    if cached is not None:
+        return cached
+
+    with searching:
+        with _lock:
+            cached = _cache.get(key)
+        if cached is not None:
+            return cached
+        clean_env = {**environ, "PATH": sanitized_path(environ)}
+        resolved = _search(name, clean_env, project_root) or name
+        with _lock:
+            _cache[key] = resolved
+    return resolved
+
+
+def clear_executable_cache() -> None:
+    with _lock:
+        _cache.clear()
+        _searching.clear()
+
+
+def _search(name: str, env: Mapping[str, str], project_root: Path | None) -> str | None:
+    if name in _PYENV_PROVIDED:
+        try:
+            result = exec_cmd(
+                [resolve_executable("pyenv", env), "which", name],
+                check=True,
+                env=dict(env),
+                cwd=str(project_root) if project_root else None,
+                cache=True,
+                cache_watch=_pyenv_version_files(env, project_root),
+            )
+            candidate = result.stdout.strip()
+            if candidate and Path(candidate).exists():
+                return candidate
+        except (ShellError, FileNotFoundError):
+            pass
+
+    return shutil.which(name, path=env.get("PATH"))
+
+
+def pyenv_root(env: Mapping[str, str] | None = None) -> Path:
+    """Return ``$PYENV_ROOT`` (pyenv's default is ``~/.pyenv``)."""
+    environ = os.environ if env is None else env
+    return Path(environ.get("PYENV_ROOT") or Path.home() / ".pyenv")
+
+
+def _pyenv_version(env: Mapping[str, str], project_root: Path | None) -> str | None:
+    """Read the pyenv version selection the way pyenv does, without spawning it."""
+    if selected := env.get("PYENV_VERSION"):
+        return selected
+    if project_root is not None:
+        for directory in (project_root, *project_root.parents):
+            version_file = directory / ".python-version"
+            if version_file.is_file():
+                return _read_version_file(version_file)
+    global_file = pyenv_root(env) / "version"
+    return _read_version_file(global_file) if global_file.is_file() else None
+
+
+def _read_version_file(path: Path) -> str | None:
+    try:
+        return " ".join(path.read_text(encoding="utf-8").split()) or None
+    except OSError:
+        return None
+
+
+def _pyenv_version_files(
+    env: Mapping[str, str], project_root: Path | None
+) -> list[Path]:
+    """Files that decide which Python ``pyenv which`` looks into."""
+    watch = [pyenv_root(env) / "version", pyenv_root(env) / "versions"]
+    if project_root is not None:
+        watch.append(project_root / ".python-version")
+    return watch
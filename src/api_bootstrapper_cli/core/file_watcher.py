@@ -0,0 +1,179 @@
+"""Wait for changes to a few files in one directory.
+
+On Linux the directory is watched with inotify, loaded through ctypes;
+elsewhere, or when inotify is unavailable, the files are polled. Editors often
+save by renaming a temp file over the original, so the directory is watched
+rather than the files. A change is only reported when a file's content hash
+differs from the last one seen, and a burst of edits is debounced into a
+single change set.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from types import TracebackType
+
+from api_bootstrapper_cli.core import files
+
+
+_IN_MODIFY = 0x002
+_IN_CLOSE_WRITE = 0x008
+_IN_MOVED_FROM = 0x040
+_IN_MOVED_TO = 0x080
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+_IN_MASK = (
+    _IN_MODIFY
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+)
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = getattr(os, "O_CLOEXEC", 0)
+# struct inotify_event: int wd; uint32 mask, cookie, len; char name[len]
+_EVENT = struct.Struct("iIII")
+
+
+class FileWatcher:
+    def __init__(
+        self,
+        directory: Path,
+        names: Iterable[str],
+        debounce: float = 0.5,
+        poll_interval: float = 1.0,
+        use_inotify: bool = True,
+    ) -> None:
+        self._directory = directory
+        self._names = frozenset(names)
+        self._debounce = debounce
+        self._poll_interval = poll_interval
+        self._fd = _inotify_watch(directory) if use_inotify else None
+        # Last reported content, and (polling) last content seen.
+        self._hashes: dict[str, str | None] = {}
+        self._seen: dict[str, str | None] = {}
+        self.rebaseline()
+
+    @property
+    def backend(self) -> str:
+        return "inotify" if self._fd is not None else "polling"
+
+    def rebaseline(self) -> set[str]:
+        """Take the files' current content as unchanged, e.g. after writing them.
+
+        Returns the names whose content differs from the previous baseline.
+        """
+        previous = self._hashes
+        self._hashes = {name: self._hash(name) for name in self._names}
+        self._seen = dict(self._hashes)
+        return {
+            name for name in self._names if previous.get(name) != self._hashes[name]
+        }
+
+    def wait(self, timeout: float | None = None) -> set[str]:
+        """Block until watched files are touched and return those that changed.
+
+        Once something was touched, keep collecting until *debounce* seconds
+        pass without another event. Empty after *timeout* seconds, or when
+        the files were rewritten with the same content.
+        """
+        changed = self._changes(timeout)
+        while changed:
+            more = self._changes(self._debounce)
+            if not more:
+                break
+            changed |= more
+        return {name for name in changed if self._settle(name)}
+
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self) -> FileWatcher:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def _changes(self, timeout: float | None) -> set[str]:
+        """Names touched within *timeout*; may include files whose content is the same."""
+        if self._fd is not None:
+            return self._read_events(self._fd, timeout)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            current = {name: self._hash(name) for name in self._names}
+            changed = {
+                name for name in self._names if current[name] != self._seen[name]
+            }
+            self._seen = current
+            if changed:
+                return changed
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return set()
+            time.sleep(
+                self._poll_interval
+                if remaining is None
+                else min(self._poll_interval, remaining)
+            )
+
+    def _read_events(self, fd: int, timeout: float | None) -> set[str]:
+        readable, _, _ = select.select([fd], [], [], timeout)
+        if not readable:
+            return set()
+        try:
+            data = os.read(fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+        names: set[str] = set()
+        offset = 0
+        while offset + _EVENT.size <= len(data):
+            _, _, _, length = _EVENT.unpack_from(data, offset)
+            raw = data[offset + _EVENT.size : offset + _EVENT.size + length]
+            offset += _EVENT.size + length
+            name = os.fsdecode(raw.rstrip(b"\0"))
+            if name in self._names:
+                names.add(name)
+        return names
+
+    def _settle(self, name: str) -> bool:
+        digest = self._hash(name)
+        if digest == self._hashes.get(name):
+            return False
+        self._hashes[name] = digest
+        return True
+
+    def _hash(self, name: str) -> str | None:
+        return files.sha256_file(self._directory / name)
+
+
+def _inotify_watch(directory: Path) -> int | None:
+    """An inotify descriptor watching *directory*, or ``None`` to fall back."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+    except (OSError, AttributeError):
+        return None
+    if fd < 0:
+        return None
+    if libc.inotify_add_watch(fd, os.fsencode(directory), _IN_MASK) < 0:
+        os.close(fd)
+        return None
+    return int(fd)
@@ -1,9 +1,27 @@
 from __future__ import annotations
 
+import hashlib
+import os
 import re
+import tempfile
 from pathlib import Path
 
 
+CACHE_DIR_ENV = "API_BOOTSTRAPPER_CACHE_DIR"
+
+
+def user_cache_dir() -> Path:
+    """Return the per-user cache directory for the CLI.
+
+    Honours ``API_BOOTSTRAPPER_CACHE_DIR`` and then ``XDG_CACHE_HOME``.
+    """
+    if override := os.environ.get(CACHE_DIR_ENV):
+        return Path(override)
+    if xdg_cache := os.environ.get("XDG_CACHE_HOME"):
+        return Path(xdg_cache) / "api-bootstrapper"
+    return Path.home() / ".cache" / "api-bootstrapper"
+
+
 def ensure_dir(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
@@ -18,6 +36,31 @@ def write_text(path: Path, content: str, overwrite: bool = False) -> None:
     path.write_text(content, encoding="utf-8")
 
 
+def write_text_atomic(path: Path, content: str) -> None:
+    """Write *content* to *path* through a temp file and an atomic rename."""
+    tmp_fd, tmp_path = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(tmp_fd, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def sha256_file(path: Path) -> str | None:
+    """Return the hex SHA-256 of *path*, or ``None`` if it cannot be read."""
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
 def create_minimal_pyproject(
     project_root: Path,
     project_name: str | None = None,
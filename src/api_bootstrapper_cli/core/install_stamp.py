@@ -0,0 +1,68 @@
+"""Record of the inputs a virtualenv was last installed from.
+
+Dependency managers write the stamp into the venv after a successful install
+and skip the next install while the project's ``pyproject.toml``, lock file,
+interpreter and install command are unchanged. Living inside the venv, the
+stamp disappears whenever the venv is recreated.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+from api_bootstrapper_cli.core import files
+
+
+STAMP_FILE = ".api-bootstrapper-install.json"
+
+
+class InstallStamp:
+    def __init__(self, path: Path) -> None:
+        self._path = path
+
+    @classmethod
+    def in_venv(cls, venv_path: Path) -> InstallStamp:
+        return cls(venv_path / STAMP_FILE)
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @staticmethod
+    def fingerprint(
+        project_root: Path, lock_file: str, venv_path: Path, args: Sequence[str]
+    ) -> dict[str, Any]:
+        """What an install depends on; *args* carries the group selection."""
+        return {
+            "pyproject": files.sha256_file(project_root / "pyproject.toml"),
+            "lock_file": lock_file,
+            "lock": files.sha256_file(project_root / lock_file),
+            # home and version of the base interpreter.
+            "interpreter": files.sha256_file(venv_path / "pyvenv.cfg"),
+            "args": list(args),
+        }
+
+    def read(self) -> dict[str, Any] | None:
+        try:
+            data = json.loads(files.read_text(self._path))
+        except (OSError, ValueError):
+            return None
+        return data if isinstance(data, dict) else None
+
+    def matches(self, fingerprint: dict[str, Any]) -> bool:
+        if fingerprint["lock"] is None or fingerprint["interpreter"] is None:
+            return False
+        return self.read() == fingerprint
+
+    def write(self, fingerprint: dict[str, Any]) -> None:
+        try:
+            files.write_text_atomic(self._path, json.dumps(fingerprint, indent=2))
+        except OSError:
+            # A missing stamp only costs a redundant install next time.
+            pass
+
+    def clear(self) -> None:
+        self._path.unlink(missing_ok=True)
@@ -0,0 +1,73 @@
+"""On-disk record of completed bootstrap steps.
+
+A bootstrap that fails half-way leaves its journal behind; the next run skips
+every leading step whose recorded inputs still match and resumes from the
+first one that changed. A successful bootstrap clears the journal.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from pathlib import Path
+from typing import Any
+
+from api_bootstrapper_cli.core import files
+
+
+class BootstrapJournal:
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._entries = self._load()
+        # Independent steps finish on different threads.
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_project(cls, project_root: Path) -> BootstrapJournal:
+        """Journal for *project_root*, kept in the user cache directory."""
+        digest = hashlib.sha256(str(project_root.resolve()).encode()).hexdigest()
+        return cls(files.user_cache_dir() / "journals" / f"{digest[:16]}.json")
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def completed(self, step: str, inputs: dict[str, Any]) -> bool:
+        entry = self._entries.get(step)
+        return entry is not None and entry.get("inputs") == _normalize(inputs)
+
+    def result(self, step: str) -> Any:
+        return self._entries.get(step, {}).get("result")
+
+    def record(self, step: str, inputs: dict[str, Any], result: Any = None) -> None:
+        with self._lock:
+            self._entries[step] = {"inputs": _normalize(inputs), "result": result}
+            self._save()
+
+    def clear(self) -> None:
+        self._entries.clear()
+        try:
+            self._path.unlink()
+        except OSError:
+            pass
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        try:
+            data = json.loads(files.read_text(self._path))
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _save(self) -> None:
+        try:
+            files.ensure_dir(self._path.parent)
+            files.write_text_atomic(self._path, json.dumps(self._entries, indent=2))
+        except OSError:
+            # Losing the journal only costs a full re-run next time.
+            pass
+
+
+def _normalize(inputs: dict[str, Any]) -> Any:
+    # Compare inputs the way they look after a JSON round trip.
+    return json.loads(json.dumps(inputs, default=str))
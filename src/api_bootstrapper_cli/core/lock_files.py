@@ -0,0 +1,165 @@
+"""Check whether a lock file still matches ``pyproject.toml`` without a resolver.
+
+Poetry records a ``content-hash`` of the dependency tables it locked; it is
+recomputed here the way Poetry 1.x and 2.x do. ``uv.lock`` carries the
+project's own requirements as metadata, which are compared by name, extras
+and version specifier together with ``requires-python``. Markers are left
+out: uv rewrites them (``python_version`` becomes ``python_full_version``).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import tomllib
+from pathlib import Path
+from typing import Any
+
+
+_POETRY_LEGACY_KEYS = ("dependencies", "source", "extras", "dev-dependencies")
+_POETRY_KEYS = (*_POETRY_LEGACY_KEYS, "group")
+_PROJECT_KEYS = ("requires-python", "dependencies", "optional-dependencies")
+
+_REQUIREMENT = re.compile(
+    r"^\s*([A-Za-z0-9][A-Za-z0-9._-]*)\s*(?:\[([^\]]*)\])?\s*([^;]*)"
+)
+
+# Name, extras and specifier clauses of one requirement.
+_Requirement = tuple[str, tuple[str, ...], tuple[str, ...]]
+
+
+def poetry_lock_is_current(project_root: Path) -> bool:
+    pyproject = _load(project_root / "pyproject.toml")
+    lock = _load(project_root / "poetry.lock")
+    if pyproject is None or lock is None:
+        return False
+    locked_hash = lock.get("metadata", {}).get("content-hash")
+    return locked_hash in poetry_content_hashes(pyproject)
+
+
+def poetry_content_hashes(pyproject: dict[str, Any]) -> set[str]:
+    """The ``content-hash`` Poetry 1.x and 2.x would write for *pyproject*."""
+    poetry = pyproject.get("tool", {}).get("poetry", {})
+
+    legacy = {
+        key: poetry.get(key)
+        for key in _POETRY_KEYS
+        if key in _POETRY_LEGACY_KEYS or poetry.get(key) is not None
+    }
+    hashes = {_hash(legacy)}
+
+    project = pyproject.get("project", {})
+    project_content = {
+        key: project[key] for key in _PROJECT_KEYS if project.get(key) is not None
+    }
+    if project_content:
+        poetry_content = {
+            key: poetry[key] for key in _POETRY_KEYS if poetry.get(key) is not None
+        }
+        content: dict[str, Any] = {
+            "project": project_content,
+            "tool": {"poetry": poetry_content},
+        }
+        if groups := pyproject.get("dependency-groups"):
+            content["dependency-groups"] = groups
+        hashes.add(_hash(content))
+    return hashes
+
+
+def uv_lock_is_current(project_root: Path) -> bool:
+    pyproject = _load(project_root / "pyproject.toml")
+    lock = _load(project_root / "uv.lock")
+    if pyproject is None or lock is None:
+        return False
+    project = pyproject.get("project", {})
+
+    requires_python = project.get("requires-python")
+    if requires_python is not None and _specifier(requires_python) != _specifier(
+        lock.get("requires-python", "")
+    ):
+        return False
+
+    name = _normalize(project.get("name", ""))
+    package = next(
+        (p for p in lock.get("package", []) if _normalize(p.get("name", "")) == name),
+        None,
+    )
+    if package is None:
+        return False
+    metadata = package.get("metadata", {})
+
+    wanted = list(project.get("dependencies", []))
+    for extra in project.get("optional-dependencies", {}).values():
+        wanted.extend(extra)
+    if _requirements(wanted) != _locked(metadata.get("requires-dist", [])):
+        return False
+
+    groups = {
+        group: _requirements(entries)
+        for group, entries in pyproject.get("dependency-groups", {}).items()
+    }
+    if dev := pyproject.get("tool", {}).get("uv", {}).get("dev-dependencies"):
+        groups["dev"] = sorted([*groups.get("dev", []), *_requirements(dev)])
+    locked_groups = {
+        group: _locked(entries)
+        for group, entries in metadata.get("requires-dev", {}).items()
+    }
+    return groups == locked_groups
+
+
+def _load(path: Path) -> dict[str, Any] | None:
+    try:
+        with path.open("rb") as f:
+            return tomllib.load(f)
+    except (OSError, tomllib.TOMLDecodeError):
+        return None
+
+
+def _hash(content: dict[str, Any]) -> str:
+    return hashlib.sha256(json.dumps(content, sort_keys=True).encode()).hexdigest()
+
+
+def _requirements(requirements: list[Any]) -> list[_Requirement]:
+    """PEP 508 strings from pyproject, in the shape :func:`_locked` reads."""
+    parsed = []
+    # Group entries may also be ``{include-group = "..."}`` tables.
+    for requirement in requirements:
+        if not isinstance(requirement, str):
+            continue
+        match = _REQUIREMENT.match(requirement)
+        if match is None:
+            continue
+        specifier = match[3].strip()
+        if specifier.startswith("("):
+            specifier = specifier.strip("()")
+        # A direct reference (``name @ url``) has no version specifier.
+        if specifier.startswith("@"):
+            specifier = ""
+        parsed.append(_requirement(match[1], (match[2] or "").split(","), specifier))
+    return sorted(parsed)
+
+
+def _locked(entries: list[Any]) -> list[_Requirement]:
+    """``requires-dist``/``requires-dev`` tables of ``uv.lock``."""
+    return sorted(
+        _requirement(entry["name"], entry.get("extras", []), entry.get("specifier", ""))
+        for entry in entries
+        if isinstance(entry, dict) and "name" in entry
+    )
+
+
+def _requirement(name: str, extras: list[str], specifier: str) -> _Requirement:
+    return (
+        _normalize(name),
+        tuple(sorted(_normalize(e.strip()) for e in extras if e.strip())),
+        tuple(sorted(_specifier(specifier))),
+    )
+
+
+def _normalize(name: str) -> str:
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def _specifier(spec: str) -> frozenset[str]:
+    return frozenset(part.replace(" ", "") for part in spec.split(",") if part.strip())
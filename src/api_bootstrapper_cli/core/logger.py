@@ -3,6 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 
 from rich.console import Console
+from rich.markup import escape
 
 
 @dataclass
@@ -12,6 +13,10 @@ class RichLogger:
     def debug(self, message: str) -> None:
         self._console.print(f"[dim]{message}[/dim]")
 
+    def output(self, line: str) -> None:
+        """A line streamed from a tool, printed as-is: brackets are not markup."""
+        self.debug(escape(line))
+
     def info(self, message: str) -> None:
         self._console.print(f"[cyan]{message}[/cyan]")
 
@@ -28,4 +33,33 @@ class RichLogger:
         self._console.print(message)
 
 
+@dataclass
+class PrefixedLogger:
+    """Tag every message with *prefix*, for output of concurrent bootstraps."""
+
+    inner: RichLogger
+    prefix: str
+
+    def _tag(self, message: str) -> str:
+        return f"[bold]{escape(self.prefix)}[/bold] {message}"
+
+    def debug(self, message: str) -> None:
+        self.inner.debug(self._tag(message))
+
+    def output(self, line: str) -> None:
+        self.debug(escape(line))
+
+    def info(self, message: str) -> None:
+        self.inner.info(self._tag(message))
+
+    def success(self, message: str) -> None:
+        self.inner.success(self._tag(message))
+
+    def warning(self, message: str) -> None:
+        self.inner.warning(self._tag(message))
+
+    def error(self, message: str) -> None:
+        self.inner.error(self._tag(message))
+
+
 logger = RichLogger()
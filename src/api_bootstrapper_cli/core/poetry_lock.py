@@ -0,0 +1,292 @@
+"""The exact package set ``poetry.lock`` installs, for pip without Poetry.
+
+Each package becomes one pip requirement pinned to its locked version, with
+the lock's hashes and the markers under which Poetry would install it, so
+``pip install --no-deps --require-hashes`` reproduces ``poetry install``
+without resolving anything.
+
+Poetry 2 locks record each package's groups and markers. Poetry 1 locks
+do not; there the markers are worked out by walking the lock's dependency
+graph from pyproject's dependency tables, the way Poetry's installer does.
+Markers are kept in disjunctive normal form: a set of terms, each a set of
+marker expressions that must all hold.
+"""
+
+from __future__ import annotations
+
+import re
+import tomllib
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+
+_NAME = re.compile(r"^\s*([A-Za-z0-9][A-Za-z0-9._-]*)\s*(?:\[([^\]]*)\])?")
+
+_Marker = frozenset[frozenset[str]]
+_ALWAYS: _Marker = frozenset({frozenset()})
+_NEVER: _Marker = frozenset()
+
+
+@dataclass(frozen=True)
+class LockedPackages:
+    """Requirements for every package ``poetry install`` would install.
+
+    *hashed* are index packages, pinned with ``--hash`` options; *direct* are
+    path, URL and git packages, which have no hash to check. *index_urls* are
+    the extra indexes the lock took packages from. *hashes* maps
+    ``name==version`` to the hashes allowed for it.
+    """
+
+    hashed: list[str]
+    direct: list[str]
+    index_urls: list[str]
+    hashes: dict[str, list[str]] = field(default_factory=dict)
+
+
+def poetry_tables(pyproject: Mapping[str, Any]) -> Iterator[dict[str, Any]]:
+    """The dependency tables ``poetry install`` installs by default."""
+    poetry = pyproject.get("tool", {}).get("poetry", {})
+    yield poetry.get("dependencies", {})
+    yield poetry.get("dev-dependencies", {})
+    for group in poetry.get("group", {}).values():
+        if not group.get("optional", False):
+            yield group.get("dependencies", {})
+
+
+def locked_packages(
+    project_root: Path, extra_hashes: Mapping[str, list[str]] | None = None
+) -> LockedPackages:
+    """Read ``poetry.lock`` and pyproject.toml in *project_root*.
+
+    *extra_hashes* adds hashes per ``name==version``, such as those of wheels
+    built locally from a locked sdist. Raises :class:`RuntimeError` when the
+    lock misses a dependency of pyproject or a hash for an index package.
+    """
+    pyproject = _load_toml(project_root / "pyproject.toml")
+    lock = _load_toml(project_root / "poetry.lock")
+    packages: dict[str, dict[str, Any]] = {}
+    for package in lock.get("package", []):
+        packages.setdefault(normalize(package["name"]), package)
+
+    for name in _required_names(pyproject):
+        if name not in packages:
+            raise RuntimeError(
+                f"[poetry] poetry.lock não contém {name}; execute 'poetry lock'"
+            )
+
+    if any("groups" in package for package in packages.values()):
+        markers = _group_markers(packages, _installed_groups(pyproject))
+    else:
+        markers = _graph_markers(pyproject, packages)
+
+    legacy_hashes = lock.get("metadata", {}).get("files", {})
+    hashed: list[str] = []
+    direct: list[str] = []
+    index_urls: list[str] = []
+    all_hashes: dict[str, list[str]] = {}
+    for name, marker in markers.items():
+        package = packages[name]
+        suffix = _marker_suffix(marker)
+        source = package.get("source") or {}
+        kind = source.get("type")
+        if kind in ("directory", "file", "url", "git"):
+            direct.append(
+                f"{package['name']} @ {_direct_url(source, project_root)}{suffix}"
+            )
+            continue
+        if kind == "legacy" and source.get("url") not in index_urls:
+            index_urls.append(source["url"])
+        pin = f"{name}=={package['version']}"
+        entries = package.get("files") or legacy_hashes.get(package["name"], [])
+        hashes = [entry["hash"] for entry in entries if "hash" in entry]
+        hashes += (extra_hashes or {}).get(pin, [])
+        if not hashes:
+            raise RuntimeError(
+                f"[poetry] poetry.lock sem hashes para {name}; execute 'poetry lock'"
+            )
+        all_hashes[pin] = hashes
+        options = " ".join(f"--hash={value}" for value in dict.fromkeys(hashes))
+        hashed.append(f"{package['name']}=={package['version']}{suffix} {options}")
+    return LockedPackages(hashed, direct, index_urls, all_hashes)
+
+
+def normalize(name: str) -> str:
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def _installed_groups(pyproject: Mapping[str, Any]) -> set[str]:
+    poetry = pyproject.get("tool", {}).get("poetry", {})
+    groups = {"main"}
+    if poetry.get("dev-dependencies"):
+        groups.add("dev")
+    for name, group in poetry.get("group", {}).items():
+        if not group.get("optional", False):
+            groups.add(name)
+    groups.update(pyproject.get("dependency-groups", {}))
+    return groups
+
+
+def _required_names(pyproject: Mapping[str, Any]) -> Iterator[str]:
+    """Names pyproject always installs; conditional ones may be left unlocked."""
+    for requirement in pyproject.get("project", {}).get("dependencies", []):
+        if ";" not in requirement and (match := _NAME.match(requirement)):
+            yield normalize(match[1])
+    for table in poetry_tables(pyproject):
+        for name, spec in table.items():
+            if name.lower() == "python":
+                continue
+            if isinstance(spec, str) or (
+                isinstance(spec, dict)
+                and not spec.get("optional", False)
+                and not {"markers", "platform", "python"} & spec.keys()
+            ):
+                yield normalize(name)
+
+
+def _group_markers(
+    packages: Mapping[str, dict[str, Any]], groups: set[str]
+) -> dict[str, _Marker]:
+    """Poetry 2: each package lists its groups, with markers per group."""
+    markers: dict[str, _Marker] = {}
+    for name, package in packages.items():
+        marker = _NEVER
+        recorded = package.get("markers")
+        for group in package.get("groups", ["main"]):
+            if group not in groups:
+                continue
+            if isinstance(recorded, dict):
+                marker = _either(marker, _atom(recorded.get(group)))
+            else:
+                marker = _either(marker, _atom(recorded))
+        if marker:
+            markers[name] = marker
+    return markers
+
+
+def _graph_markers(
+    pyproject: Mapping[str, Any], packages: Mapping[str, dict[str, Any]]
+) -> dict[str, _Marker]:
+    """Poetry 1: follow dependencies from pyproject, combining their markers.
+
+    Nodes are packages, or a package with one of its extras. A node's marker
+    only ever grows, and markers are drawn from a finite set of expressions,
+    so the walk ends even when the graph has cycles.
+    """
+    reached: dict[tuple[str, str | None], _Marker] = {}
+    pending: list[tuple[str, str | None, _Marker]] = []
+    for table in poetry_tables(pyproject):
+        for name, spec in table.items():
+            if name.lower() != "python":
+                pending.extend(_edges(name, spec, _ALWAYS))
+
+    while pending:
+        name, extra, marker = pending.pop()
+        key = (normalize(name), extra)
+        previous = reached.get(key, _NEVER)
+        current = _either(previous, marker)
+        if current == previous:
+            continue
+        reached[key] = current
+        package = packages.get(key[0])
+        if package is None:
+            continue
+        dependencies = {
+            normalize(dep): spec
+            for dep, spec in package.get("dependencies", {}).items()
+        }
+        if extra is None:
+            for dep, spec in dependencies.items():
+                pending.extend(_edges(dep, spec, current))
+            continue
+        pending.append((key[0], None, current))
+        for requirement in package.get("extras", {}).get(extra, []):
+            match = _NAME.match(requirement)
+            if match is None:
+                continue
+            dep = normalize(match[1])
+            wanted = [e.strip() for e in (match[2] or "").split(",") if e.strip()]
+            spec = dependencies.get(dep, {})
+            pending.extend(_edges(dep, spec, current, wanted, optional=True))
+
+    return {name: marker for (name, extra), marker in reached.items() if extra is None}
+
+
+def _edges(
+    name: str,
+    spec: Any,
+    marker: _Marker,
+    extras: list[str] | None = None,
+    optional: bool = False,
+) -> list[tuple[str, str | None, _Marker]]:
+    """Nodes reached through one dependency entry (a list means alternatives)."""
+    entries = spec if isinstance(spec, list) else [spec]
+    edges: list[tuple[str, str | None, _Marker]] = []
+    for entry in entries:
+        if not isinstance(entry, dict):
+            entry = {}
+        if entry.get("optional", False) and not optional:
+            continue
+        conditions = [entry["markers"]] if "markers" in entry else []
+        if "platform" in entry:
+            conditions.append(f'sys_platform == "{entry["platform"]}"')
+        reached = marker
+        for condition in conditions:
+            reached = _both(reached, _atom(condition))
+        edges.append((name, None, reached))
+        for extra in [*entry.get("extras", []), *(extras or [])]:
+            edges.append((name, extra, reached))
+    return edges
+
+
+def _atom(marker: str | None) -> _Marker:
+    if not marker or not marker.strip():
+        return _ALWAYS
+    return frozenset({frozenset({marker.strip()})})
+
+
+def _both(a: _Marker, b: _Marker) -> _Marker:
+    return _simplest(frozenset(x | y for x in a for y in b))
+
+
+def _either(a: _Marker, b: _Marker) -> _Marker:
+    return _simplest(a | b)
+
+
+def _simplest(marker: _Marker) -> _Marker:
+    # A term that needs more than another term adds nothing to the "or".
+    return frozenset(t for t in marker if not any(other < t for other in marker))
+
+
+def _marker_suffix(marker: _Marker) -> str:
+    if frozenset() in marker:
+        return ""
+    terms = sorted(" and ".join(f"({atom})" for atom in sorted(t)) for t in marker)
+    if len(terms) > 1:
+        terms = [f"({term})" if " and " in term else term for term in terms]
+    return " ; " + " or ".join(terms)
+
+
+def _direct_url(source: Mapping[str, Any], project_root: Path) -> str:
+    kind, url = source["type"], source["url"]
+    if kind in ("directory", "file"):
+        link: str = (project_root / url).resolve().as_uri()
+    elif kind == "git":
+        ref = source.get("resolved_reference") or source.get("reference")
+        link = f"git+{url}" + (f"@{ref}" if ref else "")
+    else:
+        link = url
+    if subdirectory := source.get("subdirectory"):
+        link += f"#subdirectory={subdirectory}"
+    return link
+
+
+def _load_toml(path: Path) -> dict[str, Any]:
+    try:
+        with path.open("rb") as f:
+            return tomllib.load(f)
+    except FileNotFoundError:
+        return {}
+    except tomllib.TOMLDecodeError as e:
+        raise ValueError(f"{path.name}: {e}") from e
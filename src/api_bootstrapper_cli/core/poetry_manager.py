@@ -1,79 +1,59 @@
 from __future__ import annotations
 
-import os
 import platform
+import re
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
 
 from rich.console import Console
 
+from api_bootstrapper_cli.core.environment import CleanEnvironment
+from api_bootstrapper_cli.core.executables import resolve_executable
+from api_bootstrapper_cli.core.install_stamp import InstallStamp
+from api_bootstrapper_cli.core.lock_files import poetry_lock_is_current
+from api_bootstrapper_cli.core.poetry_lock import locked_packages
+from api_bootstrapper_cli.core.protocols import LOCK_TIMEOUT, LockMode
 from api_bootstrapper_cli.core.shell import ShellError, exec_cmd
+from api_bootstrapper_cli.core.venv_templates import VenvTemplates
+from api_bootstrapper_cli.core.wheelhouse import (
+    Wheelhouse,
+    built_hashes,
+    requirements_file,
+)
 
 
 console = Console()
 
+INSTALL_ARGS = ("install", "--no-root")
+
 
 @dataclass(frozen=True)
 class PoetryManager:
     name: str = field(default="Poetry")
+    on_output: Callable[[str], None] | None = field(
+        default=None, repr=False, compare=False
+    )
+    environment: CleanEnvironment = field(
+        default_factory=CleanEnvironment.capture, repr=False, compare=False
+    )
+    templates: VenvTemplates | None = field(default=None, repr=False, compare=False)
+    wheelhouse: Wheelhouse | None = field(default=None, repr=False, compare=False)
 
-    def _get_poetry_cmd(self, project_root: Path | None = None) -> str:
-        try:
-            result = exec_cmd(
-                ["pyenv", "which", "poetry"],
-                check=True,
-                env=self._get_clean_env(),
-                cwd=str(project_root) if project_root else None,
-            )
-            poetry_path = result.stdout.strip()
-            if poetry_path and Path(poetry_path).exists():
-                return poetry_path
-        except (ShellError, FileNotFoundError):
-            pass
-
-        env = self._get_clean_env()
-        clean_path = env.get("PATH", "")
-        for path_dir in clean_path.split(os.pathsep):
-            if not path_dir:
-                continue
-            posix_path = Path(path_dir) / "poetry"
-            if posix_path.exists() and os.access(posix_path, os.X_OK):
-                return str(posix_path)
-
-        return "poetry"
-
-    def _get_clean_env(self) -> dict[str, str]:
-        """Return clean environment without active venv variables and pyenv shims.
-
-        This ensures Poetry doesn't use the CLI's venv when executing commands
-        in the target project, and prevents pyenv from redirecting poetry
-        commands to different Python versions.
-
-        CRITICAL: This allows the CLI to work from anywhere, even when run
-        from inside an active venv.
-        """
-        env = os.environ.copy()
-
-        env.pop("VIRTUAL_ENV", None)
-        env.pop("POETRY_ACTIVE", None)
-        env.pop("PYTHONPATH", None)
-        env.pop("PYTHONHOME", None)
-        env.pop("PYTHONSTARTUP", None)
-        env.pop("PYTHONUSERBASE", None)
+    def _poetry(self, project_root: Path | None = None) -> str:
+        return resolve_executable("poetry", self._env(), project_root)
 
-        path = env.get("PATH", "")
-        path_dirs = path.split(os.pathsep)
-        clean_path_dirs = [d for d in path_dirs if ".pyenv/shims" not in d]
-        env["PATH"] = os.pathsep.join(clean_path_dirs)
-
-        return env
+    def _env(self) -> Mapping[str, str]:
+        return self.environment.for_backend("poetry")
 
     def is_installed(self) -> bool:
         try:
             exec_cmd(
-                [self._get_poetry_cmd(), "--version"],
+                [self._poetry(), "--version"],
                 check=True,
-                env=self._get_clean_env(),
+                env=self._env(),
+                cache=True,
             )
             return True
         except ShellError:
@@ -83,7 +63,7 @@ class PoetryManager:
         try:
             exec_cmd(
                 [
-                    self._get_poetry_cmd(project_root),
+                    self._poetry(project_root),
                     "config",
                     "virtualenvs.in-project",
                     "true",
@@ -91,7 +71,7 @@ class PoetryManager:
                 ],
                 cwd=str(project_root),
                 check=True,
-                env=self._get_clean_env(),
+                env=self._env(),
             )
         except ShellError as e:
             raise RuntimeError(
@@ -105,10 +85,10 @@ class PoetryManager:
         """
         try:
             exec_cmd(
-                [self._get_poetry_cmd(project_root), "env", "use", str(python_path)],
+                [self._poetry(project_root), "env", "use", str(python_path)],
                 cwd=str(project_root),
                 check=True,
-                env=self._get_clean_env(),
+                env=self._env(),
             )
         except ShellError as e:
             raise RuntimeError(
@@ -128,10 +108,11 @@ class PoetryManager:
         return self._resolve_venv_python(venv_path)
 
     def ensure_venv(self, project_root: Path) -> None:
-        """Ensure virtualenv exists without running a full dependency install.
+        """Ensure virtualenv exists without installing anything into it.
 
-        Uses poetry env use to create the .venv structure if absent.
-        Safe to call when .venv may already exist.
+        ``poetry run`` creates the .venv, with the interpreter Poetry would
+        pick for an install, when it is absent. Safe to call when .venv may
+        already exist.
         """
         venv_dir = project_root / ".venv"
         if venv_dir.exists() and venv_dir.is_dir():
@@ -139,34 +120,203 @@ class PoetryManager:
 
         try:
             exec_cmd(
-                [self._get_poetry_cmd(project_root), "install", "--no-root"],
+                [self._poetry(project_root), "run", "python", "-c", ""],
                 cwd=str(project_root),
                 check=True,
-                env=self._get_clean_env(),
+                env=self._env(),
             )
-        except ShellError as e:
+        except (ShellError, FileNotFoundError) as e:
             raise RuntimeError(f"[poetry] Falha ao criar virtualenv: {e}") from e
 
-    def install_dependencies(self, project_root: Path) -> None:
+    def install_dependencies(
+        self,
+        project_root: Path,
+        force: bool = False,
+        lock_mode: LockMode = LockMode.update,
+    ) -> None:
         """Install project dependencies with Poetry.
 
+        Skipped when the install stamp matches, unless *force* is set.
+        ``poetry install`` only resolves when the lock is missing, which a
+        *lock_mode* other than ``update`` rules out up front.
+
+        ``frozen`` only means "never relock" here: ``poetry install`` has no
+        way to skip its own check that the lock matches pyproject, so a stale
+        lock is refused by Poetry just as ``locked`` refuses it up front.
+
         NOTE: Uses --no-root to support app projects without package-mode config.
+        Poetry has no find-links: with a wheelhouse, pip installs exactly the
+        locked packages into the venv instead, checked against the lock's hashes.
         """
+        self.check_lock(project_root, lock_mode)
         self.ensure_venv(project_root)
 
+        stamp = self._stamp(project_root)
+        if not force and stamp.matches(self._install_fingerprint(project_root)):
+            console.print("[dim][poetry] Dependencies up to date[/dim]")
+            return
+        stamp.clear()
+        # --no-root leaves the project out, so the lock alone defines the venv.
+        if not force and self._clone_template(project_root):
+            stamp.write(self._install_fingerprint(project_root))
+            return
+
         try:
             with console.status(
                 "[cyan][poetry] Installing dependencies...[/cyan]",
                 spinner="dots",
             ):
-                exec_cmd(
-                    [self._get_poetry_cmd(project_root), "install", "--no-root"],
-                    cwd=str(project_root),
-                    check=True,
-                    env=self._get_clean_env(),
-                )
+                if self.wheelhouse is not None:
+                    self._install_from_wheelhouse(project_root, self.wheelhouse)
+                else:
+                    exec_cmd(
+                        [self._poetry(project_root), *INSTALL_ARGS],
+                        cwd=str(project_root),
+                        check=True,
+                        env=self._env(),
+                        stream=True,
+                        on_output=self.on_output,
+                    )
         except ShellError as e:
             raise RuntimeError(f"[poetry] Falha ao instalar dependências: {e}") from e
+        stamp.write(self._install_fingerprint(project_root))
+        self._capture_template(project_root)
+
+    def check_lock(self, project_root: Path, lock_mode: LockMode) -> None:
+        """Compare ``poetry.lock``'s content-hash with pyproject, without Poetry."""
+        if lock_mode == LockMode.update:
+            return
+        if not (project_root / "poetry.lock").exists():
+            raise RuntimeError(
+                f"[poetry] poetry.lock não encontrado; "
+                f"--{lock_mode.value} exige um lock file"
+            )
+        if lock_mode == LockMode.locked and not poetry_lock_is_current(project_root):
+            raise RuntimeError(
+                "[poetry] poetry.lock desatualizado em relação ao pyproject.toml; "
+                "execute 'poetry lock'"
+            )
+
+    def lock(self, project_root: Path) -> None:
+        """Resolve ``poetry.lock`` from pyproject's declared Python constraint.
+
+        Runs with ``virtualenvs.create`` off: the venv is built concurrently
+        by ``poetry env use`` and resolution needs no interpreter of its own.
+        """
+        try:
+            exec_cmd(
+                [self._poetry(project_root), "lock"],
+                cwd=str(project_root),
+                check=True,
+                env={**self._env(), "POETRY_VIRTUALENVS_CREATE": "false"},
+                stream=True,
+                on_output=self.on_output,
+                timeout=LOCK_TIMEOUT,
+            )
+        except (ShellError, FileNotFoundError) as e:
+            raise RuntimeError(f"[poetry] Falha ao gerar lock file: {e}") from e
+
+    def relock(self, project_root: Path) -> None:
+        """Re-resolve ``poetry.lock`` against pyproject, keeping unaffected pins.
+
+        Poetry 1.x needs ``--no-update`` for that; 2.x keeps pins by default.
+        """
+        args = (
+            ["lock"]
+            if self._major_version(project_root) >= 2
+            else ["lock", "--no-update"]
+        )
+        try:
+            exec_cmd(
+                [self._poetry(project_root), *args],
+                cwd=str(project_root),
+                check=True,
+                env=self._env(),
+                stream=True,
+                on_output=self.on_output,
+                timeout=LOCK_TIMEOUT,
+            )
+        except (ShellError, FileNotFoundError) as e:
+            raise RuntimeError(f"[poetry] Falha ao atualizar lock file: {e}") from e
+
+    def _install_from_wheelhouse(
+        self, project_root: Path, wheelhouse: Wheelhouse
+    ) -> None:
+        if not (project_root / "poetry.lock").exists():
+            raise RuntimeError(
+                "[poetry] poetry.lock não encontrado; --wheelhouse exige um lock file"
+            )
+        locked = locked_packages(project_root, built_hashes(wheelhouse.path))
+        python = str(self.get_venv_python(project_root))
+
+        def pip_install(*args: str) -> None:
+            exec_cmd(
+                [python, "-m", "pip", "install", *args],
+                cwd=str(project_root),
+                check=True,
+                env=self._env(),
+                stream=True,
+                on_output=self.on_output,
+            )
+
+        # --no-deps: the lock is the whole set, nothing is left to resolve.
+        if locked.hashed:
+            with requirements_file(locked.hashed) as requirements:
+                pip_install(
+                    *wheelhouse.pip_args(locked.index_urls),
+                    "--no-deps",
+                    "--require-hashes",
+                    "--requirement",
+                    str(requirements),
+                )
+        if locked.direct:
+            pip_install(*wheelhouse.pip_args(), "--no-deps", *locked.direct)
+
+    def _major_version(self, project_root: Path) -> int:
+        try:
+            res = exec_cmd(
+                [self._poetry(project_root), "--version"],
+                check=True,
+                env=self._env(),
+                cache=True,
+            )
+        except ShellError:
+            return 1
+        match = re.search(r"(\d+)\.\d+", res.stdout)
+        return int(match.group(1)) if match else 1
+
+    def _stamp(self, project_root: Path) -> InstallStamp:
+        return InstallStamp.in_venv(self.get_venv_path(project_root))
+
+    def _template_key(self, project_root: Path) -> str | None:
+        if self.templates is None:
+            return None
+        return self.templates.key(
+            project_root, "poetry.lock", self.get_venv_path(project_root), INSTALL_ARGS
+        )
+
+    def _clone_template(self, project_root: Path) -> bool:
+        key = self._template_key(project_root)
+        if key is None or self.templates is None:
+            return False
+        method = self.templates.materialize(key, self.get_venv_path(project_root))
+        if method is None:
+            return False
+        console.print(f"[dim][poetry] Virtualenv cloned from template ({method})[/dim]")
+        return True
+
+    def _capture_template(self, project_root: Path) -> None:
+        key = self._template_key(project_root)
+        if key is not None and self.templates is not None:
+            self.templates.capture(key, self.get_venv_path(project_root))
+
+    def _install_fingerprint(self, project_root: Path) -> dict[str, Any]:
+        return InstallStamp.fingerprint(
+            project_root,
+            "poetry.lock",
+            self.get_venv_path(project_root),
+            INSTALL_ARGS,
+        )
 
     def _resolve_venv_python(self, venv_path: Path) -> Path:
         if platform.system() == "Windows":
@@ -1,31 +1,36 @@
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 from pathlib import Path
 
+from api_bootstrapper_cli.core.environment import CleanEnvironment
+from api_bootstrapper_cli.core.environment_state import inspect_environment
+from api_bootstrapper_cli.core.executables import resolve_executable
 from api_bootstrapper_cli.core.files import read_text, write_text
 from api_bootstrapper_cli.core.logger import logger
-from api_bootstrapper_cli.core.protocols import ManagerChoice
+from api_bootstrapper_cli.core.protocols import LOCK_TIMEOUT, ManagerChoice
 from api_bootstrapper_cli.core.shell import exec_cmd
 
 
 @dataclass(frozen=True)
 class PreCommitManager:
-    def _detect_manager(self, project_root: Path) -> ManagerChoice:
-        pyproject_path = project_root / "pyproject.toml"
-        if not pyproject_path.exists():
-            return ManagerChoice.pyenv
+    environment: CleanEnvironment = field(
+        default_factory=CleanEnvironment.capture, repr=False, compare=False
+    )
 
-        content = read_text(pyproject_path)
+    def _poetry(self, project_root: Path) -> str:
+        return resolve_executable("poetry", self._env("poetry"), project_root)
 
-        if "[tool.poetry]" in content:
-            return ManagerChoice.pyenv
+    def _uv(self) -> str:
+        return resolve_executable("uv", self._env("uv"))
 
-        if "[project]" in content:
-            return ManagerChoice.uv
+    def _env(self, backend: str) -> Mapping[str, str]:
+        return self.environment.for_backend(backend)
 
-        return ManagerChoice.pyenv
+    def _detect_manager(self, project_root: Path) -> ManagerChoice:
+        return inspect_environment(project_root).manager
 
     def create_config(
         self, project_root: Path, manager: ManagerChoice | None = None
@@ -129,9 +134,12 @@ repos:
         logger.info("Updating poetry.lock...")
         try:
             exec_cmd(
-                ["poetry", "lock"],
+                [self._poetry(project_root), "lock"],
                 cwd=str(project_root),
                 check=True,
+                env=self._env("poetry"),
+                stream=True,
+                timeout=LOCK_TIMEOUT,
             )
             logger.success("poetry.lock updated")
         except Exception as e:
@@ -141,9 +149,15 @@ repos:
         logger.info("Installing dependencies...")
         try:
             exec_cmd(
-                ["poetry", "install", "--no-root"],
+                [
+                    self._poetry(project_root),
+                    "install",
+                    "--no-root",
+                ],
                 cwd=str(project_root),
                 check=True,
+                env=self._env("poetry"),
+                stream=True,
             )
             logger.success("Dependencies installed")
         except Exception as e:
@@ -191,9 +205,11 @@ repos:
         logger.info("Syncing dependencies with uv...")
         try:
             exec_cmd(
-                ["uv", "sync", "--all-groups"],
+                [self._uv(), "sync", "--all-groups"],
                 cwd=str(project_root),
                 check=True,
+                env=self._env("uv"),
+                stream=True,
             )
             logger.success("Dependencies synced")
         except Exception as e:
@@ -280,7 +296,7 @@ repos:
         try:
             if manager == ManagerChoice.pyenv:
                 cmd = [
-                    "poetry",
+                    self._poetry(project_root),
                     "run",
                     "pre-commit",
                     "install",
@@ -291,7 +307,7 @@ repos:
                 ]
             else:  # uv
                 cmd = [
-                    "uv",
+                    self._uv(),
                     "run",
                     "pre-commit",
                     "install",
@@ -305,6 +321,7 @@ repos:
                 cmd,
                 cwd=str(project_root),
                 check=True,
+                env=self._env("poetry" if manager == ManagerChoice.pyenv else "uv"),
             )
             logger.success("Pre-commit hooks installed successfully")
         except Exception as e:
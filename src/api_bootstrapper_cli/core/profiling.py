@@ -0,0 +1,264 @@
+"""Lightweight timing spans for commands and bootstrap phases.
+
+Spans are only collected while the module-level ``profiler`` is enabled
+(``--profile``), so instrumented code pays almost nothing otherwise.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+import time
+from collections.abc import Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from rich.console import Console
+from rich.table import Table
+
+from api_bootstrapper_cli.core.files import write_text_atomic
+
+
+PHASE = "phase"
+COMMAND = "cmd"
+
+
+@dataclass
+class Span:
+    name: str
+    category: str
+    start: float
+    duration: float
+    thread_id: int
+    args: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def end(self) -> float:
+        return self.start + self.duration
+
+
+def rss_kb(ru_maxrss: int) -> int:
+    """``ru_maxrss`` in KiB: Linux reports KiB, macOS reports bytes."""
+    return ru_maxrss // 1024 if sys.platform == "darwin" else ru_maxrss
+
+
+class Profiler:
+    def __init__(self) -> None:
+        self.enabled = False
+        self._origin = time.perf_counter()
+        self._spans: list[Span] = []
+        self._lock = threading.Lock()
+
+    def enable(self) -> None:
+        self.reset()
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def reset(self) -> None:
+        with self._lock:
+            self._spans.clear()
+        self._origin = time.perf_counter()
+
+    @property
+    def spans(self) -> list[Span]:
+        with self._lock:
+            return sorted(self._spans, key=lambda span: span.start)
+
+    @contextmanager
+    def span(
+        self, name: str, category: str = PHASE, **args: Any
+    ) -> Iterator[dict[str, Any]]:
+        """Time the enclosed block; callers may add details to the yielded dict."""
+        if not self.enabled:
+            yield args
+            return
+
+        start = time.perf_counter()
+        try:
+            yield args
+        except BaseException as e:
+            args.setdefault("error", type(e).__name__)
+            if (returncode := getattr(e, "returncode", None)) is not None:
+                args.setdefault("exit_code", returncode)
+            raise
+        finally:
+            duration = time.perf_counter() - start
+            with self._lock:
+                self._spans.append(
+                    Span(
+                        name=name,
+                        category=category,
+                        start=start - self._origin,
+                        duration=duration,
+                        thread_id=threading.get_native_id(),
+                        args=args,
+                    )
+                )
+
+    def phase_table(self) -> Table:
+        spans = self.spans
+        commands = [span for span in spans if span.category == COMMAND]
+
+        table = Table(title="Bootstrap profile", title_justify="left")
+        table.add_column("Phase")
+        table.add_column("Wall", justify="right")
+        table.add_column("Subprocess", justify="right")
+        table.add_column("Commands", justify="right")
+        table.add_column("Peak child RSS", justify="right")
+
+        for phase in (span for span in spans if span.category == PHASE):
+            # Scheduled steps overlap in time; only a phase's own thread runs
+            # its commands.
+            inside = [
+                cmd
+                for cmd in commands
+                if cmd.thread_id == phase.thread_id
+                and cmd.start >= phase.start
+                and cmd.end <= phase.end
+            ]
+            table.add_row(
+                phase.name,
+                _format_seconds(phase.duration),
+                _format_seconds(sum(cmd.duration for cmd in inside)),
+                str(len(inside)),
+                _format_rss(_peak_rss(inside)),
+            )
+
+        if spans:
+            wall = max(span.end for span in spans) - min(s.start for s in spans)
+            in_commands = sum(cmd.duration for cmd in commands)
+            table.add_section()
+            table.add_row(
+                "[bold]total[/bold]",
+                _format_seconds(wall),
+                _format_seconds(in_commands),
+                str(len(commands)),
+                _format_rss(_peak_rss(commands)),
+            )
+        return table
+
+    def critical_path(self) -> list[Span]:
+        """Longest chain of scheduled steps (phases recorded with ``after``)."""
+        steps = {
+            span.name: span
+            for span in self.spans
+            if span.category == PHASE and "after" in span.args
+        }
+        chain = critical_path(
+            {name: span.duration for name, span in steps.items()},
+            {name: span.args["after"] for name, span in steps.items()},
+        )
+        return [steps[name] for name in chain]
+
+    def slowest_commands(self, limit: int = 5) -> list[Span]:
+        commands = [span for span in self.spans if span.category == COMMAND]
+        return sorted(commands, key=lambda span: span.duration, reverse=True)[:limit]
+
+    def chrome_trace(self) -> dict[str, Any]:
+        """Return spans in the Chrome ``about:tracing`` / Perfetto JSON format."""
+        pid = os.getpid()
+        events = [
+            {
+                "name": span.name,
+                "cat": span.category,
+                "ph": "X",
+                "ts": round(span.start * 1_000_000),
+                "dur": round(span.duration * 1_000_000),
+                "pid": pid,
+                "tid": span.thread_id,
+                "args": {key: _jsonable(value) for key, value in span.args.items()},
+            }
+            for span in self.spans
+        ]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: Path) -> Path:
+        write_text_atomic(path, json.dumps(self.chrome_trace(), indent=1) + "\n")
+        return path
+
+
+def print_profile(console: Console, trace_path: Path | None = None) -> None:
+    """Print the per-phase table and optionally write the Chrome trace file."""
+    console.print()
+    console.print(profiler.phase_table())
+
+    chain = profiler.critical_path()
+    if chain:
+        total = _format_seconds(sum(span.duration for span in chain))
+        steps = " → ".join(span.name for span in chain)
+        console.print(f"[dim]Critical path ({total}):[/dim] {steps}")
+
+    slowest = profiler.slowest_commands()
+    if slowest:
+        console.print("[dim]Slowest commands:[/dim]")
+        for span in slowest:
+            console.print(
+                f"  {_format_seconds(span.duration):>8}  "
+                f"[cyan]{span.name}[/cyan] [dim](exit {span.args.get('exit_code')})[/dim]"
+            )
+
+    if trace_path is not None:
+        profiler.write_chrome_trace(trace_path)
+        console.print(f"[dim]Chrome trace written to:[/dim] {trace_path}")
+
+
+def critical_path(
+    durations: Mapping[str, float], after: Mapping[str, Sequence[str]]
+) -> list[str]:
+    """Return the dependency chain with the largest total duration.
+
+    Edges pointing at steps missing from *durations* (not run) are ignored.
+    """
+    finish: dict[str, float] = {}
+    previous: dict[str, str | None] = {}
+
+    def longest(name: str) -> float:
+        if name not in finish:
+            deps = [dep for dep in after.get(name, ()) if dep in durations]
+            best = max(deps, key=longest, default=None)
+            previous[name] = best
+            finish[name] = durations[name] + (finish[best] if best else 0.0)
+        return finish[name]
+
+    if not durations:
+        return []
+    node: str | None = max(durations, key=longest)
+    chain: list[str] = []
+    while node is not None:
+        chain.append(node)
+        node = previous[node]
+    return chain[::-1]
+
+
+def _peak_rss(spans: list[Span]) -> int | None:
+    values = [
+        value
+        for span in spans
+        if isinstance(value := span.args.get("peak_rss_kb"), int)
+    ]
+    return max(values, default=None)
+
+
+def _format_seconds(seconds: float) -> str:
+    return f"{seconds:.2f}s"
+
+
+def _format_rss(rss_kb: int | None) -> str:
+    return "-" if rss_kb is None else f"{rss_kb / 1024:.1f} MiB"
+
+
+def _jsonable(value: Any) -> Any:
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(item) for item in value]
+    return str(value)
+
+
+profiler = Profiler()
@@ -5,6 +5,10 @@ from pathlib import Path
 from typing import Protocol
 
 
+# A dependency resolution that runs this long is stuck.
+LOCK_TIMEOUT = 15 * 60
+
+
 class ManagerChoice(str, enum.Enum):
     """Manager backend for Python environment and dependencies."""
 
@@ -12,6 +16,20 @@ class ManagerChoice(str, enum.Enum):
     uv = "uv"
 
 
+class LockMode(str, enum.Enum):
+    """How an install treats the lock file.
+
+    ``update`` resolves a missing or outdated lock. ``frozen`` installs the
+    existing lock as-is and ``locked`` also refuses a lock that no longer
+    matches pyproject.toml; neither ever resolves. Poetry checks the lock
+    itself on install, so for Poetry projects both refuse a stale lock.
+    """
+
+    update = "update"
+    frozen = "frozen"
+    locked = "locked"
+
+
 class PythonEnvironmentManager(Protocol):
     """Interface for Python version managers (pyenv, asdf, etc)."""
 
@@ -63,8 +81,25 @@ class DependencyManager(Protocol):
         """Ensure virtual environment exists without a full dependency install."""
         ...
 
-    def install_dependencies(self, project_root: Path) -> None:
-        """Install the project's dependencies."""
+    def install_dependencies(
+        self,
+        project_root: Path,
+        force: bool = False,
+        lock_mode: LockMode = LockMode.update,
+    ) -> None:
+        """Install the project's dependencies; *force* ignores the install stamp."""
+        ...
+
+    def check_lock(self, project_root: Path, lock_mode: LockMode) -> None:
+        """Raise if *lock_mode* needs a lock file that is missing or stale."""
+        ...
+
+    def lock(self, project_root: Path) -> None:
+        """Write the lock file; needs only pyproject, not the project's venv."""
+        ...
+
+    def relock(self, project_root: Path) -> None:
+        """Update the existing lock file, re-resolving only what pyproject changed."""
         ...
 
 
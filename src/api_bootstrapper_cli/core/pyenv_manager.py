@@ -1,35 +1,48 @@
 from __future__ import annotations
 
-import os
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass, field
 from pathlib import Path
 
 from rich.console import Console
 
+from api_bootstrapper_cli.core.environment import CleanEnvironment
+from api_bootstrapper_cli.core.executables import pyenv_root, resolve_executable
 from api_bootstrapper_cli.core.shell import ShellError, exec_cmd
+from api_bootstrapper_cli.core.wheelhouse import Wheelhouse
 
 
 console = Console()
 
+# Source builds are slow, but one that runs this long is stuck.
+PYTHON_BUILD_TIMEOUT = 60 * 60
+
 
 @dataclass(frozen=True)
 class PyenvManager:
     name: str = field(default="pyenv")
+    on_output: Callable[[str], None] | None = field(
+        default=None, repr=False, compare=False
+    )
+    environment: CleanEnvironment = field(
+        default_factory=CleanEnvironment.capture, repr=False, compare=False
+    )
+    wheelhouse: Wheelhouse | None = field(default=None, repr=False, compare=False)
 
-    def _get_clean_env(self) -> dict[str, str]:
-        env = os.environ.copy()
-
-        env.pop("VIRTUAL_ENV", None)
-        env.pop("POETRY_ACTIVE", None)
-        env.pop("PYTHONPATH", None)
-        env.pop("PYTHONHOME", None)
-        env.pop("PYTHONSTARTUP", None)
+    def _env(self) -> Mapping[str, str]:
+        return self.environment.for_backend("pyenv")
 
-        return env
+    def _pyenv(self) -> str:
+        return resolve_executable("pyenv", self._env())
 
     def is_installed(self) -> bool:
         try:
-            exec_cmd(["pyenv", "--version"], check=True, env=self._get_clean_env())
+            exec_cmd(
+                [self._pyenv(), "--version"],
+                check=True,
+                env=self._env(),
+                cache=True,
+            )
             return True
         except ShellError:
             return False
@@ -44,9 +57,12 @@ class PyenvManager:
                 spinner="dots",
             ):
                 exec_cmd(
-                    ["pyenv", "install", "-s", version],
+                    [self._pyenv(), "install", "-s", version],
                     check=True,
-                    env=self._get_clean_env(),
+                    env=self._env(),
+                    stream=True,
+                    on_output=self.on_output,
+                    timeout=PYTHON_BUILD_TIMEOUT,
                 )
         except ShellError as e:
             raise RuntimeError(
@@ -55,18 +71,20 @@ class PyenvManager:
 
     def set_local(self, project_root: Path, version: str) -> None:
         exec_cmd(
-            ["pyenv", "local", version],
+            [self._pyenv(), "local", version],
             cwd=str(project_root),
             check=True,
-            env=self._get_clean_env(),
+            env=self._env(),
         )
 
     def get_python_path(self, version: str) -> Path:
         try:
             res = exec_cmd(
-                ["pyenv", "prefix", version],
+                [self._pyenv(), "prefix", version],
                 check=True,
-                env=self._get_clean_env(),
+                env=self._env(),
+                cache=True,
+                cache_watch=[pyenv_root(self._env()) / "versions"],
             )
         except ShellError as e:
             raise RuntimeError(
@@ -77,6 +95,7 @@ class PyenvManager:
 
     def install_pip_packages(self, version: str, packages: list[str]) -> None:
         python_path = self.get_python_path(version)
+        sources = self.wheelhouse.pip_args() if self.wheelhouse else ()
         packages_str = ", ".join(packages)
         try:
             with console.status(
@@ -84,9 +103,19 @@ class PyenvManager:
                 spinner="dots",
             ):
                 exec_cmd(
-                    [str(python_path), "-m", "pip", "install", "--upgrade", *packages],
+                    [
+                        str(python_path),
+                        "-m",
+                        "pip",
+                        "install",
+                        *sources,
+                        "--upgrade",
+                        *packages,
+                    ],
                     check=True,
-                    env=self._get_clean_env(),
+                    env=self._env(),
+                    stream=True,
+                    on_output=self.on_output,
                 )
         except ShellError as e:
             raise RuntimeError(
@@ -95,8 +124,10 @@ class PyenvManager:
 
     def _get_installed_versions(self) -> set[str]:
         res = exec_cmd(
-            ["pyenv", "versions", "--bare"],
+            [self._pyenv(), "versions", "--bare"],
             check=True,
-            env=self._get_clean_env(),
+            env=self._env(),
+            cache=True,
+            cache_watch=[pyenv_root(self._env()) / "versions"],
         )
         return {line.strip() for line in res.stdout.splitlines() if line.strip()}
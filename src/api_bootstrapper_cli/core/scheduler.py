@@ -0,0 +1,131 @@
+"""Run bootstrap steps as a dependency graph.
+
+Every step whose dependencies have finished is started on a thread pool, so
+independent work (building the interpreter, writing ``pyproject.toml`` and
+editor settings) overlaps. The report names the critical path: the chain of
+steps that bounded the wall time.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any
+
+from api_bootstrapper_cli.core.profiling import PHASE, critical_path, profiler
+from api_bootstrapper_cli.core.shell import kill_running_commands
+
+
+@dataclass(frozen=True)
+class Step:
+    """A named unit of work; *run* receives the results of finished steps."""
+
+    name: str
+    run: Callable[[Mapping[str, Any]], Any]
+    after: tuple[str, ...] = ()
+
+
+@dataclass
+class ScheduleReport:
+    results: dict[str, Any] = field(default_factory=dict)
+    durations: dict[str, float] = field(default_factory=dict)
+    critical_path: list[str] = field(default_factory=list)
+    wall: float = 0.0
+
+    @property
+    def critical_seconds(self) -> float:
+        return sum(self.durations[name] for name in self.critical_path)
+
+
+def run_steps(steps: Sequence[Step], max_workers: int | None = None) -> ScheduleReport:
+    """Run *steps* respecting their ``after`` edges; return results and timing.
+
+    The first failing step stops new steps from starting; steps already
+    running are allowed to finish and the original exception is re-raised.
+    """
+    by_name = _validate(steps)
+    waiting = {step.name: set(step.after) for step in steps}
+    report = ScheduleReport()
+    results_view = MappingProxyType(report.results)
+    # Workers mostly wait on child processes, so the graph width is the limit.
+    workers = max_workers or max(len(steps), 1)
+    error: BaseException | None = None
+    started = time.perf_counter()
+
+    with ThreadPoolExecutor(workers, thread_name_prefix="bootstrap") as pool:
+        running: dict[Future[tuple[Any, float]], str] = {}
+
+        def start_ready() -> None:
+            for name in [name for name, deps in waiting.items() if not deps]:
+                del waiting[name]
+                future = pool.submit(_run_timed, by_name[name], results_view)
+                running[future] = name
+
+        start_ready()
+        try:
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        result, duration = future.result()
+                    except Exception as e:
+                        error = error or e
+                        continue
+                    report.results[name] = result
+                    report.durations[name] = duration
+                    for deps in waiting.values():
+                        deps.discard(name)
+                if error is None:
+                    start_ready()
+        except BaseException:
+            # Ctrl-C lands on this thread; the workers are blocked on children.
+            kill_running_commands()
+            raise
+
+    if error is not None:
+        raise error
+    report.wall = time.perf_counter() - started
+    report.critical_path = critical_path(
+        report.durations, {step.name: step.after for step in steps}
+    )
+    return report
+
+
+def _run_timed(step: Step, results: Mapping[str, Any]) -> tuple[Any, float]:
+    start = time.perf_counter()
+    with profiler.span(step.name, PHASE, after=list(step.after)):
+        result = step.run(results)
+    return result, time.perf_counter() - start
+
+
+def _validate(steps: Sequence[Step]) -> dict[str, Step]:
+    by_name: dict[str, Step] = {}
+    for step in steps:
+        if step.name in by_name:
+            raise ValueError(f"Duplicate step: {step.name}")
+        by_name[step.name] = step
+    for step in steps:
+        for dep in step.after:
+            if dep not in by_name:
+                raise ValueError(f"Step {step.name!r} depends on unknown {dep!r}")
+
+    state: dict[str, str] = {}
+
+    def visit(name: str, path: tuple[str, ...]) -> None:
+        if state.get(name) == "done":
+            return
+        if state.get(name) == "visiting":
+            cycle = " -> ".join((*path[path.index(name) :], name))
+            raise ValueError(f"Dependency cycle: {cycle}")
+        state[name] = "visiting"
+        for dep in by_name[name].after:
+            visit(dep, (*path, name))
+        state[name] = "done"
+
+    for name in by_name:
+        visit(name, ())
+    return by_name
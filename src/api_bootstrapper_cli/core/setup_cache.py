@@ -0,0 +1,53 @@
+"""The last successful bootstrap result, kept inside the venv it describes.
+
+Editor integrations and shell hooks run ``bootstrap-env`` on every folder
+open. For a ready environment the service answers from this record, saved
+with the inputs the result depends on, instead of asking the Python manager
+for the interpreter path again. Like the install stamp, it disappears with
+the venv.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+from api_bootstrapper_cli.core import files
+
+
+RESULT_FILE = ".api-bootstrapper-result.json"
+
+
+class SetupResultCache:
+    def __init__(self, path: Path) -> None:
+        self._path = path
+
+    @classmethod
+    def in_venv(cls, venv_path: Path) -> SetupResultCache:
+        return cls(venv_path / RESULT_FILE)
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def load(self, fingerprint: dict[str, Any]) -> dict[str, Any] | None:
+        """The stored result, if it was saved for the same *fingerprint*."""
+        try:
+            data = json.loads(files.read_text(self._path))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get("fingerprint") != fingerprint:
+            return None
+        result = data.get("result")
+        return result if isinstance(result, dict) else None
+
+    def store(self, fingerprint: dict[str, Any], result: dict[str, Any]) -> None:
+        try:
+            files.write_text_atomic(
+                self._path,
+                json.dumps({"fingerprint": fingerprint, "result": result}, indent=2),
+            )
+        except OSError:
+            # Without the record the next ready run only asks the manager again.
+            pass
@@ -1,11 +1,28 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+import shutil
+import signal
 import subprocess
-from dataclasses import dataclass
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from api_bootstrapper_cli.core import files
+from api_bootstrapper_cli.core.profiling import COMMAND, profiler, rss_kb
 
 
 class ShellError(Exception):
-    pass
+    def __init__(self, message: str, returncode: int | None = None) -> None:
+        super().__init__(message)
+        self.returncode = returncode
 
 
 @dataclass(frozen=True)
@@ -15,27 +32,640 @@ class CommandResult:
     returncode: int
 
 
+DEFAULT_TAIL_LINES = 200
+KILL_GRACE_SECONDS = 5.0
+
+# Each child leads its own process group so a timeout or Ctrl-C can take down
+# everything it spawned (compilers, resolver workers), not just the leader.
+_SESSION_KWARGS: dict[str, Any] = (
+    {"start_new_session": True} if os.name == "posix" else {}
+)
+
+_deadline: float | None = None
+
+# Children currently running, so a Ctrl-C on the main thread can stop the
+# ones started from worker threads.
+_live_processes: set[subprocess.Popen[str]] = set()
+_live_lock = threading.Lock()
+
+
+class CommandTimeoutError(ShellError):
+    pass
+
+
+class _Process(subprocess.Popen[str]):
+    """``Popen`` reaped with ``wait4``, keeping the child's own resource usage.
+
+    Only the thread running the command reaps it, through :meth:`reap`, after
+    reading its output; ``communicate()`` would reap it first. Other threads
+    signal its process group but never wait on it.
+    """
+
+    rusage: Any = None
+
+    def reap(self) -> int:
+        """Wait for the child and return its exit code, like ``wait()``."""
+        if self.returncode is None and hasattr(os, "wait4"):
+            try:
+                _, status, self.rusage = os.wait4(self.pid, 0)
+            except ChildProcessError:
+                pass  # Reaped already; wait() reports what it found.
+            else:
+                self.returncode = os.waitstatus_to_exitcode(status)
+        return self.wait()
+
+
+def set_deadline(seconds: float | None) -> None:
+    """Give every following command a shared budget of *seconds* (None clears)."""
+    global _deadline
+    _deadline = None if seconds is None else time.monotonic() + seconds
+
+
 def exec_cmd(
     cmd: list[str],
     cwd: str | None = None,
     check: bool = True,
-    env: dict[str, str] | None = None,
+    env: Mapping[str, str] | None = None,
+    stream: bool = False,
+    on_output: Callable[[str], None] | None = None,
+    tail_lines: int = DEFAULT_TAIL_LINES,
+    cache: bool = False,
+    cache_watch: Sequence[Path] = (),
+    timeout: float | None = None,
 ) -> CommandResult:
+    """Run *cmd* and return its output.
+
+    By default stdout and stderr are captured whole. With ``stream=True`` (or
+    when *on_output* is given) the merged output is read line by line instead:
+    each line is passed to *on_output* and only the last *tail_lines* lines are
+    kept, both for the returned ``stdout`` and for ``ShellError`` messages.
+
+    ``cache=True`` marks *cmd* as an idempotent, read-only probe: successful
+    results are reused within the process and across invocations until the
+    executable, ``PATH``/``PYENV_ROOT`` or any path in *cache_watch* changes.
+
+    The command is killed, with its whole process group, after *timeout*
+    seconds or when the global deadline from :func:`set_deadline` passes,
+    whichever comes first; ``CommandTimeoutError`` is raised in that case.
+
+    While :func:`record_transcripts` or :func:`replay_transcripts` is active
+    the probe cache is bypassed and every call is saved to, or answered from,
+    the transcript directory.
+    """
+    with profiler.span(" ".join(cmd), COMMAND, cmd=cmd, cwd=cwd) as span:
+        transcripts = _transcripts
+        if transcripts is not None and transcripts.replay:
+            result, duration = _replay(transcripts, cmd, cwd)
+            if transcripts.latency:
+                time.sleep(duration)
+            if on_output is not None:
+                for line in result.stdout.splitlines():
+                    on_output(line)
+            span["replayed"] = True
+        else:
+            recording = transcripts is not None
+            run_check = check and not recording
+            effective_timeout = _effective_timeout(cmd, timeout)
+            started = time.perf_counter()
+            if stream or on_output is not None:
+                result = _exec_streaming(
+                    cmd,
+                    cwd,
+                    run_check,
+                    env,
+                    on_output,
+                    tail_lines,
+                    effective_timeout,
+                    span,
+                )
+            elif cache and not recording:
+                result = _exec_cached(
+                    cmd, cwd, check, env, cache_watch, effective_timeout, span
+                )
+            else:
+                result = _exec_captured(
+                    cmd, cwd, run_check, env, effective_timeout, span
+                )
+            if transcripts is not None:
+                _record(transcripts, cmd, cwd, env, result, started)
+        span["exit_code"] = result.returncode
+        if check and transcripts is not None:
+            _raise_for_status(cmd, result)
+        return result
+
+
+def _effective_timeout(cmd: list[str], timeout: float | None) -> float | None:
+    if _deadline is None:
+        return timeout
+    remaining = _deadline - time.monotonic()
+    if remaining <= 0:
+        raise CommandTimeoutError(f"Deadline exceeded before running: {' '.join(cmd)}")
+    return remaining if timeout is None else min(timeout, remaining)
+
+
+def kill_running_commands() -> None:
+    """Kill every command still running, with its process group."""
+    with _live_lock:
+        processes = list(_live_processes)
+    for process in processes:
+        # Not poll(): the thread running the command reaps it.
+        if process.returncode is None:
+            _kill_process_tree(process)
+
+
+@contextmanager
+def _tracked(process: _Process, span: dict[str, Any] | None) -> Iterator[None]:
+    with _live_lock:
+        _live_processes.add(process)
+    try:
+        yield
+    finally:
+        with _live_lock:
+            _live_processes.discard(process)
+        if span is not None and process.rusage is not None:
+            span["peak_rss_kb"] = rss_kb(process.rusage.ru_maxrss)
+
+
+def _kill_process_tree(process: subprocess.Popen[str]) -> None:
+    """Terminate *process* and its process group, escalating to SIGKILL.
+
+    On POSIX the leader is left for its own thread to reap.
+    """
+    if os.name != "posix":
+        process.kill()
+        process.wait()
+        return
+
+    try:
+        os.killpg(process.pid, signal.SIGTERM)
+    except ProcessLookupError:
+        return
+    _wait_for_exit(process, KILL_GRACE_SECONDS)
     try:
-        result = subprocess.run(
+        # Grandchildren may outlive the group leader; finish them off too.
+        os.killpg(process.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+
+def _wait_for_exit(process: subprocess.Popen[str], timeout: float) -> None:
+    """Wait up to *timeout* for *process* to exit, without reaping it."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline and not _exited(process):
+        time.sleep(0.05)
+
+
+def _exited(process: subprocess.Popen[str]) -> bool:
+    if process.returncode is not None:
+        return True
+    if not hasattr(os, "waitid"):
+        # macOS has no waitid; its own thread sets returncode once reaped.
+        return False
+    try:
+        flags = os.WEXITED | os.WNOHANG | os.WNOWAIT
+        return os.waitid(os.P_PID, process.pid, flags) is not None
+    except ChildProcessError:
+        return True
+
+
+@contextmanager
+def _watchdog(process: _Process, timeout: float | None) -> Iterator[threading.Event]:
+    """Kill *process*'s group after *timeout*; the event tells if it fired."""
+    timed_out = threading.Event()
+
+    def expire() -> None:
+        timed_out.set()
+        _kill_process_tree(process)
+
+    timer = threading.Timer(timeout, expire) if timeout is not None else None
+    if timer is not None:
+        timer.daemon = True
+        timer.start()
+    try:
+        yield timed_out
+    finally:
+        if timer is not None:
+            timer.cancel()
+
+
+def _timeout_error(cmd: list[str], timeout: float | None, output: str) -> ShellError:
+    limit = "the deadline" if timeout is None else f"{timeout:.0f}s"
+    return CommandTimeoutError(
+        f"Command timed out after {limit}: {' '.join(cmd)}\n{output}"
+    )
+
+
+def _exec_captured(
+    cmd: list[str],
+    cwd: str | None,
+    check: bool,
+    env: Mapping[str, str] | None,
+    timeout: float | None = None,
+    span: dict[str, Any] | None = None,
+) -> CommandResult:
+    with (
+        _Process(
             cmd,
             cwd=cwd,
-            check=check,
-            capture_output=True,
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             text=True,
+            **_SESSION_KWARGS,
+        ) as process,
+        _tracked(process, span),
+        _watchdog(process, timeout) as timed_out,
+    ):
+        assert process.stdout is not None and process.stderr is not None
+        errors: list[str] = []
+        reader = threading.Thread(
+            target=lambda pipe: errors.append(pipe.read()),
+            args=(process.stderr,),
+            daemon=True,
+        )
+        try:
+            reader.start()
+            stdout = process.stdout.read()
+            reader.join()
+            returncode = process.reap()
+        except BaseException:
+            # KeyboardInterrupt and friends: don't leave orphans behind.
+            _kill_process_tree(process)
+            raise
+        stderr = "".join(errors)
+
+    if timed_out.is_set():
+        raise _timeout_error(cmd, timeout, stderr)
+    if check and returncode != 0:
+        raise ShellError(
+            f"Command failed: {' '.join(cmd)}\nExit code: {returncode}\n{stderr}",
+            returncode=returncode,
+        )
+    return CommandResult(stdout=stdout, stderr=stderr, returncode=returncode)
+
+
+def _exec_streaming(
+    cmd: list[str],
+    cwd: str | None,
+    check: bool,
+    env: Mapping[str, str] | None,
+    on_output: Callable[[str], None] | None,
+    tail_lines: int,
+    timeout: float | None = None,
+    span: dict[str, Any] | None = None,
+) -> CommandResult:
+    tail: deque[str] = deque(maxlen=tail_lines)
+    with (
+        _Process(
+            cmd,
+            cwd=cwd,
             env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            errors="replace",
+            bufsize=1,
+            **_SESSION_KWARGS,
+        ) as process,
+        _tracked(process, span),
+        _watchdog(process, timeout) as timed_out,
+    ):
+        try:
+            assert process.stdout is not None
+            for line in process.stdout:
+                tail.append(line)
+                if on_output is not None:
+                    on_output(line.rstrip("\n"))
+            returncode = process.reap()
+        except BaseException:
+            _kill_process_tree(process)
+            raise
+
+    output = "".join(tail)
+    if timed_out.is_set():
+        raise _timeout_error(cmd, timeout, output)
+    if check and returncode != 0:
+        raise ShellError(
+            f"Command failed: {' '.join(cmd)}\nExit code: {returncode}\n{output}",
+            returncode=returncode,
         )
-        return CommandResult(
-            stdout=result.stdout,
-            stderr=result.stderr,
-            returncode=result.returncode,
+    return CommandResult(stdout=output, stderr="", returncode=returncode)
+
+
+# ── Probe cache ────────────────────────────────────────────────────────────────
+NO_CACHE_ENV = "API_BOOTSTRAPPER_NO_CACHE"
+_PROBE_CACHE_FILE = "probes.json"
+_FINGERPRINT_ENV_VARS = ("PATH", "PYENV_ROOT", "PYENV_VERSION")
+
+# Least recently stored entries are dropped beyond this many.
+_PROBE_CACHE_LIMIT = 256
+
+# Probes run concurrently from DAG steps and batch projects. _probe_lock
+# guards the memo and its loaded flag; _probe_save_lock orders the writes,
+# so an older snapshot never replaces a newer one on disk.
+_probe_memo: dict[str, dict[str, Any]] = {}
+_probe_store_loaded = False
+_probe_generation = 0
+_probe_saved_generation = 0
+_probe_lock = threading.Lock()
+_probe_save_lock = threading.Lock()
+
+
+def clear_probe_cache() -> None:
+    """Forget every cached probe result, in memory and on disk."""
+    global _probe_store_loaded
+    with _probe_lock:
+        _probe_memo.clear()
+        _probe_store_loaded = True
+    try:
+        (files.user_cache_dir() / _PROBE_CACHE_FILE).unlink()
+    except OSError:
+        pass
+
+
+def _exec_cached(
+    cmd: list[str],
+    cwd: str | None,
+    check: bool,
+    env: Mapping[str, str] | None,
+    watch: Sequence[Path],
+    timeout: float | None,
+    span: dict[str, Any],
+) -> CommandResult:
+    fingerprint = _probe_fingerprint(cmd, env, watch)
+    if fingerprint is None:
+        return _exec_captured(cmd, cwd, check, env, timeout, span)
+
+    key = hashlib.sha256(json.dumps([cmd, cwd]).encode()).hexdigest()
+    entry = _probe_entry(key)
+    if entry is not None and entry.get("fingerprint") == fingerprint:
+        try:
+            cached = CommandResult(**entry["result"])
+        except (KeyError, TypeError):
+            cached = None
+        if cached is not None and _output_paths_exist(cached):
+            span["cached"] = True
+            return cached
+
+    result = _exec_captured(cmd, cwd, check, env, timeout, span)
+    if result.returncode == 0:
+        _store_probe(key, {"fingerprint": fingerprint, "result": asdict(result)})
+    return result
+
+
+def _probe_fingerprint(
+    cmd: list[str],
+    env: Mapping[str, str] | None,
+    watch: Sequence[Path],
+) -> dict[str, Any] | None:
+    environ = os.environ if env is None else env
+    binary = shutil.which(cmd[0], path=environ.get("PATH"))
+    if binary is None:
+        return None
+
+    mtimes: dict[str, int | None] = {}
+    for path in (binary, *map(str, watch)):
+        try:
+            mtimes[path] = os.stat(path).st_mtime_ns
+        except OSError:
+            mtimes[path] = None
+
+    return {
+        "binary": binary,
+        "env": {name: environ.get(name) for name in _FINGERPRINT_ENV_VARS},
+        "mtimes": mtimes,
+    }
+
+
+def _output_paths_exist(result: CommandResult) -> bool:
+    # Probes such as `pyenv prefix` or `uv python find` print a path; a cached
+    # answer pointing at something that was removed since is stale.
+    output = result.stdout.strip()
+    if os.path.isabs(output) and "\n" not in output:
+        return os.path.exists(output)
+    return True
+
+
+def _persistence_enabled() -> bool:
+    return not os.environ.get(NO_CACHE_ENV)
+
+
+def _probe_entry(key: str) -> dict[str, Any] | None:
+    _load_probe_store()
+    with _probe_lock:
+        return _probe_memo.get(key)
+
+
+def _load_probe_store() -> None:
+    global _probe_store_loaded
+    with _probe_lock:
+        if _probe_store_loaded or not _persistence_enabled():
+            return
+        try:
+            stored = json.loads(
+                (files.user_cache_dir() / _PROBE_CACHE_FILE).read_text(encoding="utf-8")
+            )
+        except (OSError, ValueError):
+            stored = None
+        if isinstance(stored, dict):
+            for key, entry in stored.items():
+                _probe_memo.setdefault(key, entry)
+        # Set last: until then, other threads wait on the lock, not an empty memo.
+        _probe_store_loaded = True
+
+
+def _store_probe(key: str, entry: dict[str, Any]) -> None:
+    """Remember *entry*; the file is only rewritten when something changed."""
+    global _probe_generation
+    with _probe_lock:
+        if _probe_memo.get(key) == entry:
+            return
+        _probe_memo.pop(key, None)
+        _probe_memo[key] = entry
+        while len(_probe_memo) > _PROBE_CACHE_LIMIT:
+            del _probe_memo[next(iter(_probe_memo))]
+        _probe_generation += 1
+        generation = _probe_generation
+        snapshot = dict(_probe_memo)
+    _save_probe_store(snapshot, generation)
+
+
+def _save_probe_store(snapshot: dict[str, dict[str, Any]], generation: int) -> None:
+    global _probe_saved_generation
+    if not _persistence_enabled():
+        return
+    cache_dir = files.user_cache_dir()
+    with _probe_save_lock:
+        if generation <= _probe_saved_generation:
+            return
+        try:
+            files.ensure_dir(cache_dir)
+            files.write_text_atomic(
+                cache_dir / _PROBE_CACHE_FILE, json.dumps(snapshot, indent=1)
+            )
+        except OSError:
+            # The cache is an optimisation; never fail a command because of it.
+            return
+        _probe_saved_generation = generation
+
+
+# ── Record / replay ────────────────────────────────────────────────────────────
+RECORD_ENV = "API_BOOTSTRAPPER_RECORD"
+REPLAY_ENV = "API_BOOTSTRAPPER_REPLAY"
+REPLAY_LATENCY_ENV = "API_BOOTSTRAPPER_REPLAY_LATENCY"
+
+# Machine-specific paths are stored as placeholders so a transcript recorded
+# in one checkout replays in another.
+_CWD_TOKEN = "<cwd>"
+_HOME_TOKEN = "<home>"
+
+
+class TranscriptMissError(LookupError):
+    """Replay was asked for a command that was never recorded."""
+
+
+@dataclass
+class _Transcripts:
+    directory: Path
+    replay: bool
+    latency: bool = False
+    loaded: dict[str, list[dict[str, Any]]] = field(default_factory=dict)
+    served: dict[str, int] = field(default_factory=dict)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+_transcripts: _Transcripts | None = None
+
+
+def record_transcripts(directory: Path | None) -> None:
+    """Save every following command and its result under *directory*.
+
+    Each distinct command gets one JSON file listing its invocations in order:
+    the environment diff, stdout, stderr, exit code and duration. ``None``
+    stops recording.
+    """
+    global _transcripts
+    _transcripts = None if directory is None else _Transcripts(directory, False)
+
+
+def replay_transcripts(directory: Path | None, latency: bool = False) -> None:
+    """Answer every following command from transcripts saved in *directory*.
+
+    Nothing is spawned. Repeated commands get their recorded invocations in
+    order, and the last one again once the recording runs out. With
+    *latency* each answer waits for the recorded duration. Files the real
+    tools would have written are not recreated. ``None`` stops replaying.
+    """
+    global _transcripts
+    _transcripts = (
+        None if directory is None else _Transcripts(directory, True, latency=latency)
+    )
+
+
+def configure_transcripts_from_env() -> None:
+    """Enable record or replay from ``API_BOOTSTRAPPER_RECORD``/``_REPLAY``."""
+    if replay := os.environ.get(REPLAY_ENV):
+        replay_transcripts(
+            Path(replay), latency=bool(os.environ.get(REPLAY_LATENCY_ENV))
         )
-    except subprocess.CalledProcessError as e:
+    elif record := os.environ.get(RECORD_ENV):
+        record_transcripts(Path(record))
+
+
+def _raise_for_status(cmd: list[str], result: CommandResult) -> None:
+    if result.returncode != 0:
         raise ShellError(
-            f"Command failed: {' '.join(cmd)}\nExit code: {e.returncode}\n{e.stderr}"
-        ) from e
+            f"Command failed: {' '.join(cmd)}\nExit code: {result.returncode}\n"
+            f"{result.stderr or result.stdout}",
+            returncode=result.returncode,
+        )
+
+
+def _transcript_key(cmd: list[str], cwd: str | None) -> tuple[str, list[str]]:
+    # Resolved executables differ between machines; only the name matters.
+    argv = [_tokenize(arg, cwd) for arg in (Path(cmd[0]).name, *cmd[1:])]
+    digest = hashlib.sha256(json.dumps(argv).encode()).hexdigest()[:16]
+    return f"{argv[0]}-{digest}", argv
+
+
+def _tokenize(text: str, cwd: str | None) -> str:
+    if cwd:
+        text = text.replace(cwd, _CWD_TOKEN)
+    home = str(Path.home())
+    return text.replace(home, _HOME_TOKEN) if len(home) > 1 else text
+
+
+def _expand(text: str, cwd: str | None) -> str:
+    if cwd:
+        text = text.replace(_CWD_TOKEN, cwd)
+    return text.replace(_HOME_TOKEN, str(Path.home()))
+
+
+def _env_diff(env: Mapping[str, str] | None) -> dict[str, Any]:
+    if env is None:
+        return {}
+    return {
+        "set": {
+            key: value for key, value in env.items() if os.environ.get(key) != value
+        },
+        "unset": sorted(key for key in os.environ if key not in env),
+    }
+
+
+def _record(
+    transcripts: _Transcripts,
+    cmd: list[str],
+    cwd: str | None,
+    env: Mapping[str, str] | None,
+    result: CommandResult,
+    started: float,
+) -> None:
+    key, argv = _transcript_key(cmd, cwd)
+    path = transcripts.directory / f"{key}.json"
+    invocation = {
+        "env": _env_diff(env),
+        "stdout": _tokenize(result.stdout, cwd),
+        "stderr": _tokenize(result.stderr, cwd),
+        "returncode": result.returncode,
+        "duration": round(time.perf_counter() - started, 6),
+    }
+    with transcripts.lock:
+        invocations = transcripts.loaded.setdefault(key, [])
+        invocations.append(invocation)
+        files.ensure_dir(transcripts.directory)
+        files.write_text_atomic(
+            path,
+            json.dumps({"cmd": argv, "invocations": invocations}, indent=1) + "\n",
+        )
+
+
+def _replay(
+    transcripts: _Transcripts, cmd: list[str], cwd: str | None
+) -> tuple[CommandResult, float]:
+    key, argv = _transcript_key(cmd, cwd)
+    with transcripts.lock:
+        invocations = transcripts.loaded.get(key)
+        if invocations is None:
+            try:
+                data = json.loads(
+                    (transcripts.directory / f"{key}.json").read_text(encoding="utf-8")
+                )
+                invocations = list(data["invocations"])
+            except (OSError, ValueError, KeyError, TypeError):
+                invocations = []
+            transcripts.loaded[key] = invocations
+        index = transcripts.served.get(key, 0)
+        transcripts.served[key] = index + 1
+
+    if not invocations:
+        raise TranscriptMissError(
+            f"No transcript recorded for: {' '.join(argv)} "
+            f"(looked for {key}.json in {transcripts.directory})"
+        )
+    entry = invocations[min(index, len(invocations) - 1)]
+    result = CommandResult(
+        stdout=_expand(entry.get("stdout", ""), cwd),
+        stderr=_expand(entry.get("stderr", ""), cwd),
+        returncode=int(entry.get("returncode", 0)),
+    )
+    return result, float(entry.get("duration", 0.0))
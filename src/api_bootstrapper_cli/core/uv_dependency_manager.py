@@ -5,18 +5,28 @@ https://github.com/astral-sh/uv
 
 from __future__ import annotations
 
-import os
 import platform
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
 
 from rich.console import Console
 
+from api_bootstrapper_cli.core.environment import CleanEnvironment
+from api_bootstrapper_cli.core.executables import resolve_executable
+from api_bootstrapper_cli.core.install_stamp import InstallStamp
+from api_bootstrapper_cli.core.lock_files import uv_lock_is_current
+from api_bootstrapper_cli.core.protocols import LOCK_TIMEOUT, LockMode
 from api_bootstrapper_cli.core.shell import ShellError, exec_cmd
+from api_bootstrapper_cli.core.venv_templates import VenvTemplates
+from api_bootstrapper_cli.core.wheelhouse import Wheelhouse
 
 
 console = Console()
 
+SYNC_ARGS = ("sync", "--all-groups")
+
 
 @dataclass(frozen=True)
 class UvDependencyManager:
@@ -28,18 +38,29 @@ class UvDependencyManager:
     """
 
     name: str = field(default="uv")
+    on_output: Callable[[str], None] | None = field(
+        default=None, repr=False, compare=False
+    )
+    environment: CleanEnvironment = field(
+        default_factory=CleanEnvironment.capture, repr=False, compare=False
+    )
+    templates: VenvTemplates | None = field(default=None, repr=False, compare=False)
+    wheelhouse: Wheelhouse | None = field(default=None, repr=False, compare=False)
+
+    def _env(self) -> Mapping[str, str]:
+        return self.environment.for_backend("uv")
 
-    def _get_clean_env(self) -> dict[str, str]:
-        env = os.environ.copy()
-        env.pop("VIRTUAL_ENV", None)
-        env.pop("PYTHONPATH", None)
-        env.pop("PYTHONHOME", None)
-        env.pop("PYTHONSTARTUP", None)
-        return env
+    def _uv(self) -> str:
+        return resolve_executable("uv", self._env())
 
     def is_installed(self) -> bool:
         try:
-            exec_cmd(["uv", "--version"], check=True, env=self._get_clean_env())
+            exec_cmd(
+                [self._uv(), "--version"],
+                check=True,
+                env=self._env(),
+                cache=True,
+            )
             return True
         except (ShellError, FileNotFoundError):
             return False
@@ -51,10 +72,10 @@ class UvDependencyManager:
         """Create (or recreate) .venv with the specified Python interpreter."""
         try:
             exec_cmd(
-                ["uv", "venv", "--python", str(python_path)],
+                [self._uv(), "venv", "--python", str(python_path)],
                 cwd=str(project_root),
                 check=True,
-                env=self._get_clean_env(),
+                env=self._env(),
             )
         except ShellError as e:
             raise RuntimeError(
@@ -75,37 +96,134 @@ class UvDependencyManager:
             return
         try:
             exec_cmd(
-                ["uv", "venv"],
+                [self._uv(), "venv"],
                 cwd=str(project_root),
                 check=True,
-                env=self._get_clean_env(),
+                env=self._env(),
             )
         except ShellError as e:
             raise RuntimeError(f"[uv] Falha ao criar virtualenv: {e}") from e
 
-    def install_dependencies(self, project_root: Path) -> None:
+    def install_dependencies(
+        self,
+        project_root: Path,
+        force: bool = False,
+        lock_mode: LockMode = LockMode.update,
+    ) -> None:
         """Sync project dependencies with ``uv sync --all-groups``.
 
         Works with both PEP 621 (``[project]``) and Poetry-style
         (``[tool.poetry]``) pyproject.toml files.
         Installs all dependency groups including optional ones (e.g., dev).
+        Skipped when the install stamp matches, unless *force* is set.
+        A *lock_mode* other than ``update`` is passed on as ``--frozen`` or
+        ``--locked`` so uv never re-resolves. With a wheelhouse, uv reads
+        wheels from it, and only from it when offline.
         """
+        self.check_lock(project_root, lock_mode)
         self.ensure_venv(project_root)
+
+        stamp = InstallStamp.in_venv(self.get_venv_path(project_root))
+        if not force and stamp.matches(self._install_fingerprint(project_root)):
+            console.print("[dim][uv] Dependencies up to date[/dim]")
+            return
+        stamp.clear()
+        # The sync still runs: it only reinstalls the project itself, whose
+        # editable install in the clone points at the template's checkout.
+        key = self._template_key(project_root)
+        if not force and key is not None and self.templates is not None:
+            method = self.templates.materialize(key, self.get_venv_path(project_root))
+            if method is not None:
+                console.print(
+                    f"[dim][uv] Virtualenv cloned from template ({method})[/dim]"
+                )
+
         try:
             with console.status(
                 "[cyan][uv] Syncing dependencies...[/cyan]",
                 spinner="dots",
             ):
                 exec_cmd(
-                    ["uv", "sync", "--all-groups"],
+                    [
+                        self._uv(),
+                        *SYNC_ARGS,
+                        *_lock_flags(lock_mode),
+                        *self._sources(),
+                    ],
                     cwd=str(project_root),
                     check=True,
-                    env=self._get_clean_env(),
+                    env=self._env(),
+                    stream=True,
+                    on_output=self.on_output,
                 )
         except ShellError as e:
             raise RuntimeError(f"[uv] Falha ao sincronizar dependências: {e}") from e
+        stamp.write(self._install_fingerprint(project_root))
+        # Keyed again: an update-mode sync may have rewritten uv.lock.
+        key = self._template_key(project_root)
+        if key is not None and self.templates is not None:
+            self.templates.capture(key, self.get_venv_path(project_root))
+
+    def check_lock(self, project_root: Path, lock_mode: LockMode) -> None:
+        """Compare ``uv.lock`` with pyproject locally, without resolving."""
+        if lock_mode == LockMode.update:
+            return
+        if not (project_root / "uv.lock").exists():
+            raise RuntimeError(
+                f"[uv] uv.lock não encontrado; --{lock_mode.value} exige um lock file"
+            )
+        if lock_mode == LockMode.locked and not uv_lock_is_current(project_root):
+            raise RuntimeError(
+                "[uv] uv.lock desatualizado em relação ao pyproject.toml; "
+                "execute 'uv lock'"
+            )
+
+    def lock(self, project_root: Path) -> None:
+        """Resolve ``uv.lock`` for pyproject's ``requires-python``."""
+        self._uv_lock(project_root, "gerar")
+
+    def relock(self, project_root: Path) -> None:
+        """Re-resolve ``uv.lock`` against pyproject, keeping unaffected pins.
+
+        That is what ``uv lock`` does with an existing lock, so it is the same
+        command as :meth:`lock`.
+        """
+        self._uv_lock(project_root, "atualizar")
+
+    def _uv_lock(self, project_root: Path, action: str) -> None:
+        try:
+            exec_cmd(
+                [self._uv(), "lock", *self._sources()],
+                cwd=str(project_root),
+                check=True,
+                env=self._env(),
+                stream=True,
+                on_output=self.on_output,
+                timeout=LOCK_TIMEOUT,
+            )
+        except (ShellError, FileNotFoundError) as e:
+            raise RuntimeError(f"[uv] Falha ao {action} lock file: {e}") from e
+
+    def _sources(self) -> tuple[str, ...]:
+        return self.wheelhouse.uv_args() if self.wheelhouse else ()
+
+    def _template_key(self, project_root: Path) -> str | None:
+        if self.templates is None:
+            return None
+        return self.templates.key(
+            project_root, "uv.lock", self.get_venv_path(project_root), SYNC_ARGS
+        )
+
+    def _install_fingerprint(self, project_root: Path) -> dict[str, Any]:
+        return InstallStamp.fingerprint(
+            project_root, "uv.lock", self.get_venv_path(project_root), SYNC_ARGS
+        )
 
     def _resolve_venv_python(self, venv_path: Path) -> Path:
         if platform.system() == "Windows":
             return venv_path / "Scripts" / "python.exe"
         return venv_path / "bin" / "python"
+
+
+def _lock_flags(lock_mode: LockMode) -> tuple[str, ...]:
+    return () if lock_mode == LockMode.update else (f"--{lock_mode.value}",)
@@ -6,17 +6,29 @@ https://github.com/astral-sh/uv
 from __future__ import annotations
 
 import os
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass, field
 from pathlib import Path
 
 from rich.console import Console
 
+from api_bootstrapper_cli.core.environment import CleanEnvironment
+from api_bootstrapper_cli.core.executables import resolve_executable
 from api_bootstrapper_cli.core.shell import ShellError, exec_cmd
 
 
 console = Console()
 
 
+def uv_python_dir(env: Mapping[str, str] | None = None) -> Path:
+    """Return the directory where uv installs managed interpreters."""
+    environ = os.environ if env is None else env
+    if install_dir := environ.get("UV_PYTHON_INSTALL_DIR"):
+        return Path(install_dir)
+    data_home = environ.get("XDG_DATA_HOME") or Path.home() / ".local" / "share"
+    return Path(data_home) / "uv" / "python"
+
+
 @dataclass(frozen=True)
 class UvPythonManager:
     """PythonEnvironmentManager implementation using uv.
@@ -26,18 +38,27 @@ class UvPythonManager:
     """
 
     name: str = field(default="uv")
+    on_output: Callable[[str], None] | None = field(
+        default=None, repr=False, compare=False
+    )
+    environment: CleanEnvironment = field(
+        default_factory=CleanEnvironment.capture, repr=False, compare=False
+    )
+
+    def _env(self) -> Mapping[str, str]:
+        return self.environment.for_backend("uv")
 
-    def _get_clean_env(self) -> dict[str, str]:
-        env = os.environ.copy()
-        env.pop("VIRTUAL_ENV", None)
-        env.pop("PYTHONPATH", None)
-        env.pop("PYTHONHOME", None)
-        env.pop("PYTHONSTARTUP", None)
-        return env
+    def _uv(self) -> str:
+        return resolve_executable("uv", self._env())
 
     def is_installed(self) -> bool:
         try:
-            exec_cmd(["uv", "--version"], check=True, env=self._get_clean_env())
+            exec_cmd(
+                [self._uv(), "--version"],
+                check=True,
+                env=self._env(),
+                cache=True,
+            )
             return True
         except (ShellError, FileNotFoundError):
             return False
@@ -50,9 +71,11 @@ class UvPythonManager:
                 spinner="dots",
             ):
                 exec_cmd(
-                    ["uv", "python", "install", version],
+                    [self._uv(), "python", "install", version],
                     check=True,
-                    env=self._get_clean_env(),
+                    env=self._env(),
+                    stream=True,
+                    on_output=self.on_output,
                 )
         except ShellError as e:
             raise RuntimeError(
@@ -63,10 +86,10 @@ class UvPythonManager:
         """Pin the Python version for the project (creates .python-version)."""
         try:
             exec_cmd(
-                ["uv", "python", "pin", version],
+                [self._uv(), "python", "pin", version],
                 cwd=str(project_root),
                 check=True,
-                env=self._get_clean_env(),
+                env=self._env(),
             )
         except ShellError as e:
             raise RuntimeError(
@@ -77,9 +100,11 @@ class UvPythonManager:
         """Return the path to the Python binary for the given version."""
         try:
             res = exec_cmd(
-                ["uv", "python", "find", version],
+                [self._uv(), "python", "find", version],
                 check=True,
-                env=self._get_clean_env(),
+                env=self._env(),
+                cache=True,
+                cache_watch=[uv_python_dir(self._env())],
             )
         except ShellError as e:
             raise RuntimeError(
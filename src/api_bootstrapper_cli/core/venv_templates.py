@@ -0,0 +1,364 @@
+"""Content-addressed store of installed virtualenvs, cloned into new projects.
+
+After a successful install, the venv is captured under the user cache dir,
+keyed by its base interpreter, the lock file and its hash, and the install
+arguments (group selection). A fresh venv for the same key is then
+materialized by cloning the template instead of installing. Files are
+reflinked where the filesystem supports copy-on-write, hard-linked where it
+does not, and copied as a last resort.
+
+Capturing copies the whole venv unless it can be reflinked, so it only
+happens on copy-on-write filesystems, or anywhere once copies are opted into.
+The store keeps the most recently used templates and drops the rest.
+
+The clone keeps the new venv's own ``pyvenv.cfg`` and the files its creator
+wrote under ``bin/`` (activation scripts, interpreter links). In every other
+script and ``.pth`` file, the template's venv path is rewritten to the new
+one. Rewritten files are replaced, never edited in place, so a hard-linked
+template is left untouched.
+"""
+
+from __future__ import annotations
+
+import errno
+import hashlib
+import json
+import os
+import platform
+import re
+import shutil
+import sys
+import tomllib
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+from api_bootstrapper_cli.core import files
+
+
+NO_TEMPLATES_ENV = "API_BOOTSTRAPPER_NO_VENV_TEMPLATES"
+TEMPLATE_COPIES_ENV = "API_BOOTSTRAPPER_VENV_TEMPLATE_COPIES"
+TEMPLATE_FILE = "template.json"
+TEMPLATE_LIMIT = 8
+
+# ioctl(dest, FICLONE, src): share src's extents (btrfs, XFS, bcachefs...).
+_FICLONE = 0x40049409
+# Present in any venv right after creation, before an install.
+_SEED_DISTRIBUTIONS = frozenset({"pip", "setuptools", "wheel"})
+# Per-venv state that must not travel with a template.
+_VENV_STATE = frozenset(
+    {".api-bootstrapper-install.json", ".api-bootstrapper-result.json"}
+)
+
+
+def templates_enabled() -> bool:
+    return not os.environ.get(NO_TEMPLATES_ENV)
+
+
+def template_copies_enabled() -> bool:
+    return bool(os.environ.get(TEMPLATE_COPIES_ENV))
+
+
+class VenvTemplates:
+    def __init__(
+        self,
+        root: Path | None = None,
+        limit: int = TEMPLATE_LIMIT,
+        copy: bool = False,
+    ) -> None:
+        self._root = root or files.user_cache_dir() / "venv-templates"
+        self._limit = limit
+        self._copy = copy
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    def key(
+        self, project_root: Path, lock_file: str, venv_path: Path, args: Sequence[str]
+    ) -> str | None:
+        """The template key for this install, or ``None`` when none applies.
+
+        Locks with path or directory dependencies get no key: those install
+        from the project's own checkout.
+        """
+        lock_path = project_root / lock_file
+        lock = files.sha256_file(lock_path)
+        interpreter = _interpreter(venv_path / "pyvenv.cfg")
+        if lock is None or interpreter is None or _has_local_sources(lock_path):
+            return None
+        data = {
+            "interpreter": interpreter,
+            "lock_file": lock_file,
+            "lock": lock,
+            "args": list(args),
+            "platform": f"{sys.platform}-{platform.machine()}",
+        }
+        return hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
+
+    def has(self, key: str) -> bool:
+        return (self._root / key / TEMPLATE_FILE).is_file()
+
+    def materialize(self, key: str, venv_path: Path) -> str | None:
+        """Replace the fresh venv at *venv_path* with a clone of template *key*.
+
+        Return how files were cloned ("reflink", "hardlink" or "copy"), or
+        ``None`` when there is no template or the venv already holds
+        packages, which a clone would throw away.
+        """
+        template = self._root / key
+        try:
+            origin = json.loads(files.read_text(template / TEMPLATE_FILE))["origin"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        if not _is_fresh(venv_path):
+            return None
+        _touch(template)
+
+        staging = venv_path.with_name(f".{venv_path.name}.template-{os.getpid()}")
+        trash = venv_path.with_name(f".{venv_path.name}.old-{os.getpid()}")
+        shutil.rmtree(staging, ignore_errors=True)
+        try:
+            method = clone_tree(template / "venv", staging)
+            own = _overlay(venv_path, staging)
+            _rewrite_paths(staging, origin, str(venv_path), skip=own)
+            os.rename(venv_path, trash)
+            os.rename(staging, venv_path)
+        except OSError:
+            shutil.rmtree(staging, ignore_errors=True)
+            if trash.exists() and not venv_path.exists():
+                os.rename(trash, venv_path)
+            return None
+        shutil.rmtree(trash, ignore_errors=True)
+        return method
+
+    def capture(self, key: str, venv_path: Path) -> None:
+        """Save *venv_path* as template *key*; best effort, first writer wins.
+
+        Reflinked, or copied when copies are enabled; never hard-linked: the
+        project may later change its venv in place. The least recently used
+        templates beyond the limit are removed afterwards.
+        """
+        if self.has(key):
+            return
+        files.ensure_dir(self._root)
+        staging = self._root / f".{key}.{os.getpid()}.tmp"
+        shutil.rmtree(staging, ignore_errors=True)
+        try:
+            clone_tree(venv_path, staging / "venv", hardlink=False, copy=self._copy)
+            for name in _VENV_STATE:
+                (staging / "venv" / name).unlink(missing_ok=True)
+            files.write_text_atomic(
+                staging / TEMPLATE_FILE, json.dumps({"origin": str(venv_path)})
+            )
+            os.rename(staging, self._root / key)
+        except OSError:
+            # Not cached (no reflinks, no space), or another process stored
+            # the same template first.
+            shutil.rmtree(staging, ignore_errors=True)
+            return
+        self._prune()
+
+    def _prune(self) -> None:
+        templates = sorted(
+            (
+                entry
+                for entry in self._root.iterdir()
+                if not entry.name.startswith(".") and entry.is_dir()
+            ),
+            key=_last_used,
+            reverse=True,
+        )
+        for template in templates[self._limit :]:
+            # Renamed first: a concurrent materialize sees no half-removed
+            # template, only a missing one.
+            trash = self._root / f".{template.name}.{os.getpid()}.old"
+            try:
+                os.rename(template, trash)
+            except OSError:
+                continue
+            shutil.rmtree(trash, ignore_errors=True)
+
+
+def clone_tree(src: Path, dst: Path, hardlink: bool = True, copy: bool = True) -> str:
+    """Recreate *src* at *dst*; return the weakest method any file needed.
+
+    Symlinks are recreated as symlinks. Methods are tried from reflink down
+    to copy, and once one fails the rest of the tree skips it. When the last
+    allowed method fails, :class:`OSError` is raised.
+    """
+    methods = ["reflink"]
+    if hardlink:
+        methods.append("hardlink")
+    if copy:
+        methods.append("copy")
+    if not sys.platform.startswith("linux"):
+        methods.remove("reflink")
+    if not methods:
+        raise OSError(errno.EOPNOTSUPP, "No way to clone files", str(src))
+    pending = [(src, dst)]
+    while pending:
+        source, target = pending.pop()
+        target.mkdir(parents=True)
+        shutil.copymode(source, target)
+        for entry in os.scandir(source):
+            destination = target / entry.name
+            if entry.is_symlink():
+                os.symlink(os.readlink(entry.path), destination)
+            elif entry.is_dir():
+                pending.append((Path(entry.path), destination))
+            else:
+                _clone_file(Path(entry.path), destination, methods)
+    return methods[0]
+
+
+def _clone_file(src: Path, dst: Path, methods: list[str]) -> None:
+    while True:
+        method = methods[0]
+        try:
+            if method == "reflink":
+                _reflink(src, dst)
+            elif method == "hardlink":
+                os.link(src, dst)
+            else:
+                shutil.copy2(src, dst)
+            return
+        except OSError as e:
+            if len(methods) == 1 or e.errno in (errno.ENOSPC, errno.EDQUOT):
+                raise
+            dst.unlink(missing_ok=True)
+            methods.pop(0)
+
+
+def _reflink(src: Path, dst: Path) -> None:
+    import fcntl  # POSIX only; reflinks are only tried on Linux.
+
+    with open(src, "rb") as source, open(dst, "wb") as target:
+        fcntl.ioctl(target.fileno(), _FICLONE, source.fileno())
+    shutil.copystat(src, dst)
+
+
+def _overlay(fresh: Path, staging: Path) -> set[Path]:
+    """Put the fresh venv's own files over the clone; return their paths."""
+    own = {staging / "pyvenv.cfg"}
+    _replace(fresh / "pyvenv.cfg", staging / "pyvenv.cfg")
+    scripts = "Scripts" if (fresh / "Scripts").is_dir() else "bin"
+    if not (fresh / scripts).is_dir():
+        return own
+    files.ensure_dir(staging / scripts)
+    for entry in os.scandir(fresh / scripts):
+        if entry.is_dir(follow_symlinks=False):
+            continue
+        target = staging / scripts / entry.name
+        _replace(Path(entry.path), target)
+        own.add(target)
+    return own
+
+
+def _replace(src: Path, dst: Path) -> None:
+    # Unlink first: writing through a hard link would edit the template.
+    dst.unlink(missing_ok=True)
+    shutil.copy2(src, dst, follow_symlinks=False)
+
+
+def _rewrite_paths(venv: Path, old: str, new: str, skip: set[Path]) -> None:
+    """Point scripts and ``.pth`` files of the clone at its new location."""
+    if old == new:
+        return
+    candidates: list[Path] = []
+    for scripts in (venv / "bin", venv / "Scripts"):
+        if scripts.is_dir():
+            candidates.extend(scripts.iterdir())
+    for site_packages in (
+        *venv.glob("lib/python*/site-packages"),
+        venv / "Lib/site-packages",
+    ):
+        if site_packages.is_dir():
+            candidates.extend(site_packages.glob("*.pth"))
+
+    old_bytes, new_bytes = os.fsencode(old), os.fsencode(new)
+    # Whole path components only: "/p/.venv" must not match "/p/.venv2".
+    pattern = re.compile(
+        rb"(?<![\w.~/\\\x80-\xff-])" + re.escape(old_bytes) + rb"(?![\w.~\x80-\xff-])"
+    )
+    for path in candidates:
+        if path in skip or path.is_symlink() or not path.is_file():
+            continue
+        data = path.read_bytes()
+        if old_bytes not in data or b"\0" in data:
+            continue
+        rewritten = pattern.sub(lambda _: new_bytes, data)
+        if rewritten == data:
+            continue
+        mode = path.stat().st_mode
+        path.unlink()
+        path.write_bytes(rewritten)
+        path.chmod(mode)
+
+
+def _touch(template: Path) -> None:
+    try:
+        os.utime(template)
+    except OSError:
+        pass
+
+
+def _last_used(template: Path) -> float:
+    try:
+        return template.stat().st_mtime
+    except OSError:
+        return 0.0
+
+
+def _interpreter(cfg: Path) -> str | None:
+    """``pyvenv.cfg`` without the project-specific prompt."""
+    try:
+        lines = files.read_text(cfg).splitlines()
+    except (OSError, UnicodeDecodeError):
+        return None
+    kept = [
+        line.strip()
+        for line in lines
+        if line.strip() and line.partition("=")[0].strip().lower() != "prompt"
+    ]
+    return "\n".join(sorted(kept))
+
+
+def _is_fresh(venv_path: Path) -> bool:
+    if not venv_path.is_dir():
+        return False
+    site_packages = [
+        *venv_path.glob("lib/python*/site-packages"),
+        venv_path / "Lib" / "site-packages",
+    ]
+    installed = {
+        entry.name.partition("-")[0].lower()
+        for directory in site_packages
+        for entry in directory.glob("*.dist-info")
+    }
+    return installed <= _SEED_DISTRIBUTIONS
+
+
+def _has_local_sources(lock_path: Path) -> bool:
+    """Whether the lock installs path, directory or editable dependencies."""
+    try:
+        data = _load_toml(lock_path)
+    except (OSError, ValueError):
+        return True
+    for package in data.get("package", []):
+        source = package.get("source", {})
+        if not isinstance(source, dict):
+            continue
+        # poetry.lock
+        if source.get("type") in ("directory", "file"):
+            return True
+        # uv.lock: the project itself is the "." entry.
+        for kind in ("editable", "directory", "path"):
+            if kind in source and source[kind] != ".":
+                return True
+    return False
+
+
+def _load_toml(path: Path) -> dict[str, Any]:
+    with path.open("rb") as f:
+        return tomllib.load(f)
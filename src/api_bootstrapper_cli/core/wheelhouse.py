@@ -0,0 +1,311 @@
+"""Install from a local directory of wheels instead of the package index.
+
+A wheelhouse is a flat directory of wheels, read with pip's and uv's
+``--find-links``. Offline, the index is not consulted at all. Poetry cannot
+read such a directory, so a Poetry project installs from it with pip inside
+its venv: exactly the packages ``poetry.lock`` pins, with their hashes and
+without resolving (see :mod:`~api_bootstrapper_cli.core.poetry_lock`).
+
+:func:`build_wheelhouse` fills a wheelhouse with what a project's lock
+installs, as wheels for one interpreter. A wheel pip builds from a locked
+sdist has a hash the lock does not know; the wheelhouse records it in
+``built-hashes.json`` so the hash-checked install accepts it.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import tempfile
+import tomllib
+from collections import Counter
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from api_bootstrapper_cli.core import files
+from api_bootstrapper_cli.core.poetry_lock import (
+    locked_packages,
+    normalize,
+    poetry_tables,
+)
+from api_bootstrapper_cli.core.shell import ShellError, exec_cmd
+
+
+WHEELHOUSE_ENV = "API_BOOTSTRAPPER_WHEELHOUSE"
+OFFLINE_ENV = "API_BOOTSTRAPPER_OFFLINE"
+BUILT_HASHES_FILE = "built-hashes.json"
+
+_NAME = re.compile(r"^\s*([A-Za-z0-9][A-Za-z0-9._-]*)\s*(\[[^\]]*\])?")
+
+
+@dataclass(frozen=True)
+class Wheelhouse:
+    path: Path
+    offline: bool = False
+
+    def pip_args(self, index_urls: Sequence[str] = ()) -> tuple[str, ...]:
+        """*index_urls* are extra indexes, left out offline."""
+        args = ("--find-links", str(self.path))
+        if self.offline:
+            return (*args, "--no-index")
+        return (*args, *_extra_index_args(index_urls))
+
+    def uv_args(self) -> tuple[str, ...]:
+        # --offline also keeps uv from fetching anything --no-index allows,
+        # such as direct URL dependencies; its cache still counts.
+        return (*self.pip_args(), "--offline") if self.offline else self.pip_args()
+
+
+@dataclass(frozen=True)
+class LockedRequirements:
+    """Direct requirements of a project and the versions its lock pins."""
+
+    requirements: list[str]
+    constraints: list[str]
+
+
+def locked_requirements(project_root: Path, lock_file: str) -> LockedRequirements:
+    """Read *lock_file* and pyproject's dependency tables, without a resolver.
+
+    Every dependency group is included, optional Poetry groups and extras
+    are not. Only packages from an index are pinned; path, URL and git
+    dependencies are requirements of their own.
+    """
+    pyproject = _load_toml(project_root / "pyproject.toml")
+    lock = _load_toml(project_root / lock_file)
+
+    requirements = list(pyproject.get("project", {}).get("dependencies", []))
+    for group in pyproject.get("dependency-groups", {}).values():
+        # ``{include-group = "..."}`` tables: that group is listed anyway.
+        requirements.extend(entry for entry in group if isinstance(entry, str))
+    requirements.extend(
+        pyproject.get("tool", {}).get("uv", {}).get("dev-dependencies", [])
+    )
+    for table in poetry_tables(pyproject):
+        for name, spec in table.items():
+            if name.lower() != "python":
+                requirements.extend(_poetry_requirement(name, spec, project_root))
+
+    constraints = _pins(
+        [
+            package
+            for package in lock.get("package", [])
+            if _from_index(package.get("source"))
+        ]
+    )
+    return LockedRequirements(_unique(requirements), constraints)
+
+
+def build_wheelhouse(
+    wheelhouse: Path,
+    project_root: Path,
+    python: Path,
+    extra: Sequence[str] = (),
+    env: Mapping[str, str] | None = None,
+    on_output: Callable[[str], None] | None = None,
+) -> None:
+    """Add wheels for everything *project_root*'s lock installs, for *python*.
+
+    Also what building the project needs (``build-system.requires``) and
+    *extra* requirements. Wheels already in *wheelhouse* are reused, so a
+    run for the next project only fetches what is new.
+    """
+    lock_file = next(
+        (name for name in ("poetry.lock", "uv.lock") if (project_root / name).exists()),
+        None,
+    )
+    if lock_file is None:
+        raise ValueError(f"No poetry.lock or uv.lock in {project_root}")
+    build = _load_toml(project_root / "pyproject.toml").get("build-system", {})
+    build_requires = [*build.get("requires", []), *extra]
+
+    def pip_wheel(*args: str) -> None:
+        exec_cmd(
+            [
+                str(python),
+                "-m",
+                "pip",
+                "wheel",
+                "--wheel-dir",
+                str(wheelhouse),
+                "--find-links",
+                str(wheelhouse),
+                *args,
+            ],
+            cwd=str(project_root),
+            check=True,
+            env=env,
+            stream=True,
+            on_output=on_output,
+        )
+
+    files.ensure_dir(wheelhouse)
+    try:
+        if lock_file == "poetry.lock":
+            _build_poetry_wheels(wheelhouse, project_root, pip_wheel)
+            if requirements := _unique(build_requires):
+                pip_wheel(*requirements)
+            return
+        locked = locked_requirements(project_root, lock_file)
+        with requirements_file(locked.constraints) as constraints:
+            pip_wheel(
+                "--constraint",
+                str(constraints),
+                *_unique([*locked.requirements, *build_requires]),
+            )
+    except ShellError as e:
+        raise RuntimeError(
+            f"[wheelhouse] Falha ao baixar wheels de {project_root.name}: {e}"
+        ) from e
+
+
+def built_hashes(wheelhouse: Path) -> dict[str, list[str]]:
+    """Hashes of the wheels built from locked sdists, per ``name==version``."""
+    try:
+        recorded = json.loads(files.read_text(wheelhouse / BUILT_HASHES_FILE))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    return recorded if isinstance(recorded, dict) else {}
+
+
+@contextmanager
+def requirements_file(lines: Sequence[str]) -> Iterator[Path]:
+    """A temporary pip requirements or constraints file holding *lines*."""
+    with tempfile.TemporaryDirectory(prefix="api-bootstrapper-") as directory:
+        path = Path(directory) / "requirements.txt"
+        path.write_text("".join(f"{line}\n" for line in lines))
+        yield path
+
+
+def _build_poetry_wheels(
+    wheelhouse: Path, project_root: Path, pip_wheel: Callable[..., None]
+) -> None:
+    """Wheels for the exact ``poetry.lock`` set, hash-checked like the install."""
+    locked = locked_packages(project_root, built_hashes(wheelhouse))
+    before = set(wheelhouse.glob("*.whl"))
+    if locked.hashed:
+        with requirements_file(locked.hashed) as requirements:
+            pip_wheel(
+                "--no-deps",
+                "--require-hashes",
+                *_extra_index_args(locked.index_urls),
+                "--requirement",
+                str(requirements),
+            )
+    if locked.direct:
+        pip_wheel("--no-deps", *locked.direct)
+
+    known = {value for values in locked.hashes.values() for value in values}
+    recorded = built_hashes(wheelhouse)
+    for wheel in sorted(set(wheelhouse.glob("*.whl")) - before):
+        digest = f"sha256:{files.sha256_file(wheel)}"
+        name, version = wheel.name.split("-")[:2]
+        pin = f"{normalize(name)}=={version}"
+        if pin in locked.hashes and digest not in known:
+            recorded[pin] = sorted({*recorded.get(pin, []), digest})
+    if recorded:
+        files.write_text_atomic(
+            wheelhouse / BUILT_HASHES_FILE,
+            json.dumps(recorded, indent=2, sort_keys=True),
+        )
+
+
+def _extra_index_args(index_urls: Sequence[str]) -> tuple[str, ...]:
+    return tuple(arg for url in index_urls for arg in ("--extra-index-url", url))
+
+
+def _poetry_requirement(name: str, spec: Any, project_root: Path) -> list[str]:
+    """PEP 508 requirements for one Poetry dependency; versions come from the lock."""
+    if isinstance(spec, list):
+        return [
+            requirement
+            for entry in spec
+            for requirement in _poetry_requirement(name, entry, project_root)
+        ]
+    if not isinstance(spec, dict):
+        return [name]
+    if spec.get("optional", False):
+        return []
+
+    requirement = name
+    if extras := spec.get("extras"):
+        requirement += f"[{','.join(extras)}]"
+    if "path" in spec:
+        requirement += f" @ {(project_root / spec['path']).resolve().as_uri()}"
+    elif "url" in spec:
+        requirement += f" @ {spec['url']}"
+    elif "git" in spec:
+        ref = spec.get("rev") or spec.get("tag") or spec.get("branch")
+        requirement += f" @ git+{spec['git']}" + (f"@{ref}" if ref else "")
+
+    markers = [spec["markers"]] if "markers" in spec else []
+    if "platform" in spec:
+        markers.append(f'sys_platform == "{spec["platform"]}"')
+    if markers:
+        requirement += " ; " + " and ".join(f"({marker})" for marker in markers)
+    return [requirement]
+
+
+def _pins(packages: list[dict[str, Any]]) -> list[str]:
+    """One ``name==version`` constraint per name, as pip requires.
+
+    A uv lock that forks on markers lists a name once per fork, each with
+    its ``resolution-markers``. Those pins carry their markers, and pip
+    keeps the one matching the target interpreter. A repeated name without
+    markers keeps its first pin.
+    """
+    forks = Counter(normalize(package["name"]) for package in packages)
+    pinned: set[str] = set()
+    pins: list[str] = []
+    for package in packages:
+        name = normalize(package["name"])
+        pin = f"{package['name']}=={package['version']}"
+        markers = package.get("resolution-markers", [])
+        if forks[name] > 1 and markers:
+            pins.append(pin + " ; " + " or ".join(f"({m})" for m in markers))
+        elif name not in pinned:
+            pinned.add(name)
+            pins.append(pin)
+    return pins
+
+
+def _from_index(source: Any) -> bool:
+    # poetry.lock: no source for PyPI, type "legacy" for other indexes.
+    # uv.lock: {registry = "..."}.
+    if not isinstance(source, dict) or not source:
+        return True
+    return source.get("type") == "legacy" or "registry" in source
+
+
+def _unique(requirements: list[str]) -> list[str]:
+    """Keep the first requirement per name and extras.
+
+    Poetry 2 lists a dependency under ``[project]`` and again in
+    ``[tool.poetry]``; versions do not matter, the lock pins them. Entries
+    with markers or URLs are kept as they are.
+    """
+    seen: set[str] = set()
+    unique: list[str] = []
+    for requirement in requirements:
+        key = requirement.replace(" ", "").lower()
+        match = _NAME.match(requirement)
+        if match and ";" not in requirement and "@" not in requirement:
+            extras = (match[2] or "").replace(" ", "").lower()
+            key = normalize(match[1]) + extras
+        if key not in seen:
+            seen.add(key)
+            unique.append(requirement)
+    return unique
+
+
+def _load_toml(path: Path) -> dict[str, Any]:
+    try:
+        with path.open("rb") as f:
+            return tomllib.load(f)
+    except FileNotFoundError:
+        return {}
+    except tomllib.TOMLDecodeError as e:
+        raise ValueError(f"{path.name}: {e}") from e
@@ -0,0 +1,21 @@
+"""Console entry point: hand the command to a running daemon, else run it here.
+
+Nothing here imports typer or rich, so a command the daemon answers skips
+their import entirely.
+"""
+
+from __future__ import annotations
+
+import sys
+
+
+def main() -> None:
+    from api_bootstrapper_cli.core import daemon
+
+    exit_code = daemon.forward(sys.argv[1:])
+    if exit_code is not None:
+        sys.exit(exit_code)
+
+    from api_bootstrapper_cli.cli import main as cli_main
+
+    cli_main()
@@ -1,14 +1,21 @@
 from __future__ import annotations
 
+import os
 import re
 from pathlib import Path
 from typing import Generator
 
 import pytest
 
+from api_bootstrapper_cli.core import executables, shell
+from api_bootstrapper_cli.core.files import CACHE_DIR_ENV
+from tests.fakes import FakeToolchain
+
 
 BOX_BORDER_RE = re.compile(r"^[╭╰│].*[╮╯│]$")
 
+_search_executable = executables._search
+
 
 def strip_ansi_codes(text: str) -> str:
     ansi_escape = re.compile(r"\x1b\[[0-9;]*m")
@@ -21,6 +28,41 @@ def normalize_help_lines(text: str) -> list[str]:
     return [ln for ln in lines if not BOX_BORDER_RE.match(ln)]
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path_factory: pytest.TempPathFactory, monkeypatch) -> Path:
+    """Keep probe caches and other user-level state out of the real home."""
+    cache_dir = tmp_path_factory.mktemp("cache")
+    monkeypatch.setenv(CACHE_DIR_ENV, str(cache_dir))
+    shell._probe_memo.clear()
+    monkeypatch.setattr(shell, "_probe_store_loaded", False)
+    return cache_dir
+
+
+@pytest.fixture(autouse=True)
+def bare_executables(monkeypatch) -> None:
+    """Resolve tools to their bare names so command assertions stay stable."""
+    executables.clear_executable_cache()
+    monkeypatch.setattr(executables, "_search", lambda *args: None)
+
+
+@pytest.fixture
+def fake_toolchain(
+    tmp_path_factory: pytest.TempPathFactory, monkeypatch
+) -> FakeToolchain:
+    """Put stand-in pyenv/poetry/uv executables first on PATH.
+
+    The stand-ins never touch the network; see ``tests/fakes`` for the
+    subcommands they implement and how to add delays or failures.
+    """
+    toolchain = FakeToolchain(tmp_path_factory.mktemp("toolchain"))
+    for name, value in toolchain.env().items():
+        monkeypatch.setenv(name, value)
+    monkeypatch.setenv("PATH", f"{toolchain.bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.delenv("PYENV_VERSION", raising=False)
+    monkeypatch.setattr(executables, "_search", _search_executable)
+    return toolchain
+
+
 @pytest.fixture
 def expected_bootstrap_help() -> list[str]:
     return [
@@ -58,7 +58,7 @@ def test_should_execute_full_bootstrap_workflow(
     ]
 
     mocker.patch(
-        "api_bootstrapper_cli.core.poetry_manager.PoetryManager._get_poetry_cmd",
+        "api_bootstrapper_cli.core.poetry_manager.resolve_executable",
         return_value="poetry",
     )
 
@@ -116,7 +116,7 @@ def test_should_skip_install_when_flag_is_set(
     ]
 
     mocker.patch(
-        "api_bootstrapper_cli.core.poetry_manager.PoetryManager._get_poetry_cmd",
+        "api_bootstrapper_cli.core.poetry_manager.resolve_executable",
         return_value="poetry",
     )
 
@@ -179,9 +179,9 @@ def test_should_create_minimal_pyproject_when_missing(mocker, tmp_path: Path):
         ),  # install_pip_packages (pip install)
     ]
 
-    # Mock _get_poetry_cmd to bypass pyenv which poetry call
+    # Mock resolve_executable to bypass the pyenv which poetry call
     mocker.patch(
-        "api_bootstrapper_cli.core.poetry_manager.PoetryManager._get_poetry_cmd",
+        "api_bootstrapper_cli.core.poetry_manager.resolve_executable",
         return_value="poetry",
     )
 
@@ -226,7 +226,7 @@ def test_should_show_poetry_command_for_normal_path(mocker, tmp_path: Path):
     ]
 
     mocker.patch(
-        "api_bootstrapper_cli.core.poetry_manager.PoetryManager._get_poetry_cmd",
+        "api_bootstrapper_cli.core.poetry_manager.resolve_executable",
         return_value="poetry",
     )
 
@@ -282,7 +282,7 @@ def test_should_prioritize_poetry_command_for_special_chars_path(
     ]
 
     mocker.patch(
-        "api_bootstrapper_cli.core.poetry_manager.PoetryManager._get_poetry_cmd",
+        "api_bootstrapper_cli.core.poetry_manager.resolve_executable",
         return_value="poetry",
     )
 
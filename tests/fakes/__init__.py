@@ -0,0 +1,4 @@
+from tests.fakes.toolchain import Call, FakeToolchain
+
+
+__all__ = ["Call", "FakeToolchain"]
@@ -0,0 +1,288 @@
+"""Stand-in implementations of pyenv, Poetry, uv and Python.
+
+The executables written by ``FakeToolchain`` import this module and call
+``main(<tool>)``. Everything the tools would download or compile is replaced
+by small files under ``$FAKE_TOOLCHAIN_HOME``; every invocation is appended to
+``calls.jsonl`` there, and ``config.json`` can add delays and failures.
+Only the standard library is used, so the stand-ins start fast.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+
+HOME_ENV = "FAKE_TOOLCHAIN_HOME"
+CONFIG_FILE = "config.json"
+CALLS_FILE = "calls.jsonl"
+
+TOOL_VERSIONS = {
+    "pyenv": "pyenv 2.4.0",
+    "poetry": "Poetry (version 1.8.3)",
+    "uv": "uv 0.5.0",
+}
+
+
+class ToolError(Exception):
+    def __init__(self, message: str, returncode: int = 1) -> None:
+        super().__init__(message)
+        self.returncode = returncode
+
+
+def home() -> Path:
+    return Path(os.environ[HOME_ENV])
+
+
+def bin_dir() -> Path:
+    return home() / "bin"
+
+
+def pyenv_versions_dir() -> Path:
+    return Path(os.environ.get("PYENV_ROOT") or home() / "pyenv") / "versions"
+
+
+def uv_python_dir() -> Path:
+    return Path(os.environ.get("UV_PYTHON_INSTALL_DIR") or home() / "uv-python")
+
+
+def write_executable(path: Path, tool: str) -> Path:
+    """Write a launcher at *path* that runs ``main(tool)`` from this module."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        f"#!{sys.executable}\n"
+        "import sys\n"
+        f"sys.path.insert(0, {str(Path(__file__).parent)!r})\n"
+        "from fake_tool import main\n"
+        f"sys.exit(main({tool!r}))\n"
+    )
+    path.chmod(0o755)
+    return path
+
+
+def create_interpreter(prefix: Path, version: str) -> Path:
+    prefix.mkdir(parents=True, exist_ok=True)
+    (prefix / "version").write_text(version + "\n")
+    return write_executable(prefix / "bin" / "python", "python")
+
+
+def create_venv(project: Path, python: Path) -> Path:
+    venv = project / ".venv"
+    version = interpreter_version(python)
+    (venv / "bin").mkdir(parents=True, exist_ok=True)
+    (venv / "pyvenv.cfg").write_text(
+        f"home = {python.parent}\nversion = {version}\ninclude-system-site-packages = false\n"
+    )
+    write_executable(venv / "bin" / "python", "python")
+    return venv
+
+
+def interpreter_version(python: Path) -> str:
+    prefix = python.parent.parent
+    if (cfg := prefix / "pyvenv.cfg").is_file():
+        for line in cfg.read_text().splitlines():
+            key, _, value = line.partition("=")
+            if key.strip() == "version":
+                return value.strip()
+    if (version_file := prefix / "version").is_file():
+        return version_file.read_text().strip()
+    raise ToolError(f"{python}: not a fake interpreter")
+
+
+# ── pyenv ──────────────────────────────────────────────────────────────────────
+
+
+def pyenv(args: list[str]) -> str:
+    match args:
+        case ["--version"]:
+            return TOOL_VERSIONS["pyenv"]
+        case ["versions", "--bare"]:
+            root = pyenv_versions_dir()
+            names = sorted(p.name for p in root.iterdir()) if root.is_dir() else []
+            return "\n".join(names)
+        case ["install", "-s", version] | ["install", version]:
+            create_interpreter(_pyenv_prefix(version), version)
+            return f"Installed Python-{version} to {_pyenv_prefix(version)}"
+        case ["local", version]:
+            Path(".python-version").write_text(version + "\n")
+            return ""
+        case ["prefix", version]:
+            prefix = _pyenv_prefix(version)
+            if not prefix.is_dir():
+                raise ToolError(f"pyenv: version `{version}' not installed")
+            return str(prefix)
+        case ["which", name]:
+            if (candidate := bin_dir() / name).exists():
+                return str(candidate)
+            raise ToolError(f"pyenv: {name}: command not found", 127)
+    raise ToolError(f"pyenv: no such command `{' '.join(args)}'")
+
+
+# ── Poetry ─────────────────────────────────────────────────────────────────────
+
+
+def poetry(args: list[str]) -> str:
+    project = Path.cwd()
+    match args:
+        case ["--version"]:
+            return TOOL_VERSIONS["poetry"]
+        case ["config", "virtualenvs.in-project", value, "--local"]:
+            (project / "poetry.toml").write_text(
+                f"[virtualenvs]\nin-project = {value}\n"
+            )
+            return ""
+        case ["env", "use", python]:
+            venv = create_venv(project, Path(python))
+            return f"Using virtualenv: {venv}"
+        case ["install", *_]:
+            if not (project / ".venv").is_dir():
+                create_venv(project, _pinned_python(project, _pyenv_prefix))
+            _write_lock(project / "poetry.lock")
+            _install_package(project / ".venv")
+            return "Installing dependencies from lock file"
+        case ["lock", *_]:
+            _write_lock(project / "poetry.lock")
+            return "Writing lock file"
+        case ["run", *command]:
+            if not (project / ".venv").is_dir():
+                create_venv(project, _pinned_python(project, _pyenv_prefix))
+            return f"ran {' '.join(command)}"
+    raise ToolError(f'The command "{" ".join(args)}" does not exist.')
+
+
+# ── uv ─────────────────────────────────────────────────────────────────────────
+
+
+def uv(args: list[str]) -> str:
+    project = Path.cwd()
+    match args:
+        case ["--version"]:
+            return TOOL_VERSIONS["uv"]
+        case ["python", "install", version]:
+            create_interpreter(_uv_prefix(version), version)
+            return f"Installed Python {version}"
+        case ["python", "pin", version]:
+            (project / ".python-version").write_text(version + "\n")
+            return f"Pinned `.python-version` to `{version}`"
+        case ["python", "find", version]:
+            python = _uv_prefix(version) / "bin" / "python"
+            if not python.exists():
+                raise ToolError(f"error: No interpreter found for Python {version}", 2)
+            return str(python)
+        case ["venv", "--python", python]:
+            venv = create_venv(project, Path(python))
+            return f"Creating virtual environment at: {venv}"
+        case ["venv"]:
+            venv = create_venv(project, _pinned_python(project, _uv_prefix))
+            return f"Creating virtual environment at: {venv}"
+        case ["sync", *_]:
+            if not (project / ".venv").is_dir():
+                create_venv(project, _pinned_python(project, _uv_prefix))
+            _write_lock(project / "uv.lock")
+            _install_package(project / ".venv")
+            return "Resolved and installed packages"
+        case ["lock", *_]:
+            _write_lock(project / "uv.lock")
+            return "Resolved packages"
+        case ["run", *command]:
+            return f"ran {' '.join(command)}"
+    raise ToolError(f"error: unrecognized subcommand '{' '.join(args)}'", 2)
+
+
+def _pyenv_prefix(version: str) -> Path:
+    return pyenv_versions_dir() / version
+
+
+def _uv_prefix(version: str) -> Path:
+    return uv_python_dir() / f"cpython-{version}"
+
+
+def _pinned_python(project: Path, prefix_for: Callable[[str], Path]) -> Path:
+    """The interpreter a tool falls back to when none was chosen explicitly."""
+    pin = project / ".python-version"
+    version = pin.read_text().strip() if pin.is_file() else "3.12.0"
+    prefix = prefix_for(version)
+    if not prefix.is_dir():
+        create_interpreter(prefix, version)
+    return prefix / "bin" / "python"
+
+
+def _install_package(venv: Path) -> None:
+    """What installing the fake lock leaves: one distribution and its script."""
+    version = ".".join(interpreter_version(venv / "bin" / "python").split(".")[:2])
+    site_packages = venv / "lib" / f"python{version}" / "site-packages"
+    (site_packages / "fakepkg-1.0.dist-info").mkdir(parents=True, exist_ok=True)
+    (site_packages / "fakepkg-1.0.dist-info" / "METADATA").write_text(
+        "Name: fakepkg\nVersion: 1.0\n"
+    )
+    script = venv / "bin" / "fakecli"
+    script.write_text(f"#!{venv.resolve()}/bin/python\nimport fakepkg\n")
+    script.chmod(0o755)
+
+
+def _write_lock(path: Path) -> None:
+    if not path.exists():
+        path.write_text("# fake lock file\n")
+
+
+# ── Python ─────────────────────────────────────────────────────────────────────
+
+
+def python(args: list[str]) -> str:
+    match args:
+        case ["--version"] | ["-V"]:
+            return f"Python {interpreter_version(Path(sys.argv[0]))}"
+        case ["-m", "pip", *_]:
+            return "Successfully installed"
+        case ["-c", script, workers, *_] if "compileall" in script:
+            return json.dumps({"wall": 0.0, "cpu": 0.0, "workers": int(workers) or 1})
+    raise ToolError(f"fake python cannot run: {' '.join(args)}")
+
+
+TOOLS = {"pyenv": pyenv, "poetry": poetry, "uv": uv, "python": python}
+
+
+def main(tool: str) -> int:
+    args = sys.argv[1:]
+    config = _load_config()
+    command = " ".join([tool, *args])
+    _log_call(tool, args)
+
+    for prefix, seconds in config.get("delays", {}).items():
+        if command.startswith(prefix):
+            time.sleep(seconds)
+    for prefix, failure in config.get("failures", {}).items():
+        if command.startswith(prefix):
+            print(failure.get("stderr", f"{tool}: injected failure"), file=sys.stderr)
+            return int(failure.get("returncode", 1))
+
+    try:
+        output = TOOLS[tool](args)
+    except ToolError as e:
+        print(e, file=sys.stderr)
+        return e.returncode
+    if output:
+        print(output)
+    return 0
+
+
+def _load_config() -> dict[str, Any]:
+    try:
+        config: dict[str, Any] = json.loads((home() / CONFIG_FILE).read_text())
+        return config
+    except (OSError, ValueError):
+        return {}
+
+
+def _log_call(tool: str, args: list[str]) -> None:
+    line = json.dumps({"tool": tool, "args": args, "cwd": os.getcwd()}) + "\n"
+    fd = os.open(home() / CALLS_FILE, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, line.encode())
+    finally:
+        os.close(fd)
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+
+from tests.fakes import fake_tool
+
+
+@dataclass
+class Call:
+    tool: str
+    args: list[str]
+    cwd: str
+
+    @property
+    def command(self) -> str:
+        return " ".join([self.tool, *self.args])
+
+
+class FakeToolchain:
+    """Stand-in pyenv/poetry/uv executables rooted at *home*.
+
+    ``env()`` returns the variables that make the stand-ins win over any real
+    toolchain; the ``fake_toolchain`` fixture applies them to the process.
+    """
+
+    def __init__(self, home: Path) -> None:
+        self.home = home
+        self.bin_dir = home / "bin"
+        for tool in ("pyenv", "poetry", "uv"):
+            fake_tool.write_executable(self.bin_dir / tool, tool)
+        self._config: dict[str, dict] = {"delays": {}, "failures": {}}
+        self._save_config()
+
+    def env(self) -> dict[str, str]:
+        return {
+            fake_tool.HOME_ENV: str(self.home),
+            "PYENV_ROOT": str(self.home / "pyenv"),
+            "UV_PYTHON_INSTALL_DIR": str(self.home / "uv-python"),
+        }
+
+    def delay(self, command_prefix: str, seconds: float) -> None:
+        """Sleep *seconds* in every call starting with *command_prefix*."""
+        self._config["delays"][command_prefix] = seconds
+        self._save_config()
+
+    def fail(
+        self, command_prefix: str, returncode: int = 1, stderr: str | None = None
+    ) -> None:
+        """Make every call starting with *command_prefix* exit with an error."""
+        failure: dict[str, object] = {"returncode": returncode}
+        if stderr is not None:
+            failure["stderr"] = stderr
+        self._config["failures"][command_prefix] = failure
+        self._save_config()
+
+    def install_python(self, version: str, manager: str = "pyenv") -> Path:
+        """Pre-install an interpreter, as if a previous run had built it."""
+        if manager == "uv":
+            prefix = self.home / "uv-python" / f"cpython-{version}"
+        else:
+            prefix = self.home / "pyenv" / "versions" / version
+        return fake_tool.create_interpreter(prefix, version)
+
+    def calls(self, tool: str | None = None) -> list[Call]:
+        try:
+            lines = (self.home / fake_tool.CALLS_FILE).read_text().splitlines()
+        except FileNotFoundError:
+            return []
+        calls = [Call(**json.loads(line)) for line in lines if line]
+        return [call for call in calls if tool is None or call.tool == tool]
+
+    def commands(self, tool: str | None = None) -> list[str]:
+        return [call.command for call in self.calls(tool)]
+
+    def reset_calls(self) -> None:
+        (self.home / fake_tool.CALLS_FILE).unlink(missing_ok=True)
+
+    def _save_config(self) -> None:
+        (self.home / fake_tool.CONFIG_FILE).write_text(json.dumps(self._config))
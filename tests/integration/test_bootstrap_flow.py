@@ -26,7 +26,7 @@ def test_should_coordinate_pyenv_and_poetry_setup(
         ),
     ]
     mocker.patch(
-        "api_bootstrapper_cli.core.poetry_manager.PoetryManager._get_poetry_cmd",
+        "api_bootstrapper_cli.core.poetry_manager.resolve_executable",
         return_value="poetry",
     )
     mock_poetry_exec = mocker.patch("api_bootstrapper_cli.core.poetry_manager.exec_cmd")
@@ -68,7 +68,7 @@ def test_should_handle_environment_recreation(mocker, tmp_path: Path):
     venv_dir = tmp_path / ".venv"
     venv_dir.mkdir()
     mocker.patch(
-        "api_bootstrapper_cli.core.poetry_manager.PoetryManager._get_poetry_cmd",
+        "api_bootstrapper_cli.core.poetry_manager.resolve_executable",
         return_value="poetry",
     )
     mock_exec = mocker.patch("api_bootstrapper_cli.core.poetry_manager.exec_cmd")
@@ -129,7 +129,7 @@ def test_should_handle_missing_python_version(mocker, tmp_path: Path):
 @pytest.mark.integration
 def test_should_handle_poetry_not_installed(mocker):
     mocker.patch(
-        "api_bootstrapper_cli.core.poetry_manager.PoetryManager._get_poetry_cmd",
+        "api_bootstrapper_cli.core.poetry_manager.resolve_executable",
         return_value="poetry",
     )
     mock_exec = mocker.patch("api_bootstrapper_cli.core.poetry_manager.exec_cmd")
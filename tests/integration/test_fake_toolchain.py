@@ -0,0 +1,466 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from api_bootstrapper_cli.cli import app
+from api_bootstrapper_cli.commands.common import create_bootstrap_service
+from api_bootstrapper_cli.core.pre_commit_manager import PreCommitManager
+from api_bootstrapper_cli.core.profiling import profiler
+from api_bootstrapper_cli.core.protocols import LockMode, ManagerChoice
+from api_bootstrapper_cli.core.shell import clear_probe_cache
+from api_bootstrapper_cli.core.venv_templates import (
+    NO_TEMPLATES_ENV,
+    TEMPLATE_COPIES_ENV,
+)
+from tests.conftest import strip_ansi_codes
+from tests.fakes import FakeToolchain
+
+
+PYTHON_VERSION = "3.12.3"
+
+
+@pytest.fixture
+def enabled_profiler():
+    profiler.enable()
+    yield profiler
+    profiler.disable()
+    profiler.reset()
+
+
+@pytest.mark.integration
+def test_should_bootstrap_pyenv_poetry_project_end_to_end(
+    fake_toolchain: FakeToolchain, tmp_path: Path
+):
+    project = tmp_path / "project"
+    python = fake_toolchain.home / "pyenv" / "versions" / PYTHON_VERSION / "bin/python"
+
+    result = create_bootstrap_service(ManagerChoice.pyenv).bootstrap(
+        project, PYTHON_VERSION
+    )
+
+    assert result.python_path == python
+    assert result.venv_python == project.resolve() / ".venv" / "bin" / "python"
+    assert result.venv_python.exists()
+    assert (project / ".python-version").read_text().strip() == PYTHON_VERSION
+    settings = json.loads((project / ".vscode" / "settings.json").read_text())
+    assert settings["python.defaultInterpreterPath"] == ".venv/bin/python"
+    # Guards against changes that add subprocess round-trips. Independent
+    # steps run concurrently, so only the multiset of commands is stable.
+    assert sorted(fake_toolchain.commands()) == sorted(
+        [
+            "pyenv --version",
+            "pyenv which poetry",
+            "poetry --version",
+            "pyenv versions --bare",
+            f"pyenv install -s {PYTHON_VERSION}",
+            f"pyenv local {PYTHON_VERSION}",
+            f"pyenv prefix {PYTHON_VERSION}",
+            "python -m pip install --upgrade pip setuptools wheel poetry",
+            "pyenv which poetry",
+            "poetry lock",
+            "poetry config virtualenvs.in-project true --local",
+            f"poetry env use {python}",
+            "poetry install --no-root",
+        ]
+    )
+
+
+@pytest.mark.integration
+def test_should_bootstrap_uv_project_end_to_end(
+    fake_toolchain: FakeToolchain, tmp_path: Path
+):
+    project = tmp_path / "project"
+    python = fake_toolchain.home / "uv-python" / f"cpython-{PYTHON_VERSION}/bin/python"
+
+    result = create_bootstrap_service(ManagerChoice.uv).bootstrap(
+        project, PYTHON_VERSION
+    )
+
+    assert result.venv_python is not None
+    assert result.venv_python.exists()
+    assert (project / "uv.lock").exists()
+    assert sorted(fake_toolchain.commands()) == sorted(
+        [
+            "uv --version",
+            "uv lock",
+            f"uv python install {PYTHON_VERSION}",
+            f"uv python pin {PYTHON_VERSION}",
+            f"uv python find {PYTHON_VERSION}",
+            f"uv venv --python {python}",
+            "uv sync --all-groups",
+        ]
+    )
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("manager", list(ManagerChoice))
+def test_should_not_call_toolchain_when_environment_is_ready(
+    fake_toolchain: FakeToolchain, tmp_path: Path, manager: ManagerChoice
+):
+    project = tmp_path / "project"
+    create_bootstrap_service(manager).bootstrap(project, PYTHON_VERSION)
+    fake_toolchain.reset_calls()
+
+    create_bootstrap_service(manager).bootstrap(project, PYTHON_VERSION)
+
+    assert fake_toolchain.commands() == []
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("manager", list(ManagerChoice))
+def test_should_answer_ready_environment_without_probe_cache(
+    fake_toolchain: FakeToolchain, tmp_path: Path, manager: ManagerChoice
+):
+    project = tmp_path / "project"
+    first = create_bootstrap_service(manager).bootstrap(project, PYTHON_VERSION)
+    clear_probe_cache()
+    fake_toolchain.reset_calls()
+
+    second = create_bootstrap_service(manager).bootstrap(project, PYTHON_VERSION)
+
+    assert second == first
+    assert fake_toolchain.commands() == []
+
+
+@pytest.mark.integration
+def test_should_force_install_even_when_environment_is_ready(
+    fake_toolchain: FakeToolchain, tmp_path: Path
+):
+    project = tmp_path / "project"
+    create_bootstrap_service(ManagerChoice.uv).bootstrap(project, PYTHON_VERSION)
+    fake_toolchain.reset_calls()
+
+    create_bootstrap_service(ManagerChoice.uv).bootstrap(
+        project, PYTHON_VERSION, force_install=True
+    )
+
+    assert fake_toolchain.commands().count("uv sync --all-groups") == 1
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("manager", list(ManagerChoice))
+def test_should_fail_frozen_install_without_lock_before_building_python(
+    fake_toolchain: FakeToolchain, tmp_path: Path, manager: ManagerChoice
+):
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "pyproject.toml").write_text('[project]\nname = "api"\n')
+
+    with pytest.raises(RuntimeError, match="não encontrado"):
+        create_bootstrap_service(manager).bootstrap(
+            project, PYTHON_VERSION, lock_mode=LockMode.frozen
+        )
+
+    assert not any(" install" in command for command in fake_toolchain.commands())
+    assert not any(" lock" in command for command in fake_toolchain.commands())
+
+
+@pytest.mark.integration
+def test_should_precompile_bytecode_of_ready_environment(
+    fake_toolchain: FakeToolchain, tmp_path: Path
+):
+    project = tmp_path / "project"
+    create_bootstrap_service(ManagerChoice.uv).bootstrap(project, PYTHON_VERSION)
+    fake_toolchain.reset_calls()
+
+    create_bootstrap_service(ManagerChoice.uv).bootstrap(
+        project, PYTHON_VERSION, compile_bytecode=True
+    )
+
+    commands = fake_toolchain.commands()
+    assert [c for c in commands if c.startswith("python -c")] != []
+    assert "uv sync --all-groups" not in commands
+
+
+@pytest.mark.integration
+def test_should_skip_install_when_lock_and_venv_are_unchanged(
+    fake_toolchain: FakeToolchain, tmp_path: Path
+):
+    project = tmp_path / "project"
+    create_bootstrap_service().bootstrap(project, PYTHON_VERSION)
+    (project / ".python-version").unlink()
+    fake_toolchain.reset_calls()
+
+    create_bootstrap_service().bootstrap(project, PYTHON_VERSION)
+
+    assert "poetry install --no-root" not in fake_toolchain.commands()
+
+
+@pytest.mark.integration
+def test_should_keep_lock_pins_when_python_constraint_changes(
+    fake_toolchain: FakeToolchain, tmp_path: Path
+):
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "pyproject.toml").write_text(
+        '[tool.poetry]\nname = "api"\n\n[tool.poetry.dependencies]\npython = "^3.11"\n'
+    )
+    (project / "poetry.lock").write_text("# pinned\n")
+
+    create_bootstrap_service().bootstrap(project, PYTHON_VERSION)
+
+    assert (project / "poetry.lock").read_text() == "# pinned\n"
+    assert "poetry lock --no-update" in fake_toolchain.commands()
+
+
+@pytest.mark.integration
+def test_should_relock_and_sync_after_dependency_edit(
+    fake_toolchain: FakeToolchain, tmp_path: Path
+):
+    project = tmp_path / "project"
+    create_bootstrap_service().bootstrap(project, PYTHON_VERSION)
+    with (project / "pyproject.toml").open("a") as f:
+        f.write('httpx = "*"\n')
+    fake_toolchain.reset_calls()
+
+    create_bootstrap_service().bootstrap(project, PYTHON_VERSION)
+
+    commands = fake_toolchain.commands()
+    assert "poetry lock --no-update" in commands
+    assert "poetry install --no-root" in commands
+    assert not any(c.startswith(("pyenv install", "poetry env use")) for c in commands)
+
+
+@pytest.mark.integration
+def test_should_repair_only_the_venv_when_its_python_is_missing(
+    fake_toolchain: FakeToolchain, tmp_path: Path
+):
+    project = tmp_path / "project"
+    create_bootstrap_service().bootstrap(project, PYTHON_VERSION)
+    (project / ".venv" / "bin" / "python").unlink()
+    fake_toolchain.reset_calls()
+
+    result = create_bootstrap_service().bootstrap(project, PYTHON_VERSION)
+
+    assert result.venv_python is not None
+    assert result.venv_python.exists()
+    commands = fake_toolchain.commands()
+    assert any(cmd.startswith("poetry env use") for cmd in commands)
+    assert not any(
+        cmd.startswith(("pyenv install", "python -m pip")) for cmd in commands
+    )
+
+
+@pytest.mark.integration
+def test_should_skip_build_when_interpreter_is_installed(
+    fake_toolchain: FakeToolchain, tmp_path: Path
+):
+    fake_toolchain.install_python(PYTHON_VERSION)
+
+    create_bootstrap_service().bootstrap(tmp_path / "project", PYTHON_VERSION)
+
+    assert not any(cmd.startswith("pyenv install") for cmd in fake_toolchain.commands())
+
+
+@pytest.mark.integration
+def test_should_surface_injected_toolchain_failure(
+    fake_toolchain: FakeToolchain, tmp_path: Path
+):
+    fake_toolchain.fail("poetry install", stderr="Because nothing depends on it")
+
+    with pytest.raises(RuntimeError, match="Falha ao instalar dependências"):
+        create_bootstrap_service().bootstrap(tmp_path / "project", PYTHON_VERSION)
+
+
+@pytest.mark.integration
+def test_should_attribute_injected_latency_to_its_phase(
+    fake_toolchain: FakeToolchain, tmp_path: Path, enabled_profiler
+):
+    fake_toolchain.delay("pyenv install", 0.3)
+
+    create_bootstrap_service().bootstrap(tmp_path / "project", PYTHON_VERSION)
+
+    phases = {span.name: span.duration for span in enabled_profiler.spans}
+    assert phases["ensure_python"] >= 0.3
+    assert phases["install_dependencies"] < 0.3
+    assert enabled_profiler.critical_path()[0].name == "ensure_python"
+
+
+@pytest.mark.integration
+def test_should_overlap_uv_lock_resolution_with_interpreter_build(
+    fake_toolchain: FakeToolchain, tmp_path: Path, enabled_profiler
+):
+    fake_toolchain.delay("uv python install", 0.4)
+    fake_toolchain.delay("uv lock", 0.4)
+
+    create_bootstrap_service(ManagerChoice.uv).bootstrap(
+        tmp_path / "project", PYTHON_VERSION
+    )
+
+    spans = {span.name: span for span in enabled_profiler.spans}
+    lock, build = spans["lock"], spans["ensure_python"]
+    assert lock.start < build.end
+    assert build.start < lock.end
+
+
+@pytest.mark.integration
+def test_should_lock_poetry_project_after_its_tooling_is_installed(
+    fake_toolchain: FakeToolchain, tmp_path: Path, enabled_profiler
+):
+    create_bootstrap_service().bootstrap(tmp_path / "project", PYTHON_VERSION)
+
+    spans = {span.name: span for span in enabled_profiler.spans}
+    assert spans["lock"].start >= spans["python_tooling"].end
+    assert spans["lock"].start >= spans["set_local"].end
+
+
+@pytest.mark.integration
+def test_should_add_pre_commit_to_poetry_project_end_to_end(
+    fake_toolchain: FakeToolchain, tmp_path: Path, mock_pyproject_toml: Path
+):
+    project = mock_pyproject_toml.parent
+
+    config_path, _, _ = PreCommitManager().create_config(project)
+
+    assert config_path.exists()
+    assert (project / "poetry.lock").exists()
+    assert fake_toolchain.commands("poetry") == [
+        "poetry lock",
+        "poetry install --no-root",
+        "poetry run pre-commit install --hook-type pre-commit --hook-type commit-msg",
+    ]
+
+
+@pytest.mark.integration
+def test_should_bootstrap_manifest_building_each_interpreter_once(
+    fake_toolchain: FakeToolchain, tmp_path: Path, monkeypatch
+):
+    monkeypatch.setenv(TEMPLATE_COPIES_ENV, "1")
+    (tmp_path / "billing").mkdir()
+    (tmp_path / "billing" / "pyproject.toml").write_text('[project]\nname = "b"\n')
+    manifest = tmp_path / "manifest.toml"
+    manifest.write_text(
+        f'python = "{PYTHON_VERSION}"\nprojects = ["orders", "users", "billing"]\n'
+    )
+    fake_toolchain.fail("uv sync")
+    report = tmp_path / "report.json"
+
+    result = CliRunner().invoke(
+        app, ["env", "bootstrap-many", str(manifest), "--report", str(report)]
+    )
+
+    assert result.exit_code == 1
+    projects = {p["path"]: p for p in json.loads(report.read_text())["projects"]}
+    assert projects[str(tmp_path / "orders")]["ok"]
+    assert projects[str(tmp_path / "users")]["ok"]
+    assert not projects[str(tmp_path / "billing")]["ok"]
+    commands = fake_toolchain.commands()
+    assert commands.count(f"pyenv install -s {PYTHON_VERSION}") == 1
+    assert (
+        commands.count("python -m pip install --upgrade pip setuptools wheel poetry")
+        == 1
+    )
+    # Same lock: the second project clones the first one's venv template.
+    assert commands.count("poetry install --no-root") == 1
+    assert commands.count(f"uv python install {PYTHON_VERSION}") == 1
+    assert "2 ready, 1 failed" in strip_ansi_codes(result.stdout)
+
+
+@pytest.mark.integration
+def test_should_bootstrap_monorepo_recursively_building_python_once(
+    fake_toolchain: FakeToolchain, tmp_path: Path, monkeypatch
+):
+    monkeypatch.setenv(TEMPLATE_COPIES_ENV, "1")
+    for name in ("orders", "users", "node_modules/dep"):
+        (tmp_path / name).mkdir(parents=True)
+        (tmp_path / name / "pyproject.toml").write_text("[tool.poetry]\n")
+
+    result = CliRunner().invoke(
+        app,
+        ["bootstrap-env", "--path", str(tmp_path), "--python", PYTHON_VERSION, "-r"],
+    )
+
+    assert result.exit_code == 0, result.stdout
+    assert (tmp_path / "orders" / ".venv").is_dir()
+    assert (tmp_path / "users" / ".venv").is_dir()
+    assert not (tmp_path / "node_modules" / "dep" / ".venv").exists()
+    commands = fake_toolchain.commands()
+    assert commands.count(f"pyenv install -s {PYTHON_VERSION}") == 1
+    assert commands.count("poetry install --no-root") == 1
+    assert (tmp_path / "users" / ".venv" / "bin" / "fakecli").exists()
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("manager", [ManagerChoice.pyenv, ManagerChoice.uv])
+def test_should_clone_second_venv_with_same_lock_from_template(
+    fake_toolchain: FakeToolchain, tmp_path: Path, manager: ManagerChoice, monkeypatch
+):
+    # The test filesystem may lack reflinks.
+    monkeypatch.setenv(TEMPLATE_COPIES_ENV, "1")
+    first, second = tmp_path / "first", tmp_path / "second"
+    create_bootstrap_service(manager).bootstrap(first, PYTHON_VERSION)
+    fake_toolchain.reset_calls()
+
+    result = create_bootstrap_service(manager).bootstrap(second, PYTHON_VERSION)
+
+    commands = fake_toolchain.commands()
+    if manager == ManagerChoice.pyenv:
+        assert "poetry install --no-root" not in commands
+    assert result.venv_path is not None
+    script = (result.venv_path / "bin" / "fakecli").read_text()
+    assert script.startswith(f"#!{result.venv_path}/bin/python")
+    assert (
+        (first / ".venv" / "bin" / "fakecli")
+        .read_text()
+        .startswith(f"#!{(first / '.venv').resolve()}/bin/python")
+    )
+
+
+@pytest.mark.integration
+def test_should_install_every_venv_when_templates_are_disabled(
+    fake_toolchain: FakeToolchain, tmp_path: Path, monkeypatch
+):
+    monkeypatch.setenv(NO_TEMPLATES_ENV, "1")
+    create_bootstrap_service().bootstrap(tmp_path / "first", PYTHON_VERSION)
+    create_bootstrap_service().bootstrap(tmp_path / "second", PYTHON_VERSION)
+
+    assert fake_toolchain.commands().count("poetry install --no-root") == 2
+
+
+@pytest.mark.integration
+def test_should_bootstrap_offline_from_wheelhouse(
+    fake_toolchain: FakeToolchain, tmp_path: Path
+):
+    project, wheels = tmp_path / "project", tmp_path / "wheels"
+    project.mkdir()
+    wheels.mkdir()
+    (project / "pyproject.toml").write_text(
+        '[tool.poetry]\nname = "api"\n\n'
+        '[tool.poetry.dependencies]\npython = "^3.12"\nfakepkg = "^1.0"\n'
+    )
+    (project / "poetry.lock").write_text(
+        '[[package]]\nname = "fakepkg"\nversion = "1.0"\n'
+        'files = [{file = "fakepkg-1.0-py3-none-any.whl", hash = "sha256:abc"}]\n'
+    )
+
+    result = CliRunner().invoke(
+        app,
+        [
+            "bootstrap-env",
+            "--path",
+            str(project),
+            "--python",
+            PYTHON_VERSION,
+            "--wheelhouse",
+            str(wheels),
+            "--offline",
+        ],
+    )
+
+    assert result.exit_code == 0, result.stdout
+    commands = fake_toolchain.commands()
+    sources = f"--find-links {wheels} --no-index"
+    assert f"python -m pip install {sources} --upgrade pip setuptools wheel poetry" in (
+        commands
+    )
+    assert any(
+        c.startswith(
+            f"python -m pip install {sources} --no-deps --require-hashes --requirement "
+        )
+        for c in commands
+    )
+    assert not any(c.startswith(("poetry install", "poetry lock")) for c in commands)
@@ -26,7 +26,7 @@ def test_should_detect_pyenv_installation(mocker):
 @pytest.mark.integration
 def test_should_detect_poetry_installation(mocker):
     mocker.patch(
-        "api_bootstrapper_cli.core.poetry_manager.PoetryManager._get_poetry_cmd",
+        "api_bootstrapper_cli.core.poetry_manager.resolve_executable",
         return_value="poetry",
     )
     mock_exec = mocker.patch("api_bootstrapper_cli.core.poetry_manager.exec_cmd")
@@ -57,7 +57,7 @@ def test_should_set_local_python_version_in_directory(mocker, tmp_path: Path):
 @pytest.mark.integration
 def test_should_configure_poetry_venv_location(mocker, tmp_path: Path):
     mocker.patch(
-        "api_bootstrapper_cli.core.poetry_manager.PoetryManager._get_poetry_cmd",
+        "api_bootstrapper_cli.core.poetry_manager.resolve_executable",
         return_value="poetry",
     )
     mock_exec = mocker.patch("api_bootstrapper_cli.core.poetry_manager.exec_cmd")
@@ -80,7 +80,7 @@ def test_should_configure_poetry_venv_location(mocker, tmp_path: Path):
 @pytest.mark.integration
 def test_should_get_venv_path_from_poetry(mocker, tmp_path: Path):
     mocker.patch(
-        "api_bootstrapper_cli.core.poetry_manager.PoetryManager._get_poetry_cmd",
+        "api_bootstrapper_cli.core.poetry_manager.resolve_executable",
         return_value="poetry",
     )
 
@@ -109,7 +109,7 @@ def test_should_get_python_path_from_pyenv(mocker):
 @pytest.mark.integration
 def test_should_install_poetry_dependencies(mocker, tmp_path: Path):
     mocker.patch(
-        "api_bootstrapper_cli.core.poetry_manager.PoetryManager._get_poetry_cmd",
+        "api_bootstrapper_cli.core.poetry_manager.resolve_executable",
         return_value="poetry",
     )
     mock_exec = mocker.patch("api_bootstrapper_cli.core.poetry_manager.exec_cmd")
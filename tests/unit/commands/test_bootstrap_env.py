@@ -3,12 +3,16 @@ from __future__ import annotations
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
 from typer.testing import CliRunner
 
 from api_bootstrapper_cli.cli import app
 from api_bootstrapper_cli.commands.bootstrap_env import _display_success
+from api_bootstrapper_cli.commands.common import create_bootstrap_service
 from api_bootstrapper_cli.core.environment_service import EnvironmentSetupResult
+from api_bootstrapper_cli.core.protocols import LockMode, ManagerChoice
 from api_bootstrapper_cli.core.shell import ShellError
+from api_bootstrapper_cli.core.wheelhouse import Wheelhouse
 from tests.conftest import strip_ansi_codes
 
 
@@ -28,7 +32,7 @@ def _make_result(
     )
 
 
-@patch("api_bootstrapper_cli.commands.bootstrap_env._create_bootstrap_service")
+@patch("api_bootstrapper_cli.commands.bootstrap_env.create_bootstrap_service")
 def test_should_exit_1_and_show_message_on_value_error(
     mock_factory: MagicMock, tmp_path: Path
 ):
@@ -45,7 +49,7 @@ def test_should_exit_1_and_show_message_on_value_error(
     assert "pyenv not found" in output
 
 
-@patch("api_bootstrapper_cli.commands.bootstrap_env._create_bootstrap_service")
+@patch("api_bootstrapper_cli.commands.bootstrap_env.create_bootstrap_service")
 def test_should_exit_1_and_show_message_on_runtime_error(
     mock_factory: MagicMock, tmp_path: Path
 ):
@@ -64,7 +68,7 @@ def test_should_exit_1_and_show_message_on_runtime_error(
     assert "Falha ao instalar" in output
 
 
-@patch("api_bootstrapper_cli.commands.bootstrap_env._create_bootstrap_service")
+@patch("api_bootstrapper_cli.commands.bootstrap_env.create_bootstrap_service")
 def test_should_exit_1_and_show_message_on_shell_error(
     mock_factory: MagicMock, tmp_path: Path
 ):
@@ -138,3 +142,169 @@ def test_display_success_without_venv(capsys):
 
     captured = capsys.readouterr().out
     assert "Environment ready" in captured
+
+
+def test_create_bootstrap_service_forwards_output_when_verbose():
+    """--verbose wires the logger's debug output into the managers."""
+    verbose_service = create_bootstrap_service(verbose=True)
+    quiet_service = create_bootstrap_service()
+
+    assert verbose_service._python_env.on_output is not None
+    assert verbose_service._deps.on_output is not None
+    assert quiet_service._deps.on_output is None
+
+
+def test_verbose_output_keeps_tool_brackets(capsys):
+    """Streamed lines are not Rich markup: brackets survive, [/...] can't crash."""
+    service = create_bootstrap_service(verbose=True)
+    assert service._deps.on_output is not None
+
+    service._deps.on_output("[notice] Installing uvicorn[standard] [/dim]")
+
+    out = capsys.readouterr().out
+    assert "[notice] Installing uvicorn[standard] [/dim]" in out
+
+
+@pytest.mark.parametrize("manager", list(ManagerChoice))
+def test_create_bootstrap_service_shares_one_environment(manager):
+    """Both managers run their commands from the same sanitized environment."""
+    service = create_bootstrap_service(manager)
+
+    assert service._python_env.environment is service._deps.environment
+
+
+@patch("api_bootstrapper_cli.commands.bootstrap_env.create_bootstrap_service")
+def test_should_write_profile_trace(mock_factory: MagicMock, tmp_path: Path):
+    """--profile-trace prints the timing table and writes a Chrome trace."""
+    mock_service = MagicMock()
+    mock_service.bootstrap.return_value = _make_result(venv_path=tmp_path / ".venv")
+    mock_factory.return_value = mock_service
+    trace_path = tmp_path / "trace.json"
+
+    result = runner.invoke(
+        app,
+        [
+            "bootstrap-env",
+            "--path",
+            str(tmp_path),
+            "--profile-trace",
+            str(trace_path),
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert "Bootstrap profile" in strip_ansi_codes(result.stdout)
+    assert "traceEvents" in trace_path.read_text()
+
+
+@patch("api_bootstrapper_cli.commands.bootstrap_env.set_deadline")
+@patch("api_bootstrapper_cli.commands.bootstrap_env.create_bootstrap_service")
+def test_should_set_and_clear_global_deadline(
+    mock_factory: MagicMock, mock_set_deadline: MagicMock, tmp_path: Path
+):
+    """--timeout bounds the whole run and is cleared afterwards."""
+    mock_service = MagicMock()
+    mock_service.bootstrap.side_effect = ShellError("Command timed out after 30s")
+    mock_factory.return_value = mock_service
+
+    result = runner.invoke(
+        app, ["bootstrap-env", "--path", str(tmp_path), "--timeout", "30"]
+    )
+
+    assert result.exit_code == 1
+    assert [c.args for c in mock_set_deadline.call_args_list] == [(30.0,), (None,)]
+
+
+@patch("api_bootstrapper_cli.commands.common.create_bootstrap_service")
+def test_should_bootstrap_each_discovered_project_when_recursive(
+    mock_factory: MagicMock, tmp_path: Path
+):
+    for name in ("api", "worker"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "pyproject.toml").write_text("")
+    mock_factory.return_value.bootstrap.side_effect = lambda project_root, **_: (
+        _make_result(project_root / ".venv")
+    )
+
+    result = runner.invoke(
+        app, ["bootstrap-env", "--path", str(tmp_path), "--recursive"]
+    )
+
+    assert result.exit_code == 0
+    roots = sorted(
+        c.kwargs["project_root"] for c in mock_factory.return_value.bootstrap.mock_calls
+    )
+    assert roots == [tmp_path / "api", tmp_path / "worker"]
+    assert all(c.kwargs["shared"] is not None for c in mock_factory.call_args_list)
+    assert "2 ready, 0 failed" in strip_ansi_codes(result.stdout)
+
+
+def test_should_exit_1_when_recursive_finds_no_project(tmp_path: Path):
+    result = runner.invoke(
+        app, ["bootstrap-env", "--path", str(tmp_path), "--recursive"]
+    )
+
+    assert result.exit_code == 1
+    assert "No pyproject.toml found" in strip_ansi_codes(result.stdout)
+
+
+@patch("api_bootstrapper_cli.commands.bootstrap_env.create_bootstrap_service")
+def test_should_install_frozen_from_wheelhouse_when_offline(
+    mock_factory: MagicMock, tmp_path: Path
+):
+    wheels = tmp_path / "wheels"
+    wheels.mkdir()
+    mock_factory.return_value.bootstrap.return_value = _make_result()
+
+    result = runner.invoke(
+        app,
+        ["bootstrap-env", "--path", str(tmp_path), "--wheelhouse", str(wheels)],
+        env={"API_BOOTSTRAPPER_OFFLINE": "1"},
+    )
+
+    assert result.exit_code == 0
+    assert mock_factory.call_args.kwargs["wheelhouse"] == Wheelhouse(
+        wheels, offline=True
+    )
+    bootstrap = mock_factory.return_value.bootstrap.call_args.kwargs
+    assert bootstrap["lock_mode"] == LockMode.frozen
+
+
+@patch("api_bootstrapper_cli.commands.bootstrap_env.create_bootstrap_service")
+def test_should_keep_locked_check_when_offline(mock_factory: MagicMock, tmp_path: Path):
+    wheels = tmp_path / "wheels"
+    wheels.mkdir()
+    mock_factory.return_value.bootstrap.return_value = _make_result()
+
+    result = runner.invoke(
+        app,
+        [
+            "bootstrap-env",
+            "--path",
+            str(tmp_path),
+            "--wheelhouse",
+            str(wheels),
+            "--offline",
+            "--locked",
+        ],
+    )
+
+    assert result.exit_code == 0, result.stdout
+    bootstrap = mock_factory.return_value.bootstrap.call_args.kwargs
+    assert bootstrap["lock_mode"] == LockMode.locked
+
+
+def test_should_exit_1_when_offline_has_no_wheelhouse(tmp_path: Path):
+    result = runner.invoke(app, ["bootstrap-env", "--path", str(tmp_path), "--offline"])
+
+    assert result.exit_code == 1
+    assert "--offline needs --wheelhouse" in strip_ansi_codes(result.stdout)
+
+
+def test_create_bootstrap_service_installs_from_wheelhouse(tmp_path):
+    wheelhouse = Wheelhouse(tmp_path)
+
+    service = create_bootstrap_service(wheelhouse=wheelhouse)
+
+    assert service._python_env.wheelhouse is wheelhouse
+    assert service._deps.wheelhouse is wheelhouse
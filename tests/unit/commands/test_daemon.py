@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from api_bootstrapper_cli.cli import app
+from api_bootstrapper_cli.commands.daemon import _run_cli
+from api_bootstrapper_cli.core import daemon
+from tests.conftest import strip_ansi_codes
+
+
+runner = CliRunner()
+
+
+def test_should_report_missing_daemon(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv(daemon.SOCKET_ENV, str(tmp_path / "d.sock"))
+
+    for command in ("status", "stop"):
+        result = runner.invoke(app, ["daemon", command])
+
+        assert result.exit_code == 1
+        assert "No daemon is running" in strip_ansi_codes(result.stdout)
+
+
+def test_should_run_cli_in_process_and_return_exit_code(tmp_path: Path, capsys):
+    (tmp_path / ".python-version").write_text("3.12.3\n")
+
+    assert _run_cli(["env", "status", "--path", str(tmp_path), "--json"]) == 0
+    assert json.loads(capsys.readouterr().out)["python_pin"] == "3.12.3"
+
+    assert _run_cli(["no-such-command"]) == 2
+
+
+def test_should_look_up_executables_again_for_each_request(tmp_path: Path, mocker):
+    clear = mocker.patch("api_bootstrapper_cli.commands.daemon.clear_executable_cache")
+
+    _run_cli(["env", "status", "--path", str(tmp_path), "--json"])
+    _run_cli(["env", "status", "--path", str(tmp_path), "--json"])
+
+    assert clear.call_count == 2
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from api_bootstrapper_cli.cli import app
+from api_bootstrapper_cli.core.install_stamp import InstallStamp
+from tests.conftest import strip_ansi_codes
+
+
+runner = CliRunner()
+
+
+def _make_project(project: Path) -> None:
+    (project / "pyproject.toml").write_text('[project]\nname = "api"\n')
+    (project / ".python-version").write_text("3.12.3\n")
+    (project / "uv.lock").write_text("version = 1\n")
+    (project / ".venv" / "bin").mkdir(parents=True)
+    (project / ".venv" / "bin" / "python").touch()
+    (project / ".venv" / "pyvenv.cfg").write_text("version_info = 3.12.3\n")
+    venv = project / ".venv"
+    InstallStamp.in_venv(venv).write(
+        InstallStamp.fingerprint(project, "uv.lock", venv, ("sync", "--all-groups"))
+    )
+
+
+def test_should_show_ready_environment(tmp_path: Path):
+    _make_project(tmp_path)
+
+    result = runner.invoke(app, ["env", "status", "--path", str(tmp_path)])
+    output = strip_ansi_codes(result.stdout)
+
+    assert result.exit_code == 0
+    assert "uv-style" in output
+    assert "uv.lock" in output
+    assert "Environment ready" in output
+
+
+def test_should_warn_when_venv_is_missing(tmp_path: Path):
+    (tmp_path / ".python-version").write_text("3.12.3\n")
+
+    result = runner.invoke(app, ["env", "status", "--path", str(tmp_path)])
+    output = strip_ansi_codes(result.stdout)
+
+    assert result.exit_code == 0
+    assert "virtualenv is missing" in output
+    assert "env bootstrap" in output
+
+
+def test_should_print_state_as_json(tmp_path: Path):
+    _make_project(tmp_path)
+
+    result = runner.invoke(app, ["env", "status", "--path", str(tmp_path), "--json"])
+
+    state = json.loads(result.stdout)
+    assert state["manager"] == "uv"
+    assert state["venv"]["version"] == "3.12.3"
+    assert state["dependencies_synced"] is True
+    assert state["issues"] == []
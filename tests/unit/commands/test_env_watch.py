@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from api_bootstrapper_cli.cli import app
+from api_bootstrapper_cli.core.file_watcher import FileWatcher
+from api_bootstrapper_cli.core.protocols import ManagerChoice
+from tests.conftest import strip_ansi_codes
+
+
+runner = CliRunner()
+
+
+class ScriptedWatcher:
+    """Reports the given change sets, then stops the loop like Ctrl-C."""
+
+    def __init__(
+        self, changes: list[set[str]], during_sync: list[set[str]] | None = None
+    ) -> None:
+        self.changes = changes
+        self.during_sync = during_sync or []
+        self.backend = "scripted"
+        self.rebaselines = 0
+
+    def __call__(self, *args, **kwargs) -> ScriptedWatcher:
+        return self
+
+    def __enter__(self) -> ScriptedWatcher:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        pass
+
+    def wait(self, timeout=None) -> set[str]:
+        if not self.changes:
+            raise KeyboardInterrupt
+        return self.changes.pop(0)
+
+    def rebaseline(self) -> set[str]:
+        self.rebaselines += 1
+        return self.during_sync.pop(0) if self.during_sync else set()
+
+
+def test_should_sync_on_start_and_after_each_change(tmp_path: Path, mocker):
+    (tmp_path / ".python-version").write_text("3.12.3\n")
+    (tmp_path / "pyproject.toml").write_text('[project]\nname = "api"\n')
+    watcher = ScriptedWatcher([{"pyproject.toml"}, set(), {"uv.lock"}])
+    mocker.patch("api_bootstrapper_cli.commands.env_watch.FileWatcher", watcher)
+    create = mocker.patch(
+        "api_bootstrapper_cli.commands.env_watch.create_bootstrap_service"
+    )
+
+    result = runner.invoke(app, ["env", "watch", "--path", str(tmp_path)])
+    output = strip_ansi_codes(result.stdout)
+
+    assert result.exit_code == 0
+    assert create.return_value.bootstrap.call_count == 3
+    create.return_value.bootstrap.assert_called_with(
+        project_root=tmp_path, python_version="3.12.3"
+    )
+    assert create.call_args[0][0] == ManagerChoice.uv
+    assert watcher.rebaselines == 3
+    assert "Changed: pyproject.toml" in output
+    assert "Stopped watching" in output
+
+
+def test_should_keep_watching_after_failed_sync(tmp_path: Path, mocker):
+    watcher = ScriptedWatcher([{"pyproject.toml"}])
+    mocker.patch("api_bootstrapper_cli.commands.env_watch.FileWatcher", watcher)
+    create = mocker.patch(
+        "api_bootstrapper_cli.commands.env_watch.create_bootstrap_service"
+    )
+    create.return_value.bootstrap.side_effect = RuntimeError("[uv] Falha")
+
+    result = runner.invoke(
+        app, ["env", "watch", "--path", str(tmp_path), "--python", "3.12.3"]
+    )
+    output = strip_ansi_codes(result.stdout)
+
+    assert result.exit_code == 0
+    assert output.count("Error:") == 2
+    assert "Stopped watching" in output
+
+
+def test_should_sync_again_when_files_change_during_a_sync(tmp_path: Path, mocker):
+    watcher = ScriptedWatcher([], during_sync=[{"pyproject.toml"}, set()])
+    mocker.patch("api_bootstrapper_cli.commands.env_watch.FileWatcher", watcher)
+    create = mocker.patch(
+        "api_bootstrapper_cli.commands.env_watch.create_bootstrap_service"
+    )
+
+    result = runner.invoke(
+        app, ["env", "watch", "--path", str(tmp_path), "--python", "3.12.3"]
+    )
+
+    assert result.exit_code == 0
+    assert create.return_value.bootstrap.call_count == 2
+    assert watcher.rebaselines == 2
+
+
+def test_should_not_lose_an_edit_made_during_a_slow_sync(tmp_path: Path, mocker):
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text('[project]\nname = "api"\n')
+    seen: list[str] = []
+
+    def bootstrap(**kwargs) -> None:
+        seen.append(pyproject.read_text())
+        if len(seen) == 1:
+            # Edited in the editor while the first sync is still running.
+            pyproject.write_text('[project]\nname = "api"\ndependencies = ["httpx"]\n')
+
+    create = mocker.patch(
+        "api_bootstrapper_cli.commands.env_watch.create_bootstrap_service"
+    )
+    create.return_value.bootstrap.side_effect = bootstrap
+    mocker.patch.object(FileWatcher, "wait", side_effect=KeyboardInterrupt)
+
+    result = runner.invoke(
+        app,
+        ["env", "watch", "--path", str(tmp_path), "--python", "3.12.3", "--poll"],
+    )
+
+    assert result.exit_code == 0
+    assert len(seen) == 2
+    assert "httpx" in seen[1]
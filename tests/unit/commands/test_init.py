@@ -164,3 +164,24 @@ def test_should_use_current_directory_by_default(
 
     assert bootstrap_kwargs["path"].is_absolute()
     assert pre_commit_kwargs["path"].is_absolute()
+
+
+@patch("api_bootstrapper_cli.commands.init.bootstrap_env")
+@patch("api_bootstrapper_cli.commands.init.add_pre_commit")
+def test_should_configure_pre_commit_in_each_project_when_recursive(
+    mock_pre_commit: MagicMock, mock_bootstrap: MagicMock, tmp_path: Path
+):
+    for name in ("api", "worker"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "pyproject.toml").write_text("")
+
+    result = runner.invoke(
+        app, ["init", "--python", "3.12.12", "--path", str(tmp_path), "--recursive"]
+    )
+
+    assert result.exit_code == 0
+    assert mock_bootstrap.call_args.kwargs["recursive"] is True
+    assert [c.kwargs["path"] for c in mock_pre_commit.call_args_list] == [
+        tmp_path / "api",
+        tmp_path / "worker",
+    ]
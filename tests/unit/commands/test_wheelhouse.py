@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from typer.testing import CliRunner
+
+from api_bootstrapper_cli.cli import app
+from api_bootstrapper_cli.core.environment_service import PYTHON_TOOLING
+from tests.conftest import strip_ansi_codes
+
+
+runner = CliRunner()
+
+
+@patch("api_bootstrapper_cli.commands.wheelhouse.build_wheelhouse")
+def test_should_build_wheelhouse_for_each_project_when_recursive(
+    mock_build: MagicMock, tmp_path: Path
+):
+    (tmp_path / "api").mkdir()
+    (tmp_path / "api" / "pyproject.toml").write_text('[tool.poetry]\nname = "api"\n')
+    (tmp_path / "worker").mkdir()
+    (tmp_path / "worker" / "pyproject.toml").write_text('[project]\nname = "worker"\n')
+    wheels = tmp_path / "wheels"
+
+    result = runner.invoke(
+        app,
+        ["env", "wheelhouse", "build", str(wheels), "--path", str(tmp_path), "-r"],
+    )
+
+    assert result.exit_code == 0
+    calls = [c.args for c in mock_build.call_args_list]
+    python = Path(sys.executable)
+    assert calls == [
+        (wheels, tmp_path / "api", python),
+        (wheels, tmp_path / "worker", python),
+    ]
+    assert mock_build.call_args_list[0].kwargs["extra"] == PYTHON_TOOLING
+    assert mock_build.call_args_list[1].kwargs["extra"] == ()
+    assert "0 wheels in" in strip_ansi_codes(result.stdout)
+
+
+@patch("api_bootstrapper_cli.commands.wheelhouse.build_wheelhouse")
+def test_should_exit_1_when_wheelhouse_build_fails(
+    mock_build: MagicMock, tmp_path: Path
+):
+    mock_build.side_effect = ValueError(f"No poetry.lock or uv.lock in {tmp_path}")
+
+    result = runner.invoke(
+        app,
+        ["env", "wheelhouse", "build", str(tmp_path / "w"), "--path", str(tmp_path)],
+    )
+
+    assert result.exit_code == 1
+    assert "No poetry.lock or uv.lock" in strip_ansi_codes(result.stdout)
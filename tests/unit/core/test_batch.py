@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from api_bootstrapper_cli.core.batch import (
+    BatchProject,
+    SharedProvisioning,
+    bootstrap_many,
+    load_manifest,
+)
+from api_bootstrapper_cli.core.protocols import ManagerChoice
+
+
+def _write(path: Path, text: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    return path
+
+
+def test_should_load_toml_manifest_with_defaults(tmp_path: Path):
+    _write(tmp_path / "pinned" / ".python-version", "3.11.9\n")
+    _write(tmp_path / "pep621" / "pyproject.toml", '[project]\nname = "x"\n')
+    manifest = _write(
+        tmp_path / "manifest.toml",
+        """
+manager = "pyenv"
+
+[[projects]]
+path = "pinned"
+
+[[projects]]
+path = "pep621"
+python = "3.12.3"
+manager = "uv"
+""",
+    )
+
+    projects = load_manifest(manifest)
+
+    assert projects == [
+        BatchProject(tmp_path / "pinned", "3.11.9", ManagerChoice.pyenv),
+        BatchProject(tmp_path / "pep621", "3.12.3", ManagerChoice.uv),
+    ]
+
+
+def test_should_detect_manager_from_pyproject(tmp_path: Path):
+    _write(tmp_path / "svc" / "pyproject.toml", '[project]\nname = "svc"\n')
+    manifest = _write(
+        tmp_path / "manifest.toml", 'python = "3.12.3"\nprojects = ["svc"]\n'
+    )
+
+    assert load_manifest(manifest)[0].manager == ManagerChoice.uv
+
+
+def test_should_load_yaml_manifest(tmp_path: Path):
+    pytest.importorskip("yaml")
+    manifest = _write(
+        tmp_path / "manifest.yaml",
+        "python: 3.12.3\nprojects:\n  - path: a\n  - path: b\n    manager: uv\n",
+    )
+
+    projects = load_manifest(manifest)
+
+    assert [(p.name, p.python_version, p.manager) for p in projects] == [
+        ("a", "3.12.3", ManagerChoice.pyenv),
+        ("b", "3.12.3", ManagerChoice.uv),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("content", "message"),
+    [
+        ("projects = []", "non-empty 'projects'"),
+        ('python = "3.12.3"\nprojects = ["a", "./a"]', "listed twice"),
+        ('projects = ["a"]', "no Python version for a"),
+        ('python = "3.12.3"\nmanager = "conda"\nprojects = ["a"]', "unknown manager"),
+        ("[[projects]]\npython = '3.12.3'", "needs a 'path'"),
+    ],
+)
+def test_should_reject_invalid_manifest(tmp_path: Path, content: str, message: str):
+    manifest = _write(tmp_path / "manifest.toml", content)
+
+    with pytest.raises(ValueError, match=message):
+        load_manifest(manifest)
+
+
+class RecordingPythonManager:
+    name = "pyenv"
+
+    def __init__(self) -> None:
+        self.builds: list[str] = []
+        self.tooling: list[str] = []
+        self.running = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def is_installed(self) -> bool:
+        return True
+
+    def ensure_python(self, version: str) -> None:
+        with self._lock:
+            self.builds.append(version)
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        time.sleep(0.05)
+        with self._lock:
+            self.running -= 1
+
+    def set_local(self, project_root: Path, version: str) -> None:
+        pass
+
+    def get_python_path(self, version: str) -> Path:
+        return Path(f"/pythons/{version}/bin/python")
+
+    def install_pip_packages(self, version: str, packages: list[str]) -> None:
+        self.tooling.append(version)
+
+
+def _in_threads(count: int, target) -> None:
+    threads = [threading.Thread(target=target, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def test_should_provision_each_interpreter_once():
+    inner = RecordingPythonManager()
+    shared = SharedProvisioning(build_jobs=4)
+    versions = ["3.12.3", "3.11.9"]
+
+    def bootstrap(i: int) -> None:
+        manager = shared.python_manager(inner)
+        manager.ensure_python(versions[i % 2])
+        manager.install_pip_packages(versions[i % 2], ["pip", "poetry"])
+
+    _in_threads(6, bootstrap)
+
+    assert sorted(inner.builds) == sorted(versions)
+    assert sorted(inner.tooling) == sorted(versions)
+    assert set(shared.interpreters) == {"3.12.3 (pyenv)", "3.11.9 (pyenv)"}
+
+
+def test_should_limit_concurrent_builds():
+    inner = RecordingPythonManager()
+    shared = SharedProvisioning(build_jobs=1)
+
+    _in_threads(3, lambda i: shared.python_manager(inner).ensure_python(f"3.1{i}.0"))
+
+    assert len(inner.builds) == 3
+    assert inner.peak == 1
+
+
+def test_should_fail_every_project_of_a_failed_build():
+    shared = SharedProvisioning()
+    calls = []
+
+    def build() -> None:
+        calls.append(1)
+        raise RuntimeError("[env] Falha ao instalar Python 3.12.3")
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError, match="Falha ao instalar"):
+            shared.provision("pyenv", "3.12.3", build)
+
+    assert len(calls) == 1
+
+
+class StubService:
+    def __init__(self, fail: bool) -> None:
+        self._fail = fail
+
+    def bootstrap(self, project_root: Path, python_version: str, **kwargs):
+        if self._fail:
+            raise RuntimeError(
+                f"[poetry] Falha ao instalar dependências em {project_root.name}"
+            )
+        return None
+
+
+def test_should_report_every_project_in_manifest_order(tmp_path: Path):
+    projects = [
+        BatchProject(tmp_path / name, "3.12.3", ManagerChoice.pyenv)
+        for name in ("a", "broken", "c")
+    ]
+
+    report = bootstrap_many(
+        projects,
+        lambda project, shared: StubService(fail=project.name == "broken"),  # type: ignore[arg-type, return-value]
+        jobs=2,
+    )
+
+    assert [result.project.name for result in report.results] == ["a", "broken", "c"]
+    assert [result.project.name for result in report.failed] == ["broken"]
+    assert "Falha ao instalar dependências em broken" in str(report.failed[0].error)
+    assert report.busy_seconds >= 0
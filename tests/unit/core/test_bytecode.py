@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from api_bootstrapper_cli.core.bytecode import (
+    BytecodeReport,
+    compile_bytecode,
+    project_sources,
+)
+from api_bootstrapper_cli.core.shell import CommandResult, ShellError
+
+
+def test_should_compile_in_venv_interpreter_with_all_cores(mocker, tmp_path: Path):
+    mock_exec = mocker.patch("api_bootstrapper_cli.core.bytecode.exec_cmd")
+    mock_exec.return_value = CommandResult(
+        stdout='{"wall": 1.5, "cpu": 5.25, "workers": 4}\n', stderr="", returncode=0
+    )
+    python = tmp_path / ".venv" / "bin" / "python"
+
+    report = compile_bytecode(python, [tmp_path / "src"])
+
+    assert report == BytecodeReport(wall_seconds=1.5, cpu_seconds=5.25, workers=4)
+    args = mock_exec.call_args[0][0]
+    assert args[0] == str(python)
+    assert args[-2:] == ["0", str(tmp_path / "src")]
+
+
+@pytest.mark.parametrize(
+    "outcome",
+    [ShellError("boom"), CommandResult(stdout="", stderr="", returncode=0)],
+)
+def test_should_raise_runtime_error_when_compilation_fails(
+    mocker, tmp_path: Path, outcome
+):
+    mocker.patch(
+        "api_bootstrapper_cli.core.bytecode.exec_cmd",
+        side_effect=outcome if isinstance(outcome, Exception) else None,
+        return_value=outcome,
+    )
+
+    with pytest.raises(RuntimeError, match="Falha ao pré-compilar bytecode"):
+        compile_bytecode(tmp_path / "python", [])
+
+
+def test_should_prefer_src_layout(tmp_path: Path):
+    (tmp_path / "src" / "api").mkdir(parents=True)
+    (tmp_path / "app").mkdir()
+    (tmp_path / "app" / "__init__.py").touch()
+
+    assert project_sources(tmp_path) == [tmp_path / "src"]
+
+
+def test_should_use_top_level_packages_without_src(tmp_path: Path):
+    for package in ("app", "tests", ".hidden"):
+        (tmp_path / package).mkdir()
+        (tmp_path / package / "__init__.py").touch()
+    (tmp_path / "scripts").mkdir()
+
+    assert project_sources(tmp_path) == [tmp_path / "app", tmp_path / "tests"]
+
+
+@pytest.mark.integration
+def test_should_precompile_site_packages_and_sources(tmp_path: Path):
+    venv = tmp_path / ".venv"
+    subprocess.run(
+        [sys.executable, "-m", "venv", "--without-pip", str(venv)], check=True
+    )
+    python = venv / "bin" / "python"
+    site_packages = next(venv.glob("lib/python*/site-packages"))
+    (site_packages / "dep.py").write_text("VALUE = 1\n")
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "main.py").write_text("import dep\n")
+
+    report = compile_bytecode(python, [tmp_path / "src"], workers=2)
+
+    assert report.workers == 2
+    assert report.cpu_seconds >= 0
+    assert list((site_packages / "__pycache__").glob("dep.*.pyc"))
+    assert list((tmp_path / "src" / "__pycache__").glob("main.*.pyc"))
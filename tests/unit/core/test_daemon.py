@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import io
+import json
+import os
+import socket
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from api_bootstrapper_cli import __version__
+from api_bootstrapper_cli.core import daemon
+from api_bootstrapper_cli.core.shell import ShellError, exec_cmd, kill_running_commands
+
+
+@pytest.fixture
+def running_daemon(tmp_path: Path) -> Iterator[Path]:
+    path = tmp_path / "d.sock"
+    calls: list[list[str]] = []
+
+    def run(argv: list[str]) -> int:
+        calls.append(argv)
+        print(f"cwd={os.getcwd()} color={os.environ.get('DAEMON_TEST_COLOR')}")
+        return 3
+
+    server = threading.Thread(target=daemon.serve, args=(run, path), daemon=True)
+    server.start()
+    for _ in range(200):
+        if daemon.ping(path) is not None:
+            break
+        threading.Event().wait(0.01)
+    yield path
+    daemon.stop(path)
+    server.join(timeout=5)
+    assert not server.is_alive()
+
+
+@pytest.mark.parametrize(
+    ("argv", "expected"),
+    [
+        (["bootstrap-env", "--python", "3.12.3"], True),
+        (["env", "status", "--json"], True),
+        (["hooks", "add-pre-commit"], True),
+        (["env", "watch"], False),
+        (["init", "--python", "3.12.3"], False),
+        ([], False),
+    ],
+)
+def test_should_forward_only_served_commands(argv: list[str], expected: bool):
+    assert daemon.forwardable(argv) is expected
+
+
+def test_should_run_locally_when_opted_out(monkeypatch):
+    monkeypatch.setenv(daemon.NO_DAEMON_ENV, "1")
+
+    assert not daemon.forwardable(["env", "status"])
+
+
+def test_should_run_locally_without_daemon(tmp_path: Path):
+    assert daemon.forward(["env", "status"], path=tmp_path / "none.sock") is None
+    assert daemon.ping(tmp_path / "none.sock") is None
+
+
+def test_should_run_command_with_client_cwd_and_env(
+    running_daemon: Path, tmp_path: Path, monkeypatch
+):
+    project = tmp_path / "project"
+    project.mkdir()
+    monkeypatch.chdir(project)
+    monkeypatch.setenv("DAEMON_TEST_COLOR", "blue")
+    out = io.StringIO()
+
+    exit_code = daemon.forward(["env", "status"], path=running_daemon, out=out)
+
+    assert exit_code == 3
+    assert out.getvalue() == f"cwd={project} color=blue\n"
+
+
+def test_should_restore_daemon_cwd_and_env(running_daemon: Path, monkeypatch):
+    monkeypatch.setenv("DAEMON_TEST_COLOR", "blue")
+    daemon.forward(["env", "status"], path=running_daemon, out=io.StringIO())
+    monkeypatch.delenv("DAEMON_TEST_COLOR")
+    out = io.StringIO()
+
+    daemon.forward(["env", "status"], path=running_daemon, out=out)
+
+    assert "color=None" in out.getvalue()
+
+
+def test_should_refuse_request_from_other_version(running_daemon: Path):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(running_daemon))
+        request = {"version": "0.0.0", "argv": ["env", "status"], "cwd": "/", "env": {}}
+        sock.sendall(json.dumps(request).encode() + b"\n")
+        frame = json.loads(sock.makefile("rb").readline())
+
+    assert "refused" in frame
+
+
+def test_should_not_start_second_daemon_on_same_socket(running_daemon: Path):
+    with pytest.raises(RuntimeError, match="Já existe um daemon"):
+        daemon.serve(lambda argv: 0, running_daemon)
+
+
+def test_should_only_let_owner_connect(running_daemon: Path):
+    assert running_daemon.stat().st_mode & 0o077 == 0
+
+
+def test_should_interrupt_command_when_client_hangs_up(tmp_path: Path):
+    path = tmp_path / "d.sock"
+    finished: list[tuple[int, float]] = []
+
+    def run(argv: list[str]) -> int:
+        print("started", flush=True)
+        started = time.monotonic()
+        try:
+            exec_cmd(["sleep", "30"], check=True)
+        except ShellError:
+            finished.append((1, time.monotonic() - started))
+            return 1
+        finished.append((0, time.monotonic() - started))
+        return 0
+
+    server = threading.Thread(
+        target=daemon.serve,
+        args=(run, path, kill_running_commands),
+        daemon=True,
+    )
+    server.start()
+    for _ in range(200):
+        if daemon.ping(path) is not None:
+            break
+        threading.Event().wait(0.01)
+
+    request = {
+        "version": __version__,
+        "argv": ["env", "status"],
+        "cwd": str(tmp_path),
+        "env": dict(os.environ),
+    }
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(path))
+        sock.sendall(json.dumps(request).encode() + b"\n")
+        assert json.loads(sock.makefile("rb").readline()) == {"out": "started"}
+        # Give exec_cmd time to spawn sleep before the client disappears.
+        threading.Event().wait(0.3)
+
+    for _ in range(500):
+        if finished:
+            break
+        threading.Event().wait(0.01)
+    daemon.stop(path)
+    server.join(timeout=5)
+
+    assert finished and finished[0][0] == 1
+    assert finished[0][1] < 10
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from api_bootstrapper_cli.core.discovery import discover_projects
+
+
+def _project(path: Path) -> Path:
+    path.mkdir(parents=True, exist_ok=True)
+    (path / "pyproject.toml").write_text("")
+    return path
+
+
+def test_should_find_root_and_nested_projects(tmp_path: Path):
+    root = _project(tmp_path)
+    billing = _project(tmp_path / "services" / "billing")
+    shared = _project(tmp_path / "libs" / "shared")
+
+    assert discover_projects(tmp_path) == sorted([root, billing, shared])
+
+
+def test_should_skip_environments_caches_and_hidden_dirs(tmp_path: Path):
+    app = _project(tmp_path / "app")
+    for ignored in (".venv", ".tox", "node_modules", "build", "venv"):
+        _project(tmp_path / "app" / ignored / "pkg")
+    custom_venv = tmp_path / "app" / "python-env"
+    (custom_venv / "pyvenv.cfg").parent.mkdir()
+    (custom_venv / "pyvenv.cfg").write_text("home = /usr/bin\n")
+    _project(custom_venv / "lib" / "pkg")
+
+    assert discover_projects(tmp_path) == [app]
+
+
+def test_should_not_follow_symlinks(tmp_path: Path):
+    app = _project(tmp_path / "app")
+    (tmp_path / "link").symlink_to(app, target_is_directory=True)
+    (app / "loop").symlink_to(tmp_path, target_is_directory=True)
+
+    assert discover_projects(tmp_path) == [app]
+
+
+def test_should_honor_custom_ignore_list(tmp_path: Path):
+    _project(tmp_path / "examples" / "demo")
+    app = _project(tmp_path / "app")
+
+    assert discover_projects(tmp_path, ignored={"examples"}) == [app]
+
+
+def test_should_find_nothing_in_missing_directory(tmp_path: Path):
+    assert discover_projects(tmp_path / "missing") == []
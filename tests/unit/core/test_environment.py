@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import pytest
+
+from api_bootstrapper_cli.core.environment import CleanEnvironment
+
+
+@pytest.fixture
+def environment() -> CleanEnvironment:
+    return CleanEnvironment.capture(
+        {
+            "PATH": "/home/me/.pyenv/shims:/usr/bin",
+            "HOME": "/home/me",
+            "VIRTUAL_ENV": "/cli/.venv",
+            "POETRY_ACTIVE": "1",
+            "PYTHONPATH": "/cli/src",
+            "PYTHONHOME": "/cli",
+        }
+    )
+
+
+def test_should_strip_venv_activation_variables(environment: CleanEnvironment):
+    env = environment.for_backend("uv")
+
+    assert env["HOME"] == "/home/me"
+    for name in ("VIRTUAL_ENV", "POETRY_ACTIVE", "PYTHONPATH", "PYTHONHOME"):
+        assert name not in env
+
+
+def test_should_remove_pyenv_shims_only_for_poetry(environment: CleanEnvironment):
+    assert environment.for_backend("poetry")["PATH"] == "/usr/bin"
+    assert environment.for_backend("pyenv")["PATH"] == (
+        "/home/me/.pyenv/shims:/usr/bin"
+    )
+
+
+def test_should_build_each_view_once(environment: CleanEnvironment):
+    assert environment.for_backend("poetry") is environment.for_backend("poetry")
+    assert environment.for_backend("uv") is environment.for_backend("pyenv")
+
+
+def test_should_be_read_only(environment: CleanEnvironment):
+    with pytest.raises(TypeError):
+        environment.for_backend("uv")["VIRTUAL_ENV"] = "/cli/.venv"  # type: ignore[index]
+
+
+def test_should_apply_tuning_without_overriding_user_values():
+    environment = CleanEnvironment.capture(
+        {"PATH": "/usr/bin", "UV_CONCURRENT_DOWNLOADS": "4"}
+    ).with_tuning(UV_CONCURRENT_DOWNLOADS="16", UV_CACHE_DIR="/tmp/uv-cache")
+
+    env = environment.for_backend("uv")
+
+    assert env["PIP_DISABLE_PIP_VERSION_CHECK"] == "1"
+    assert env["UV_CACHE_DIR"] == "/tmp/uv-cache"
+    assert env["UV_CONCURRENT_DOWNLOADS"] == "4"
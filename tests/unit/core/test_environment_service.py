@@ -1,16 +1,18 @@
 from __future__ import annotations
 
-import subprocess
+import threading
 from pathlib import Path
 from typing import cast
-from unittest.mock import patch
 
 import pytest
 
+from api_bootstrapper_cli.core.bytecode import BytecodeReport
 from api_bootstrapper_cli.core.environment_service import (
     EnvironmentBootstrapService,
     EnvironmentSetupResult,
 )
+from api_bootstrapper_cli.core.install_stamp import InstallStamp
+from api_bootstrapper_cli.core.protocols import LockMode
 
 
 class MockLogger:
@@ -67,7 +69,18 @@ class MockDependencyManager:
     def ensure_venv(self, path: Path) -> None:
         pass
 
-    def install_dependencies(self, path: Path) -> None:
+    def install_dependencies(
+        self, path: Path, force: bool = False, lock_mode: LockMode = LockMode.update
+    ) -> None:
+        pass
+
+    def check_lock(self, path: Path, lock_mode: LockMode) -> None:
+        pass
+
+    def lock(self, path: Path) -> None:
+        pass
+
+    def relock(self, path: Path) -> None:
         pass
 
     def get_venv_path(self, path: Path) -> Path:
@@ -89,6 +102,7 @@ def test_should_return_existing_environment_when_already_configured(
     venv_path.mkdir()
     (venv_path / "bin").mkdir(parents=True)
     (venv_path / "bin" / "python").touch()
+    (venv_path / "pyvenv.cfg").write_text("home = /usr/bin\nversion = 3.12.3\n")
 
     pyproject_path = tmp_path / "pyproject.toml"
     pyproject_path.write_text('[tool.poetry]\nname = "test"\nversion = "1.0.0"')
@@ -96,6 +110,11 @@ def test_should_return_existing_environment_when_already_configured(
     python_version_file = tmp_path / ".python-version"
     python_version_file.write_text("3.12.3")
 
+    (tmp_path / "poetry.lock").write_text("# lock\n")
+    InstallStamp.in_venv(venv_path).write(
+        InstallStamp.fingerprint(tmp_path, "poetry.lock", venv_path, ("install",))
+    )
+
     vscode_dir = tmp_path / ".vscode"
     vscode_dir.mkdir()
     (vscode_dir / "settings.json").touch()
@@ -108,14 +127,7 @@ def test_should_return_existing_environment_when_already_configured(
         logger=logger,
     )
 
-    mock_completed = subprocess.CompletedProcess(
-        args=[], returncode=0, stdout="Python 3.12.3\n", stderr=""
-    )
-    with patch(
-        "api_bootstrapper_cli.core.environment_service.subprocess.run",
-        return_value=mock_completed,
-    ):
-        result = service.bootstrap(tmp_path, "3.12.3", install_dependencies=True)
+    result = service.bootstrap(tmp_path, "3.12.3", install_dependencies=True)
 
     assert isinstance(result, EnvironmentSetupResult)
     assert result.python_version == "3.12.3"
@@ -128,6 +140,48 @@ def test_should_return_existing_environment_when_already_configured(
     assert "environment ready" in messages
 
 
+def test_should_answer_ready_rerun_from_saved_result(tmp_path: Path, mocker):
+    _bootstrapped_project(tmp_path)
+    python_env = MockPythonEnvManager()
+    python_env.python_path = tmp_path / "interpreter" / "bin" / "python"
+    python_env.python_path.touch()
+    service = EnvironmentBootstrapService(
+        python_env_manager=python_env,
+        dependency_manager=MockDependencyManager(),
+        editor_writer=MockEditorWriter(),
+        logger=MockLogger(),
+    )
+    first = service.bootstrap(tmp_path, "3.12.3")
+    path_spy = mocker.spy(python_env, "get_python_path")
+    installed_spy = mocker.spy(python_env, "is_installed")
+
+    second = service.bootstrap(tmp_path, "3.12.3")
+
+    assert second == first
+    path_spy.assert_not_called()
+    installed_spy.assert_not_called()
+
+
+def test_should_not_reuse_result_when_interpreter_is_removed(tmp_path: Path, mocker):
+    _bootstrapped_project(tmp_path)
+    python_env = MockPythonEnvManager()
+    python_env.python_path = tmp_path / "interpreter" / "bin" / "python"
+    python_env.python_path.touch()
+    service = EnvironmentBootstrapService(
+        python_env_manager=python_env,
+        dependency_manager=MockDependencyManager(),
+        editor_writer=MockEditorWriter(),
+        logger=MockLogger(),
+    )
+    service.bootstrap(tmp_path, "3.12.3")
+    path_spy = mocker.spy(python_env, "get_python_path")
+
+    python_env.python_path.unlink()
+    service.bootstrap(tmp_path, "3.12.3")
+
+    path_spy.assert_called_once_with("3.12.3")
+
+
 def test_should_recreate_environment_when_python_version_mismatches(
     tmp_path: Path, mocker
 ):
@@ -135,6 +189,7 @@ def test_should_recreate_environment_when_python_version_mismatches(
     venv_path.mkdir()
     (venv_path / "bin").mkdir(parents=True)
     (venv_path / "bin" / "python").touch()
+    (venv_path / "pyvenv.cfg").write_text("home = /usr/bin\nversion = 3.12.3\n")
 
     pyproject_path = tmp_path / "pyproject.toml"
     pyproject_path.write_text('[tool.poetry]\nname = "test"\nversion = "1.0.0"')
@@ -228,6 +283,7 @@ def test_should_create_environment_when_python_version_file_is_missing(
     venv_path.mkdir()
     (venv_path / "bin").mkdir(parents=True)
     (venv_path / "bin" / "python").touch()
+    (venv_path / "pyvenv.cfg").write_text("home = /usr/bin\nversion = 3.12.3\n")
 
     pyproject_path = tmp_path / "pyproject.toml"
     pyproject_path.write_text('[tool.poetry]\nname = "test"\nversion = "1.0.0"')
@@ -274,6 +330,7 @@ def test_should_force_setup_when_venv_python_version_mismatches(tmp_path: Path,
     venv_path.mkdir()
     (venv_path / "bin").mkdir(parents=True)
     (venv_path / "bin" / "python").touch()
+    (venv_path / "pyvenv.cfg").write_text("home = /usr/bin\nversion_info = 3.11.9\n")
 
     (tmp_path / "pyproject.toml").write_text('[tool.poetry]\nname = "t"\nversion = "1"')
     (tmp_path / ".python-version").write_text("3.12.3")
@@ -290,21 +347,14 @@ def test_should_force_setup_when_venv_python_version_mismatches(tmp_path: Path,
         logger=logger,
     )
 
-    mock_completed = subprocess.CompletedProcess(
-        args=[], returncode=0, stdout="Python 3.11.9\n", stderr=""
-    )
-    with patch(
-        "api_bootstrapper_cli.core.environment_service.subprocess.run",
-        return_value=mock_completed,
-    ):
-        result = service.bootstrap(tmp_path, "3.12.3", install_dependencies=False)
+    result = service.bootstrap(tmp_path, "3.12.3", install_dependencies=False)
 
     ensure_python_spy.assert_called_once_with("3.12.3")
     assert result.python_version == "3.12.3"
 
 
-def test_should_force_setup_when_venv_python_not_runnable(tmp_path: Path, mocker):
-    """_is_environment_ready returns False when running venv Python raises an error."""
+def test_should_force_setup_when_venv_has_no_pyvenv_cfg(tmp_path: Path, mocker):
+    """_is_environment_ready returns False when the venv version cannot be read."""
     venv_path = tmp_path / ".venv"
     venv_path.mkdir()
     (venv_path / "bin").mkdir(parents=True)
@@ -325,11 +375,458 @@ def test_should_force_setup_when_venv_python_not_runnable(tmp_path: Path, mocker
         logger=logger,
     )
 
-    with patch(
-        "api_bootstrapper_cli.core.environment_service.subprocess.run",
-        side_effect=OSError("Cannot execute"),
-    ):
-        result = service.bootstrap(tmp_path, "3.12.3", install_dependencies=False)
+    result = service.bootstrap(tmp_path, "3.12.3", install_dependencies=False)
 
     ensure_python_spy.assert_called_once_with("3.12.3")
     assert result.python_version == "3.12.3"
+
+
+def _project_with_old_constraint(project: Path) -> Path:
+    (project / "pyproject.toml").write_text(
+        '[tool.poetry]\nname = "t"\n\n[tool.poetry.dependencies]\npython = "^3.11"\n'
+    )
+    lock = project / "poetry.lock"
+    lock.write_text("# pinned\n")
+    return lock
+
+
+def test_should_relock_instead_of_removing_lock_on_constraint_change(
+    tmp_path: Path, mocker
+):
+    lock = _project_with_old_constraint(tmp_path)
+    deps = MockDependencyManager()
+    relock_spy = mocker.spy(deps, "relock")
+    service = EnvironmentBootstrapService(
+        python_env_manager=MockPythonEnvManager(),
+        dependency_manager=deps,
+        editor_writer=MockEditorWriter(),
+        logger=MockLogger(),
+    )
+
+    service.bootstrap(tmp_path, "3.12.3", install_dependencies=False)
+
+    relock_spy.assert_called_once_with(tmp_path)
+    assert lock.read_text() == "# pinned\n"
+
+
+def test_should_remove_lock_when_relock_fails(tmp_path: Path, mocker):
+    lock = _project_with_old_constraint(tmp_path)
+    deps = MockDependencyManager()
+    mocker.patch.object(
+        deps, "relock", side_effect=RuntimeError("[poetry] incompatible")
+    )
+    logger = MockLogger()
+    service = EnvironmentBootstrapService(
+        python_env_manager=MockPythonEnvManager(),
+        dependency_manager=deps,
+        editor_writer=MockEditorWriter(),
+        logger=logger,
+    )
+
+    service.bootstrap(tmp_path, "3.12.3", install_dependencies=False)
+
+    assert not lock.exists()
+    assert any(level == "warning" for level, _ in logger.messages)
+
+
+def test_should_install_frozen_lock_without_touching_pyproject(tmp_path: Path, mocker):
+    lock = _project_with_old_constraint(tmp_path)
+    pyproject = (tmp_path / "pyproject.toml").read_text()
+    deps = MockDependencyManager()
+    relock_spy = mocker.spy(deps, "relock")
+    install_spy = mocker.spy(deps, "install_dependencies")
+    service = EnvironmentBootstrapService(
+        python_env_manager=MockPythonEnvManager(),
+        dependency_manager=deps,
+        editor_writer=MockEditorWriter(),
+        logger=MockLogger(),
+    )
+
+    service.bootstrap(tmp_path, "3.12.3", lock_mode=LockMode.frozen)
+
+    relock_spy.assert_not_called()
+    install_spy.assert_called_once_with(
+        tmp_path, force=False, lock_mode=LockMode.frozen
+    )
+    assert (tmp_path / "pyproject.toml").read_text() == pyproject
+    assert lock.read_text() == "# pinned\n"
+
+
+def test_should_precompile_bytecode_after_install(tmp_path: Path, mocker):
+    (tmp_path / "pyproject.toml").write_text('[tool.poetry]\nname = "t"')
+    deps = MockDependencyManager()
+    calls = mocker.Mock()
+    mocker.patch.object(deps, "install_dependencies", calls.install)
+    calls.compile.return_value = BytecodeReport(
+        wall_seconds=0.5, cpu_seconds=2.0, workers=4
+    )
+    mocker.patch(
+        "api_bootstrapper_cli.core.environment_service.bytecode.compile_bytecode",
+        calls.compile,
+    )
+    logger = MockLogger()
+    service = EnvironmentBootstrapService(
+        python_env_manager=MockPythonEnvManager(),
+        dependency_manager=deps,
+        editor_writer=MockEditorWriter(),
+        logger=logger,
+    )
+
+    service.bootstrap(tmp_path, "3.12.3", compile_bytecode=True)
+
+    assert [name for name, _, _ in calls.mock_calls] == ["install", "compile"]
+    assert calls.compile.call_args[0][0] == deps.get_venv_python(tmp_path)
+    assert any("skip 2.0s of compilation" in msg for _, msg in logger.messages)
+
+
+def test_should_only_warn_when_precompilation_fails(tmp_path: Path, mocker):
+    (tmp_path / "pyproject.toml").write_text('[tool.poetry]\nname = "t"')
+    mocker.patch(
+        "api_bootstrapper_cli.core.environment_service.bytecode.compile_bytecode",
+        side_effect=RuntimeError("[env] Falha ao pré-compilar bytecode: boom"),
+    )
+    logger = MockLogger()
+    service = EnvironmentBootstrapService(
+        python_env_manager=MockPythonEnvManager(),
+        dependency_manager=MockDependencyManager(),
+        editor_writer=MockEditorWriter(),
+        logger=logger,
+    )
+
+    service.bootstrap(tmp_path, "3.12.3", compile_bytecode=True)
+
+    assert ("warning", "[env] Falha ao pré-compilar bytecode: boom") in logger.messages
+
+
+def test_should_check_lock_before_provisioning_python(tmp_path: Path, mocker):
+    _project_with_old_constraint(tmp_path)
+    python_env = MockPythonEnvManager()
+    ensure_python_spy = mocker.spy(python_env, "ensure_python")
+    deps = MockDependencyManager()
+    mocker.patch.object(
+        deps, "check_lock", side_effect=RuntimeError("[poetry] stale lock")
+    )
+    service = EnvironmentBootstrapService(
+        python_env_manager=python_env,
+        dependency_manager=deps,
+        editor_writer=MockEditorWriter(),
+        logger=MockLogger(),
+    )
+
+    with pytest.raises(RuntimeError, match="stale lock"):
+        service.bootstrap(tmp_path, "3.12.3", lock_mode=LockMode.locked)
+
+    ensure_python_spy.assert_not_called()
+
+
+def _bootstrapped_project(project: Path) -> Path:
+    """A project as a previous bootstrap left it, including the install stamp."""
+    home = project / "interpreter" / "bin"
+    home.mkdir(parents=True)
+    venv = project / ".venv"
+    (venv / "bin").mkdir(parents=True)
+    (venv / "bin" / "python").touch()
+    (venv / "pyvenv.cfg").write_text(f"home = {home}\nversion = 3.12.3\n")
+    (project / "pyproject.toml").write_text('[tool.poetry]\nname = "t"\n')
+    (project / "poetry.lock").write_text("# lock\n")
+    (project / ".python-version").write_text("3.12.3\n")
+    InstallStamp.in_venv(venv).write(
+        InstallStamp.fingerprint(project, "poetry.lock", venv, ("install",))
+    )
+    return venv
+
+
+def _spied_service(mocker, project: Path):
+    python_env = MockPythonEnvManager()
+    python_env.python_path = project / "interpreter" / "bin" / "python"
+    python_env.python_path.touch()
+    deps = MockDependencyManager()
+    spies = {
+        name: mocker.spy(target, name)
+        for target, names in (
+            (python_env, ("ensure_python", "set_local", "install_pip_packages")),
+            (deps, ("configure_venv", "use_python", "install_dependencies")),
+        )
+        for name in names
+    }
+    service = EnvironmentBootstrapService(
+        python_env_manager=python_env,
+        dependency_manager=deps,
+        editor_writer=MockEditorWriter(),
+        logger=MockLogger(),
+    )
+    return service, spies
+
+
+def _called(spies) -> set[str]:
+    return {name for name, spy in spies.items() if spy.call_count}
+
+
+def test_should_only_rewrite_pin_when_python_version_file_mismatches(
+    tmp_path: Path, mocker
+):
+    _bootstrapped_project(tmp_path)
+    (tmp_path / ".python-version").write_text("3.11.0\n")
+    service, spies = _spied_service(mocker, tmp_path)
+
+    service.bootstrap(tmp_path, "3.12.3")
+
+    assert _called(spies) == {"ensure_python", "set_local"}
+
+
+def test_should_recreate_only_venv_when_venv_python_is_missing(tmp_path: Path, mocker):
+    venv = _bootstrapped_project(tmp_path)
+    (venv / "bin" / "python").unlink()
+    service, spies = _spied_service(mocker, tmp_path)
+
+    service.bootstrap(tmp_path, "3.12.3")
+
+    assert not venv.exists()
+    assert _called(spies) == {
+        "ensure_python",
+        "configure_venv",
+        "use_python",
+        "install_dependencies",
+    }
+
+
+def test_should_only_sync_when_lock_changed(tmp_path: Path, mocker):
+    _bootstrapped_project(tmp_path)
+    (tmp_path / "poetry.lock").write_text("# relocked\n")
+    service, spies = _spied_service(mocker, tmp_path)
+
+    result = service.bootstrap(tmp_path, "3.12.3")
+
+    assert _called(spies) == {"ensure_python", "install_dependencies"}
+    assert result.editor_config_path == tmp_path / ".vscode" / "settings.json"
+
+
+def test_should_run_full_bootstrap_when_venv_interpreter_is_gone(
+    tmp_path: Path, mocker
+):
+    venv = _bootstrapped_project(tmp_path)
+    (venv / "pyvenv.cfg").write_text("home = /nonexistent/bin\nversion = 3.12.3\n")
+    (tmp_path / "poetry.lock").write_text("# relocked\n")
+    service, spies = _spied_service(mocker, tmp_path)
+
+    service.bootstrap(tmp_path, "3.12.3")
+
+    assert "install_pip_packages" in _called(spies)
+
+
+def _failing_once(deps: MockDependencyManager) -> None:
+    calls = {"count": 0}
+
+    def install(
+        path: Path, force: bool = False, lock_mode: LockMode = LockMode.update
+    ) -> None:
+        calls["count"] += 1
+        if calls["count"] == 1:
+            raise RuntimeError("[poetry] network error")
+
+    deps.install_dependencies = install  # type: ignore[method-assign]
+
+
+def test_should_resume_after_failed_dependency_install(tmp_path: Path, mocker):
+    """A re-run after a failed install skips the steps that already completed."""
+    (tmp_path / "pyproject.toml").write_text('[tool.poetry]\nname = "t"')
+    interpreter = tmp_path / "python3.12"
+    interpreter.touch()
+
+    python_env = MockPythonEnvManager()
+    python_env.python_path = interpreter
+    deps = MockDependencyManager()
+    _failing_once(deps)
+    ensure_python_spy = mocker.spy(python_env, "ensure_python")
+    tooling_spy = mocker.spy(python_env, "install_pip_packages")
+    use_python_spy = mocker.spy(deps, "use_python")
+    logger = MockLogger()
+
+    service = EnvironmentBootstrapService(
+        python_env_manager=python_env,
+        dependency_manager=deps,
+        editor_writer=MockEditorWriter(),
+        logger=logger,
+    )
+
+    with pytest.raises(RuntimeError, match="network error"):
+        service.bootstrap(tmp_path, "3.12.3")
+    result = service.bootstrap(tmp_path, "3.12.3")
+
+    assert result.python_version == "3.12.3"
+    assert ensure_python_spy.call_count == 1
+    assert tooling_spy.call_count == 1
+    assert use_python_spy.call_count == 1
+    assert ("info", "[resume] ensure_python already done, skipping") in logger.messages
+
+
+def test_should_rerun_every_step_without_resume(tmp_path: Path, mocker):
+    (tmp_path / "pyproject.toml").write_text('[tool.poetry]\nname = "t"')
+    interpreter = tmp_path / "python3.12"
+    interpreter.touch()
+
+    python_env = MockPythonEnvManager()
+    python_env.python_path = interpreter
+    deps = MockDependencyManager()
+    _failing_once(deps)
+    ensure_python_spy = mocker.spy(python_env, "ensure_python")
+
+    service = EnvironmentBootstrapService(
+        python_env_manager=python_env,
+        dependency_manager=deps,
+        editor_writer=MockEditorWriter(),
+        logger=MockLogger(),
+    )
+
+    with pytest.raises(RuntimeError):
+        service.bootstrap(tmp_path, "3.12.3")
+    service.bootstrap(tmp_path, "3.12.3", resume=False)
+
+    assert ensure_python_spy.call_count == 2
+
+
+def test_should_resume_from_first_step_whose_inputs_changed(tmp_path: Path, mocker):
+    (tmp_path / "pyproject.toml").write_text('[tool.poetry]\nname = "t"')
+    interpreter = tmp_path / "python3.12"
+    interpreter.touch()
+
+    python_env = MockPythonEnvManager()
+    python_env.python_path = interpreter
+    deps = MockDependencyManager()
+    _failing_once(deps)
+    ensure_python_spy = mocker.spy(python_env, "ensure_python")
+    use_python_spy = mocker.spy(deps, "use_python")
+
+    service = EnvironmentBootstrapService(
+        python_env_manager=python_env,
+        dependency_manager=deps,
+        editor_writer=MockEditorWriter(),
+        logger=MockLogger(),
+    )
+
+    with pytest.raises(RuntimeError):
+        service.bootstrap(tmp_path, "3.12.3")
+    (tmp_path / "pyproject.toml").write_text('[tool.poetry]\nname = "renamed"')
+    service.bootstrap(tmp_path, "3.12.3")
+
+    assert ensure_python_spy.call_count == 1
+    assert use_python_spy.call_count == 2
+
+
+def test_should_report_critical_path_of_bootstrap(tmp_path: Path):
+    interpreter = tmp_path / "python3.12"
+    interpreter.touch()
+    python_env = MockPythonEnvManager()
+    python_env.python_path = interpreter
+    service = EnvironmentBootstrapService(
+        python_env_manager=python_env,
+        dependency_manager=MockDependencyManager(),
+        editor_writer=MockEditorWriter(),
+        logger=MockLogger(),
+    )
+
+    service.bootstrap(tmp_path, "3.12.3")
+
+    assert service.last_schedule is not None
+    path = service.last_schedule.critical_path
+    assert path[0] == "ensure_python"
+    assert path[-1] == "install_dependencies"
+
+
+def test_should_write_editor_config_without_waiting_for_venv(tmp_path: Path):
+    """Editor settings only need the venv path, so they are written first."""
+    written = threading.Event()
+    python_env = MockPythonEnvManager()
+    python_env.python_path = tmp_path / "python3.12"
+    python_env.python_path.touch()
+
+    def ensure_python(version: str) -> None:
+        assert written.wait(timeout=2), "editor config waited for the interpreter"
+
+    python_env.ensure_python = ensure_python  # type: ignore[method-assign]
+    editor = MockEditorWriter()
+    original_write = editor.write_config
+
+    def write_config(project_root: Path, python_path: Path) -> Path:
+        written.set()
+        return original_write(project_root, python_path)
+
+    editor.write_config = write_config  # type: ignore[method-assign]
+    service = EnvironmentBootstrapService(
+        python_env_manager=python_env,
+        dependency_manager=MockDependencyManager(),
+        editor_writer=editor,
+        logger=MockLogger(),
+    )
+
+    result = service.bootstrap(tmp_path, "3.12.3")
+
+    assert result.editor_config_path == tmp_path / ".vscode" / "settings.json"
+
+
+def test_should_resolve_uv_lock_while_interpreter_installs(tmp_path: Path):
+    """uv locking needs only pyproject, so it runs during ensure_python."""
+    locked = threading.Event()
+    python_env = MockPythonEnvManager()
+    python_env.python_path = tmp_path / "python3.12"
+    python_env.python_path.touch()
+
+    def ensure_python(version: str) -> None:
+        assert locked.wait(timeout=2), "lock waited for the interpreter"
+
+    python_env.ensure_python = ensure_python  # type: ignore[method-assign]
+    deps = MockDependencyManager()
+    deps.name = "uv"
+    deps.lock = lambda path: locked.set()  # type: ignore[method-assign]
+    service = EnvironmentBootstrapService(
+        python_env_manager=python_env,
+        dependency_manager=deps,
+        editor_writer=MockEditorWriter(),
+        logger=MockLogger(),
+    )
+
+    service.bootstrap(tmp_path, "3.12.3")
+
+    assert service.last_schedule is not None
+    assert "lock" in service.last_schedule.results
+
+
+def test_should_run_poetry_lock_with_the_project_tooling(tmp_path: Path):
+    """``poetry`` is looked up per pyenv version: lock waits until it is set."""
+    done: list[str] = []
+    python_env = MockPythonEnvManager()
+    python_env.python_path = tmp_path / "python3.12"
+    python_env.python_path.touch()
+    python_env.set_local = lambda path, version: done.append("set_local")  # type: ignore[method-assign]
+    python_env.install_pip_packages = (  # type: ignore[method-assign]
+        lambda version, packages: done.append("python_tooling")
+    )
+    deps = MockDependencyManager()
+    deps.lock = lambda path: done.append("lock")  # type: ignore[method-assign]
+    service = EnvironmentBootstrapService(
+        python_env_manager=python_env,
+        dependency_manager=deps,
+        editor_writer=MockEditorWriter(),
+        logger=MockLogger(),
+    )
+
+    service.bootstrap(tmp_path, "3.12.3")
+
+    assert done.index("lock") > max(
+        done.index("set_local"), done.index("python_tooling")
+    )
+
+
+def test_should_not_resolve_missing_lock_without_install(tmp_path: Path, mocker):
+    deps = MockDependencyManager()
+    lock_spy = mocker.spy(deps, "lock")
+    service = EnvironmentBootstrapService(
+        python_env_manager=MockPythonEnvManager(),
+        dependency_manager=deps,
+        editor_writer=MockEditorWriter(),
+        logger=MockLogger(),
+    )
+
+    service.bootstrap(tmp_path, "3.12.3", install_dependencies=False)
+
+    lock_spy.assert_not_called()
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from api_bootstrapper_cli.core.environment_state import Issue, inspect_environment
+from api_bootstrapper_cli.core.install_stamp import InstallStamp
+from api_bootstrapper_cli.core.protocols import ManagerChoice
+
+
+def _make_venv(project: Path, cfg: str) -> Path:
+    venv = project / ".venv"
+    (venv / "bin").mkdir(parents=True)
+    (venv / "bin" / "python").touch()
+    (venv / "pyvenv.cfg").write_text(cfg)
+    return venv
+
+
+def _make_project(project: Path, version: str = "3.12.3") -> None:
+    (project / "pyproject.toml").write_text('[tool.poetry]\nname = "api"\n')
+    (project / ".python-version").write_text(f"{version}\n")
+    _make_venv(project, f"home = /usr/bin\nversion = {version}\n")
+
+
+def test_should_read_state_from_files(tmp_path: Path):
+    _make_project(tmp_path)
+    (tmp_path / "poetry.lock").write_text("# lock\n")
+    site_packages = tmp_path / ".venv" / "lib" / "python3.12" / "site-packages"
+    (site_packages / "Django-5.0.1.dist-info").mkdir(parents=True)
+    (site_packages / "typing_extensions-4.9.0.dist-info").mkdir()
+    (site_packages / "django").mkdir()
+
+    state = inspect_environment(tmp_path)
+
+    assert state.python_pin == "3.12.3"
+    assert state.manager == ManagerChoice.pyenv
+    assert state.pyproject_hash is not None
+    assert set(state.lock_hashes) == {"poetry.lock"}
+    assert state.venv is not None
+    assert state.venv.version == "3.12.3"
+    assert state.venv.home == Path("/usr/bin")
+    assert dict(state.installed) == {"django": "5.0.1", "typing-extensions": "4.9.0"}
+
+
+def test_should_read_virtualenv_version_info(tmp_path: Path):
+    _make_venv(tmp_path, "home = /usr/bin\nversion_info = 3.12.3.final.0\n")
+
+    state = inspect_environment(tmp_path)
+
+    assert state.venv is not None
+    assert state.venv.version == "3.12.3"
+
+
+def test_should_be_ready_when_venv_matches_pin(tmp_path: Path):
+    _make_project(tmp_path)
+
+    state = inspect_environment(tmp_path)
+
+    assert state.is_ready_for("3.12.3")
+    assert not state.is_ready_for("3.13.0")
+
+
+def test_should_not_be_ready_without_pyvenv_cfg(tmp_path: Path):
+    _make_project(tmp_path)
+    (tmp_path / ".venv" / "pyvenv.cfg").unlink()
+
+    state = inspect_environment(tmp_path)
+
+    assert state.venv is None
+    assert not state.is_ready_for("3.12.3")
+
+
+def test_should_not_start_processes(tmp_path: Path, mocker):
+    _make_project(tmp_path)
+    popen = mocker.patch("subprocess.Popen", side_effect=AssertionError)
+    process = mocker.patch(
+        "api_bootstrapper_cli.core.shell._Process", side_effect=AssertionError
+    )
+
+    inspect_environment(tmp_path).is_ready_for("3.12.3")
+
+    popen.assert_not_called()
+    process.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    ("content", "expected"),
+    [
+        ('[project]\nname = "api"\n', ManagerChoice.uv),
+        ('[project]\nname = "api"\n[tool.poetry]\n', ManagerChoice.pyenv),
+        ("not = [valid toml", ManagerChoice.pyenv),
+    ],
+)
+def test_should_detect_manager_from_pyproject(
+    tmp_path: Path, content: str, expected: ManagerChoice
+):
+    (tmp_path / "pyproject.toml").write_text(content)
+
+    assert inspect_environment(tmp_path).manager == expected
+
+
+@pytest.mark.parametrize(
+    ("breakage", "expected"),
+    [
+        (
+            lambda project: (project / "pyproject.toml").unlink(),
+            Issue.missing_pyproject,
+        ),
+        (
+            lambda project: (project / ".python-version").write_text("3.11.0\n"),
+            Issue.python_pin,
+        ),
+        (
+            lambda project: (project / ".venv" / "bin" / "python").unlink(),
+            Issue.broken_venv,
+        ),
+        (
+            lambda project: (project / ".venv" / "pyvenv.cfg").unlink(),
+            Issue.broken_venv,
+        ),
+        (
+            lambda project: (project / ".venv" / "pyvenv.cfg").write_text(
+                "version = 3.11.9\n"
+            ),
+            Issue.venv_version,
+        ),
+        (
+            lambda project: (project / "poetry.lock").write_text("# new\n"),
+            Issue.dependencies,
+        ),
+    ],
+)
+def test_should_diagnose_each_failed_check(tmp_path: Path, breakage, expected: Issue):
+    _make_project(tmp_path)
+    venv = tmp_path / ".venv"
+    (tmp_path / "poetry.lock").write_text("# lock\n")
+    InstallStamp.in_venv(venv).write(
+        InstallStamp.fingerprint(tmp_path, "poetry.lock", venv, ("install",))
+    )
+    assert inspect_environment(tmp_path).diagnose("3.12.3") == []
+
+    breakage(tmp_path)
+
+    assert inspect_environment(tmp_path).diagnose("3.12.3")[0] == expected
+
+
+def test_should_ignore_dependencies_when_not_checked(tmp_path: Path):
+    _make_project(tmp_path)
+
+    state = inspect_environment(tmp_path)
+
+    assert state.diagnose("3.12.3") == [Issue.dependencies]
+    assert state.diagnose("3.12.3", check_dependencies=False) == []
+
+
+def test_should_diagnose_stale_lock_after_pyproject_edit(tmp_path: Path):
+    _make_project(tmp_path)
+    venv = tmp_path / ".venv"
+    (tmp_path / "poetry.lock").write_text('[metadata]\ncontent-hash = "0000"\n')
+    InstallStamp.in_venv(venv).write(
+        InstallStamp.fingerprint(tmp_path, "poetry.lock", venv, ("install",))
+    )
+    assert inspect_environment(tmp_path).diagnose("3.12.3") == []
+
+    with (tmp_path / "pyproject.toml").open("a") as f:
+        f.write('\n[tool.poetry.dependencies]\nhttpx = "*"\n')
+
+    assert inspect_environment(tmp_path).diagnose("3.12.3") == [Issue.stale_lock]
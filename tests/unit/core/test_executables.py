@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from api_bootstrapper_cli.core import executables
+from api_bootstrapper_cli.core.executables import (
+    clear_executable_cache,
+    resolve_executable,
+    sanitized_path,
+)
+from api_bootstrapper_cli.core.shell import CommandResult, ShellError
+
+
+@pytest.fixture(autouse=True)
+def bare_executables() -> None:
+    """Exercise the real search instead of the suite-wide bare-name stub."""
+    clear_executable_cache()
+
+
+def _make_executable(path: Path) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.touch()
+    path.chmod(0o755)
+    return path
+
+
+def test_should_use_pyenv_path_when_available(mocker, tmp_path: Path):
+    poetry_path = _make_executable(tmp_path / "poetry-executable")
+    mock_exec = mocker.patch(
+        "api_bootstrapper_cli.core.executables.exec_cmd",
+        return_value=CommandResult(stdout=f"{poetry_path}\n", stderr="", returncode=0),
+    )
+
+    result = resolve_executable("poetry", {"PATH": "", "PYENV_VERSION": "3.12.0"})
+
+    assert result == str(poetry_path)
+    assert mock_exec.call_args[0][0] == ["pyenv", "which", "poetry"]
+
+
+def test_should_search_path_when_pyenv_fails(mocker, tmp_path: Path):
+    poetry_path = _make_executable(tmp_path / "bin" / "poetry")
+    mocker.patch(
+        "api_bootstrapper_cli.core.executables.exec_cmd",
+        side_effect=FileNotFoundError("pyenv not found"),
+    )
+
+    result = resolve_executable("poetry", {"PATH": str(poetry_path.parent)})
+
+    assert result == str(poetry_path)
+
+
+def test_should_fallback_to_bare_name_when_not_found(mocker):
+    mocker.patch(
+        "api_bootstrapper_cli.core.executables.exec_cmd",
+        side_effect=ShellError("pyenv: poetry: command not found"),
+    )
+
+    assert resolve_executable("poetry", {"PATH": ""}) == "poetry"
+
+
+def test_should_resolve_each_tool_once(mocker, tmp_path: Path):
+    uv_path = _make_executable(tmp_path / "bin" / "uv")
+    which = mocker.patch(
+        "api_bootstrapper_cli.core.executables.shutil.which",
+        return_value=str(uv_path),
+    )
+    env = {"PATH": str(uv_path.parent)}
+
+    assert resolve_executable("uv", env) == str(uv_path)
+    assert resolve_executable("uv", env) == str(uv_path)
+    assert which.call_count == 1
+
+    clear_executable_cache()
+    resolve_executable("uv", env)
+    assert which.call_count == 2
+
+
+def test_should_ignore_pyenv_shims_when_searching(tmp_path: Path):
+    shims = _make_executable(tmp_path / ".pyenv" / "shims" / "uv").parent
+    real = _make_executable(tmp_path / "bin" / "uv")
+    env = {"PATH": f"{shims}:{real.parent}"}
+
+    assert sanitized_path(env) == str(real.parent)
+    assert resolve_executable("uv", env) == str(real)
+
+
+def test_should_resolve_poetry_per_pyenv_version(mocker, tmp_path: Path):
+    old = _make_executable(tmp_path / "3.11.0" / "poetry")
+    new = _make_executable(tmp_path / "3.12.0" / "poetry")
+    project = tmp_path / "project"
+    project.mkdir()
+    version_file = project / ".python-version"
+
+    def pyenv_which(cmd, **kwargs):
+        version = version_file.read_text().strip()
+        return CommandResult(
+            stdout=str(tmp_path / version / "poetry"), stderr="", returncode=0
+        )
+
+    mock_exec = mocker.patch(
+        "api_bootstrapper_cli.core.executables.exec_cmd", side_effect=pyenv_which
+    )
+    env = {"PATH": "", "PYENV_ROOT": str(tmp_path / "pyenv")}
+
+    version_file.write_text("3.11.0\n")
+    assert resolve_executable("poetry", env, project) == str(old)
+    assert resolve_executable("poetry", env, project) == str(old)
+
+    version_file.write_text("3.12.0\n")
+    assert resolve_executable("poetry", env, project) == str(new)
+    assert mock_exec.call_count == 2
+
+
+def test_should_read_pyenv_version_from_parent_directories(tmp_path: Path):
+    (tmp_path / ".python-version").write_text("3.12.0\n")
+    nested = tmp_path / "a" / "b"
+    nested.mkdir(parents=True)
+
+    assert executables._pyenv_version({}, nested) == "3.12.0"
+    pinned = {"PYENV_VERSION": "3.10.1"}
+    assert executables._pyenv_version(pinned, nested) == "3.10.1"
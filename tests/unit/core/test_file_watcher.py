@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from api_bootstrapper_cli.core.file_watcher import FileWatcher
+
+
+BACKENDS = [
+    pytest.param(
+        True,
+        id="inotify",
+        marks=pytest.mark.skipif(
+            not sys.platform.startswith("linux"), reason="inotify is Linux-only"
+        ),
+    ),
+    pytest.param(False, id="polling"),
+]
+
+
+def _watcher(project: Path, use_inotify: bool, debounce: float = 0.05) -> FileWatcher:
+    return FileWatcher(
+        project,
+        ["pyproject.toml", "poetry.lock"],
+        debounce=debounce,
+        poll_interval=0.01,
+        use_inotify=use_inotify,
+    )
+
+
+@pytest.mark.parametrize("use_inotify", BACKENDS)
+def test_should_report_changed_file(tmp_path: Path, use_inotify: bool):
+    (tmp_path / "pyproject.toml").write_text("a\n")
+    with _watcher(tmp_path, use_inotify) as watcher:
+        assert watcher.backend == ("inotify" if use_inotify else "polling")
+
+        (tmp_path / "pyproject.toml").write_text("b\n")
+        (tmp_path / "README.md").write_text("ignored\n")
+
+        assert watcher.wait(timeout=2) == {"pyproject.toml"}
+        assert watcher.wait(timeout=0.1) == set()
+
+
+@pytest.mark.parametrize("use_inotify", BACKENDS)
+def test_should_debounce_a_burst_of_edits(tmp_path: Path, use_inotify: bool):
+    def edit() -> None:
+        for i in range(5):
+            (tmp_path / "pyproject.toml").write_text(f"{i}\n")
+            time.sleep(0.02)
+        (tmp_path / "poetry.lock").write_text("lock\n")
+
+    with _watcher(tmp_path, use_inotify, debounce=0.2) as watcher:
+        editor = threading.Thread(target=edit)
+        editor.start()
+        changed = watcher.wait(timeout=2)
+        editor.join()
+
+    assert changed == {"pyproject.toml", "poetry.lock"}
+
+
+@pytest.mark.parametrize("use_inotify", BACKENDS)
+def test_should_ignore_rewrites_after_rebaseline(tmp_path: Path, use_inotify: bool):
+    (tmp_path / "pyproject.toml").write_text("a\n")
+    with _watcher(tmp_path, use_inotify) as watcher:
+        (tmp_path / "pyproject.toml").write_text("a\n")
+        assert watcher.wait(timeout=0.2) == set()
+
+        (tmp_path / "pyproject.toml").write_text("b\n")
+        watcher.rebaseline()
+        assert watcher.wait(timeout=0.2) == set()
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from api_bootstrapper_cli.core.install_stamp import InstallStamp
+
+
+ARGS = ("install", "--no-root")
+
+
+def _make_project(project: Path) -> Path:
+    (project / "pyproject.toml").write_text('[tool.poetry]\nname = "api"\n')
+    (project / "poetry.lock").write_text("# lock\n")
+    venv = project / ".venv"
+    venv.mkdir()
+    (venv / "pyvenv.cfg").write_text("home = /usr/bin\nversion = 3.12.3\n")
+    return venv
+
+
+def test_should_match_after_write(tmp_path: Path):
+    venv = _make_project(tmp_path)
+    stamp = InstallStamp.in_venv(venv)
+    fingerprint = InstallStamp.fingerprint(tmp_path, "poetry.lock", venv, ARGS)
+
+    stamp.write(fingerprint)
+
+    assert stamp.path.parent == venv
+    assert stamp.matches(InstallStamp.fingerprint(tmp_path, "poetry.lock", venv, ARGS))
+
+
+def test_should_not_match_when_inputs_change(tmp_path: Path):
+    venv = _make_project(tmp_path)
+    stamp = InstallStamp.in_venv(venv)
+    stamp.write(InstallStamp.fingerprint(tmp_path, "poetry.lock", venv, ARGS))
+
+    (tmp_path / "poetry.lock").write_text("# relocked\n")
+    assert not stamp.matches(
+        InstallStamp.fingerprint(tmp_path, "poetry.lock", venv, ARGS)
+    )
+    assert not stamp.matches(
+        InstallStamp.fingerprint(tmp_path, "poetry.lock", venv, ("install",))
+    )
+
+
+def test_should_never_match_without_lock_file(tmp_path: Path):
+    venv = _make_project(tmp_path)
+    (tmp_path / "poetry.lock").unlink()
+    stamp = InstallStamp.in_venv(venv)
+    fingerprint = InstallStamp.fingerprint(tmp_path, "poetry.lock", venv, ARGS)
+
+    stamp.write(fingerprint)
+
+    assert not stamp.matches(fingerprint)
+
+
+def test_should_not_match_after_clear(tmp_path: Path):
+    venv = _make_project(tmp_path)
+    stamp = InstallStamp.in_venv(venv)
+    fingerprint = InstallStamp.fingerprint(tmp_path, "poetry.lock", venv, ARGS)
+    stamp.write(fingerprint)
+
+    stamp.clear()
+
+    assert not stamp.matches(fingerprint)
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from api_bootstrapper_cli.core.journal import BootstrapJournal
+
+
+def test_should_report_step_completed_with_same_inputs(tmp_path: Path):
+    journal = BootstrapJournal(tmp_path / "journal.json")
+
+    journal.record("ensure_python", {"version": "3.12.3"})
+
+    assert journal.completed("ensure_python", {"version": "3.12.3"})
+    assert not journal.completed("ensure_python", {"version": "3.13.0"})
+    assert not journal.completed("set_local", {"version": "3.12.3"})
+
+
+def test_should_persist_entries_and_results(tmp_path: Path):
+    path = tmp_path / "journal.json"
+    BootstrapJournal(path).record(
+        "python_path", {"version": "3.12.3"}, "/usr/bin/python3"
+    )
+
+    reloaded = BootstrapJournal(path)
+
+    assert reloaded.completed("python_path", {"version": "3.12.3"})
+    assert reloaded.result("python_path") == "/usr/bin/python3"
+
+
+def test_should_compare_inputs_after_json_round_trip(tmp_path: Path):
+    journal = BootstrapJournal(tmp_path / "journal.json")
+
+    journal.record("python_tooling", {"packages": ("pip", "poetry")})
+
+    assert journal.completed("python_tooling", {"packages": ["pip", "poetry"]})
+
+
+def test_should_clear_journal_file(tmp_path: Path):
+    path = tmp_path / "journal.json"
+    journal = BootstrapJournal(path)
+    journal.record("ensure_python", {"version": "3.12.3"})
+
+    journal.clear()
+
+    assert not path.exists()
+    assert not journal.completed("ensure_python", {"version": "3.12.3"})
+
+
+def test_should_ignore_corrupt_journal(tmp_path: Path):
+    path = tmp_path / "journal.json"
+    path.write_text("{not json")
+
+    journal = BootstrapJournal(path)
+
+    assert not journal.completed("ensure_python", {"version": "3.12.3"})
+
+
+def test_should_store_project_journals_in_cache_dir(
+    tmp_path: Path, isolated_cache_dir: Path
+):
+    journal = BootstrapJournal.for_project(tmp_path)
+
+    assert journal.path.parent == isolated_cache_dir / "journals"
+    assert BootstrapJournal.for_project(tmp_path).path == journal.path
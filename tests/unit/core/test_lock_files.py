@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+
+import pytest
+
+from api_bootstrapper_cli.core.lock_files import (
+    poetry_content_hashes,
+    poetry_lock_is_current,
+    uv_lock_is_current,
+)
+
+
+POETRY_PYPROJECT = """\
+[tool.poetry]
+name = "api"
+
+[tool.poetry.dependencies]
+python = "^3.12"
+fastapi = "^0.110"
+"""
+
+UV_PYPROJECT = """\
+[project]
+name = "api"
+requires-python = ">=3.12"
+dependencies = ["fastapi>=0.110", "Pydantic_Settings[dotenv]>=2; python_version>='3.12'"]
+
+[dependency-groups]
+dev = ["pytest>=8", {include-group = "lint"}]
+lint = ["ruff"]
+"""
+
+UV_LOCK = """\
+version = 1
+requires-python = ">=3.12"
+
+[[package]]
+name = "api"
+version = "0.1.0"
+source = { virtual = "." }
+
+[package.metadata]
+requires-dist = [
+    { name = "fastapi", specifier = ">=0.110" },
+    { name = "pydantic-settings", extras = ["dotenv"], specifier = ">=2" },
+]
+
+[package.metadata.requires-dev]
+dev = [{ name = "pytest", specifier = ">=8" }]
+lint = [{ name = "ruff" }]
+"""
+
+
+def _poetry_hash(content: dict) -> str:
+    return hashlib.sha256(json.dumps(content, sort_keys=True).encode()).hexdigest()
+
+
+def test_should_match_poetry_1_content_hash(tmp_path: Path):
+    (tmp_path / "pyproject.toml").write_text(POETRY_PYPROJECT)
+    locked = _poetry_hash(
+        {
+            "dependencies": {"python": "^3.12", "fastapi": "^0.110"},
+            "dev-dependencies": None,
+            "extras": None,
+            "source": None,
+        }
+    )
+    (tmp_path / "poetry.lock").write_text(f'[metadata]\ncontent-hash = "{locked}"\n')
+
+    assert poetry_lock_is_current(tmp_path)
+
+    (tmp_path / "pyproject.toml").write_text(POETRY_PYPROJECT + 'httpx = "*"\n')
+    assert not poetry_lock_is_current(tmp_path)
+
+
+def test_should_hash_pep621_project_like_poetry_2():
+    pyproject = {
+        "project": {"name": "api", "dependencies": ["fastapi>=0.110"]},
+        "tool": {"poetry": {"group": {"dev": {"dependencies": {"pytest": "^8"}}}}},
+    }
+
+    expected = _poetry_hash(
+        {
+            "project": {"dependencies": ["fastapi>=0.110"]},
+            "tool": {"poetry": {"group": {"dev": {"dependencies": {"pytest": "^8"}}}}},
+        }
+    )
+    assert expected in poetry_content_hashes(pyproject)
+
+
+def test_should_not_trust_missing_poetry_lock(tmp_path: Path):
+    (tmp_path / "pyproject.toml").write_text(POETRY_PYPROJECT)
+
+    assert not poetry_lock_is_current(tmp_path)
+
+
+def test_should_accept_uv_lock_matching_pyproject(tmp_path: Path):
+    (tmp_path / "pyproject.toml").write_text(UV_PYPROJECT)
+    (tmp_path / "uv.lock").write_text(UV_LOCK)
+
+    assert uv_lock_is_current(tmp_path)
+
+
+def test_should_accept_uv_lock_that_spells_requirements_differently(tmp_path: Path):
+    pyproject = UV_PYPROJECT.replace('"fastapi>=0.110"', '"FastAPI (>= 0.110)"')
+    (tmp_path / "pyproject.toml").write_text(pyproject)
+    (tmp_path / "uv.lock").write_text(UV_LOCK)
+
+    assert uv_lock_is_current(tmp_path)
+
+
+@pytest.mark.parametrize(
+    ("old", "new"),
+    [
+        ('requires-python = ">=3.12"', 'requires-python = ">=3.13"'),
+        ('"fastapi>=0.110", ', '"fastapi>=0.110", "httpx", '),
+        ('lint = ["ruff"]', 'lint = ["ruff", "mypy"]'),
+        ('name = "api"', 'name = "other"'),
+        ('"fastapi>=0.110"', '"fastapi>=0.111"'),
+        ('"fastapi>=0.110"', '"fastapi>=0.110,<1"'),
+        ("[dotenv]", "[dotenv,yaml]"),
+        ('"pytest>=8"', '"pytest>=9"'),
+    ],
+)
+def test_should_detect_stale_uv_lock(tmp_path: Path, old: str, new: str):
+    (tmp_path / "pyproject.toml").write_text(UV_PYPROJECT.replace(old, new))
+    (tmp_path / "uv.lock").write_text(UV_LOCK)
+
+    assert not uv_lock_is_current(tmp_path)
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from api_bootstrapper_cli.core.poetry_lock import locked_packages
+
+
+POETRY2_PYPROJECT = """\
+[tool.poetry]
+name = "api"
+version = "0.1.0"
+
+[tool.poetry.dependencies]
+python = "^3.12"
+click = "^8"
+
+[tool.poetry.group.dev.dependencies]
+pytest = "^8"
+
+[tool.poetry.group.docs]
+optional = true
+
+[tool.poetry.group.docs.dependencies]
+mkdocs = "*"
+"""
+
+POETRY2_LOCK = """\
+[[package]]
+name = "click"
+version = "8.1.7"
+groups = ["main", "dev"]
+files = [{file = "click-8.1.7-py3-none-any.whl", hash = "sha256:c1"}]
+
+[[package]]
+name = "colorama"
+version = "0.4.6"
+groups = ["main", "dev"]
+markers = {main = "platform_system == \\"Windows\\"", dev = "sys_platform == \\"win32\\""}
+files = [{file = "colorama-0.4.6-py2.py3-none-any.whl", hash = "sha256:c2"}]
+
+[[package]]
+name = "pytest"
+version = "8.1.1"
+groups = ["dev"]
+files = [{file = "pytest-8.1.1-py3-none-any.whl", hash = "sha256:p1"}]
+
+[[package]]
+name = "mkdocs"
+version = "1.5.3"
+groups = ["docs"]
+files = [{file = "mkdocs-1.5.3-py3-none-any.whl", hash = "sha256:m1"}]
+"""
+
+POETRY1_PYPROJECT = """\
+[tool.poetry]
+name = "api"
+version = "0.1.0"
+
+[tool.poetry.dependencies]
+python = "^3.12"
+uvicorn = { version = "^0.29", extras = ["standard"] }
+tomli = { version = "*", markers = "python_version < '3.11'" }
+lib = { git = "https://github.com/org/lib.git", branch = "main" }
+"""
+
+POETRY1_LOCK = """\
+[[package]]
+name = "uvicorn"
+version = "0.29.0"
+
+[package.dependencies]
+h11 = ">=0.8"
+uvloop = { version = ">=0.14", optional = true, markers = "sys_platform != 'win32'" }
+
+[package.extras]
+standard = ["uvloop (>=0.14)"]
+
+[[package]]
+name = "h11"
+version = "0.14.0"
+
+[[package]]
+name = "uvloop"
+version = "0.19.0"
+
+[[package]]
+name = "tomli"
+version = "2.0.1"
+
+[[package]]
+name = "unused"
+version = "1.0"
+
+[[package]]
+name = "lib"
+version = "0.3.0"
+
+[package.source]
+type = "git"
+url = "https://github.com/org/lib.git"
+reference = "main"
+resolved_reference = "0123abc"
+
+[metadata.files]
+uvicorn = [{file = "uvicorn-0.29.0.tar.gz", hash = "sha256:u1"}]
+h11 = [{file = "h11-0.14.0.tar.gz", hash = "sha256:h1"}]
+uvloop = [{file = "uvloop-0.19.0.tar.gz", hash = "sha256:l1"}]
+tomli = [{file = "tomli-2.0.1.tar.gz", hash = "sha256:t1"}]
+unused = [{file = "unused-1.0.tar.gz", hash = "sha256:x1"}]
+lib = []
+"""
+
+
+def _project(tmp_path: Path, pyproject: str, lock: str) -> Path:
+    (tmp_path / "pyproject.toml").write_text(pyproject)
+    (tmp_path / "poetry.lock").write_text(lock)
+    return tmp_path
+
+
+def test_should_take_groups_and_markers_from_a_poetry2_lock(tmp_path: Path):
+    locked = locked_packages(_project(tmp_path, POETRY2_PYPROJECT, POETRY2_LOCK))
+
+    assert locked.hashed == [
+        "click==8.1.7 --hash=sha256:c1",
+        'colorama==0.4.6 ; (platform_system == "Windows") or '
+        '(sys_platform == "win32") --hash=sha256:c2',
+        "pytest==8.1.1 --hash=sha256:p1",
+    ]
+    assert locked.direct == []
+
+
+def test_should_walk_a_poetry1_lock_from_pyproject(tmp_path: Path):
+    locked = locked_packages(_project(tmp_path, POETRY1_PYPROJECT, POETRY1_LOCK))
+
+    assert sorted(locked.hashed) == [
+        "h11==0.14.0 --hash=sha256:h1",
+        "tomli==2.0.1 ; (python_version < '3.11') --hash=sha256:t1",
+        "uvicorn==0.29.0 --hash=sha256:u1",
+        "uvloop==0.19.0 ; (sys_platform != 'win32') --hash=sha256:l1",
+    ]
+    assert locked.direct == ["lib @ git+https://github.com/org/lib.git@0123abc"]
+
+
+def test_should_add_extra_hashes_for_locally_built_wheels(tmp_path: Path):
+    project = _project(tmp_path, POETRY2_PYPROJECT, POETRY2_LOCK)
+
+    locked = locked_packages(project, {"click==8.1.7": ["sha256:built"]})
+
+    assert locked.hashed[0] == "click==8.1.7 --hash=sha256:c1 --hash=sha256:built"
+    assert locked.hashes["click==8.1.7"] == ["sha256:c1", "sha256:built"]
+
+
+def test_should_collect_index_urls_of_legacy_sources(tmp_path: Path):
+    project = _project(
+        tmp_path,
+        POETRY2_PYPROJECT,
+        POETRY2_LOCK.replace(
+            'hash = "sha256:c1"}]\n',
+            'hash = "sha256:c1"}]\n\n[package.source]\ntype = "legacy"\n'
+            'url = "https://pypi.example.com/simple"\nreference = "example"\n',
+        ),
+    )
+
+    assert locked_packages(project).index_urls == ["https://pypi.example.com/simple"]
+
+
+def test_should_refuse_a_lock_missing_a_dependency(tmp_path: Path):
+    project = _project(
+        tmp_path,
+        POETRY2_PYPROJECT.replace('click = "^8"', 'click = "^8"\nhttpx = "*"'),
+        POETRY2_LOCK,
+    )
+
+    with pytest.raises(RuntimeError, match="poetry.lock não contém httpx"):
+        locked_packages(project)
+
+
+def test_should_refuse_an_index_package_without_hashes(tmp_path: Path):
+    project = _project(
+        tmp_path,
+        POETRY2_PYPROJECT,
+        POETRY2_LOCK.replace(
+            'files = [{file = "click-8.1.7-py3-none-any.whl", hash = "sha256:c1"}]',
+            "files = []",
+        ),
+    )
+
+    with pytest.raises(RuntimeError, match="sem hashes para click"):
+        locked_packages(project)
@@ -4,13 +4,17 @@ from pathlib import Path
 
 import pytest
 
+from api_bootstrapper_cli.core.install_stamp import InstallStamp
 from api_bootstrapper_cli.core.poetry_manager import PoetryManager
+from api_bootstrapper_cli.core.protocols import LOCK_TIMEOUT, LockMode
 from api_bootstrapper_cli.core.shell import CommandResult, ShellError
+from api_bootstrapper_cli.core.venv_templates import VenvTemplates
+from api_bootstrapper_cli.core.wheelhouse import Wheelhouse
 
 
 def test_should_verify_poetry_is_installed(mocker):
     mocker.patch(
-        "api_bootstrapper_cli.core.poetry_manager.PoetryManager._get_poetry_cmd",
+        "api_bootstrapper_cli.core.poetry_manager.resolve_executable",
         return_value="poetry",
     )
     mock_exec = mocker.patch("api_bootstrapper_cli.core.poetry_manager.exec_cmd")
@@ -30,7 +34,7 @@ def test_should_verify_poetry_is_installed(mocker):
 
 def test_should_configure_in_project_venv(mocker, tmp_path: Path):
     mocker.patch(
-        "api_bootstrapper_cli.core.poetry_manager.PoetryManager._get_poetry_cmd",
+        "api_bootstrapper_cli.core.poetry_manager.resolve_executable",
         return_value="poetry",
     )
     mock_exec = mocker.patch("api_bootstrapper_cli.core.poetry_manager.exec_cmd")
@@ -56,7 +60,7 @@ def test_should_use_specific_python_version(mocker, tmp_path: Path):
     (tmp_path / ".venv").mkdir()
 
     mocker.patch(
-        "api_bootstrapper_cli.core.poetry_manager.PoetryManager._get_poetry_cmd",
+        "api_bootstrapper_cli.core.poetry_manager.resolve_executable",
         return_value="poetry",
     )
     mock_exec = mocker.patch("api_bootstrapper_cli.core.poetry_manager.exec_cmd")
@@ -85,7 +89,7 @@ def test_should_install_dependencies(mocker, tmp_path: Path):
     (tmp_path / ".venv").mkdir()
 
     mocker.patch(
-        "api_bootstrapper_cli.core.poetry_manager.PoetryManager._get_poetry_cmd",
+        "api_bootstrapper_cli.core.poetry_manager.resolve_executable",
         return_value="poetry",
     )
     mock_exec = mocker.patch("api_bootstrapper_cli.core.poetry_manager.exec_cmd")
@@ -103,77 +107,173 @@ def test_should_install_dependencies(mocker, tmp_path: Path):
     assert call_args[1]["check"] is True
 
 
-def test_should_use_pyenv_path_when_available(mocker, tmp_path: Path):
-    poetry_path = tmp_path / "poetry-executable"
-    poetry_path.touch()
-    poetry_path.chmod(0o755)
+def _make_installable_project(project: Path) -> None:
+    (project / "pyproject.toml").write_text('[tool.poetry]\nname = "api"\n')
+    (project / "poetry.lock").write_text("# lock\n")
+    (project / ".venv").mkdir()
+    (project / ".venv" / "pyvenv.cfg").write_text("version = 3.12.3\n")
 
-    mock_exec = mocker.patch("api_bootstrapper_cli.core.poetry_manager.exec_cmd")
-    mock_exec.side_effect = [
-        CommandResult(stdout=f"{poetry_path}\n", stderr="", returncode=0),
-        CommandResult(stdout="Poetry version 1.7.0", stderr="", returncode=0),
-    ]
+
+def test_should_skip_install_when_stamp_matches(mocker, tmp_path: Path):
+    _make_installable_project(tmp_path)
     mocker.patch(
-        "api_bootstrapper_cli.core.poetry_manager.Path.exists", return_value=True
+        "api_bootstrapper_cli.core.poetry_manager.resolve_executable",
+        return_value="poetry",
     )
+    mock_exec = mocker.patch("api_bootstrapper_cli.core.poetry_manager.exec_cmd")
+    manager = PoetryManager()
 
+    manager.install_dependencies(tmp_path)
+    manager.install_dependencies(tmp_path)
+    assert mock_exec.call_count == 1
+
+    manager.install_dependencies(tmp_path, force=True)
+    assert mock_exec.call_count == 2
+
+    (tmp_path / "poetry.lock").write_text("# relocked\n")
+    manager.install_dependencies(tmp_path)
+    assert mock_exec.call_count == 3
+
+
+def test_should_not_stamp_failed_install(mocker, tmp_path: Path):
+    _make_installable_project(tmp_path)
+    mocker.patch(
+        "api_bootstrapper_cli.core.poetry_manager.resolve_executable",
+        return_value="poetry",
+    )
+    mock_exec = mocker.patch("api_bootstrapper_cli.core.poetry_manager.exec_cmd")
+    mock_exec.side_effect = [ShellError("network error"), None]
     manager = PoetryManager()
-    result = manager.is_installed()
 
-    assert result is True
+    with pytest.raises(RuntimeError):
+        manager.install_dependencies(tmp_path)
+    manager.install_dependencies(tmp_path)
+
     assert mock_exec.call_count == 2
-    assert mock_exec.call_args_list[0][0][0] == ["pyenv", "which", "poetry"]
-    assert mock_exec.call_args_list[1][0][0] == [str(poetry_path), "--version"]
 
 
-def test_should_search_path_when_pyenv_fails(mocker, tmp_path: Path):
-    poetry_path = tmp_path / "bin" / "poetry"
-    poetry_path.parent.mkdir(parents=True)
-    poetry_path.touch()
-    poetry_path.chmod(0o755)
+def test_should_refuse_stale_lock_before_installing(mocker, tmp_path: Path):
+    _make_installable_project(tmp_path)
+    (tmp_path / "poetry.lock").write_text('[metadata]\ncontent-hash = "0000"\n')
+    mock_exec = mocker.patch("api_bootstrapper_cli.core.poetry_manager.exec_cmd")
+
+    with pytest.raises(RuntimeError, match=r"poetry\.lock desatualizado"):
+        PoetryManager().install_dependencies(tmp_path, lock_mode=LockMode.locked)
+
+    mock_exec.assert_not_called()
 
+
+def test_should_leave_a_lock_missing_a_dependency_to_poetry_when_frozen(
+    mocker, tmp_path: Path
+):
+    _make_installable_project(tmp_path)
+    (tmp_path / "pyproject.toml").write_text(
+        '[tool.poetry]\nname = "api"\n\n'
+        '[tool.poetry.dependencies]\npython = "^3.12"\n'
+        'fastapi = "^0.110"\nhttpx = "^0.27"\n'
+    )
+    (tmp_path / "poetry.lock").write_text(
+        '[[package]]\nname = "fastapi"\nversion = "0.110.1"\n\n'
+        '[metadata]\ncontent-hash = "0000"\n'
+    )
+    mocker.patch(
+        "api_bootstrapper_cli.core.poetry_manager.resolve_executable",
+        return_value="poetry",
+    )
     mock_exec = mocker.patch("api_bootstrapper_cli.core.poetry_manager.exec_cmd")
-    mock_exec.side_effect = [
-        FileNotFoundError("pyenv not found"),
-        CommandResult(stdout="Poetry version 1.7.0", stderr="", returncode=0),
-    ]
 
-    mock_env = mocker.patch("api_bootstrapper_cli.core.poetry_manager.os.environ")
-    mock_env.copy.return_value = {"PATH": str(poetry_path.parent)}
-    mock_env.get.return_value = str(poetry_path.parent)
+    PoetryManager().install_dependencies(tmp_path, lock_mode=LockMode.frozen)
 
-    manager = PoetryManager()
-    result = manager.is_installed()
+    # Only `poetry install`, which refuses the stale lock; httpx is never
+    # resolved on the side, and the lock is never rewritten.
+    [call] = mock_exec.call_args_list
+    assert call[0][0] == ["poetry", "install", "--no-root"]
 
-    assert result is True
-    assert mock_exec.call_count == 2
-    assert mock_exec.call_args_list[1][0][0] == [str(poetry_path), "--version"]
+
+def test_should_require_lock_file_when_frozen(mocker, tmp_path: Path):
+    (tmp_path / "pyproject.toml").write_text('[tool.poetry]\nname = "api"\n')
+    mock_exec = mocker.patch("api_bootstrapper_cli.core.poetry_manager.exec_cmd")
+
+    with pytest.raises(RuntimeError, match=r"poetry\.lock não encontrado"):
+        PoetryManager().install_dependencies(tmp_path, lock_mode=LockMode.frozen)
+
+    mock_exec.assert_not_called()
 
 
-def test_should_fallback_to_poetry_string_command(mocker):
+@pytest.mark.parametrize(
+    ("version", "expected"),
+    [
+        ("Poetry (version 1.8.3)", ["poetry", "lock", "--no-update"]),
+        ("Poetry (version 2.1.1)", ["poetry", "lock"]),
+    ],
+)
+def test_should_relock_without_updating_pins(
+    mocker, tmp_path: Path, version: str, expected: list[str]
+):
+    mocker.patch(
+        "api_bootstrapper_cli.core.poetry_manager.resolve_executable",
+        return_value="poetry",
+    )
     mock_exec = mocker.patch("api_bootstrapper_cli.core.poetry_manager.exec_cmd")
-    mock_exec.side_effect = [
-        FileNotFoundError("pyenv not found"),
-        CommandResult(stdout="Poetry version 1.7.0", stderr="", returncode=0),
-    ]
+    mock_exec.return_value = CommandResult(stdout=version, stderr="", returncode=0)
 
-    mock_env = mocker.patch("api_bootstrapper_cli.core.poetry_manager.os.environ")
-    mock_env.copy.return_value = {"PATH": ""}
-    mock_env.get.return_value = ""
+    PoetryManager().relock(tmp_path)
 
-    manager = PoetryManager()
-    result = manager.is_installed()
+    assert mock_exec.call_args[0][0] == expected
+    assert mock_exec.call_args[1]["cwd"] == str(tmp_path)
 
-    assert result is True
-    assert mock_exec.call_count == 2
-    assert mock_exec.call_args_list[1][0][0] == ["poetry", "--version"]
+
+def test_should_lock_without_creating_a_venv(mocker, tmp_path: Path):
+    mocker.patch(
+        "api_bootstrapper_cli.core.poetry_manager.resolve_executable",
+        return_value="poetry",
+    )
+    mock_exec = mocker.patch("api_bootstrapper_cli.core.poetry_manager.exec_cmd")
+
+    PoetryManager().lock(tmp_path)
+
+    assert mock_exec.call_args[0][0] == ["poetry", "lock"]
+    assert mock_exec.call_args[1]["env"]["POETRY_VIRTUALENVS_CREATE"] == "false"
+    assert mock_exec.call_args[1]["timeout"] == LOCK_TIMEOUT
+
+
+def test_should_raise_runtime_error_when_poetry_is_missing_for_lock(
+    mocker, tmp_path: Path
+):
+    """The bare-name fallback fails to spawn; that is a domain error too."""
+    mocker.patch(
+        "api_bootstrapper_cli.core.poetry_manager.resolve_executable",
+        return_value="poetry",
+    )
+    mocker.patch(
+        "api_bootstrapper_cli.core.poetry_manager.exec_cmd",
+        side_effect=FileNotFoundError(2, "No such file or directory", "poetry"),
+    )
+
+    with pytest.raises(RuntimeError, match=r"\[poetry\] Falha ao gerar lock file"):
+        PoetryManager().lock(tmp_path)
+
+
+def test_should_raise_runtime_error_when_relock_fails(mocker, tmp_path: Path):
+    mocker.patch(
+        "api_bootstrapper_cli.core.poetry_manager.resolve_executable",
+        return_value="poetry",
+    )
+    mock_exec = mocker.patch("api_bootstrapper_cli.core.poetry_manager.exec_cmd")
+    mock_exec.side_effect = [
+        CommandResult(stdout="Poetry (version 1.8.3)", stderr="", returncode=0),
+        ShellError("SolverProblemError"),
+    ]
+
+    with pytest.raises(RuntimeError, match=r"\[poetry\]"):
+        PoetryManager().relock(tmp_path)
 
 
 def test_should_raise_runtime_error_when_configure_venv_fails(mocker, tmp_path: Path):
     """configure_venv should raise RuntimeError (not raw ShellError) on failure."""
 
     mocker.patch(
-        "api_bootstrapper_cli.core.poetry_manager.PoetryManager._get_poetry_cmd",
+        "api_bootstrapper_cli.core.poetry_manager.resolve_executable",
         return_value="poetry",
     )
     mock_exec = mocker.patch("api_bootstrapper_cli.core.poetry_manager.exec_cmd")
@@ -190,7 +290,7 @@ def test_should_raise_runtime_error_when_use_python_fails(mocker, tmp_path: Path
     """use_python should raise RuntimeError on ShellError."""
 
     mocker.patch(
-        "api_bootstrapper_cli.core.poetry_manager.PoetryManager._get_poetry_cmd",
+        "api_bootstrapper_cli.core.poetry_manager.resolve_executable",
         return_value="poetry",
     )
     mock_exec = mocker.patch("api_bootstrapper_cli.core.poetry_manager.exec_cmd")
@@ -208,7 +308,7 @@ def test_should_raise_runtime_error_when_install_dependencies_fails(
 
     (tmp_path / ".venv").mkdir()
     mocker.patch(
-        "api_bootstrapper_cli.core.poetry_manager.PoetryManager._get_poetry_cmd",
+        "api_bootstrapper_cli.core.poetry_manager.resolve_executable",
         return_value="poetry",
     )
     mock_exec = mocker.patch("api_bootstrapper_cli.core.poetry_manager.exec_cmd")
@@ -234,7 +334,7 @@ def test_ensure_venv_raises_runtime_error_when_creation_fails(mocker, tmp_path:
     """ensure_venv should raise RuntimeError when poetry fails to create venv."""
 
     mocker.patch(
-        "api_bootstrapper_cli.core.poetry_manager.PoetryManager._get_poetry_cmd",
+        "api_bootstrapper_cli.core.poetry_manager.resolve_executable",
         return_value="poetry",
     )
     mock_exec = mocker.patch("api_bootstrapper_cli.core.poetry_manager.exec_cmd")
@@ -243,3 +343,132 @@ def test_ensure_venv_raises_runtime_error_when_creation_fails(mocker, tmp_path:
 
     with pytest.raises(RuntimeError, match=r"\[poetry\].*Falha ao criar virtualenv"):
         manager.ensure_venv(tmp_path)
+
+
+def test_ensure_venv_creates_venv_without_installing(mocker, tmp_path: Path):
+    mocker.patch(
+        "api_bootstrapper_cli.core.poetry_manager.resolve_executable",
+        return_value="poetry",
+    )
+    mock_exec = mocker.patch("api_bootstrapper_cli.core.poetry_manager.exec_cmd")
+
+    PoetryManager().ensure_venv(tmp_path)
+
+    assert mock_exec.call_args[0][0] == ["poetry", "run", "python", "-c", ""]
+    assert mock_exec.call_args[1]["cwd"] == str(tmp_path)
+
+
+def test_should_clone_venv_template_instead_of_installing(mocker, tmp_path: Path):
+    mocker.patch(
+        "api_bootstrapper_cli.core.poetry_manager.resolve_executable",
+        return_value="poetry",
+    )
+    mock_exec = mocker.patch("api_bootstrapper_cli.core.poetry_manager.exec_cmd")
+    templates = VenvTemplates(tmp_path / "templates", copy=True)
+    manager = PoetryManager(templates=templates)
+    first, second = tmp_path / "first", tmp_path / "second"
+    for project in (first, second):
+        project.mkdir()
+        _make_installable_project(project)
+
+    manager.install_dependencies(first)
+    manager.install_dependencies(second)
+
+    assert mock_exec.call_count == 1
+    assert InstallStamp.in_venv(second / ".venv").read() is not None
+    manager.install_dependencies(second)
+    assert mock_exec.call_count == 1
+
+
+def test_should_pip_install_exact_lock_with_hashes_from_wheelhouse(
+    mocker, tmp_path: Path
+):
+    _make_installable_project(tmp_path)
+    (tmp_path / "pyproject.toml").write_text(
+        '[tool.poetry]\nname = "api"\n\n'
+        '[tool.poetry.dependencies]\npython = "^3.12"\nfastapi = "^0.110"\n'
+        'shared = { path = "../shared" }\n'
+    )
+    (tmp_path / "poetry.lock").write_text(
+        '[[package]]\nname = "fastapi"\nversion = "0.110.1"\ngroups = ["main"]\n'
+        'files = [{file = "fastapi-0.110.1.tar.gz", hash = "sha256:aaa"}]\n\n'
+        '[package.dependencies]\ninternal = "*"\n\n'
+        '[[package]]\nname = "internal"\nversion = "1.0"\ngroups = ["main"]\n'
+        'files = [{file = "internal-1.0.tar.gz", hash = "sha256:bbb"}]\n\n'
+        '[package.source]\ntype = "legacy"\nurl = "https://pypi.example.com/simple"\n\n'
+        '[[package]]\nname = "shared"\nversion = "0.1.0"\ngroups = ["main"]\n\n'
+        '[package.source]\ntype = "directory"\nurl = "../shared"\n'
+    )
+    requirements: list[str] = []
+
+    def run(cmd, **kwargs):
+        if "--requirement" in cmd:
+            requirements.append(Path(cmd[cmd.index("--requirement") + 1]).read_text())
+        return CommandResult(stdout="", stderr="", returncode=0)
+
+    mock_exec = mocker.patch(
+        "api_bootstrapper_cli.core.poetry_manager.exec_cmd", side_effect=run
+    )
+    wheels = tmp_path / "wheels"
+    manager = PoetryManager(wheelhouse=Wheelhouse(wheels))
+
+    manager.install_dependencies(tmp_path)
+
+    python = str(tmp_path.resolve() / ".venv" / "bin" / "python")
+    hashed, direct = (c.args[0] for c in mock_exec.call_args_list[-2:])
+    assert hashed[:-1] == [
+        python,
+        "-m",
+        "pip",
+        "install",
+        "--find-links",
+        str(wheels),
+        "--extra-index-url",
+        "https://pypi.example.com/simple",
+        "--no-deps",
+        "--require-hashes",
+        "--requirement",
+    ]
+    assert requirements == [
+        "fastapi==0.110.1 --hash=sha256:aaa\ninternal==1.0 --hash=sha256:bbb\n"
+    ]
+    shared = (tmp_path.parent / "shared").resolve().as_uri()
+    assert direct == [
+        python,
+        "-m",
+        "pip",
+        "install",
+        "--find-links",
+        str(wheels),
+        "--no-deps",
+        f"shared @ {shared}",
+    ]
+    assert InstallStamp.in_venv(tmp_path / ".venv").read() is not None
+
+
+def test_should_refuse_wheelhouse_install_when_lock_misses_a_dependency(
+    mocker, tmp_path: Path
+):
+    _make_installable_project(tmp_path)
+    (tmp_path / "pyproject.toml").write_text(
+        '[tool.poetry]\nname = "api"\n\n'
+        '[tool.poetry.dependencies]\npython = "^3.12"\nfastapi = "^0.110"\n'
+    )
+    (tmp_path / "poetry.lock").write_text("")
+    mock_exec = mocker.patch("api_bootstrapper_cli.core.poetry_manager.exec_cmd")
+    manager = PoetryManager(wheelhouse=Wheelhouse(tmp_path / "wheels", offline=True))
+
+    with pytest.raises(RuntimeError, match="poetry.lock não contém fastapi"):
+        manager.install_dependencies(tmp_path)
+    assert not any("pip" in c.args[0] for c in mock_exec.call_args_list)
+
+
+def test_should_require_poetry_lock_to_install_from_wheelhouse(mocker, tmp_path: Path):
+    _make_installable_project(tmp_path)
+    (tmp_path / "poetry.lock").unlink()
+    mock_exec = mocker.patch("api_bootstrapper_cli.core.poetry_manager.exec_cmd")
+    manager = PoetryManager(wheelhouse=Wheelhouse(tmp_path / "wheels"))
+
+    with pytest.raises(RuntimeError, match=r"\[poetry\] poetry.lock não encontrado"):
+        manager.install_dependencies(tmp_path)
+    mock_exec.assert_not_called()
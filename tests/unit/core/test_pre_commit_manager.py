@@ -5,7 +5,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from api_bootstrapper_cli.core.pre_commit_manager import PreCommitManager
+from api_bootstrapper_cli.core.pre_commit_manager import LOCK_TIMEOUT, PreCommitManager
 from api_bootstrapper_cli.core.protocols import ManagerChoice
 
 
@@ -320,11 +320,16 @@ requires = ["poetry-core"]
         ["poetry", "lock"],
         cwd=str(tmp_path),
         check=True,
+        env=manager.environment.for_backend("poetry"),
+        stream=True,
+        timeout=LOCK_TIMEOUT,
     )
     mock_exec.assert_any_call(
         ["poetry", "install", "--no-root"],
         cwd=str(tmp_path),
         check=True,
+        env=manager.environment.for_backend("poetry"),
+        stream=True,
     )
 
 
@@ -357,6 +362,7 @@ def test_should_call_correct_command_to_install_hooks(
         ],
         cwd=str(tmp_path),
         check=True,
+        env=manager.environment.for_backend("poetry"),
     )
 
 
@@ -442,6 +448,8 @@ requires = ["hatchling"]
         ["uv", "sync", "--all-groups"],
         cwd=str(tmp_path),
         check=True,
+        env=manager.environment.for_backend("uv"),
+        stream=True,
     )
 
 
@@ -488,6 +496,7 @@ def test_should_call_uv_run_to_install_hooks(mock_exec: MagicMock, tmp_path: Pat
         ],
         cwd=str(tmp_path),
         check=True,
+        env=manager.environment.for_backend("uv"),
     )
 
 
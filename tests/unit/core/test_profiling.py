@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+from rich.console import Console
+
+from api_bootstrapper_cli.core.profiling import (
+    COMMAND,
+    PHASE,
+    Profiler,
+    critical_path,
+    print_profile,
+    profiler,
+)
+from api_bootstrapper_cli.core.shell import ShellError, exec_cmd
+
+
+@pytest.fixture
+def enabled_profiler():
+    profiler.enable()
+    yield profiler
+    profiler.disable()
+    profiler.reset()
+
+
+def test_should_not_record_spans_when_disabled():
+    local = Profiler()
+
+    with local.span("phase"):
+        pass
+
+    assert local.spans == []
+
+
+def test_should_record_phase_span_when_enabled():
+    local = Profiler()
+    local.enable()
+
+    with local.span("python environment") as args:
+        args["version"] = "3.12.3"
+
+    [span] = local.spans
+    assert span.name == "python environment"
+    assert span.category == PHASE
+    assert span.duration >= 0
+    assert span.args == {"version": "3.12.3"}
+
+
+def test_should_record_error_on_failed_span():
+    local = Profiler()
+    local.enable()
+
+    with pytest.raises(ShellError):
+        with local.span("install", COMMAND):
+            raise ShellError("boom", returncode=7)
+
+    [span] = local.spans
+    assert span.args["error"] == "ShellError"
+    assert span.args["exit_code"] == 7
+
+
+def test_exec_cmd_should_emit_command_span(enabled_profiler, tmp_path: Path):
+    exec_cmd([sys.executable, "-c", "pass"], cwd=str(tmp_path))
+
+    [span] = enabled_profiler.spans
+    assert span.category == COMMAND
+    assert span.args["cmd"] == [sys.executable, "-c", "pass"]
+    assert span.args["cwd"] == str(tmp_path)
+    assert span.args["exit_code"] == 0
+    assert "peak_rss_kb" in span.args
+
+
+@pytest.mark.skipif(not hasattr(os, "wait4"), reason="needs os.wait4")
+@pytest.mark.parametrize("stream", [False, True])
+def test_should_measure_each_command_own_peak_rss(enabled_profiler, stream: bool):
+    exec_cmd(
+        [
+            sys.executable,
+            "-c",
+            "b = bytearray(256 * 1024 * 1024); b[::4096] = b'x' * 65536",
+        ],
+        stream=stream,
+    )
+    exec_cmd([sys.executable, "-c", "pass"], stream=stream)
+
+    big, small = enabled_profiler.spans
+    assert big.args["peak_rss_kb"] > 256 * 1024
+    # Not the high-water mark of every child so far.
+    assert small.args["peak_rss_kb"] < 128 * 1024
+
+
+def test_exec_cmd_should_record_exit_code_of_failed_command(enabled_profiler):
+    with pytest.raises(ShellError):
+        exec_cmd([sys.executable, "-c", "import sys; sys.exit(4)"])
+
+    [span] = enabled_profiler.spans
+    assert span.args["exit_code"] == 4
+
+
+def test_should_export_chrome_trace(enabled_profiler, tmp_path: Path):
+    with enabled_profiler.span("dependency environment"):
+        exec_cmd([sys.executable, "-c", "pass"])
+
+    trace_path = enabled_profiler.write_chrome_trace(tmp_path / "trace.json")
+    trace = json.loads(trace_path.read_text())
+
+    events = trace["traceEvents"]
+    assert [event["cat"] for event in events] == [PHASE, COMMAND]
+    assert all(event["ph"] == "X" for event in events)
+    assert events[0]["dur"] >= events[1]["dur"]
+
+
+def test_should_print_phase_table(enabled_profiler, tmp_path: Path):
+    with enabled_profiler.span("python tooling"):
+        exec_cmd([sys.executable, "-c", "pass"])
+    console = Console(record=True, width=120)
+
+    print_profile(console, tmp_path / "trace.json")
+
+    output = console.export_text()
+    assert "python tooling" in output
+    assert "total" in output
+    assert "Slowest commands" in output
+    assert (tmp_path / "trace.json").exists()
+
+
+def test_should_count_commands_only_in_their_own_concurrent_phase():
+    local = Profiler()
+    local.enable()
+    both_started = threading.Barrier(2)
+
+    def step(name: str, commands: int) -> None:
+        with local.span(name):
+            both_started.wait()
+            for _ in range(commands):
+                with local.span(f"{name} cmd", COMMAND):
+                    pass
+            both_started.wait()
+
+    threads = [
+        threading.Thread(target=step, args=("first", 1)),
+        threading.Thread(target=step, args=("second", 2)),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    console = Console(record=True, width=120)
+    console.print(local.phase_table())
+
+    rows = {
+        cells[1].strip(): cells[4].strip()
+        for line in console.export_text().splitlines()
+        if len(cells := line.split("│")) > 4
+    }
+    assert rows["first"] == "1"
+    assert rows["second"] == "2"
+
+
+def test_should_find_longest_dependency_chain():
+    durations = {"ensure_python": 5.0, "pyproject": 0.1, "use_python": 1.0}
+    after = {"use_python": ("ensure_python", "pyproject")}
+
+    assert critical_path(durations, after) == ["ensure_python", "use_python"]
+    assert critical_path({}, {}) == []
+
+
+def test_should_print_critical_path_of_scheduled_steps(enabled_profiler):
+    with enabled_profiler.span("ensure_python", after=[]):
+        pass
+    with enabled_profiler.span("use_python", after=["ensure_python"]):
+        pass
+    console = Console(record=True, width=120)
+
+    print_profile(console)
+
+    assert "ensure_python → use_python" in console.export_text()
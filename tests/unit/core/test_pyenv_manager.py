@@ -4,8 +4,10 @@ from pathlib import Path
 
 import pytest
 
-from api_bootstrapper_cli.core.pyenv_manager import PyenvManager
+from api_bootstrapper_cli.core.environment import CleanEnvironment
+from api_bootstrapper_cli.core.pyenv_manager import PYTHON_BUILD_TIMEOUT, PyenvManager
 from api_bootstrapper_cli.core.shell import CommandResult, ShellError
+from api_bootstrapper_cli.core.wheelhouse import Wheelhouse
 
 
 def test_should_detect_pyenv_is_installed(mocker):
@@ -143,3 +145,60 @@ def test_should_raise_runtime_error_when_install_pip_packages_fails(mocker):
 
     with pytest.raises(RuntimeError, match=r"\[env\].*Falha ao instalar pacotes pip"):
         manager.install_pip_packages("3.12.0", ["pip", "wheel"])
+
+
+def test_should_cache_read_only_pyenv_probes(mocker, tmp_path: Path):
+    mock_exec = mocker.patch("api_bootstrapper_cli.core.pyenv_manager.exec_cmd")
+    mock_exec.return_value = CommandResult(
+        stdout="/home/user/.pyenv/versions/3.12.3\n", stderr="", returncode=0
+    )
+    mocker.patch(
+        "api_bootstrapper_cli.core.pyenv_manager.resolve_executable",
+        return_value="pyenv",
+    )
+    # The injected environment's PYENV_ROOT, not the process's, is watched.
+    manager = PyenvManager(
+        environment=CleanEnvironment.capture({"PYENV_ROOT": str(tmp_path)})
+    )
+
+    manager.get_python_path("3.12.3")
+    manager._get_installed_versions()
+
+    for probe_call in mock_exec.call_args_list:
+        assert probe_call.kwargs["cache"] is True
+        assert probe_call.kwargs["cache_watch"] == [tmp_path / "versions"]
+
+
+def test_should_bound_python_build_with_timeout(mocker):
+    mock_exec = mocker.patch("api_bootstrapper_cli.core.pyenv_manager.exec_cmd")
+    mock_exec.side_effect = [
+        CommandResult(stdout="", stderr="", returncode=0),
+        CommandResult(stdout="", stderr="", returncode=0),
+    ]
+
+    PyenvManager().ensure_python("3.12.3")
+
+    assert mock_exec.call_args_list[1].kwargs["timeout"] == PYTHON_BUILD_TIMEOUT
+
+
+def test_should_install_pip_packages_from_wheelhouse(mocker, tmp_path: Path):
+    mock_exec = mocker.patch("api_bootstrapper_cli.core.pyenv_manager.exec_cmd")
+    mock_exec.return_value = CommandResult(
+        stdout="/home/user/.pyenv/versions/3.12.0\n", stderr="", returncode=0
+    )
+    manager = PyenvManager(wheelhouse=Wheelhouse(tmp_path, offline=True))
+
+    manager.install_pip_packages("3.12.0", ["pip", "poetry"])
+
+    assert mock_exec.call_args[0][0] == [
+        "/home/user/.pyenv/versions/3.12.0/bin/python",
+        "-m",
+        "pip",
+        "install",
+        "--find-links",
+        str(tmp_path),
+        "--no-index",
+        "--upgrade",
+        "pip",
+        "poetry",
+    ]
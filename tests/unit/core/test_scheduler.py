@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from api_bootstrapper_cli.core.scheduler import Step, run_steps
+
+
+def test_should_pass_dependency_results_to_later_steps():
+    report = run_steps(
+        [
+            Step("python_path", lambda _: "/usr/bin/python3"),
+            Step(
+                "use_python",
+                lambda results: results["python_path"] + " ok",
+                ("python_path",),
+            ),
+        ]
+    )
+
+    assert report.results["use_python"] == "/usr/bin/python3 ok"
+
+
+def test_should_run_independent_steps_concurrently():
+    barrier = threading.Barrier(2, timeout=2)
+
+    report = run_steps(
+        [
+            Step("interpreter", lambda _: barrier.wait()),
+            Step("pyproject", lambda _: barrier.wait()),
+        ]
+    )
+
+    assert set(report.results) == {"interpreter", "pyproject"}
+
+
+def test_should_start_step_only_after_its_dependencies():
+    order: list[str] = []
+
+    def record(name: str):
+        def run(_):
+            time.sleep(0.02)
+            order.append(name)
+
+        return run
+
+    run_steps(
+        [
+            Step("install", record("install"), ("use_python", "pyproject")),
+            Step("use_python", record("use_python"), ("ensure_python",)),
+            Step("ensure_python", record("ensure_python")),
+            Step("pyproject", record("pyproject")),
+        ]
+    )
+
+    assert order.index("ensure_python") < order.index("use_python")
+    assert order[-1] == "install"
+
+
+def test_should_not_start_dependents_of_failed_step():
+    started: list[str] = []
+
+    def fail(_):
+        raise RuntimeError("[poetry] network error")
+
+    with pytest.raises(RuntimeError, match="network error"):
+        run_steps(
+            [
+                Step("use_python", fail),
+                Step("install", lambda _: started.append("install"), ("use_python",)),
+            ]
+        )
+
+    assert started == []
+
+
+def test_should_report_critical_path():
+    report = run_steps(
+        [
+            Step("ensure_python", lambda _: time.sleep(0.1)),
+            Step("pyproject", lambda _: None),
+            Step("use_python", lambda _: None, ("ensure_python", "pyproject")),
+            Step("vscode_config", lambda _: None),
+        ]
+    )
+
+    assert report.critical_path == ["ensure_python", "use_python"]
+    assert report.critical_seconds >= 0.1
+    assert report.wall >= report.critical_seconds
+
+
+@pytest.mark.parametrize(
+    ("steps", "message"),
+    [
+        ([Step("a", lambda _: None), Step("a", lambda _: None)], "Duplicate step"),
+        ([Step("a", lambda _: None, ("missing",))], "unknown 'missing'"),
+        (
+            [Step("a", lambda _: None, ("b",)), Step("b", lambda _: None, ("a",))],
+            "Dependency cycle",
+        ),
+    ],
+)
+def test_should_reject_invalid_graphs(steps, message):
+    with pytest.raises(ValueError, match=message):
+        run_steps(steps)
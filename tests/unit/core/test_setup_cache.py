@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from api_bootstrapper_cli.core.setup_cache import SetupResultCache
+
+
+FINGERPRINT = {"python_version": "3.12.3", "interpreter": "abc"}
+RESULT = {"python_path": "/usr/bin/python3.12"}
+
+
+def test_should_load_result_stored_for_same_fingerprint(tmp_path: Path):
+    cache = SetupResultCache.in_venv(tmp_path)
+
+    cache.store(FINGERPRINT, RESULT)
+
+    assert cache.path.parent == tmp_path
+    assert cache.load(dict(FINGERPRINT)) == RESULT
+
+
+def test_should_ignore_result_for_other_fingerprint(tmp_path: Path):
+    cache = SetupResultCache.in_venv(tmp_path)
+    cache.store(FINGERPRINT, RESULT)
+
+    assert cache.load({**FINGERPRINT, "interpreter": "def"}) is None
+
+
+def test_should_treat_unreadable_record_as_missing(tmp_path: Path):
+    cache = SetupResultCache.in_venv(tmp_path)
+    assert cache.load(FINGERPRINT) is None
+
+    cache.path.write_text("{not json")
+    assert cache.load(FINGERPRINT) is None
+
+
+def test_should_not_fail_when_venv_is_gone(tmp_path: Path):
+    SetupResultCache.in_venv(tmp_path / "missing").store(FINGERPRINT, RESULT)
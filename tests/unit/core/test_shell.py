@@ -1,46 +1,72 @@
 from __future__ import annotations
 
-import subprocess
-from unittest.mock import Mock
+import json
+import os
+import signal
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
 
 import pytest
 
-from api_bootstrapper_cli.core.shell import CommandResult, ShellError, exec_cmd
+from api_bootstrapper_cli.core import shell
+from api_bootstrapper_cli.core.shell import (
+    CommandResult,
+    CommandTimeoutError,
+    ShellError,
+    TranscriptMissError,
+    clear_probe_cache,
+    exec_cmd,
+    kill_running_commands,
+    record_transcripts,
+    replay_transcripts,
+    set_deadline,
+)
+
+
+def _mock_popen(mocker, stdout: str = "", stderr: str = "", returncode: int = 0):
+    process = MagicMock()
+    process.__enter__.return_value = process
+    process.stdout.read.return_value = stdout
+    process.stderr.read.return_value = stderr
+    process.reap.return_value = returncode
+    process.rusage = None
+    return mocker.patch(
+        "api_bootstrapper_cli.core.shell._Process", return_value=process
+    )
 
 
 def test_should_execute_simple_command_successfully(mocker):
-    mock_run = mocker.patch("subprocess.run")
-    mock_run.return_value = Mock(stdout="output", stderr="", returncode=0)
+    mock_popen = _mock_popen(mocker, stdout="output")
 
     result = exec_cmd(["echo", "test"])
 
     assert result.stdout == "output"
     assert result.stderr == ""
     assert result.returncode == 0
-    mock_run.assert_called_once()
+    mock_popen.assert_called_once()
 
 
 def test_should_pass_cwd_to_subprocess(mocker):
-    mock_run = mocker.patch("subprocess.run")
-    mock_run.return_value = Mock(stdout="", stderr="", returncode=0)
+    mock_popen = _mock_popen(mocker)
 
     exec_cmd(["ls"], cwd="/tmp")
 
-    call_args = mock_run.call_args
+    call_args = mock_popen.call_args
     assert call_args.kwargs["cwd"] == "/tmp"
 
 
 def test_should_raise_shell_error_on_failure(mocker):
-    mock_run = mocker.patch("subprocess.run")
-    mock_run.side_effect = subprocess.CalledProcessError(1, ["false"], stderr="error")
+    _mock_popen(mocker, stderr="error", returncode=1)
 
     with pytest.raises(ShellError, match="Command failed"):
         exec_cmd(["false"], check=True)
 
 
 def test_should_not_raise_when_check_is_false(mocker):
-    mock_run = mocker.patch("subprocess.run")
-    mock_run.return_value = Mock(stdout="", stderr="error", returncode=1)
+    _mock_popen(mocker, stderr="error", returncode=1)
 
     result = exec_cmd(["false"], check=False)
 
@@ -48,8 +74,7 @@ def test_should_not_raise_when_check_is_false(mocker):
 
 
 def test_should_return_command_result_object(mocker):
-    mock_run = mocker.patch("subprocess.run")
-    mock_run.return_value = Mock(stdout="out", stderr="err", returncode=0)
+    _mock_popen(mocker, stdout="out", stderr="err")
 
     result = exec_cmd(["test"])
 
@@ -57,3 +82,406 @@ def test_should_return_command_result_object(mocker):
     assert result.stdout == "out"
     assert result.stderr == "err"
     assert result.returncode == 0
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_should_report_exit_status_of_command_killed_from_another_thread(
+    stream: bool,
+):
+    errors: list[ShellError] = []
+
+    def run() -> None:
+        try:
+            exec_cmd(
+                [sys.executable, "-c", "import time; time.sleep(30)"], stream=stream
+            )
+        except ShellError as e:
+            errors.append(e)
+
+    worker = threading.Thread(target=run)
+    worker.start()
+    while not shell._live_processes:
+        time.sleep(0.01)
+    kill_running_commands()
+    worker.join(timeout=10)
+
+    # The killer leaves reaping to the command's thread, which sees the signal.
+    [error] = errors
+    assert error.returncode == -signal.SIGTERM
+    assert not shell._live_processes
+
+
+def test_should_stream_output_lines_to_callback():
+    lines: list[str] = []
+
+    result = exec_cmd(
+        [sys.executable, "-c", "for i in range(5): print(f'line {i}')"],
+        on_output=lines.append,
+    )
+
+    assert lines == [f"line {i}" for i in range(5)]
+    assert result.returncode == 0
+
+
+def test_should_keep_only_tail_of_streamed_output():
+    result = exec_cmd(
+        [sys.executable, "-c", "for i in range(1000): print(i)"],
+        stream=True,
+        tail_lines=3,
+    )
+
+    assert result.stdout.splitlines() == ["997", "998", "999"]
+
+
+def test_should_include_streamed_tail_in_shell_error():
+    script = (
+        "import sys\n"
+        "for i in range(50): print(f'noise {i}')\n"
+        "print('fatal: boom', file=sys.stderr)\n"
+        "sys.exit(2)"
+    )
+
+    with pytest.raises(ShellError) as exc_info:
+        exec_cmd([sys.executable, "-c", script], stream=True, tail_lines=5)
+
+    message = str(exc_info.value)
+    assert "Exit code: 2" in message
+    assert "fatal: boom" in message
+    assert "noise 0" not in message
+
+
+@pytest.fixture
+def counting_tool(tmp_path):
+    """An executable on its own PATH that counts how often it was run."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    counter = tmp_path / "calls"
+    tool = bin_dir / "probe-tool"
+    tool.write_text(
+        f"#!{sys.executable}\n"
+        f"with open({str(counter)!r}, 'a') as f: f.write('x')\n"
+        "print('probe-tool 1.0')\n"
+    )
+    tool.chmod(0o755)
+
+    def calls() -> int:
+        return len(counter.read_text()) if counter.exists() else 0
+
+    return tool, {"PATH": str(bin_dir)}, calls
+
+
+def test_should_reuse_cached_probe_within_process(counting_tool):
+    tool, env, calls = counting_tool
+
+    first = exec_cmd(["probe-tool"], env=env, cache=True)
+    second = exec_cmd(["probe-tool"], env=env, cache=True)
+
+    assert first == second
+    assert first.stdout.strip() == "probe-tool 1.0"
+    assert calls() == 1
+
+
+def test_should_persist_probe_cache_across_invocations(counting_tool):
+    tool, env, calls = counting_tool
+    exec_cmd(["probe-tool"], env=env, cache=True)
+
+    shell._probe_memo.clear()
+    shell._probe_store_loaded = False
+    result = exec_cmd(["probe-tool"], env=env, cache=True)
+
+    assert result.stdout.strip() == "probe-tool 1.0"
+    assert calls() == 1
+
+
+def test_should_invalidate_probe_when_binary_changes(counting_tool):
+    tool, env, calls = counting_tool
+    exec_cmd(["probe-tool"], env=env, cache=True)
+
+    stat = tool.stat()
+    os.utime(tool, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    exec_cmd(["probe-tool"], env=env, cache=True)
+
+    assert calls() == 2
+
+
+def test_should_invalidate_probe_when_path_changes(counting_tool, tmp_path):
+    tool, env, calls = counting_tool
+    exec_cmd(["probe-tool"], env=env, cache=True)
+
+    other_path = {"PATH": f"{env['PATH']}{os.pathsep}{tmp_path}"}
+    exec_cmd(["probe-tool"], env=other_path, cache=True)
+
+    assert calls() == 2
+
+
+def test_should_invalidate_probe_when_watched_path_changes(counting_tool, tmp_path):
+    tool, env, calls = counting_tool
+    watched = tmp_path / "versions"
+    exec_cmd(["probe-tool"], env=env, cache=True, cache_watch=[watched])
+
+    watched.mkdir()
+    exec_cmd(["probe-tool"], env=env, cache=True, cache_watch=[watched])
+
+    assert calls() == 2
+
+
+def test_should_not_cache_failed_probes(tmp_path):
+    env = {"PATH": os.path.dirname(sys.executable)}
+    cmd = [sys.executable, "-c", "import sys; sys.exit(1)"]
+
+    exec_cmd(cmd, env=env, check=False, cache=True)
+
+    assert shell._probe_memo == {}
+
+
+def test_should_clear_probe_cache(counting_tool):
+    tool, env, calls = counting_tool
+    exec_cmd(["probe-tool"], env=env, cache=True)
+
+    clear_probe_cache()
+    exec_cmd(["probe-tool"], env=env, cache=True)
+
+    assert calls() == 2
+
+
+def test_should_share_probe_cache_between_threads(counting_tool, tmp_path):
+    tool, env, calls = counting_tool
+    cwds = [tmp_path / str(i) for i in range(8)]
+    for cwd in cwds:
+        cwd.mkdir()
+        exec_cmd(["probe-tool"], cwd=str(cwd), env=env, cache=True)
+    shell._probe_memo.clear()
+    shell._probe_store_loaded = False
+
+    with ThreadPoolExecutor(8) as pool:
+        results = list(
+            pool.map(
+                lambda cwd: exec_cmd(["probe-tool"], cwd=str(cwd), env=env, cache=True),
+                cwds * 4,
+            )
+        )
+
+    assert {r.stdout.strip() for r in results} == {"probe-tool 1.0"}
+    assert calls() == 8
+
+
+def test_should_cap_probe_cache_and_write_only_changes(
+    counting_tool, tmp_path, monkeypatch
+):
+    tool, env, calls = counting_tool
+    monkeypatch.setattr(shell, "_PROBE_CACHE_LIMIT", 2)
+    writes = MagicMock(wraps=shell.files.write_text_atomic)
+    monkeypatch.setattr(shell.files, "write_text_atomic", writes)
+    cwds = [tmp_path / str(i) for i in range(3)]
+    for cwd in cwds:
+        cwd.mkdir()
+        exec_cmd(["probe-tool"], cwd=str(cwd), env=env, cache=True)
+        exec_cmd(["probe-tool"], cwd=str(cwd), env=env, cache=True)
+
+    assert len(shell._probe_memo) == 2
+    assert writes.call_count == 3
+    exec_cmd(["probe-tool"], cwd=str(cwds[0]), env=env, cache=True)
+    assert calls() == 4
+
+
+SPAWN_GRANDCHILD = (
+    "import subprocess, sys, time\n"
+    "child = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(60)'])\n"
+    "open(sys.argv[1], 'w').write(str(child.pid))\n"
+    "print('started', flush=True)\n"
+    "time.sleep(60)\n"
+)
+
+
+def _is_gone(pid: int) -> bool:
+    deadline = time.monotonic() + 3
+    while time.monotonic() < deadline:
+        try:
+            with open(f"/proc/{pid}/stat") as f:
+                if f.read().split()[2] == "Z":
+                    return True
+        except FileNotFoundError:
+            return True
+        time.sleep(0.05)
+    return False
+
+
+@pytest.fixture
+def clear_deadline():
+    yield
+    set_deadline(None)
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="inspects /proc")
+def test_should_kill_process_group_on_timeout(tmp_path):
+    pid_file = tmp_path / "grandchild.pid"
+
+    started = time.perf_counter()
+    with pytest.raises(CommandTimeoutError, match="timed out after"):
+        exec_cmd([sys.executable, "-c", SPAWN_GRANDCHILD, str(pid_file)], timeout=1)
+
+    assert time.perf_counter() - started < 10
+    assert _is_gone(int(pid_file.read_text()))
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="inspects /proc")
+def test_should_kill_process_group_on_streaming_timeout(tmp_path):
+    pid_file = tmp_path / "grandchild.pid"
+    lines: list[str] = []
+
+    with pytest.raises(CommandTimeoutError) as exc_info:
+        exec_cmd(
+            [sys.executable, "-c", SPAWN_GRANDCHILD, str(pid_file)],
+            on_output=lines.append,
+            timeout=1,
+        )
+
+    assert lines == ["started"]
+    assert "started" in str(exc_info.value)
+    assert _is_gone(int(pid_file.read_text()))
+
+
+def test_should_apply_global_deadline(clear_deadline):
+    set_deadline(0.5)
+
+    with pytest.raises(CommandTimeoutError):
+        exec_cmd([sys.executable, "-c", "import time; time.sleep(30)"])
+
+
+def test_should_fail_fast_when_deadline_already_passed(mocker, clear_deadline):
+    mock_popen = mocker.patch("api_bootstrapper_cli.core.shell._Process")
+    set_deadline(0)
+
+    with pytest.raises(CommandTimeoutError, match="Deadline exceeded"):
+        exec_cmd(["poetry", "lock"])
+
+    mock_popen.assert_not_called()
+
+
+# ── Record / replay ────────────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def transcript_dir(tmp_path):
+    yield tmp_path / "transcripts"
+    record_transcripts(None)
+
+
+def _record_script(transcript_dir, script: str, **kwargs) -> CommandResult:
+    record_transcripts(transcript_dir)
+    try:
+        return exec_cmd([sys.executable, "-c", script], **kwargs)
+    finally:
+        record_transcripts(None)
+
+
+def test_should_record_command_transcript(transcript_dir):
+    _record_script(
+        transcript_dir,
+        "import sys; print('out'); print('err', file=sys.stderr)",
+        env={**os.environ, "EXTRA_VAR": "1"},
+    )
+
+    [path] = transcript_dir.glob("*.json")
+    transcript = json.loads(path.read_text())
+    [invocation] = transcript["invocations"]
+    assert transcript["cmd"][0] == os.path.basename(sys.executable)
+    assert invocation["stdout"] == "out\n"
+    assert invocation["stderr"] == "err\n"
+    assert invocation["returncode"] == 0
+    assert invocation["duration"] > 0
+    assert invocation["env"]["set"] == {"EXTRA_VAR": "1"}
+
+
+def test_should_replay_without_spawning(mocker, transcript_dir):
+    _record_script(transcript_dir, "print('recorded')")
+    mock_popen = mocker.patch("api_bootstrapper_cli.core.shell._Process")
+    replay_transcripts(transcript_dir)
+
+    result = exec_cmd([sys.executable, "-c", "print('recorded')"])
+
+    assert result.stdout == "recorded\n"
+    mock_popen.assert_not_called()
+
+
+def test_should_replay_recorded_failures(transcript_dir):
+    script = "import sys; print('boom', file=sys.stderr); sys.exit(3)"
+    with pytest.raises(ShellError, match="Exit code: 3"):
+        _record_script(transcript_dir, script)
+    replay_transcripts(transcript_dir)
+
+    with pytest.raises(ShellError, match="boom") as exc_info:
+        exec_cmd([sys.executable, "-c", script])
+    assert exc_info.value.returncode == 3
+
+
+def test_should_replay_repeated_commands_in_order(transcript_dir, tmp_path):
+    counter = tmp_path / "count"
+    script = (
+        "import pathlib; p = pathlib.Path(r'%s'); "
+        "n = int(p.read_text()) + 1 if p.exists() else 1; "
+        "p.write_text(str(n)); print(n)" % counter
+    )
+    record_transcripts(transcript_dir)
+    exec_cmd([sys.executable, "-c", script])
+    exec_cmd([sys.executable, "-c", script])
+    replay_transcripts(transcript_dir)
+
+    outputs = [exec_cmd([sys.executable, "-c", script]).stdout for _ in range(3)]
+
+    assert outputs == ["1\n", "2\n", "2\n"]
+
+
+def test_should_rewrite_working_directory_on_replay(transcript_dir, tmp_path):
+    recorded_in = tmp_path / "recorded"
+    replayed_in = tmp_path / "replayed"
+    recorded_in.mkdir()
+    replayed_in.mkdir()
+    script = "import os; print(os.getcwd())"
+    _record_script(transcript_dir, script, cwd=str(recorded_in))
+    replay_transcripts(transcript_dir)
+
+    result = exec_cmd([sys.executable, "-c", script], cwd=str(replayed_in))
+
+    assert result.stdout.strip() == str(replayed_in)
+
+
+def test_should_stream_replayed_output(transcript_dir):
+    _record_script(transcript_dir, "print('a'); print('b')", stream=True)
+    replay_transcripts(transcript_dir)
+    lines: list[str] = []
+
+    exec_cmd([sys.executable, "-c", "print('a'); print('b')"], on_output=lines.append)
+
+    assert lines == ["a", "b"]
+
+
+def test_should_replay_with_recorded_latency(mocker, transcript_dir):
+    _record_script(transcript_dir, "import time; time.sleep(0.05)")
+    sleep = mocker.patch("api_bootstrapper_cli.core.shell.time.sleep")
+
+    replay_transcripts(transcript_dir)
+    exec_cmd([sys.executable, "-c", "import time; time.sleep(0.05)"])
+    sleep.assert_not_called()
+
+    replay_transcripts(transcript_dir, latency=True)
+    exec_cmd([sys.executable, "-c", "import time; time.sleep(0.05)"])
+    assert sleep.call_args[0][0] >= 0.05
+
+
+def test_should_fail_loudly_on_unrecorded_command(transcript_dir):
+    replay_transcripts(transcript_dir)
+
+    with pytest.raises(TranscriptMissError, match="poetry lock"):
+        exec_cmd(["poetry", "lock"])
+
+
+def test_should_bypass_probe_cache_while_recording(counting_tool, transcript_dir):
+    tool, env, calls = counting_tool
+    exec_cmd(["probe-tool"], env=env, cache=True)
+    record_transcripts(transcript_dir)
+
+    exec_cmd(["probe-tool"], env=env, cache=True)
+
+    assert calls() == 2
+    assert list(transcript_dir.glob("*.json"))
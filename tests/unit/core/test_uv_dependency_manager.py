@@ -2,8 +2,11 @@ from __future__ import annotations
 
 import pytest
 
+from api_bootstrapper_cli.core.protocols import LockMode
 from api_bootstrapper_cli.core.shell import CommandResult, ShellError
 from api_bootstrapper_cli.core.uv_dependency_manager import UvDependencyManager
+from api_bootstrapper_cli.core.venv_templates import VenvTemplates
+from api_bootstrapper_cli.core.wheelhouse import Wheelhouse
 
 
 def test_should_detect_uv_is_installed(mocker):
@@ -101,6 +104,77 @@ def test_should_run_uv_sync_to_install_dependencies(mocker, tmp_path):
     assert call_args[1]["check"] is True
 
 
+def test_should_skip_sync_when_stamp_matches(mocker, tmp_path):
+    mock_exec = mocker.patch("api_bootstrapper_cli.core.uv_dependency_manager.exec_cmd")
+    (tmp_path / "pyproject.toml").write_text('[project]\nname = "api"\n')
+    (tmp_path / "uv.lock").write_text("version = 1\n")
+    (tmp_path / ".venv").mkdir()
+    (tmp_path / ".venv" / "pyvenv.cfg").write_text("version_info = 3.12.3\n")
+    manager = UvDependencyManager()
+
+    manager.install_dependencies(tmp_path)
+    manager.install_dependencies(tmp_path)
+    assert mock_exec.call_count == 1
+
+    manager.install_dependencies(tmp_path, force=True)
+    assert mock_exec.call_count == 2
+
+
+@pytest.mark.parametrize("lock_mode", [LockMode.frozen, LockMode.locked])
+def test_should_sync_strictly_from_lock(mocker, tmp_path, lock_mode):
+    mock_exec = mocker.patch("api_bootstrapper_cli.core.uv_dependency_manager.exec_cmd")
+    (tmp_path / "pyproject.toml").write_text('[project]\nname = "api"\n')
+    (tmp_path / "uv.lock").write_text(
+        'version = 1\n\n[[package]]\nname = "api"\nversion = "0.1.0"\n'
+    )
+    (tmp_path / ".venv").mkdir()
+
+    UvDependencyManager().install_dependencies(tmp_path, lock_mode=lock_mode)
+
+    args = mock_exec.call_args[0][0]
+    assert args == ["uv", "sync", "--all-groups", f"--{lock_mode.value}"]
+
+
+def test_should_refuse_stale_lock_before_syncing(mocker, tmp_path):
+    mock_exec = mocker.patch("api_bootstrapper_cli.core.uv_dependency_manager.exec_cmd")
+    (tmp_path / "pyproject.toml").write_text(
+        '[project]\nname = "api"\ndependencies = ["fastapi>=0.110"]\n'
+    )
+    (tmp_path / "uv.lock").write_text(
+        'version = 1\n\n[[package]]\nname = "api"\nversion = "0.1.0"\n'
+    )
+
+    with pytest.raises(RuntimeError, match=r"uv\.lock desatualizado"):
+        UvDependencyManager().install_dependencies(tmp_path, lock_mode=LockMode.locked)
+
+    mock_exec.assert_not_called()
+
+
+def test_should_raise_runtime_error_when_lock_fails(mocker, tmp_path):
+    mock_exec = mocker.patch("api_bootstrapper_cli.core.uv_dependency_manager.exec_cmd")
+    mock_exec.side_effect = ShellError("No solution found")
+
+    with pytest.raises(RuntimeError, match=r"\[uv\] Falha ao gerar lock file"):
+        UvDependencyManager().lock(tmp_path)
+
+
+def test_should_relock_with_uv_lock(mocker, tmp_path):
+    mock_exec = mocker.patch("api_bootstrapper_cli.core.uv_dependency_manager.exec_cmd")
+
+    UvDependencyManager().relock(tmp_path)
+
+    assert mock_exec.call_args[0][0] == ["uv", "lock"]
+    assert mock_exec.call_args[1]["cwd"] == str(tmp_path)
+
+
+def test_should_raise_runtime_error_when_uv_is_missing_on_relock(mocker, tmp_path):
+    mock_exec = mocker.patch("api_bootstrapper_cli.core.uv_dependency_manager.exec_cmd")
+    mock_exec.side_effect = FileNotFoundError("uv")
+
+    with pytest.raises(RuntimeError, match=r"\[uv\] Falha ao atualizar lock file"):
+        UvDependencyManager().relock(tmp_path)
+
+
 def test_should_raise_runtime_error_when_sync_fails(mocker, tmp_path):
     mock_exec = mocker.patch("api_bootstrapper_cli.core.uv_dependency_manager.exec_cmd")
     mock_exec.side_effect = ShellError("lock file missing")
@@ -133,3 +207,44 @@ def test_should_return_venv_python_on_windows(mocker, tmp_path):
 
 def test_manager_name_is_uv():
     assert UvDependencyManager().name == "uv"
+
+
+def test_should_still_sync_project_after_cloning_venv_template(mocker, tmp_path):
+    mock_exec = mocker.patch("api_bootstrapper_cli.core.uv_dependency_manager.exec_cmd")
+    manager = UvDependencyManager(
+        templates=VenvTemplates(tmp_path / "templates", copy=True)
+    )
+    for name in ("first", "second"):
+        project = tmp_path / name
+        (project / ".venv").mkdir(parents=True)
+        (project / "pyproject.toml").write_text('[project]\nname = "api"\n')
+        (project / "uv.lock").write_text("version = 1\n")
+        (project / ".venv" / "pyvenv.cfg").write_text("version_info = 3.12.3\n")
+    (tmp_path / "first" / ".venv" / "marker").write_text("installed")
+
+    manager.install_dependencies(tmp_path / "first")
+    manager.install_dependencies(tmp_path / "second")
+
+    assert mock_exec.call_count == 2
+    assert (tmp_path / "second" / ".venv" / "marker").exists()
+
+
+def test_should_sync_from_wheelhouse_only_when_offline(mocker, tmp_path):
+    mock_exec = mocker.patch("api_bootstrapper_cli.core.uv_dependency_manager.exec_cmd")
+    (tmp_path / "uv.lock").write_text("version = 1\n")
+    (tmp_path / ".venv").mkdir()
+    wheels = tmp_path / "wheels"
+    manager = UvDependencyManager(wheelhouse=Wheelhouse(wheels, offline=True))
+
+    manager.install_dependencies(tmp_path, lock_mode=LockMode.frozen)
+
+    assert mock_exec.call_args[0][0] == [
+        "uv",
+        "sync",
+        "--all-groups",
+        "--frozen",
+        "--find-links",
+        str(wheels),
+        "--no-index",
+        "--offline",
+    ]
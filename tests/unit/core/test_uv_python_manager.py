@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import pytest
 
+from api_bootstrapper_cli.core.environment import CleanEnvironment
 from api_bootstrapper_cli.core.shell import CommandResult, ShellError
 from api_bootstrapper_cli.core.uv_python_manager import UvPythonManager
 
@@ -85,6 +86,21 @@ def test_should_return_python_path_from_uv(mocker, tmp_path):
     assert call_args[0][0] == ["uv", "python", "find", "3.12.0"]
 
 
+def test_should_watch_install_dir_of_the_injected_environment(
+    mocker, tmp_path, monkeypatch
+):
+    monkeypatch.setenv("UV_PYTHON_INSTALL_DIR", str(tmp_path / "process"))
+    mock_exec = mocker.patch("api_bootstrapper_cli.core.uv_python_manager.exec_cmd")
+    mock_exec.return_value = CommandResult(stdout="python\n", stderr="", returncode=0)
+    environment = CleanEnvironment.capture(
+        {"UV_PYTHON_INSTALL_DIR": str(tmp_path / "injected")}
+    )
+
+    UvPythonManager(environment=environment).get_python_path("3.12.0")
+
+    assert mock_exec.call_args[1]["cache_watch"] == [tmp_path / "injected"]
+
+
 def test_should_raise_runtime_error_when_python_path_not_found(mocker):
     mock_exec = mocker.patch("api_bootstrapper_cli.core.uv_python_manager.exec_cmd")
     mock_exec.side_effect = ShellError("not found")
@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from api_bootstrapper_cli.core import venv_templates
+from api_bootstrapper_cli.core.venv_templates import VenvTemplates, clone_tree
+
+
+SITE = "lib/python3.12/site-packages"
+
+
+def _venv(project: Path, prompt: str, installed: bool = True) -> Path:
+    venv = project / ".venv"
+    (venv / "bin").mkdir(parents=True)
+    (venv / SITE).mkdir(parents=True)
+    (venv / "pyvenv.cfg").write_text(
+        f"home = /opt/python/bin\nversion = 3.12.3\nprompt = {prompt}\n"
+    )
+    (venv / "bin" / "python").symlink_to("/opt/python/bin/python3.12")
+    (venv / "bin" / "activate").write_text(f"VIRTUAL_ENV='{venv}'\n")
+    if installed:
+        (venv / SITE / "httpx-0.27.0.dist-info").mkdir()
+        (venv / SITE / "local.pth").write_text(f"{venv}/extra\n")
+        script = venv / "bin" / "httpx"
+        script.write_text(f"#!{venv}/bin/python\nfrom httpx import main\n")
+        script.chmod(0o755)
+        (venv / ".api-bootstrapper-install.json").write_text("{}")
+    return venv
+
+
+def _project(path: Path, lock: str = "# lock\n") -> Path:
+    path.mkdir(parents=True)
+    (path / "poetry.lock").write_text(lock)
+    return path
+
+
+@pytest.fixture
+def templates(tmp_path: Path) -> VenvTemplates:
+    return VenvTemplates(tmp_path / "templates", copy=True)
+
+
+def test_should_key_on_interpreter_lock_and_args_but_not_prompt(
+    tmp_path: Path, templates: VenvTemplates
+):
+    a, b = _project(tmp_path / "a"), _project(tmp_path / "b")
+    _venv(a, "a"), _venv(b, "b")
+
+    def key(project: Path, args: tuple[str, ...] = ("install",)) -> str | None:
+        return templates.key(project, "poetry.lock", project / ".venv", args)
+
+    assert key(a) is not None
+    assert key(a) == key(b)
+    assert key(a) != key(a, ("install", "--only", "main"))
+    (b / "poetry.lock").write_text("# other lock\n")
+    assert key(a) != key(b)
+
+
+@pytest.mark.parametrize(
+    ("lock_file", "lock"),
+    [
+        (
+            "poetry.lock",
+            '[[package]]\nname = "lib"\n[package.source]\ntype = "directory"\nurl = "../lib"\n',
+        ),
+        ("uv.lock", '[[package]]\nname = "lib"\nsource = { editable = "../lib" }\n'),
+    ],
+)
+def test_should_not_key_locks_with_local_sources(
+    tmp_path: Path, templates: VenvTemplates, lock_file: str, lock: str
+):
+    _venv(tmp_path, "p")
+    (tmp_path / lock_file).write_text(lock)
+
+    assert templates.key(tmp_path, lock_file, tmp_path / ".venv", ()) is None
+
+
+def test_should_key_uv_lock_of_the_project_itself(
+    tmp_path: Path, templates: VenvTemplates
+):
+    _venv(tmp_path, "p")
+    (tmp_path / "uv.lock").write_text(
+        '[[package]]\nname = "api"\nsource = { editable = "." }\n'
+    )
+
+    assert templates.key(tmp_path, "uv.lock", tmp_path / ".venv", ()) is not None
+
+
+def test_should_not_key_without_lock(tmp_path: Path, templates: VenvTemplates):
+    _venv(tmp_path, "p")
+
+    assert templates.key(tmp_path, "poetry.lock", tmp_path / ".venv", ()) is None
+
+
+def test_should_clone_template_into_fresh_venv(
+    tmp_path: Path, templates: VenvTemplates
+):
+    source = _venv(_project(tmp_path / "source"), "source")
+    templates.capture("k", source)
+    fresh = _venv(_project(tmp_path / "target"), "target", installed=False)
+
+    method = templates.materialize("k", fresh)
+
+    assert method in ("reflink", "hardlink")
+    assert (fresh / SITE / "httpx-0.27.0.dist-info").is_dir()
+    assert (fresh / "bin" / "httpx").read_text().startswith(f"#!{fresh}/bin/python")
+    assert os.access(fresh / "bin" / "httpx", os.X_OK)
+    assert (fresh / SITE / "local.pth").read_text() == f"{fresh}/extra\n"
+    # The new venv keeps its own configuration and activation scripts.
+    assert "prompt = target" in (fresh / "pyvenv.cfg").read_text()
+    assert (fresh / "bin" / "activate").read_text() == f"VIRTUAL_ENV='{fresh}'\n"
+    assert os.readlink(fresh / "bin" / "python") == "/opt/python/bin/python3.12"
+    assert not (fresh / ".api-bootstrapper-install.json").exists()
+    assert not list(fresh.parent.glob(".venv.*"))
+
+
+def test_should_leave_template_intact_after_rewriting_clone(
+    tmp_path: Path, templates: VenvTemplates
+):
+    source = _venv(_project(tmp_path / "source"), "source")
+    templates.capture("k", source)
+    templates.materialize("k", _venv(tmp_path / "target", "target", installed=False))
+
+    template = templates.root / "k" / "venv"
+    assert (template / "bin" / "httpx").read_text().startswith(f"#!{source}/bin/")
+    assert "prompt = source" in (template / "pyvenv.cfg").read_text()
+
+
+def test_should_not_replace_venv_that_has_packages(
+    tmp_path: Path, templates: VenvTemplates
+):
+    templates.capture("k", _venv(tmp_path / "source", "source"))
+    target = _venv(tmp_path / "target", "target")
+
+    assert templates.materialize("k", target) is None
+    assert (target / "bin" / "httpx").read_text().startswith(f"#!{target}/bin/")
+
+
+def test_should_not_materialize_unknown_template(
+    tmp_path: Path, templates: VenvTemplates
+):
+    fresh = _venv(tmp_path, "p", installed=False)
+
+    assert templates.materialize("missing", fresh) is None
+
+
+def test_should_keep_first_capture_of_a_key(tmp_path: Path, templates: VenvTemplates):
+    first = _venv(tmp_path / "first", "first")
+    templates.capture("k", first)
+    templates.capture("k", _venv(tmp_path / "second", "second"))
+
+    assert (
+        "prompt = first" in (templates.root / "k" / "venv" / "pyvenv.cfg").read_text()
+    )
+
+
+def test_should_fall_back_to_hardlinks_then_copies(tmp_path: Path, monkeypatch):
+    source = tmp_path / "source"
+    (source / "sub").mkdir(parents=True)
+    (source / "sub" / "file").write_text("data")
+    (source / "link").symlink_to("sub/file")
+
+    def no_reflink(src: Path, dst: Path) -> None:
+        raise OSError(95, "Operation not supported")
+
+    monkeypatch.setattr(venv_templates, "_reflink", no_reflink)
+
+    assert clone_tree(source, tmp_path / "linked") == "hardlink"
+    assert (tmp_path / "linked" / "sub" / "file").stat().st_ino == (
+        source / "sub" / "file"
+    ).stat().st_ino
+    assert os.readlink(tmp_path / "linked" / "link") == "sub/file"
+
+    assert clone_tree(source, tmp_path / "copied", hardlink=False) == "copy"
+    assert (tmp_path / "copied" / "sub" / "file").stat().st_ino != (
+        source / "sub" / "file"
+    ).stat().st_ino
+
+
+def test_should_only_capture_reflinks_unless_copies_are_enabled(
+    tmp_path: Path, monkeypatch
+):
+    def no_reflink(src: Path, dst: Path) -> None:
+        raise OSError(95, "Operation not supported")
+
+    monkeypatch.setattr(venv_templates, "_reflink", no_reflink)
+    source = _venv(tmp_path / "source", "source")
+    reflink_only = VenvTemplates(tmp_path / "templates")
+
+    reflink_only.capture("k", source)
+
+    assert not reflink_only.has("k")
+    assert list(reflink_only.root.iterdir()) == []
+
+
+def test_should_drop_least_recently_used_templates(tmp_path: Path):
+    templates = VenvTemplates(tmp_path / "templates", limit=2, copy=True)
+    source = _venv(tmp_path / "source", "source")
+    templates.capture("a", source)
+    templates.capture("b", source)
+    os.utime(templates.root / "a", (1, 1))
+    os.utime(templates.root / "b", (2, 2))
+    templates.materialize("a", _venv(tmp_path / "target", "target", installed=False))
+
+    templates.capture("c", source)
+
+    assert templates.has("a")
+    assert not templates.has("b")
+    assert templates.has("c")
+
+
+def test_should_not_rewrite_sibling_paths(tmp_path: Path, templates: VenvTemplates):
+    source = _venv(_project(tmp_path / "source"), "source")
+    (source / SITE / "local.pth").write_text(
+        f"{source}/extra\n{source}2/lib\n{source}-old\n/mirror{source}\n"
+    )
+    templates.capture("k", source)
+    fresh = _venv(_project(tmp_path / "target"), "target", installed=False)
+
+    templates.materialize("k", fresh)
+
+    assert (fresh / SITE / "local.pth").read_text() == (
+        f"{fresh}/extra\n{source}2/lib\n{source}-old\n/mirror{source}\n"
+    )
@@ -0,0 +1,315 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from api_bootstrapper_cli.core.shell import CommandResult, ShellError
+from api_bootstrapper_cli.core.wheelhouse import (
+    Wheelhouse,
+    build_wheelhouse,
+    built_hashes,
+    locked_requirements,
+)
+
+
+POETRY_PYPROJECT = """\
+[tool.poetry]
+name = "api"
+version = "0.1.0"
+
+[tool.poetry.dependencies]
+python = "^3.12"
+fastapi = "^0.110"
+uvicorn = { version = "^0.29", extras = ["standard"] }
+pywin32 = { version = "*", platform = "win32" }
+tomli = { version = "*", markers = "python_version < '3.11'" }
+boto3 = { version = "*", optional = true }
+shared = { path = "../shared", develop = true }
+
+[tool.poetry.group.dev.dependencies]
+pytest = "^8"
+
+[tool.poetry.group.docs]
+optional = true
+
+[tool.poetry.group.docs.dependencies]
+mkdocs = "*"
+"""
+
+POETRY_LOCK = """\
+[[package]]
+name = "fastapi"
+version = "0.110.1"
+
+[[package]]
+name = "pytest"
+version = "8.1.1"
+
+[[package]]
+name = "internal"
+version = "1.0"
+
+[package.source]
+type = "legacy"
+url = "https://pypi.example.com/simple"
+reference = "example"
+
+[[package]]
+name = "shared"
+version = "0.1.0"
+
+[package.source]
+type = "directory"
+url = "../shared"
+"""
+
+UV_PYPROJECT = """\
+[project]
+name = "worker"
+version = "0.1.0"
+dependencies = ["httpx>=0.27", "Pydantic[email]>=2"]
+
+[dependency-groups]
+dev = ["pytest", {include-group = "lint"}]
+lint = ["ruff"]
+
+[build-system]
+requires = ["hatchling"]
+build-backend = "hatchling.build"
+"""
+
+UV_LOCK = """\
+version = 1
+
+[[package]]
+name = "httpx"
+version = "0.27.0"
+source = { registry = "https://pypi.org/simple" }
+
+[[package]]
+name = "worker"
+version = "0.1.0"
+source = { editable = "." }
+"""
+
+
+@pytest.fixture
+def poetry_project(tmp_path: Path) -> Path:
+    project = tmp_path / "api"
+    project.mkdir()
+    (project / "pyproject.toml").write_text(POETRY_PYPROJECT)
+    (project / "poetry.lock").write_text(POETRY_LOCK)
+    return project
+
+
+@pytest.fixture
+def uv_project(tmp_path: Path) -> Path:
+    project = tmp_path / "worker"
+    project.mkdir()
+    (project / "pyproject.toml").write_text(UV_PYPROJECT)
+    (project / "uv.lock").write_text(UV_LOCK)
+    return project
+
+
+def test_should_only_read_the_wheelhouse_when_offline(tmp_path: Path):
+    online = Wheelhouse(tmp_path)
+    offline = Wheelhouse(tmp_path, offline=True)
+
+    assert online.pip_args() == ("--find-links", str(tmp_path))
+    assert online.uv_args() == ("--find-links", str(tmp_path))
+    assert offline.pip_args() == ("--find-links", str(tmp_path), "--no-index")
+    assert offline.uv_args() == (
+        "--find-links",
+        str(tmp_path),
+        "--no-index",
+        "--offline",
+    )
+    assert online.pip_args(["https://pypi.example.com/simple"]) == (
+        "--find-links",
+        str(tmp_path),
+        "--extra-index-url",
+        "https://pypi.example.com/simple",
+    )
+    assert offline.pip_args(["https://pypi.example.com/simple"]) == (offline.pip_args())
+
+
+def test_should_read_poetry_requirements_and_locked_pins(poetry_project: Path):
+    locked = locked_requirements(poetry_project, "poetry.lock")
+
+    shared = (poetry_project.parent / "shared").resolve().as_uri()
+    assert locked.requirements == [
+        "fastapi",
+        "uvicorn[standard]",
+        'pywin32 ; (sys_platform == "win32")',
+        "tomli ; (python_version < '3.11')",
+        f"shared @ {shared}",
+        "pytest",
+    ]
+    assert locked.constraints == [
+        "fastapi==0.110.1",
+        "pytest==8.1.1",
+        "internal==1.0",
+    ]
+
+
+def test_should_read_uv_requirements_and_registry_pins(uv_project: Path):
+    locked = locked_requirements(uv_project, "uv.lock")
+
+    assert locked.requirements == [
+        "httpx>=0.27",
+        "Pydantic[email]>=2",
+        "pytest",
+        "ruff",
+    ]
+    assert locked.constraints == ["httpx==0.27.0"]
+
+
+def test_should_pin_each_fork_of_a_uv_lock_under_its_markers(uv_project: Path):
+    (uv_project / "uv.lock").write_text(
+        UV_LOCK
+        + """
+[[package]]
+name = "numpy"
+version = "1.26.4"
+source = { registry = "https://pypi.org/simple" }
+resolution-markers = ["python_full_version < '3.12'"]
+
+[[package]]
+name = "numpy"
+version = "2.1.0"
+source = { registry = "https://pypi.org/simple" }
+resolution-markers = [
+    "python_full_version >= '3.12' and sys_platform == 'linux'",
+    "python_full_version >= '3.12' and sys_platform != 'linux'",
+]
+
+[[package]]
+name = "idna"
+version = "3.7"
+source = { registry = "https://pypi.org/simple" }
+
+[[package]]
+name = "idna"
+version = "3.6"
+source = { registry = "https://pypi.org/simple" }
+"""
+    )
+
+    locked = locked_requirements(uv_project, "uv.lock")
+
+    assert locked.constraints == [
+        "httpx==0.27.0",
+        "numpy==1.26.4 ; (python_full_version < '3.12')",
+        "numpy==2.1.0 ; (python_full_version >= '3.12' and sys_platform == 'linux')"
+        " or (python_full_version >= '3.12' and sys_platform != 'linux')",
+        "idna==3.7",
+    ]
+
+
+def test_should_list_a_dependency_once_when_poetry_repeats_it(tmp_path: Path):
+    (tmp_path / "pyproject.toml").write_text(
+        '[project]\nname = "api"\ndependencies = ["fastapi>=0.110"]\n\n'
+        '[tool.poetry.dependencies]\nFastAPI = { source = "pypi" }\n'
+    )
+
+    locked = locked_requirements(tmp_path, "poetry.lock")
+
+    assert locked.requirements == ["fastapi>=0.110"]
+    assert locked.constraints == []
+
+
+def test_should_build_wheels_for_locked_and_build_requirements(
+    mocker, uv_project: Path, tmp_path: Path
+):
+    constraints: list[str] = []
+
+    def run(cmd, **kwargs):
+        constraints.append(Path(cmd[cmd.index("--constraint") + 1]).read_text())
+        return CommandResult(stdout="", stderr="", returncode=0)
+
+    mock_exec = mocker.patch(
+        "api_bootstrapper_cli.core.wheelhouse.exec_cmd", side_effect=run
+    )
+    wheelhouse = tmp_path / "wheels"
+    python = Path("/usr/bin/python3")
+
+    build_wheelhouse(wheelhouse, uv_project, python, extra=["pip"])
+
+    cmd = mock_exec.call_args[0][0]
+    assert cmd[:9] == [
+        str(python),
+        "-m",
+        "pip",
+        "wheel",
+        "--wheel-dir",
+        str(wheelhouse),
+        "--find-links",
+        str(wheelhouse),
+        "--constraint",
+    ]
+    assert cmd[10:] == [
+        "httpx>=0.27",
+        "Pydantic[email]>=2",
+        "pytest",
+        "ruff",
+        "hatchling",
+        "pip",
+    ]
+    assert constraints == ["httpx==0.27.0\n"]
+    assert wheelhouse.is_dir()
+
+
+def test_should_build_hash_checked_wheels_for_a_poetry_lock(mocker, tmp_path: Path):
+    project = tmp_path / "api"
+    project.mkdir()
+    (project / "pyproject.toml").write_text(
+        '[tool.poetry.dependencies]\npython = "^3.12"\nfastapi = "*"\n\n'
+        '[build-system]\nrequires = ["poetry-core"]\n'
+    )
+    (project / "poetry.lock").write_text(
+        '[[package]]\nname = "fastapi"\nversion = "0.110.1"\ngroups = ["main"]\n'
+        'files = [{file = "fastapi-0.110.1.tar.gz", hash = "sha256:sdist"}]\n'
+    )
+    wheelhouse = tmp_path / "wheels"
+    requirements: list[str] = []
+
+    def run(cmd, **kwargs):
+        if "--require-hashes" in cmd:
+            requirements.append(Path(cmd[-1]).read_text())
+            # pip built a wheel from the locked sdist.
+            (wheelhouse / "fastapi-0.110.1-py3-none-any.whl").write_bytes(b"wheel")
+        return CommandResult(stdout="", stderr="", returncode=0)
+
+    mock_exec = mocker.patch(
+        "api_bootstrapper_cli.core.wheelhouse.exec_cmd", side_effect=run
+    )
+
+    build_wheelhouse(wheelhouse, project, Path("python"))
+
+    locked, build = (c.args[0][8:] for c in mock_exec.call_args_list)
+    assert locked[:-1] == ["--no-deps", "--require-hashes", "--requirement"]
+    assert requirements == ["fastapi==0.110.1 --hash=sha256:sdist\n"]
+    assert build == ["poetry-core"]
+    built = built_hashes(wheelhouse)
+    assert list(built) == ["fastapi==0.110.1"]
+    assert built["fastapi==0.110.1"][0].startswith("sha256:")
+
+
+def test_should_refuse_to_build_wheelhouse_without_lock(tmp_path: Path):
+    (tmp_path / "pyproject.toml").write_text(UV_PYPROJECT)
+
+    with pytest.raises(ValueError, match="No poetry.lock or uv.lock"):
+        build_wheelhouse(tmp_path / "wheels", tmp_path, Path("python"))
+
+
+def test_should_raise_runtime_error_when_building_wheels_fails(
+    mocker, uv_project: Path, tmp_path: Path
+):
+    mocker.patch(
+        "api_bootstrapper_cli.core.wheelhouse.exec_cmd",
+        side_effect=ShellError("No matching distribution found for httpx"),
+    )
+
+    with pytest.raises(RuntimeError, match=r"\[wheelhouse\] Falha ao baixar wheels"):
+        build_wheelhouse(tmp_path / "wheels", uv_project, Path("python"))